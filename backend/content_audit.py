@@ -2,11 +2,29 @@
 Content Audit module.
 Loads HP Canada content audit CSV, provides keyword-based matching for Gamma
 slideshow integration, and supports user-added items at runtime.
+
+Matching runs against an index built at load time (and extended by `add_item`)
+rather than rescoring every item per call: each item's searchable text, static
+score (recommendation + year) and audience are precomputed, a token -> items
+posting map narrows each keyword to the items that can contain it, and results
+are memoized per (keywords, audience, exclude set). Scores are identical to
+`_score_item` (substring semantics included), so the same item wins. Deck
+building matches from worker threads while `add_item` runs on the event loop,
+so the index and its memos are only touched under the index's lock.
+
+When the optional local embedding index is present (content_embeddings.py),
+the sales-program and supporting-asset matchers pass a `semantic_query` and the
+cosine similarity of its top hits is added to the keyword score (hybrid).
 """
 import csv
+import heapq
 import os
 import logging
-from typing import Dict, Any, List, Optional
+import threading
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Set, Tuple
+
+import content_embeddings
 
 logger = logging.getLogger(__name__)
 
@@ -14,6 +32,15 @@ logger = logging.getLogger(__name__)
 _items: List[Dict[str, Any]] = []
 _loaded = False
 
+# Memoized match results kept per index (cleared whenever the index changes).
+MATCH_CACHE_SIZE = 1024
+
+# Hybrid scoring: cosine above SEMANTIC_FLOOR scales linearly up to
+# SEMANTIC_WEIGHT points (a phrase hit is 10), for the SEMANTIC_TOP_K nearest assets.
+SEMANTIC_WEIGHT = 15.0
+SEMANTIC_FLOOR = 0.3
+SEMANTIC_TOP_K = 25
+
 CSV_PATH = os.path.join(
     os.path.dirname(__file__),
     "..",
@@ -64,6 +91,7 @@ def load_content_audit(force: bool = False) -> None:
         logger.warning(f"Content audit CSV not found at {csv_path}")
         _items = []
         _loaded = True
+        _index.rebuild(_items)
         return
 
     with open(csv_path, "r", encoding="utf-8", errors="replace") as f:
@@ -84,6 +112,8 @@ def load_content_audit(force: bool = False) -> None:
     user_items = [i for i in _items if i.get("source") == "user"]
     _items = base_items + user_items
     _loaded = True
+    _index.rebuild(_items)
+    content_embeddings.load(csv_path)
     logger.info(f"Loaded {len(base_items)} content audit items from CSV, {len(user_items)} user items preserved")
 
 
@@ -131,6 +161,7 @@ def add_item(
         "audit_notes": "",
     }
     _items.append(item)
+    _index.add(item)
     logger.info(f"Added user content audit item: {asset_name}")
     return item
 
@@ -139,36 +170,16 @@ def add_item(
 # Matching helpers for Gamma slideshow integration
 # ---------------------------------------------------------------------------
 
-def _score_item(item: Dict[str, Any], keywords: List[str], audience: str = "") -> float:
-    """Score how well an item matches the given keywords and audience.
-
-    Higher score = better match.
-    """
-    score = 0.0
-    searchable = (
+def _searchable(item: Dict[str, Any]) -> str:
+    return (
         (item.get("asset_name", "") + " " + item.get("asset_summary", "") + " " + item.get("service_solution", ""))
         .lower()
     )
 
-    for kw in keywords:
-        kw_lower = kw.lower().strip()
-        if not kw_lower:
-            continue
-        # Exact phrase match worth more
-        if kw_lower in searchable:
-            score += 10.0
-        else:
-            # Check individual words
-            for word in kw_lower.split():
-                if len(word) > 2 and word in searchable:
-                    score += 2.0
-
-    # Audience match bonus
-    if audience:
-        item_audience = item.get("audience", "").strip().upper()
-        if audience.upper() in item_audience:
-            score += 5.0
 
+def _static_score(item: Dict[str, Any]) -> float:
+    """The keyword-independent part of the score (recommendation + recency)."""
+    score = 0.0
     # Prefer "Leverage" items over "Upcycle" over "Retire"
     rec = item.get("inventory_recommendations", "").strip().lower()
     if "leverage" in rec:
@@ -184,14 +195,200 @@ def _score_item(item: Dict[str, Any], keywords: List[str], audience: str = "") -
         score += 2.0
     elif year == "2024":
         score += 1.0
+    return score
 
+
+def _keyword_score(searchable: str, keywords: List[str]) -> float:
+    score = 0.0
+    for kw in keywords:
+        kw_lower = kw.lower().strip()
+        if not kw_lower:
+            continue
+        # Exact phrase match worth more
+        if kw_lower in searchable:
+            score += 10.0
+        else:
+            # Check individual words
+            for word in kw_lower.split():
+                if len(word) > 2 and word in searchable:
+                    score += 2.0
     return score
 
 
+def _audience_bonus(item_audience: str, audience: str) -> float:
+    return 5.0 if audience and audience.upper() in item_audience else 0.0
+
+
+def _score_item(item: Dict[str, Any], keywords: List[str], audience: str = "") -> float:
+    """Score how well an item matches the given keywords and audience.
+
+    Higher score = better match. Reference scorer: `_ContentIndex` computes the
+    same score from precomputed parts.
+    """
+    return (_keyword_score(_searchable(item), keywords)
+            + _audience_bonus(item.get("audience", "").strip().upper(), audience)
+            + _static_score(item))
+
+
+class _ContentIndex:
+    """Precomputed scoring inputs plus a token -> item-position posting map.
+
+    A keyword can only score on items whose searchable text contains it, and a
+    whitespace-free string is contained in the text iff it is contained in one
+    of its tokens — so each query word maps (via one scan of the vocabulary,
+    memoized) to the items worth scoring. Every other item scores only its
+    static part, whose per-audience order is precomputed.
+    """
+
+    def __init__(self) -> None:
+        self.lock = threading.RLock()
+        self.rebuild([])
+
+    def rebuild(self, items: List[Dict[str, Any]]) -> None:
+        with self.lock:
+            self.items: List[Dict[str, Any]] = []
+            self.searchable: List[str] = []
+            self.static: List[float] = []
+            self.audience: List[str] = []
+            self.postings: Dict[str, Set[int]] = {}
+            self.pos_by_id: Dict[Any, int] = {}
+            for item in items:
+                self._append(item)
+            self._invalidate()
+
+    def add(self, item: Dict[str, Any]) -> None:
+        with self.lock:
+            self._append(item)
+            self._invalidate()
+
+    def _append(self, item: Dict[str, Any]) -> None:
+        pos = len(self.items)
+        text = _searchable(item)
+        self.items.append(item)
+        self.searchable.append(text)
+        self.static.append(_static_score(item))
+        self.audience.append(item.get("audience", "").strip().upper())
+        self.pos_by_id[item.get("id")] = pos
+        for token in set(text.split()):
+            self.postings.setdefault(token, set()).add(pos)
+
+    def _invalidate(self) -> None:
+        self._containing: Dict[str, Set[int]] = {}
+        self._static_order: Dict[str, List[int]] = {}
+        self._matches: "OrderedDict[tuple, List[int]]" = OrderedDict()
+
+    # -- candidate generation ---------------------------------------------
+    def _items_containing(self, word: str) -> Set[int]:
+        """Positions whose text contains whitespace-free `word` (memoized)."""
+        hit = self._containing.get(word)
+        if hit is None:
+            hit = set()
+            for token, positions in self.postings.items():
+                if word in token:
+                    hit |= positions
+            self._containing[word] = hit
+        return hit
+
+    def candidates(self, keywords: List[str]) -> Set[int]:
+        """Every item that can get a nonzero keyword score."""
+        found: Set[int] = set()
+        for kw in keywords:
+            kw_lower = kw.lower().strip()
+            if not kw_lower:
+                continue
+            parts = kw_lower.split()
+            # Phrase: each part must occur (necessary; confirmed when scoring).
+            phrase = set(self._items_containing(parts[0]))
+            for part in parts[1:]:
+                phrase &= self._items_containing(part)
+            found |= phrase
+            for word in parts:
+                if len(word) > 2:
+                    found |= self._items_containing(word)
+        return found
+
+    def static_order(self, audience: str) -> List[int]:
+        """Positions by (static + audience) score desc, list order for ties."""
+        order = self._static_order.get(audience)
+        if order is None:
+            order = sorted(range(len(self.items)),
+                           key=lambda p: (-(self.static[p] + _audience_bonus(self.audience[p], audience)), p))
+            self._static_order[audience] = order
+        return order
+
+    # -- ranking ------------------------------------------------------------
+    @staticmethod
+    def semantic_hits(query: Optional[str]) -> List[Tuple[Any, float]]:
+        """(asset id, cosine) for the query's nearest assets ([] without an index)."""
+        if not query or not content_embeddings.available():
+            return []
+        return content_embeddings.search(query, SEMANTIC_TOP_K)
+
+    def semantic_bonus(self, hits: List[Tuple[Any, float]]) -> Dict[int, float]:
+        """position -> hybrid bonus for `semantic_hits`."""
+        bonus = {}
+        for asset_id, cosine in hits:
+            pos = self.pos_by_id.get(asset_id)
+            if pos is not None and cosine > SEMANTIC_FLOOR:
+                bonus[pos] = SEMANTIC_WEIGHT * (cosine - SEMANTIC_FLOOR) / (1.0 - SEMANTIC_FLOOR)
+        return bonus
+
+    def score(self, pos: int, keywords: List[str], audience: str,
+              bonus: Optional[Dict[int, float]] = None) -> float:
+        return (_keyword_score(self.searchable[pos], keywords)
+                + _audience_bonus(self.audience[pos], audience) + self.static[pos]
+                + (bonus or {}).get(pos, 0.0))
+
+    def top(self, keywords: List[str], audience: str, exclude: frozenset, k: int,
+            bonus: Optional[Dict[int, float]] = None) -> List[Tuple[float, int]]:
+        """The k best (score, position), ties broken by list order — the same
+        order a stable descending sort over all items gives."""
+        if exclude and len(exclude) >= len(self.items) and \
+                all(item.get("id") in exclude for item in self.items):
+            exclude = frozenset()   # everything excluded: fall back to all items
+        cands = self.candidates(keywords) | set(bonus or ())
+        scored = [(self.score(p, keywords, audience, bonus), -p) for p in cands
+                  if not exclude or self.items[p].get("id") not in exclude]
+        # Non-candidates score only their static part: take the k best of those.
+        rest = []
+        for p in self.static_order(audience):
+            if len(rest) == k:
+                break
+            if p in cands or (exclude and self.items[p].get("id") in exclude):
+                continue
+            rest.append((self.static[p] + _audience_bonus(self.audience[p], audience), -p))
+        return [(s, -neg) for s, neg in heapq.nlargest(k, scored + rest)]
+
+    def best_items(self, keywords: List[str], audience: str, exclude: frozenset, k: int,
+                   semantic_query: Optional[str] = None) -> List[Dict[str, Any]]:
+        key = (tuple(keywords), audience, exclude, k, semantic_query)
+        with self.lock:
+            hit = self._matches.get(key)
+            if hit is not None:
+                self._matches.move_to_end(key)
+                return [self.items[p] for p in hit]
+        # While the embedding model is still loading the ranking is keyword-only:
+        # serve it, but don't memoize it past the model becoming ready.
+        memoize = not (semantic_query and content_embeddings.warming())
+        hits = self.semantic_hits(semantic_query)   # may encode the query: outside the lock
+        with self.lock:
+            positions = [p for s, p in self.top(keywords, audience, exclude, k,
+                                                self.semantic_bonus(hits)) if s > 0]
+            if memoize:
+                self._matches[key] = positions
+                if len(self._matches) > MATCH_CACHE_SIZE:
+                    self._matches.popitem(last=False)
+            return [self.items[p] for p in positions]
+
+
+_index = _ContentIndex()
+
+
 def match_content(
     keywords: List[str],
     audience: str = "",
     exclude_ids: Optional[List[int]] = None,
+    semantic_query: Optional[str] = None,
 ) -> Optional[Dict[str, Any]]:
     """Find the best matching content audit item for the given keywords.
 
@@ -199,28 +396,33 @@ def match_content(
         keywords: Search terms to match against asset name, summary, and solution.
         audience: Preferred audience (e.g. "ITDM", "BDM").
         exclude_ids: Item IDs to skip (avoid duplicating across slots).
+        semantic_query: Free text for the embedding index (hybrid score); ignored
+            when no index is available.
 
     Returns:
         Best matching item dict, or None if no items loaded.
     """
-    if not _loaded:
-        load_content_audit()
+    best = top_matches(keywords, audience=audience, exclude_ids=exclude_ids, k=1,
+                       semantic_query=semantic_query)
+    return best[0] if best else None
 
-    if not _items:
-        return None
 
-    exclude_set = set(exclude_ids or [])
-    candidates = [i for i in _items if i.get("id") not in exclude_set]
-    if not candidates:
-        candidates = list(_items)
+def top_matches(
+    keywords: List[str],
+    audience: str = "",
+    exclude_ids: Optional[List[int]] = None,
+    k: int = 5,
+    semantic_query: Optional[str] = None,
+) -> List[Dict[str, Any]]:
+    """The `k` best-scoring items (score > 0), best first. See `match_content`."""
+    if not _loaded:
+        load_content_audit()
 
-    scored = [(item, _score_item(item, keywords, audience)) for item in candidates]
-    scored.sort(key=lambda x: x[1], reverse=True)
+    if not _items or k <= 0:
+        return []
 
-    best_item, best_score = scored[0]
-    if best_score <= 0:
-        return None
-    return best_item
+    return _index.best_items(list(keywords), audience, frozenset(exclude_ids or ()), k,
+                             semantic_query)
 
 
 def match_content_for_collateral(
@@ -249,8 +451,10 @@ def match_content_for_collateral(
 
     # Filter empty keywords
     keywords = [k for k in keywords if k]
+    semantic_query = " ".join(p for p in (step_description, intent_topic, industry) if p)
 
-    return match_content(keywords=keywords, audience="ITDM", exclude_ids=exclude_ids)
+    return match_content(keywords=keywords, audience="ITDM", exclude_ids=exclude_ids,
+                         semantic_query=semantic_query)
 
 
 def match_content_for_supporting_asset(
@@ -286,4 +490,5 @@ def match_content_for_supporting_asset(
 
     keywords = [k for k in keywords if k]
 
-    return match_content(keywords=keywords, audience=audience, exclude_ids=exclude_ids)
+    return match_content(keywords=keywords, audience=audience, exclude_ids=exclude_ids,
+                         semantic_query=" ".join(keywords))
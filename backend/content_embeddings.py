@@ -0,0 +1,174 @@
+"""
+Optional local embedding index for content-audit retrieval.
+
+Keyword scoring (`content_audit._score_item`) only sees shared words, so a
+"zero trust" priority never finds the "endpoint security" asset. This module
+adds a semantic signal that `content_audit` blends into the keyword score:
+
+  * the index is built OFFLINE by scripts/build_content_embeddings.py — one
+    L2-normalised row per CSV asset (name + summary + service/solution) — and
+    stored next to the V2 CSV as `<csv>.embeddings.npy` (loaded memory-mapped)
+    plus `<csv>.embeddings.json` (model id, CSV hash, row -> asset id),
+  * queries are embedded on CPU with the same sentence-transformers model,
+    loaded from the local cache only (`local_files_only=True`) — never the
+    network. `load` only maps the index; the model (seconds to build) is loaded
+    by `load_model` in the startup warmup's worker thread, or, if a search gets
+    there first, in a background thread while that search stays keyword-only —
+    never on the event loop,
+  * `search` is a cosine top-k (one mat-vec + argpartition). Deck building runs
+    the matching in a worker thread (`asyncio.to_thread`), so query encoding
+    stays off the event loop too.
+
+Everything here is optional: without numpy, sentence-transformers, the index
+files, or with a stale index (CSV changed since the build), `available()` is
+False and matching is keyword-only, exactly as before. Set
+CONTENT_EMBEDDINGS=0 to turn it off explicitly.
+"""
+import hashlib
+import json
+import logging
+import os
+import threading
+from functools import lru_cache
+from typing import Any, Dict, List, Tuple
+
+logger = logging.getLogger(__name__)
+
+ENABLED = os.getenv("CONTENT_EMBEDDINGS", "1").lower() not in ("0", "false", "no")
+MODEL_NAME = os.getenv("CONTENT_EMBED_MODEL", "sentence-transformers/all-MiniLM-L6-v2")
+
+_state: Dict[str, Any] = {"loaded": False, "matrix": None, "ids": [], "model": None,
+                          "model_failed": False, "model_loading": False}
+_lock = threading.Lock()
+_model_lock = threading.Lock()
+
+
+def index_paths(csv_path: str) -> Tuple[str, str]:
+    """(matrix .npy, metadata .json) stored next to `csv_path`."""
+    base = os.path.splitext(os.path.normpath(csv_path))[0]
+    return base + ".embeddings.npy", base + ".embeddings.json"
+
+
+def csv_digest(csv_path: str) -> str:
+    with open(csv_path, "rb") as f:
+        return hashlib.sha256(f.read()).hexdigest()
+
+
+def item_text(item: Dict[str, Any]) -> str:
+    """What gets embedded: the same fields the keyword scorer searches."""
+    return " ".join(p for p in (item.get("asset_name", ""), item.get("asset_summary", ""),
+                                item.get("service_solution", "")) if p)
+
+
+def _load_model():
+    from sentence_transformers import SentenceTransformer  # optional dependency
+    # Local cache only; never download at runtime.
+    return SentenceTransformer(MODEL_NAME, device="cpu", local_files_only=True)
+
+
+def encode(texts: List[str], model=None):
+    """L2-normalised float32 embeddings, one row per text."""
+    model = model or _state["model"] or _load_model()
+    return model.encode(texts, batch_size=32, convert_to_numpy=True,
+                        normalize_embeddings=True).astype("float32")
+
+
+def build_index(items: List[Dict[str, Any]], csv_path: str, model=None) -> str:
+    """Embed `items` and write the matrix + metadata next to `csv_path` (offline step)."""
+    import numpy as np
+
+    matrix_path, meta_path = index_paths(csv_path)
+    matrix = encode([item_text(i) for i in items], model=model)
+    np.save(matrix_path, matrix)
+    with open(meta_path, "w", encoding="utf-8") as f:
+        json.dump({"model": MODEL_NAME, "dim": int(matrix.shape[1]),
+                   "csv_sha256": csv_digest(csv_path),
+                   "ids": [i.get("id") for i in items]}, f, indent=2)
+    return matrix_path
+
+
+def load(csv_path: str) -> bool:
+    """Map the index for `csv_path` if it exists, matches the CSV and can be queried."""
+    with _lock:
+        _state.update(loaded=True, matrix=None, ids=[])
+        if not ENABLED:
+            return False
+        matrix_path, meta_path = index_paths(csv_path)
+        if not (os.path.exists(matrix_path) and os.path.exists(meta_path)):
+            return False
+        try:
+            import numpy as np
+
+            with open(meta_path, "r", encoding="utf-8") as f:
+                meta = json.load(f)
+            if meta.get("csv_sha256") != csv_digest(csv_path):
+                logger.warning("Content embeddings are stale (CSV changed since build) — keyword-only matching")
+                return False
+            matrix = np.load(matrix_path, mmap_mode="r")
+        except Exception as e:  # noqa: BLE001 — optional: fall back to keyword-only
+            logger.info(f"Content embeddings unavailable ({e}) — keyword-only matching")
+            return False
+        _state.update(matrix=matrix, ids=list(meta.get("ids") or []))
+        logger.info(f"Loaded content embeddings: {matrix.shape[0]} assets, model {meta.get('model')}")
+        return True
+
+
+def load_model() -> bool:
+    """Load the query encoder (blocking: call from a worker thread, as warmup does)."""
+    with _model_lock:
+        if _state["model"] is not None:
+            return True
+        if _state["matrix"] is None or _state["model_failed"]:
+            return False
+        try:
+            model = _load_model()
+        except Exception as e:  # noqa: BLE001 — optional: fall back to keyword-only
+            logger.info(f"Content embedding model unavailable ({e}) — keyword-only matching")
+            _state["model_failed"] = True
+            return False
+        finally:
+            _state["model_loading"] = False
+        _state["model"] = model
+        _embed_query.cache_clear()
+        return True
+
+
+def _load_model_in_background() -> None:
+    with _model_lock:
+        if _state["model_loading"] or _state["model"] is not None or _state["model_failed"]:
+            return
+        _state["model_loading"] = True
+    threading.Thread(target=load_model, name="content-embeddings-model", daemon=True).start()
+
+
+def available() -> bool:
+    return _state["matrix"] is not None and not _state["model_failed"]
+
+
+def warming() -> bool:
+    """An index is mapped but its query model isn't loaded yet, so `search`
+    returns [] for now (callers must not memoize that keyword-only result)."""
+    return available() and _state["model"] is None
+
+
+@lru_cache(maxsize=512)
+def _embed_query(text: str):
+    return encode([text])[0]
+
+
+def search(query: str, k: int = 10) -> List[Tuple[Any, float]]:
+    """Top-k (asset id, cosine) for `query`; [] when the index is unavailable."""
+    matrix = _state["matrix"]
+    if matrix is None or not query.strip():
+        return []
+    if _state["model"] is None:
+        _load_model_in_background()   # keyword-only until the model is ready
+        return []
+    import numpy as np
+
+    sims = matrix @ _embed_query(query)
+    k = min(k, sims.shape[0])
+    top = np.argpartition(-sims, k - 1)[:k]
+    top = top[np.argsort(-sims[top])]
+    ids = _state["ids"]
+    return [(ids[i], float(sims[i])) for i in top]
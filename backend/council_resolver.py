@@ -0,0 +1,271 @@
+"""
+Pre-council deterministic resolver (fast path for well-covered companies).
+
+`llm_council.run_council` used to dispatch every specialist on every job, even
+when ZoomInfo, Apollo and PDL already agree on the facts a specialist exists to
+reconcile. Before the council runs, `resolve_fields` looks at each factual field:
+
+  * multi-source agreement — two or more sources carry a value and they all agree
+    after normalization (same as `LLMValidator`'s ALL_SAME case, with a small
+    tolerance for employee counts), or
+  * known-facts match — a source value is listed for the domain in
+    `data_validator.KNOWN_COMPANY_FACTS`,
+
+and `plan_specialists` then skips the specialists whose resolvable fields are
+all resolved, or that have no input to work from (no news, no stakeholders).
+A skipped specialist's slot in the aggregator input is filled by the resolved
+values plus its other outputs (sub_industry, ticker, employee_range, ...)
+carried straight from the vendor payloads by `carried_values`; whatever no
+source carries is left to the aggregator, which sees the raw payloads anyway.
+Everything else — the conflicts, gaps and generative writers — is dispatched
+as before. The plan is reported in `_council_metadata["fast_path"]`.
+"""
+import re
+from typing import Any, Dict, List, Optional, Tuple
+
+try:
+    from worker.data_validator import KNOWN_COMPANY_FACTS
+except ImportError:
+    from data_validator import KNOWN_COMPANY_FACTS  # bare path (worker/ on sys.path)
+
+# Relative spread tolerated between employee counts that still "agree"
+# (vendors refresh headcount on different schedules).
+EMPLOYEE_COUNT_TOLERANCE = 0.05
+
+# Specialist focus -> the factual fields the fast path can resolve for it.
+RESOLVABLE_FOCUS = {
+    "industry": ("industry",),
+    "employee_count": ("employee_count",),
+    "geography": ("headquarters",),
+    "history": ("founded_year",),
+    "leadership": ("ceo",),
+    "legal": ("company_type",),
+}
+
+# Specialist focus -> every field its prompt emits (llm_council.SPECIALISTS); the
+# ones outside RESOLVABLE_FOCUS are carried from the sources when it is skipped.
+FOCUS_OUTPUT_FIELDS = {
+    "industry": ("industry", "sub_industry", "industry_keywords"),
+    "employee_count": ("employee_count", "employee_range", "headcount_trend"),
+    "geography": ("headquarters", "countries", "regions"),
+    "history": ("founded_year", "founders", "milestones"),
+    "leadership": ("ceo", "executives", "leadership_size"),
+    "legal": ("company_type", "ticker", "parent_company"),
+}
+
+# Non-resolvable output field -> (source, key) pairs, first non-empty wins
+# (ZoomInfo first, as everywhere else in the pipeline).
+CARRIED_FIELDS = {
+    "sub_industry": (("zoominfo", "sub_industry"), ("apollo", "sub_industry"), ("pdl", "sub_industry")),
+    "industry_keywords": (("apollo", "keywords"), ("pdl", "tags")),
+    "employee_range": (("zoominfo", "employee_range"), ("pdl", "size")),
+    "headcount_trend": (("zoominfo", "one_year_employee_growth"),),
+    "countries": (("zoominfo", "countries"), ("pdl", "country"), ("hunter", "country")),
+    "founders": (("zoominfo", "founders"), ("apollo", "founders"), ("pdl", "founders")),
+    "executives": (("zoominfo", "executives"),),
+    "ticker": (("zoominfo", "ticker"), ("apollo", "publicly_traded_symbol"), ("pdl", "ticker")),
+    "parent_company": (("zoominfo", "parent_company"),),
+}
+
+_US_STATES = {
+    "al": "alabama", "ak": "alaska", "az": "arizona", "ar": "arkansas", "ca": "california",
+    "co": "colorado", "ct": "connecticut", "de": "delaware", "dc": "district of columbia",
+    "fl": "florida", "ga": "georgia", "hi": "hawaii", "id": "idaho", "il": "illinois",
+    "in": "indiana", "ia": "iowa", "ks": "kansas", "ky": "kentucky", "la": "louisiana",
+    "me": "maine", "md": "maryland", "ma": "massachusetts", "mi": "michigan", "mn": "minnesota",
+    "ms": "mississippi", "mo": "missouri", "mt": "montana", "ne": "nebraska", "nv": "nevada",
+    "nh": "new hampshire", "nj": "new jersey", "nm": "new mexico", "ny": "new york",
+    "nc": "north carolina", "nd": "north dakota", "oh": "ohio", "ok": "oklahoma", "or": "oregon",
+    "pa": "pennsylvania", "ri": "rhode island", "sc": "south carolina", "sd": "south dakota",
+    "tn": "tennessee", "tx": "texas", "ut": "utah", "vt": "vermont", "va": "virginia",
+    "wa": "washington", "wv": "west virginia", "wi": "wisconsin", "wy": "wyoming",
+}
+_COUNTRIES = {
+    "us": "united states", "usa": "united states", "u s": "united states", "u s a": "united states",
+    "united states of america": "united states", "uk": "united kingdom", "u k": "united kingdom",
+    "great britain": "united kingdom", "england": "united kingdom",
+}
+
+
+def _apollo_org(apollo_data: Optional[Dict]) -> Dict:
+    if not apollo_data:
+        return {}
+    if "organization" in apollo_data:
+        return apollo_data.get("organization") or {}
+    for key in ("organizations", "accounts"):
+        if apollo_data.get(key):
+            return apollo_data[key][0] or {}
+    return {}
+
+
+def _pdl_hq(pdl: Dict) -> Optional[str]:
+    loc = pdl.get("location")
+    if isinstance(loc, dict):
+        parts = [loc.get("locality"), loc.get("region"), loc.get("country")]
+        return ", ".join(p for p in parts if p) or None
+    return loc if isinstance(loc, str) else None
+
+
+def source_values(apollo_data: Optional[Dict], pdl_data: Optional[Dict],
+                  zoominfo_data: Optional[Dict], hunter_data: Optional[Dict] = None) -> Dict[str, Dict[str, Any]]:
+    """field -> {source: raw value} for the fields the fast path can resolve."""
+    apollo = _apollo_org(apollo_data)
+    pdl = pdl_data if pdl_data and pdl_data.get("name") else {}
+    zi = zoominfo_data or {}
+    hunter = hunter_data or {}
+    apollo_hq = None
+    if apollo.get("city"):
+        apollo_hq = ", ".join(p for p in (apollo.get("city"), apollo.get("state"), apollo.get("country")) if p)
+    fields = {
+        "industry": {"zoominfo": zi.get("industry"), "apollo": apollo.get("industry"),
+                     "pdl": pdl.get("industry"), "hunter": hunter.get("industry")},
+        "employee_count": {"zoominfo": zi.get("employee_count"),
+                           "apollo": apollo.get("estimated_num_employees"),
+                           "pdl": pdl.get("employee_count")},
+        "headquarters": {"zoominfo": zi.get("headquarters"), "apollo": apollo_hq, "pdl": _pdl_hq(pdl)},
+        "founded_year": {"zoominfo": zi.get("founded_year"), "apollo": apollo.get("founded_year"),
+                         "pdl": pdl.get("founded")},
+        "ceo": {"zoominfo": zi.get("ceo"), "apollo": apollo.get("ceo") or apollo.get("ceo_name")},
+        "company_type": {"zoominfo": zi.get("company_type"), "pdl": pdl.get("type")},
+    }
+    return {f: {s: v for s, v in vals.items() if v not in (None, "", [], {})}
+            for f, vals in fields.items()}
+
+
+def carried_values(apollo_data: Optional[Dict], pdl_data: Optional[Dict],
+                   zoominfo_data: Optional[Dict], hunter_data: Optional[Dict] = None) -> Dict[str, Any]:
+    """field -> value for the CARRIED_FIELDS some source reports."""
+    pdl = dict(pdl_data) if pdl_data and pdl_data.get("name") else {}
+    if isinstance(pdl.get("location"), dict) and pdl["location"].get("country"):
+        pdl["country"] = pdl["location"]["country"]
+    by_source = {"zoominfo": zoominfo_data or {}, "apollo": _apollo_org(apollo_data),
+                 "pdl": pdl, "hunter": hunter_data or {}}
+    carried: Dict[str, Any] = {}
+    for field, keys in CARRIED_FIELDS.items():
+        for source, key in keys:
+            value = by_source[source].get(key)
+            if value not in (None, "", [], {}):
+                carried[field] = [value] if field == "countries" and isinstance(value, str) else value
+                break
+    return carried
+
+
+def _norm_text(value: Any) -> str:
+    return " ".join(re.sub(r"[^a-z0-9 ]", " ", str(value).lower().replace("&", " and ")).split())
+
+
+def _norm_country(text: str) -> str:
+    return _COUNTRIES.get(text, text)
+
+
+def _norm_hq(value: Any) -> Tuple[str, str, str]:
+    """'Austin, TX, USA' -> ('austin', 'texas', 'united states'). Two parts are
+    (city, country) when the second names a known country, else (city, region)."""
+    parts = [_norm_text(p) for p in str(value).split(",")]
+    parts = [p for p in parts if p]
+    if not parts:
+        return ("", "", "")
+    city, rest = parts[0], parts[1:]
+    region = country = ""
+    if len(rest) >= 2:
+        region, country = rest[0], rest[-1]
+    elif rest and (rest[0] in _COUNTRIES or rest[0] in _COUNTRIES.values()):
+        country = rest[0]
+    elif rest:
+        region = rest[0]
+    return (city, _US_STATES.get(region, region), _norm_country(country))
+
+
+def _as_int(value: Any) -> Optional[int]:
+    try:
+        return int(float(str(value).replace(",", "").strip()))
+    except (TypeError, ValueError):
+        return None
+
+
+def _normalizer(field: str):
+    if field == "headquarters":
+        return _norm_hq
+    if field in ("employee_count", "founded_year"):
+        return _as_int
+    return _norm_text
+
+
+def _agree(field: str, normalized: List[Any]) -> bool:
+    if any(v in (None, "", ("", "", "")) for v in normalized):
+        return False
+    if field == "employee_count":
+        lo, hi = min(normalized), max(normalized)
+        return hi <= lo * (1 + EMPLOYEE_COUNT_TOLERANCE)
+    return len(set(normalized)) == 1
+
+
+def _known_fact(domain: str, field: str, values: Dict[str, Any]) -> Optional[Tuple[str, Any]]:
+    known = KNOWN_COMPANY_FACTS.get((domain or "").lower().removeprefix("www."), {}).get(field)
+    if not known:
+        return None
+    norm = _normalizer(field)
+    accepted = {norm(k) for k in known}
+    for source, value in values.items():
+        if norm(value) in accepted:
+            return source, value
+    return None
+
+
+def resolve_fields(domain: str, values: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """field -> {"value", "sources", "reason"} for every field resolved without an LLM.
+
+    The value kept is ZoomInfo's when it is among the agreeing sources (ZoomInfo is
+    the pipeline's primary/tiebreaker source), else the first source's.
+    """
+    resolved: Dict[str, Dict[str, Any]] = {}
+    for field, by_source in values.items():
+        fact = _known_fact(domain, field, by_source)
+        if fact is not None:
+            resolved[field] = {"value": fact[1], "sources": [fact[0]], "reason": "known_fact"}
+            continue
+        if len(by_source) < 2:
+            continue
+        norm = _normalizer(field)
+        if _agree(field, [norm(v) for v in by_source.values()]):
+            winner = "zoominfo" if "zoominfo" in by_source else next(iter(by_source))
+            resolved[field] = {"value": by_source[winner], "sources": sorted(by_source),
+                               "reason": "multi_source_agreement"}
+    return resolved
+
+
+def plan_specialists(specialists: List[Dict], resolved: Dict[str, Dict[str, Any]], *,
+                     has_news: bool, has_stakeholders: bool) -> Tuple[List[Dict], List[Dict[str, str]]]:
+    """(specialists to dispatch, [{"id", "focus", "reason"}] for those skipped)."""
+    dispatch, skipped = [], []
+    for spec in specialists:
+        focus = spec["focus"]
+        fields = RESOLVABLE_FOCUS.get(focus)
+        if fields and all(f in resolved for f in fields):
+            reason = "resolved:" + ",".join(f"{f}={resolved[f]['reason']}" for f in fields)
+        elif focus == "news_intelligence" and not has_news:
+            reason = "no_input:news"
+        elif focus == "stakeholder_profiles" and not has_stakeholders:
+            reason = "no_input:stakeholders"
+        else:
+            dispatch.append(spec)
+            continue
+        skipped.append({"id": spec["id"], "focus": focus, "reason": reason})
+    return dispatch, skipped
+
+
+def resolved_analysis(spec: Dict, resolved: Dict[str, Dict[str, Any]],
+                      carried: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """Stand-in specialist result carrying the resolved values, and the other
+    outputs the sources report (`carried_values`), to the aggregator."""
+    fields = FOCUS_OUTPUT_FIELDS.get(spec["focus"], ())
+    carried = carried or {}
+    analysis = {f: resolved[f]["value"] for f in fields if f in resolved}
+    analysis.update({f: carried[f] for f in fields if f not in analysis and f in carried})
+    return {
+        "specialist_id": spec["id"],
+        "specialist_name": spec["name"],
+        "focus": spec["focus"],
+        "analysis": analysis,
+        "resolved_by": "fast_path",
+    }
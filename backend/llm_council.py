@@ -9,10 +9,22 @@ from datetime import datetime
 import json
 import os
 
+import council_resolver
+
+try:
+    from worker import metrics, tracing
+except ImportError:
+    import metrics  # bare path (worker/ on sys.path)
+    import tracing
+
 logger = logging.getLogger(__name__)
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+# Pre-council fast path (council_resolver): skip specialists whose facts the
+# sources already agree on. Set COUNCIL_FAST_PATH=0 to always run all of them.
+COUNCIL_FAST_PATH = os.getenv("COUNCIL_FAST_PATH", "1").lower() not in ("0", "false", "no")
+
 # 20 Specialist LLM Personalities
 SPECIALISTS = [
     {
@@ -588,6 +600,7 @@ ZoomInfo takes priority as the tiebreaker. Cross-reference all sources for accur
 Output ONLY valid JSON, no explanation."""
 
 
+@tracing.traced("openai.council", kind="llm")
 async def call_openai(prompt: str, system_prompt: str, model: str = "gpt-4o-mini") -> Dict[str, Any]:
     """Call OpenAI API with given prompts."""
     if not OPENAI_API_KEY:
@@ -626,6 +639,7 @@ async def call_openai(prompt: str, system_prompt: str, model: str = "gpt-4o-mini
         logger.error(f"JSON decode error: {e}")
         return {}
     except Exception as e:
+        tracing.annotate_error(e)
         logger.error(f"OpenAI API error: {e}")
         return {}
 
@@ -681,21 +695,51 @@ Analyze this data for your specialty: {specialist['focus']}
     }
 
 
-async def run_council(company_data: Dict, apollo_data: Dict, pdl_data: Dict, hunter_data: Dict = None, stakeholders_data: List[Dict] = None, news_data: Dict = None, zoominfo_data: Dict = None) -> Dict[str, Any]:
+async def run_council(company_data: Dict, apollo_data: Dict, pdl_data: Dict, hunter_data: Dict = None, stakeholders_data: List[Dict] = None, news_data: Dict = None, zoominfo_data: Dict = None, reuse_results: Optional[Dict[str, Dict]] = None) -> Dict[str, Any]:
     """
     Run the full LLM Council:
-    1. Run specialists in batches of 5 to avoid rate limits
+    0. Resolve agreed/known fields deterministically and skip the specialists
+       they cover (council_resolver; reported in _council_metadata["fast_path"])
+    1. Run the remaining specialists in batches of 5 to avoid rate limits
+       (`reuse_results`: specialist_id -> a previous run's result, used as-is
+       instead of dispatching — refresh mode, see worker/incremental_refresh.py)
     2. Aggregate results with central LLM
     """
-    logger.info(f"Starting LLM Council ({len(SPECIALISTS)} specialists) for {company_data.get('company_name')}")
+    # Step 0: Deterministic fast path — resolve fields the sources already agree
+    # on (or that match known facts) and skip the specialists they cover.
+    specialists, skipped, resolved, carried = SPECIALISTS, [], {}, {}
+    if COUNCIL_FAST_PATH:
+        resolved = council_resolver.resolve_fields(
+            company_data.get("domain", ""),
+            council_resolver.source_values(apollo_data, pdl_data, zoominfo_data, hunter_data),
+        )
+        carried = council_resolver.carried_values(apollo_data, pdl_data, zoominfo_data, hunter_data)
+        specialists, skipped = council_resolver.plan_specialists(
+            SPECIALISTS, resolved,
+            has_news=bool(news_data and news_data.get("success")),
+            has_stakeholders=bool(stakeholders_data),
+        )
+        if skipped:
+            logger.info(
+                f"Council fast path: resolved {sorted(resolved)}; skipping "
+                f"{len(skipped)} specialists ({', '.join(s['id'] for s in skipped)})"
+            )
+
+    reused = []
+    if reuse_results:
+        reused = [dict(reuse_results[s["id"]], reused=True) for s in specialists if s["id"] in reuse_results]
+        specialists = [s for s in specialists if s["id"] not in reuse_results]
+        logger.info(f"Council refresh: reusing {len(reused)} unchanged specialist analyses")
+
+    logger.info(f"Starting LLM Council ({len(specialists)}/{len(SPECIALISTS)} specialists) for {company_data.get('company_name')}")
 
     # Step 1: Run specialists in batches of 5 to avoid rate limits
-    valid_results = []
+    valid_results = list(reused)
     batch_size = 5
 
-    for i in range(0, len(SPECIALISTS), batch_size):
-        batch = SPECIALISTS[i:i + batch_size]
-        logger.info(f"Running specialist batch {i//batch_size + 1}/{(len(SPECIALISTS) + batch_size - 1)//batch_size}")
+    for i in range(0, len(specialists), batch_size):
+        batch = specialists[i:i + batch_size]
+        logger.info(f"Running specialist batch {i//batch_size + 1}/{(len(specialists) + batch_size - 1)//batch_size}")
 
         batch_tasks = [
             run_specialist(specialist, company_data, apollo_data, pdl_data, hunter_data, stakeholders_data, news_data, zoominfo_data)
@@ -711,10 +755,19 @@ async def run_council(company_data: Dict, apollo_data: Dict, pdl_data: Dict, hun
                 valid_results.append(result)
 
         # Small delay between batches to avoid rate limits
-        if i + batch_size < len(SPECIALISTS):
+        if i + batch_size < len(specialists):
             await asyncio.sleep(0.5)
 
-    logger.info(f"Completed {len(valid_results)}/{len(SPECIALISTS)} specialist analyses")
+    logger.info(f"Completed {len(valid_results) - len(reused)}/{len(specialists)} specialist analyses")
+
+    fast_path = {
+        "enabled": COUNCIL_FAST_PATH,
+        "resolved_fields": resolved,
+        "skipped_specialists": skipped,
+        "specialists_dispatched": len(specialists),
+        "specialists_reused": len(reused),
+    }
+    metrics.observe_council(len(specialists), len(skipped), len(reused))
 
     # If no specialists returned data, return empty result with metadata
     if len(valid_results) == 0:
@@ -725,14 +778,22 @@ async def run_council(company_data: Dict, apollo_data: Dict, pdl_data: Dict, hun
                 "specialists_total": len(SPECIALISTS),
                 "timestamp": datetime.utcnow().isoformat(),
                 "specialist_results": [],
-                "mode": "no_specialist_data"
+                "mode": "no_specialist_data",
+                "fast_path": fast_path,
             }
         }
 
+    # Resolved fields stand in for the skipped specialists' analyses.
+    by_id = {s["id"]: s for s in SPECIALISTS}
+    resolved_results = [
+        council_resolver.resolved_analysis(by_id[s["id"]], resolved, carried)
+        for s in skipped if s["reason"].startswith("resolved:")
+    ]
+
     # Step 2: Run aggregator
     specialist_inputs_text = "\n\n".join([
         f"=== {r['specialist_name']} ({r['focus']}) ===\n{json.dumps(r['analysis'], indent=2)}"
-        for r in valid_results
+        for r in valid_results + resolved_results
     ])
 
     news_summary_text = "No news data"
@@ -765,12 +826,17 @@ async def run_council(company_data: Dict, apollo_data: Dict, pdl_data: Dict, hun
         logger.warning("Aggregator returned no data")
         final_result = {}
 
+    # Deterministically resolved fields are authoritative over the aggregator.
+    for field, res in resolved.items():
+        final_result[field] = res["value"]
+
     # Add metadata
     final_result["_council_metadata"] = {
         "specialists_run": len(valid_results),
         "specialists_total": len(SPECIALISTS),
         "timestamp": datetime.utcnow().isoformat(),
-        "specialist_results": valid_results
+        "specialist_results": valid_results,
+        "fast_path": fast_path,
     }
 
     logger.info(f"LLM Council completed for {company_data.get('company_name')}")
@@ -1085,7 +1151,7 @@ def apply_formatting(data: Dict[str, Any]) -> Dict[str, Any]:
     return result
 
 
-async def validate_with_council(company_data: Dict, apollo_data: Dict, pdl_data: Dict, hunter_data: Dict = None, stakeholders_data: List[Dict] = None, news_data: Dict = None, zoominfo_data: Dict = None) -> Dict[str, Any]:
+async def validate_with_council(company_data: Dict, apollo_data: Dict, pdl_data: Dict, hunter_data: Dict = None, stakeholders_data: List[Dict] = None, news_data: Dict = None, zoominfo_data: Dict = None, reuse_results: Optional[Dict[str, Dict]] = None) -> Dict[str, Any]:
     """
     Main entry point for LLM Council validation.
     Returns validated, concise, fact-driven company data with expanded intelligence.
@@ -1107,7 +1173,7 @@ async def validate_with_council(company_data: Dict, apollo_data: Dict, pdl_data:
         return apply_formatting(base_data)
 
     try:
-        result = await run_council(company_data, apollo_data, pdl_data, hunter_data, stakeholders_data, news_data, zoominfo_data)
+        result = await run_council(company_data, apollo_data, pdl_data, hunter_data, stakeholders_data, news_data, zoominfo_data, reuse_results=reuse_results)
 
         # Check if council returned useful data (more than just metadata)
         useful_fields = [k for k in result.keys() if not k.startswith("_") and result[k]]
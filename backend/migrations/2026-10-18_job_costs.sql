@@ -0,0 +1,58 @@
+-- ============================================================================
+-- job_costs + rollup views — additive migration (REVIEW + APPLY)
+--
+-- WHY THIS EXISTS
+-- worker/cost_meter kept each job's API cost in process memory only; the
+-- snapshot rode along inside job_results.result, so "what did seller X spend
+-- today" or "what did this batch cost" meant scanning result JSON.
+--
+--   * job_costs — one row per finished job (production_main.persist_job_cost):
+--     seller, batch, UTC day, total and per-service USD, duration, per-stage ms
+--     (from the job's trace) and any optional steps a budget skipped.
+--   * job_cost_daily_by_seller / job_cost_daily / job_cost_by_batch — rollups.
+--     The per-seller view also seeds the tenant day budget at job start
+--     (COST_BUDGET_PER_TENANT_DAY_USD, worker/cost_budget.py).
+--   * /profile-request?estimate=1 reads the most recent job_costs rows for its
+--     p50/p90 cost and latency prediction.
+--
+-- ALL ADDITIVE: no existing table is altered or dropped.
+-- Apply via the Supabase SQL editor AFTER review.
+-- ============================================================================
+
+create table if not exists job_costs (
+    job_id         text primary key,
+    seller         text not null default '',
+    batch_id       text,
+    day            date not null,
+    domain         text,
+    total_usd      numeric(12, 4) not null default 0,
+    by_service     jsonb not null default '{}'::jsonb,   -- service -> usd
+    duration_ms    double precision,
+    stage_ms       jsonb not null default '{}'::jsonb,   -- trace stage -> ms
+    skipped_steps  text[] not null default '{}',
+    created_at     timestamptz not null default now()
+);
+
+create index if not exists job_costs_seller_day_idx on job_costs (seller, day);
+create index if not exists job_costs_batch_idx on job_costs (batch_id) where batch_id is not null;
+create index if not exists job_costs_created_idx on job_costs (created_at desc);
+
+-- Match the repo convention: RLS on + an allow-all policy.
+alter table job_costs enable row level security;
+create policy "Allow all on job_costs" on job_costs
+    for all using (true) with check (true);
+
+create or replace view job_cost_daily_by_seller as
+    select seller, day, count(*) as jobs, sum(total_usd) as total_usd,
+           avg(total_usd) as avg_usd, avg(duration_ms) as avg_duration_ms
+    from job_costs group by seller, day;
+
+create or replace view job_cost_daily as
+    select day, count(*) as jobs, sum(total_usd) as total_usd,
+           avg(total_usd) as avg_usd, avg(duration_ms) as avg_duration_ms
+    from job_costs group by day;
+
+create or replace view job_cost_by_batch as
+    select batch_id, min(day) as first_day, max(day) as last_day, count(*) as jobs,
+           sum(total_usd) as total_usd, avg(duration_ms) as avg_duration_ms
+    from job_costs where batch_id is not null group by batch_id;
@@ -0,0 +1,20 @@
+-- ============================================================================
+-- job_results domain index — additive migration (REVIEW + APPLY)
+--
+-- WHY THIS EXISTS
+-- `/profile-request` refresh mode ("refresh": true) looks up the newest
+-- completed job_results row for the request's domain
+-- (_fetch_latest_domain_result in production_main.py) and reuses the parts of
+-- it whose inputs are unchanged (worker/incremental_refresh.py). The domain
+-- lives inside the result JSON, so without this index the lookup is a full
+-- table scan.
+--
+-- Without this index refresh still works, just slower.
+--
+-- ALL ADDITIVE: no existing table is altered or dropped.
+-- Apply via the Supabase SQL editor AFTER review.
+-- ============================================================================
+
+create index if not exists job_results_domain_updated_idx
+    on job_results ((result->>'domain'), updated_at desc)
+    where status = 'completed';
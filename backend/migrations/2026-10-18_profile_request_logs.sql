@@ -0,0 +1,59 @@
+-- ============================================================================
+-- profile_request_logs + advance_profile_request — additive migration (REVIEW + APPLY)
+--
+-- WHY THIS EXISTS
+-- JobStore.logger_sink (worker/job_store.py) used to flush JobLogger entries by
+-- reading the whole profile_requests.debug_logs array and writing it back with
+-- the new entries appended, and update_progress did a SELECT then an UPDATE on
+-- every progress tick. Log writes were O(n^2) in entries over a job's life and
+-- every tick cost two round trips.
+--
+--   * profile_request_logs — append-only, one row per JobLogger entry; a flush
+--     is one bulk INSERT of its batch. profile_requests.debug_logs is no longer
+--     written (kept for rows created before this migration).
+--   * advance_profile_request — one conditional UPDATE that applies a progress
+--     update only if it does not move current_stage_seq backwards, merging the
+--     partial result into partial_results server-side. (Progress updates
+--     without a partial use a plain conditional UPDATE, no RPC needed.)
+--
+-- ALL ADDITIVE: no existing table is altered or dropped.
+-- Apply via the Supabase SQL editor AFTER review.
+-- ============================================================================
+
+create table if not exists profile_request_logs (
+    id          bigserial primary key,
+    job_id      uuid not null references profile_requests (id) on delete cascade,
+    ts          double precision not null,   -- JobLogger clock (epoch seconds)
+    stage       text,
+    step        text,
+    level       text not null default 'info',  -- info|warn|error
+    msg         text,
+    data        jsonb not null default '{}'::jsonb,
+    created_at  timestamptz not null default now()
+);
+
+create index if not exists profile_request_logs_job_ts_idx on profile_request_logs (job_id, ts);
+
+-- Match the repo convention: RLS on + an allow-all policy.
+alter table profile_request_logs enable row level security;
+create policy "Allow all on profile_request_logs" on profile_request_logs
+    for all using (true) with check (true);
+
+create or replace function advance_profile_request(
+    p_id uuid, p_seq integer, p_update jsonb, p_partial jsonb default '{}'::jsonb
+) returns boolean
+language sql as $$
+    with updated as (
+        update profile_requests set
+            current_stage     = coalesce(p_update->>'current_stage', current_stage),
+            current_step      = coalesce(p_update->>'current_step', current_step),
+            current_stage_seq = p_seq,
+            step_progress     = coalesce((p_update->>'step_progress')::numeric, step_progress),
+            status            = coalesce(p_update->>'status', status),
+            partial_results   = partial_results || coalesce(p_partial, '{}'::jsonb),
+            updated_at        = now()
+        where id = p_id and current_stage_seq <= p_seq
+        returning 1
+    )
+    select exists (select 1 from updated);
+$$;
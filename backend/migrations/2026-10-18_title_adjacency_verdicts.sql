@@ -0,0 +1,36 @@
+-- ============================================================================
+-- Title-adjacency verdict memo — additive migration (REVIEW + APPLY)
+--
+-- WHY THIS EXISTS
+-- v3.1 Stage 3 asks Claude Haiku whether a title that classify_title_proximity
+-- can't place ("SVP Digital Workplace", "Head of Enterprise Apps") belongs to a
+-- persona's functional domain. The same titles recur across thousands of
+-- companies, so worker/adjacency_memo.py keeps every verdict here, keyed by
+-- (normalized title, persona), and consults it before any LLM call. `hits`
+-- counts reuses; positive verdicts reused often enough are promoted into the
+-- deterministic classify_title_proximity fast path at load.
+--
+-- Without this table the memo still works in memory (per process) and logs a
+-- warning on load/persist.
+--
+-- ALL ADDITIVE: no existing table is altered or dropped.
+-- Apply via the Supabase SQL editor AFTER review.
+-- ============================================================================
+
+create table if not exists title_adjacency_verdicts (
+    title       text not null,              -- bi_resolver._normalize_title(title)
+    persona     text not null,              -- CIO / CTO / CFO / COO / CISO / CPO
+    verdict     boolean not null,           -- Haiku: in the persona's domain?
+    hits        integer not null default 0, -- reuses since first judged
+    updated_at  timestamptz not null default now(),
+    primary key (title, persona)
+);
+
+comment on table title_adjacency_verdicts is
+    'Memo of Haiku title-adjacency verdicts consulted before any LLM call. Written by worker/adjacency_memo.py.';
+
+-- Match the repo convention: RLS with an allow-all policy (the backend may use
+-- the anon SUPABASE_KEY).
+alter table title_adjacency_verdicts enable row level security;
+create policy "Allow all on title_adjacency_verdicts" on title_adjacency_verdicts
+    for all using (true) with check (true);
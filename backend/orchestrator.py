@@ -7,18 +7,48 @@ data points and assigns the most capable APIs for EACH INDIVIDUAL FIELD.
 
 Rule: Minimum 2 APIs per data point for data validation and completeness.
 Rule: Hunter.io is ALWAYS queried for contact/stakeholder data.
+
+Plan cache: the plan depends on the kind of company (industry, country from
+the domain TLD) and which vendor keys are configured, not on the company
+itself. Only request-time fields are used — the plan is made before any
+vendor has been queried, so firmographics such as employee count don't exist
+yet. `analyze_and_plan` looks the plan up by that feature signature
+(`plan_signature`, versioned on ORCHESTRATOR_VERSION) and never waits on the
+LLM: on a miss it returns the deterministic `rules_based_plan` and refreshes
+the signature's entry with an LLM plan in the background.
 """
 import os
+import re
 import json
+import time
+import asyncio
 import logging
-from dataclasses import dataclass, field
-from typing import Dict, List, Any, Optional
+from dataclasses import dataclass, field, replace
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 
 logger = logging.getLogger(__name__)
 
 OPENAI_API_KEY = os.getenv("OPENAI_API_KEY")
 
+# Bump when the prompt/rules change: cached plans from other versions are ignored.
+ORCHESTRATOR_VERSION = "2.0-granular"
+
+# How long an LLM plan serves its signature before a background refresh.
+PLAN_CACHE_TTL_SECONDS = float(os.getenv("ORCHESTRATOR_PLAN_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+
+# Vendor -> env vars, any of which configures it (mirrors production_main).
+API_ENV_KEYS = {
+    "apollo": ("APOLLO_API_KEY",),
+    "pdl": ("PEOPLEDATALABS_API_KEY", "PDL_API_KEY"),
+    "hunter": ("HUNTER_API_KEY",),
+    "gnews": ("GNEWS_API_KEY",),
+    "zoominfo": ("ZOOMINFO_CLIENT_ID", "ZOOMINFO_ACCESS_TOKEN", "ZOOMINFO_USERNAME"),
+}
+
+# Generic TLDs carry no country signal.
+_GENERIC_TLDS = frozenset({"com", "org", "net", "io", "co", "ai", "biz", "info", "app", "dev", "tech"})
+
 
 # GRANULAR DATA POINTS - Each individual bullet point mapped to capable APIs
 # Format: "section.field" -> [list of APIs that can provide this data]
@@ -284,7 +314,7 @@ class OrchestratorResult:
     priority_order: List[str]
     granular_assignments: Dict[str, Dict[str, List[str]]]  # Section -> Field -> APIs
     timestamp: str = field(default_factory=lambda: datetime.utcnow().isoformat())
-    orchestrator_version: str = "2.0-granular"
+    orchestrator_version: str = ORCHESTRATOR_VERSION
 
 
 def get_default_query_plan() -> OrchestratorResult:
@@ -316,6 +346,64 @@ def get_default_query_plan() -> OrchestratorResult:
     )
 
 
+def configured_apis() -> List[str]:
+    """Vendors with credentials in the environment, in API_CAPABILITIES order."""
+    return [api for api, keys in API_ENV_KEYS.items() if any(os.getenv(k) for k in keys)]
+
+
+def plan_signature(company_data: Dict[str, Any], apis: Optional[List[str]] = None) -> Tuple[str, ...]:
+    """Plan-cache key: (version, industry, country, configured APIs)."""
+    industry = " ".join(re.sub(r"[^a-z0-9]+", " ", str(company_data.get("industry") or "").lower()).split())
+    tld = str(company_data.get("domain") or "").lower().rstrip(".").rsplit(".", 1)[-1]
+    country = tld if len(tld) == 2 and tld not in _GENERIC_TLDS else "generic"
+    apis = configured_apis() if apis is None else apis
+    return (
+        ORCHESTRATOR_VERSION,
+        industry or "unknown",
+        country,
+        ",".join(sorted(apis)),
+    )
+
+
+def rules_based_plan(company_data: Dict[str, Any], apis: Optional[List[str]] = None) -> OrchestratorResult:
+    """Deterministic plan: the default field assignments, with configured vendors
+    prioritized ahead of unconfigured ones (all five are still queried)."""
+    plan = get_default_query_plan()
+    apis = configured_apis() if apis is None else apis
+    if apis:
+        plan.priority_order = ([a for a in plan.priority_order if a in apis]
+                               + [a for a in plan.priority_order if a not in apis])
+    plan.reasoning = ("Rules plan: default field assignments, configured vendors first "
+                      f"({', '.join(apis) or 'none configured'}).")
+    return plan
+
+
+class _PlanCache:
+    """signature -> (stored_at, OrchestratorResult); expired entries are still
+    served (stale-while-revalidate) but flagged for a background refresh."""
+
+    def __init__(self, ttl: float):
+        self.ttl = ttl
+        self._data: Dict[Tuple[str, ...], Tuple[float, OrchestratorResult]] = {}
+
+    def get(self, key: Tuple[str, ...]) -> Tuple[Optional[OrchestratorResult], bool]:
+        """(plan or None, fresh)."""
+        hit = self._data.get(key)
+        if hit is None:
+            return None, False
+        return hit[1], time.monotonic() - hit[0] < self.ttl
+
+    def put(self, key: Tuple[str, ...], plan: OrchestratorResult) -> None:
+        self._data[key] = (time.monotonic(), plan)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+
+_PLAN_CACHE = _PlanCache(PLAN_CACHE_TTL_SECONDS)
+_REFRESHING: Dict[Tuple[str, ...], "asyncio.Task"] = {}
+
+
 def build_orchestrator_prompt(company_data: Dict[str, Any]) -> str:
     """Build the prompt for the orchestrator LLM with GRANULAR field assignments."""
     company_name = company_data.get("company_name", "Unknown")
@@ -467,11 +555,98 @@ async def call_orchestrator_llm(prompt: str) -> Optional[Dict[str, Any]]:
         return None
 
 
+def _plan_from_llm(llm_result: Dict[str, Any]) -> OrchestratorResult:
+    """Validate an LLM plan: known APIs only, all five queried, every field assigned."""
+    apis_to_query = llm_result.get("apis_to_query", [])
+    priority_order = llm_result.get("priority_order", apis_to_query)
+    granular_assignments = llm_result.get("granular_assignments", {})
+    reasoning = llm_result.get("reasoning", "LLM-based granular selection")
+
+    # Ensure all APIs are valid
+    valid_apis = set(API_CAPABILITIES.keys())
+    apis_to_query = [api for api in apis_to_query if api in valid_apis]
+
+    # CRITICAL: Hunter.io is ALWAYS required for contact data
+    if "hunter" not in apis_to_query:
+        apis_to_query.append("hunter")
+        logger.info("Added Hunter.io to query plan (required for contacts)")
+
+    # Ensure apollo is included for org data
+    if "apollo" not in apis_to_query:
+        apis_to_query.append("apollo")
+
+    # Ensure gnews is included for news/signals
+    if "gnews" not in apis_to_query:
+        apis_to_query.append("gnews")
+
+    # Ensure pdl is included for technographics
+    if "pdl" not in apis_to_query:
+        apis_to_query.append("pdl")
+
+    # Ensure zoominfo is included for intent/scoops
+    if "zoominfo" not in apis_to_query:
+        apis_to_query.append("zoominfo")
+
+    # Build flat mapping from granular assignments
+    flat_mapping = {}
+    for section, fields in granular_assignments.items():
+        for field_name, apis in fields.items():
+            flat_mapping[f"{section}.{field_name}"] = apis
+
+    # Fill in any missing fields from default
+    for full_key, default_apis in GRANULAR_DATA_POINTS.items():
+        if full_key not in flat_mapping:
+            flat_mapping[full_key] = default_apis[:2]
+            section, field_name = full_key.split(".", 1)
+            if section not in granular_assignments:
+                granular_assignments[section] = {}
+            granular_assignments[section][field_name] = default_apis[:2]
+
+    return OrchestratorResult(
+        apis_to_query=apis_to_query,
+        data_point_api_mapping=flat_mapping,
+        reasoning=reasoning,
+        priority_order=priority_order if priority_order else apis_to_query,
+        granular_assignments=granular_assignments
+    )
+
+
+async def refresh_plan(company_data: Dict[str, Any], signature: Tuple[str, ...]) -> Optional[OrchestratorResult]:
+    """Ask the LLM for a plan and store it under `signature` (None if unavailable)."""
+    llm_result = await call_orchestrator_llm(build_orchestrator_prompt(company_data))
+    if not llm_result:
+        return None
+    try:
+        plan = _plan_from_llm(llm_result)
+    except Exception as e:
+        logger.error(f"Error parsing orchestrator result: {e}")
+        return None
+    _PLAN_CACHE.put(signature, plan)
+    logger.info(f"Orchestrator plan cached for signature {signature}")
+    return plan
+
+
+def _schedule_refresh(company_data: Dict[str, Any], signature: Tuple[str, ...]) -> None:
+    """Fire-and-forget LLM refresh for `signature` (one in flight per signature)."""
+    if not OPENAI_API_KEY or signature in _REFRESHING:
+        return
+    try:
+        task = asyncio.get_running_loop().create_task(refresh_plan(dict(company_data), signature))
+    except RuntimeError:  # no running loop
+        return
+    _REFRESHING[signature] = task
+    task.add_done_callback(lambda _t: _REFRESHING.pop(signature, None))
+
+
 async def analyze_and_plan(company_data: Dict[str, Any]) -> OrchestratorResult:
     """
     Analyze required data points and create an intelligent API query plan.
     Now with GRANULAR field-level assignments.
 
+    Served from the plan cache by feature signature; on a miss (or a stale
+    entry) the rules plan (or the stale plan) is returned immediately and the
+    LLM refresh runs in the background — jobs never wait on the LLM.
+
     Args:
         company_data: Dictionary with company_name, domain, and optional industry
 
@@ -483,72 +658,17 @@ async def analyze_and_plan(company_data: Dict[str, Any]) -> OrchestratorResult:
         logger.warning("Empty company data, using default plan")
         return get_default_query_plan()
 
-    # Build prompt and call LLM
-    prompt = build_orchestrator_prompt(company_data)
-    llm_result = await call_orchestrator_llm(prompt)
-
-    if not llm_result:
-        logger.info("Using default query plan (LLM unavailable)")
-        return get_default_query_plan()
-
-    try:
-        # Validate and extract results
-        apis_to_query = llm_result.get("apis_to_query", [])
-        priority_order = llm_result.get("priority_order", apis_to_query)
-        granular_assignments = llm_result.get("granular_assignments", {})
-        reasoning = llm_result.get("reasoning", "LLM-based granular selection")
-
-        # Ensure all APIs are valid
-        valid_apis = set(API_CAPABILITIES.keys())
-        apis_to_query = [api for api in apis_to_query if api in valid_apis]
-
-        # CRITICAL: Hunter.io is ALWAYS required for contact data
-        if "hunter" not in apis_to_query:
-            apis_to_query.append("hunter")
-            logger.info("Added Hunter.io to query plan (required for contacts)")
-
-        # Ensure apollo is included for org data
-        if "apollo" not in apis_to_query:
-            apis_to_query.append("apollo")
-
-        # Ensure gnews is included for news/signals
-        if "gnews" not in apis_to_query:
-            apis_to_query.append("gnews")
-
-        # Ensure pdl is included for technographics
-        if "pdl" not in apis_to_query:
-            apis_to_query.append("pdl")
-
-        # Ensure zoominfo is included for intent/scoops
-        if "zoominfo" not in apis_to_query:
-            apis_to_query.append("zoominfo")
-
-        # Build flat mapping from granular assignments
-        flat_mapping = {}
-        for section, fields in granular_assignments.items():
-            for field_name, apis in fields.items():
-                flat_mapping[f"{section}.{field_name}"] = apis
-
-        # Fill in any missing fields from default
-        for full_key, default_apis in GRANULAR_DATA_POINTS.items():
-            if full_key not in flat_mapping:
-                flat_mapping[full_key] = default_apis[:2]
-                section, field_name = full_key.split(".", 1)
-                if section not in granular_assignments:
-                    granular_assignments[section] = {}
-                granular_assignments[section][field_name] = default_apis[:2]
-
-        return OrchestratorResult(
-            apis_to_query=apis_to_query,
-            data_point_api_mapping=flat_mapping,
-            reasoning=reasoning,
-            priority_order=priority_order if priority_order else apis_to_query,
-            granular_assignments=granular_assignments
-        )
-
-    except Exception as e:
-        logger.error(f"Error parsing orchestrator result: {e}")
-        return get_default_query_plan()
+    apis = configured_apis()
+    signature = plan_signature(company_data, apis)
+    cached, fresh = _PLAN_CACHE.get(signature)
+    if not fresh:
+        _schedule_refresh(company_data, signature)
+    if cached is not None:
+        return replace(cached, timestamp=datetime.utcnow().isoformat(),
+                       reasoning=f"[cached plan] {cached.reasoning}")
+
+    logger.info("Using rules-based query plan (no cached LLM plan for this signature)")
+    return rules_based_plan(company_data, apis)
 
 
 def should_query_api(api_name: str, query_plan: OrchestratorResult) -> bool:
@@ -2,7 +2,7 @@
 Production FastAPI application with real data sources.
 Uses Apollo.io, PeopleDataLabs, LLM Council validation, and Gamma slideshow generation.
 """
-from fastapi import FastAPI, HTTPException, status, BackgroundTasks
+from fastapi import FastAPI, HTTPException, Request, status, BackgroundTasks
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel, Field
 from typing import Optional, Dict, List, Any
@@ -18,21 +18,10 @@ from dotenv import load_dotenv
 # Load environment variables from .env file
 load_dotenv()
 
-# Import LLM Council for 20-specialist validation
-from llm_council import validate_with_council, SPECIALISTS
-
-# Import Orchestrator for intelligent API routing
-from orchestrator import analyze_and_plan, OrchestratorResult, should_query_api
-
-# Import Data Validator for pre-LLM fact-checking
-from worker.data_validator import DataValidator, get_validator
-
-# Import Content Audit module for HP asset matching
-from content_audit import (
-    load_content_audit,
-    get_all_items as get_content_audit_items,
-    add_item as add_content_audit_item,
-)
+# The council, orchestrator, data validator and content audit are imported on
+# first use (see the _*_module helpers below) and preloaded in the background
+# by the startup warmup, so importing this module — and binding the port —
+# does not wait on them.
 
 # Configure logging
 logging.basicConfig(
@@ -42,8 +31,87 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
-# In-memory job storage (in production, use Redis or database)
-jobs_store: Dict[str, dict] = {}
+# Import the bounded job cache backing jobs_store
+from worker.job_cache import BoundedJobStore
+# Per-job span tracing (stdlib-only; job id from cost_meter.current_job_id)
+from worker import tracing
+# Process-wide Prometheus metrics (fed by tracing spans; served by /metrics)
+from worker import metrics
+
+
+def _llm_council_module():
+    """LLM Council (20-specialist validation), imported on first use."""
+    import llm_council
+    return llm_council
+
+
+def _orchestrator_module():
+    """Orchestrator (intelligent API routing), imported on first use."""
+    import orchestrator
+    return orchestrator
+
+
+def _data_validator_module():
+    """Dual-path import of the pre-LLM fact-checker (KNOWN_COMPANY_FACTS)."""
+    try:
+        from worker import data_validator as dv
+    except Exception:  # noqa: BLE001
+        import data_validator as dv  # bare path
+    return dv
+
+
+def _content_audit_module():
+    """HP content-audit matcher; its CSV loads on first use or during warmup."""
+    import content_audit
+    return content_audit
+
+
+def _debug_payload_module():
+    """Debug-mode payload builder (routers/debug_payload.py), imported on first use."""
+    from routers import debug_payload
+    return debug_payload
+
+
+def _warmup_module():
+    """Dual-path import of the stdlib-only background warmup."""
+    try:
+        from worker import warmup
+    except Exception:  # noqa: BLE001
+        import warmup  # bare path
+    return warmup
+
+
+# In-memory job storage: bounded LRU/TTL cache with approximate byte accounting.
+# Finished jobs are evicted under pressure, spilled to the durable job_results
+# table by the maintenance sweep, and rehydrated from there on access.
+jobs_store = BoundedJobStore(
+    max_jobs=int(os.getenv("JOBS_STORE_MAX_JOBS", "200")),
+    ttl_seconds=float(os.getenv("JOBS_STORE_TTL_SECONDS", str(6 * 3600))),
+    max_bytes=int(float(os.getenv("JOBS_STORE_MAX_MB", "512")) * 1024 * 1024),
+)
+
+
+
+def _job_store_samples():
+    """Scrape-time job gauges: queue depth by status, resident/in-flight, evictions."""
+    by_status: Dict[str, int] = {}
+    for _, job in jobs_store.items():
+        st = job.get("status") or "unknown"
+        by_status[st] = by_status.get(st, 0) + 1
+    for st, n in sorted(by_status.items()):
+        yield "rad_jobs", {"status": st}, n
+    stats = jobs_store.stats()
+    yield "rad_jobs_in_flight", {}, stats["in_flight_jobs"]
+    yield "rad_jobs_resident_bytes", {}, stats["estimated_bytes"]
+    yield "rad_jobs_evictions", {}, stats["evictions"]
+
+
+metrics.register_collector(_job_store_samples, {
+    "rad_jobs": "Jobs held in memory, by status (pending = queue depth).",
+    "rad_jobs_in_flight": "Jobs not yet completed or failed.",
+    "rad_jobs_resident_bytes": "Approximate bytes held by the in-memory job store.",
+    "rad_jobs_evictions": "Jobs evicted from the in-memory job store since start.",
+})
 
 # v3.1 runtime diagnostics — last flag-gated pipeline error (surfaced via /debug-v31)
 _v31_diag: Dict[str, Any] = {"last_error": None, "last_traceback": None, "last_job": None}
@@ -270,6 +338,52 @@ app.add_middleware(
 )
 
 
+class _CompressionMiddleware:
+    """Compress responses: brotli when brotli-asgi is installed (gzip fallback
+    for clients that don't accept br), plain gzip otherwise. SSE streams
+    (/jobs/{id}/events) pass through untouched — a compressor would buffer the
+    small event frames instead of flushing them to the client."""
+
+    def __init__(self, app, minimum_size: int = 1024):
+        self.app = app
+        try:
+            from brotli_asgi import BrotliMiddleware
+            self.compressed = BrotliMiddleware(app, minimum_size=minimum_size, gzip_fallback=True)
+        except Exception:  # noqa: BLE001 — optional dependency
+            from starlette.middleware.gzip import GZipMiddleware
+            self.compressed = GZipMiddleware(app, minimum_size=minimum_size)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope.get("path", "").endswith("/events"):
+            await self.app(scope, receive, send)
+        else:
+            await self.compressed(scope, receive, send)
+
+
+app.add_middleware(_CompressionMiddleware)
+
+# Side routes live in routers/ (health, content audit, debug); the pipeline
+# and job routes below stay here.
+from routers import content_audit as _content_audit_routes, debug as _debug_routes, health as _health_routes
+
+app.include_router(_health_routes.router)
+app.include_router(_content_audit_routes.router)
+app.include_router(_debug_routes.router)
+
+# Names that moved out with the routers, resolved on first access (PEP 562)
+_LAZY_ATTRS = {
+    "generate_debug_data": ("routers.debug_payload", "generate_debug_data"),
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_ATTRS:
+        import importlib
+        module, attr = _LAZY_ATTRS[name]
+        return getattr(importlib.import_module(module), attr)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 # Models
 class CompanyProfileRequest(BaseModel):
     company_name: str = Field(..., min_length=1, max_length=500)
@@ -278,6 +392,8 @@ class CompanyProfileRequest(BaseModel):
     requested_by: str = Field(..., description="Email of requester")
     salesperson_name: Optional[str] = Field(None, max_length=200, description="Name of the salesperson")
     canada_only: bool = Field(False, description="Restrict contact discovery to Canada (no US/global fallback)")
+    refresh: bool = Field(False, description="Incremental re-profile: reuse the domain's last completed run wherever its inputs are unchanged")
+    batch_id: Optional[str] = Field(None, max_length=100, description="Groups requests submitted together (cost rollups per batch)")
 
 
 class ProfileRequestResponse(BaseModel):
@@ -344,92 +460,6 @@ logger.info(f"  GAMMA_API_KEY: {'SET' if GAMMA_API_KEY else 'MISSING'}")
 logger.info("=" * 50)
 
 
-# ============================================================================
-# Content Audit endpoints
-# ============================================================================
-
-# Load content audit CSV on startup
-load_content_audit()
-
-
-@app.get("/api/content-audit", tags=["Content Audit"])
-async def list_content_audit():
-    """Return all HP content audit items (CSV + user-added)."""
-    items = get_content_audit_items()
-    return {"items": items, "total": len(items)}
-
-
-class ContentAuditItemCreate(BaseModel):
-    """Request body for adding a content audit item."""
-    asset_name: str = Field(..., min_length=1)
-    sp_link: str = Field(..., min_length=1)
-    asset_summary: str = Field(default="")
-    industry: str = Field(default="")
-    service_solution: str = Field(default="")
-    audience: str = Field(default="")
-    format_type: str = Field(default="")
-
-
-@app.post("/api/content-audit", tags=["Content Audit"], status_code=status.HTTP_201_CREATED)
-async def create_content_audit_item(body: ContentAuditItemCreate):
-    """Add a user-defined content audit item."""
-    item = add_content_audit_item(
-        asset_name=body.asset_name,
-        sp_link=body.sp_link,
-        asset_summary=body.asset_summary,
-        industry=body.industry,
-        service_solution=body.service_solution,
-        audience=body.audience,
-        format_type=body.format_type,
-    )
-    return {"item": item}
-
-
-# Health check
-@app.get("/health", tags=["Health"])
-async def health_check():
-    """Health check endpoint with API status."""
-    api_status = {
-        "apollo": "configured" if APOLLO_API_KEY else "missing",
-        "peopledatalabs": "configured" if PEOPLEDATALABS_API_KEY else "missing",
-        "hunter": "configured" if HUNTER_API_KEY else "missing",
-        "openai": "configured" if OPENAI_API_KEY else "missing",
-        "supabase": "configured" if SUPABASE_URL and SUPABASE_KEY else "missing",
-        "gamma": "configured" if GAMMA_API_KEY else "missing",
-        "zoominfo": "configured" if (ZOOMINFO_USERNAME and ZOOMINFO_PASSWORD) or ZOOMINFO_REFRESH_TOKEN or (ZOOMINFO_CLIENT_ID and ZOOMINFO_CLIENT_SECRET) or ZOOMINFO_ACCESS_TOKEN else "missing",
-    }
-
-    all_configured = all(v == "configured" for v in api_status.values())
-
-    return {
-        "status": "healthy",
-        "service": "RADTest Backend Production",
-        "mode": "production" if all_configured else "degraded",
-        "api_status": api_status,
-        "timestamp": datetime.utcnow().isoformat(),
-        "deploy_version": "gamma-template-v3",
-    }
-
-
-# Root endpoint
-@app.get("/", tags=["Info"])
-async def root():
-    """Root endpoint."""
-    return {
-        "service": "RADTest Backend Production",
-        "version": "2.0.0",
-        "mode": "production",
-        "data_sources": ["Apollo.io", "PeopleDataLabs", "OpenAI", "Gamma API"],
-        "endpoints": {
-            "health": "/health",
-            "debug_env": "/debug-env",
-            "profile_request": "/profile-request",
-            "job_status": "/job-status/{job_id}",
-            "docs": "/docs"
-        }
-    }
-
-
 # OAuth2 callback — displays authorization code for one-time token exchange
 from fastapi.responses import HTMLResponse
 
@@ -449,179 +479,6 @@ async def zoominfo_oauth_callback(code: str = None, state: str = None, error: st
     </body></html>"""
 
 
-# Debug endpoint to check env vars at runtime
-@app.get("/debug-env", tags=["Debug"])
-async def debug_env():
-    """Debug endpoint to check environment variable status at runtime."""
-    def mask(val):
-        if not val:
-            return "NOT SET"
-        if len(val) <= 8:
-            return f"SET ({len(val)} chars)"
-        return f"{val[:4]}...{val[-4:]} ({len(val)} chars)"
-
-    zi_auth_method = "none"
-    if os.getenv("ZOOMINFO_USERNAME") and os.getenv("ZOOMINFO_PASSWORD"):
-        zi_auth_method = "username+password (auto-refresh)"
-    elif os.getenv("ZOOMINFO_REFRESH_TOKEN"):
-        zi_auth_method = "refresh_token (Okta OAuth)"
-    elif os.getenv("ZOOMINFO_ACCESS_TOKEN"):
-        zi_auth_method = "static token (expires ~1h — set USERNAME+PASSWORD for auto-refresh)"
-
-    return {
-        "runtime_getenv": {
-            "APOLLO_API_KEY": mask(os.getenv("APOLLO_API_KEY")),
-            "PEOPLEDATALABS_API_KEY": mask(os.getenv("PEOPLEDATALABS_API_KEY")),
-            "HUNTER_API_KEY": mask(os.getenv("HUNTER_API_KEY")),
-            "OPENAI_API_KEY": mask(os.getenv("OPENAI_API_KEY")),
-            "GNEWS_API_KEY": mask(os.getenv("GNEWS_API_KEY")),
-            "SUPABASE_URL": mask(os.getenv("SUPABASE_URL")),
-            "SUPABASE_KEY": mask(os.getenv("SUPABASE_KEY")),
-            "GAMMA_API_KEY": mask(os.getenv("GAMMA_API_KEY")),
-            "ZOOMINFO_USERNAME": mask(os.getenv("ZOOMINFO_USERNAME")),
-            "ZOOMINFO_PASSWORD": mask(os.getenv("ZOOMINFO_PASSWORD")),
-            "ZOOMINFO_ACCESS_TOKEN": mask(os.getenv("ZOOMINFO_ACCESS_TOKEN")),
-            "ZOOMINFO_REFRESH_TOKEN": mask(os.getenv("ZOOMINFO_REFRESH_TOKEN")),
-            "ZOOMINFO_CLIENT_ID": mask(os.getenv("ZOOMINFO_CLIENT_ID")),
-            "ZOOMINFO_CLIENT_SECRET": mask(os.getenv("ZOOMINFO_CLIENT_SECRET")),
-        },
-        "zoominfo_auth_method": zi_auth_method,
-        # Supabase project host/ref the backend actually talks to (NOT a secret —
-        # the ref appears in every client URL). Used to confirm backend/frontend
-        # point at the same project.
-        "supabase_host": (os.getenv("SUPABASE_URL", "") or "").replace("https://", "").split(".")[0] or "NOT SET",
-        "note": "All values checked at request time. NOT SET = missing from Render environment variables."
-    }
-
-
-@app.get("/debug-zoominfo-auth", tags=["Debug"])
-async def debug_zoominfo_auth(live: bool = False):
-    """
-    ZoomInfo auth health check — diagnoses the "token expires daily" problem.
-
-    Reports which auth strategy is active, whether the rotating refresh_token is
-    being durably persisted to the Supabase `zi_auth_tokens` table (the linchpin
-    for surviving Render restarts), and the static-token fallback state.
-
-    Pass ?live=true to actually perform a token refresh and report the result +
-    expiry — this consumes/rotates the refresh_token, so use sparingly.
-    """
-    from worker.zoominfo_client import ZoomInfoClient
-
-    out: Dict[str, Any] = {}
-    try:
-        client = ZoomInfoClient()
-        out["auto_auth"] = client._auto_auth
-        out["strategy"] = (
-            "1. OAuth2 refresh_token grant (auto-refresh, durable)"
-            if client._auto_auth
-            else "2. static ZOOMINFO_ACCESS_TOKEN (24h, manual replace)"
-            if client._static_token
-            else "none configured"
-        )
-        out["has_client_id"] = bool(client._client_id)
-        out["has_client_secret"] = bool(client._client_secret)
-        out["has_refresh_token_seed"] = bool(client._refresh_token)
-        out["has_static_access_token"] = bool(client._static_token)
-
-        # Is the rotated token being persisted? (the daily-expiry root cause)
-        persisted = await client._load_persisted_refresh_token()
-        if persisted is None:
-            out["persisted_refresh_token"] = (
-                "NOT FOUND — Supabase 'zi_auth_tokens' table is missing or empty. "
-                "Apply migration backend/migrations/2026-06-24_zi_auth_tokens.sql, "
-                "then the rotated token will survive restarts."
-            )
-            out["persistence_healthy"] = False
-        else:
-            seed = client._refresh_token or ""
-            out["persisted_refresh_token"] = (
-                f"FOUND ({persisted[:6]}…, {len(persisted)} chars)"
-            )
-            out["persisted_differs_from_seed"] = persisted != seed
-            out["persistence_healthy"] = True
-
-        if live:
-            try:
-                await client._ensure_valid_token()
-                import time as _t
-                ttl = int(max(0, client._token_expires_at - _t.time()))
-                out["live_refresh"] = "OK"
-                out["access_token_present"] = bool(client.access_token)
-                out["expires_in_seconds"] = ttl
-                out["expires_in_hours"] = round(ttl / 3600, 1)
-            except Exception as e:  # noqa: BLE001
-                out["live_refresh"] = f"FAILED: {e}"
-    except Exception as e:  # noqa: BLE001
-        out["error"] = str(e)
-
-    # Raw probe: surface the actual exception from a direct supabase-py read so
-    # we can see WHY persistence fails (vs. the swallowed debug-level log).
-    try:
-        from supabase import create_client as _cc
-        import supabase as _sb_mod
-        _url = os.getenv("SUPABASE_URL")
-        _key = os.getenv("SUPABASE_KEY") or os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-        out["supabase_probe"] = {
-            "py_version": getattr(_sb_mod, "__version__", "unknown"),
-            "url_present": bool(_url), "key_present": bool(_key),
-        }
-        sb = _cc(_url, _key)
-        r = sb.table("zi_auth_tokens").select("*").execute()
-        out["supabase_probe"]["read_ok"] = True
-        out["supabase_probe"]["rows"] = len(r.data or [])
-    except Exception as e:  # noqa: BLE001
-        out.setdefault("supabase_probe", {})["read_ok"] = False
-        out["supabase_probe"]["error"] = f"{type(e).__name__}: {str(e)[:400]}"
-
-    out["verdict"] = (
-        "HEALTHY — refresh_token auto-rotates and persists across restarts."
-        if out.get("auto_auth") and out.get("persistence_healthy")
-        else "AT RISK — rotated token will not survive restarts; auth will lapse "
-             "to the 24h static token. See migration + runbook."
-    )
-    return out
-
-
-@app.get("/debug-v31", tags=["Debug"])
-async def debug_v31():
-    """Diagnose why the v3.1 flag-gated pipeline is/ isn't engaging.
-    If this endpoint 404s, the latest code has NOT deployed yet."""
-    result = {
-        "marker": "v31-diag-3-contactfloor-jobrecovery",
-        "USE_V31_PIPELINE": os.getenv("USE_V31_PIPELINE", "NOT SET"),
-        "flag_active": os.getenv("USE_V31_PIPELINE", "").strip().lower() == "true",
-        "ANTHROPIC_API_KEY_set": bool(os.getenv("ANTHROPIC_API_KEY")),
-        "SUPABASE_URL_set": bool(os.getenv("SUPABASE_URL")),
-        "SUPABASE_KEY_len": len(os.getenv("SUPABASE_KEY", "")),
-    }
-    try:
-        from worker.pipeline_v31_hook import run_v31_pipeline  # noqa: F401
-        result["v31_hook_import"] = "ok"
-    except Exception as e:
-        result["v31_hook_import"] = f"FAIL: {type(e).__name__}: {e}"
-    try:
-        import pptx
-        result["python_pptx"] = getattr(pptx, "__version__", "ok")
-    except Exception as e:
-        result["python_pptx"] = f"FAIL: {type(e).__name__}: {e}"
-    try:
-        import httpx as _httpx
-        base = os.getenv("SUPABASE_URL", "").rstrip("/")
-        bucket = os.getenv("SUPABASE_STORAGE_BUCKET_DECKS", "decks")
-        url = f"{base}/storage/v1/object/public/{bucket}/master-template.pptx"
-        async with _httpx.AsyncClient(timeout=15) as c:
-            r = await c.get(url, headers={"Range": "bytes=0-0"})
-        result["master_template_http"] = r.status_code
-    except Exception as e:
-        result["master_template_http"] = f"FAIL: {type(e).__name__}: {e}"
-    # Last runtime v3.1 failure (if any job fell back to Gamma)
-    result["last_v31_error"] = _v31_diag.get("last_error")
-    result["last_v31_traceback"] = _v31_diag.get("last_traceback")
-    result["last_v31_job"] = _v31_diag.get("last_job")
-    return result
-
-
 def _build_news_intelligence_section(validated_data: dict, news_data: Optional[dict]) -> Optional[dict]:
     """Build news intelligence section from council-aggregated data and raw news_data."""
     # Check if we have news data from either source
@@ -981,6 +838,7 @@ def build_buying_signals(validated_data: dict) -> Optional[dict]:
     }
 
 
+@tracing.traced("openai.chat", kind="llm")
 async def _call_openai_json(prompt: str, system_prompt: str = "Output only valid JSON.") -> dict:
     """Call OpenAI and parse JSON response. Returns None on failure."""
     if not OPENAI_API_KEY:
@@ -1004,6 +862,7 @@ async def _call_openai_json(prompt: str, system_prompt: str = "Output only valid
                     "response_format": {"type": "json_object"}
                 }
             )
+            tracing.annotate_status(response.status_code)
             if response.status_code == 200:
                 data = response.json()
                 content = data["choices"][0]["message"]["content"]
@@ -1012,60 +871,50 @@ async def _call_openai_json(prompt: str, system_prompt: str = "Output only valid
                 logger.warning(f"OpenAI API error: {response.status_code}")
                 return None
     except Exception as e:
+        tracing.annotate_error(e)
         logger.error(f"OpenAI call failed: {e}")
         return None
 
 
+# Step 2.83: qualified contacts per fact-check prompt; chunks run concurrently.
+FACT_CHECK_CHUNK_SIZE = int(os.getenv("FACT_CHECK_CHUNK_SIZE", "25"))
+
+
+def _contact_fact_check_module():
+    """Dual-path import of the stdlib-only step 2.83 rule/remap helpers."""
+    try:
+        from worker import contact_fact_check as fc
+    except Exception:  # noqa: BLE001
+        import contact_fact_check as fc  # bare path
+    return fc
+
+
+@tracing.traced("fact_check_contacts", kind="internal")
 async def fact_check_contacts(company_name: str, domain: str, contacts: list) -> list:
     """
     Contact validation with strict filtering rules + LLM employment verification.
 
-    Ground rules (applied BEFORE LLM):
+    Ground rules (applied BEFORE LLM, see contact_fact_check.HARD_RULES):
       (a) No LinkedIn → omit
       (b) LinkedIn present but no phone AND no email → omit
     Then LLM validates remaining contacts:
       (c) Check LinkedIn to verify they are a current decision maker at the company
 
+    Large lists are split into FACT_CHECK_CHUNK_SIZE-contact prompts validated
+    concurrently; verdicts map back by a stable per-contact id.
+
     Returns contacts with added fact_check_score and fact_check_notes.
     Filters out contacts with score < 0.15.
     """
     if not contacts:
         return []
 
-    # ── Pre-LLM hard filters ──────────────────────────────────────────────
-    qualified = []
-    filtered_no_linkedin = 0
-    filtered_no_contact_info = 0
-
-    for contact in contacts:
-        linkedin = contact.get("linkedin_url") or contact.get("linkedin") or ""
-        has_phone = bool(
-            contact.get("phone") or contact.get("direct_phone")
-            or contact.get("mobile_phone") or contact.get("company_phone")
-        )
-        has_email = bool(contact.get("email"))
-
-        # Rule (a): LinkedIn is mandatory
-        if not linkedin:
-            contact["fact_check_score"] = 0.0
-            contact["fact_check_notes"] = "Filtered: no LinkedIn URL"
-            filtered_no_linkedin += 1
-            logger.info(
-                f"FILTERED (no LinkedIn): {contact.get('name')} — {contact.get('title')}"
-            )
-            continue
-
-        # Rule (b): Must have at least one of phone or email
-        if not has_phone and not has_email:
-            contact["fact_check_score"] = 0.0
-            contact["fact_check_notes"] = "Filtered: has LinkedIn but no phone or email"
-            filtered_no_contact_info += 1
-            logger.info(
-                f"FILTERED (no phone/email): {contact.get('name')} — {contact.get('title')}"
-            )
-            continue
+    fc = _contact_fact_check_module()
 
-        qualified.append(contact)
+    # ── Pre-LLM hard filters ──────────────────────────────────────────────
+    qualified, rejected = fc.apply_hard_rules(contacts)
+    filtered_no_linkedin = rejected["no_linkedin"]
+    filtered_no_contact_info = rejected["no_contact_info"]
 
     logger.info(
         f"Pre-LLM filter: {len(qualified)}/{len(contacts)} qualified "
@@ -1077,17 +926,17 @@ async def fact_check_contacts(company_name: str, domain: str, contacts: list) ->
         return []
 
     # ── LLM validation: verify current employment + decision maker role ───
-    contact_list = []
-    for c in qualified:
-        linkedin = c.get("linkedin_url") or c.get("linkedin") or ""
-        contact_list.append({
-            "name": c.get("name", ""),
-            "title": c.get("title", ""),
-            "linkedin_url": linkedin,
-            "email": c.get("email", ""),
-        })
+    ided = fc.assign_ids(qualified)
+    system_prompt = (
+        f"You are a corporate contact verification system for {company_name}. "
+        "Validate that contacts CURRENTLY work at this company as decision makers. "
+        "Use LinkedIn URLs to confirm identity and current employment. "
+        "Be accurate — flag obvious mismatches but don't over-filter legitimate employees."
+    )
 
-    prompt = f"""Validate these contacts for {company_name} ({domain}).
+    def _prompt(chunk: list) -> str:
+        contact_list = [fc.prompt_row(cid, c) for cid, c in chunk]
+        return f"""Validate these contacts for {company_name} ({domain}).
 
 CRITICAL: For each contact, verify TWO things:
 1. They are a CURRENT employee of {company_name} (not former, not at a different company)
@@ -1105,10 +954,10 @@ Red flags to check:
 Contacts to validate:
 {json.dumps(contact_list, indent=2)}
 
-Output JSON:
+Output JSON (one entry per contact, echoing its "id"):
 {{
     "contacts": [
-        {{"name": "...", "fact_check_score": 0.0-1.0, "fact_check_notes": "brief explanation"}}
+        {{"id": "...", "name": "...", "fact_check_score": 0.0-1.0, "fact_check_notes": "brief explanation"}}
     ]
 }}
 
@@ -1118,58 +967,34 @@ Scoring guide:
 - 0.4-0.7: Uncertain — title is ambiguous or not clearly a decision maker
 - 0.0-0.3: Not a current employee, not a decision maker, or works at different company"""
 
-    result = await _call_openai_json(
-        prompt,
-        f"You are a corporate contact verification system for {company_name}. "
-        "Validate that contacts CURRENTLY work at this company as decision makers. "
-        "Use LinkedIn URLs to confirm identity and current employment. "
-        "Be accurate — flag obvious mismatches but don't over-filter legitimate employees."
-    )
-
-    if not result or "contacts" not in result:
-        logger.warning("Fact checker LLM returned no results, keeping qualified contacts with score=0.7")
-        for contact in qualified:
-            contact["fact_check_score"] = 0.7
-            contact["fact_check_notes"] = "LinkedIn validation unavailable"
-        return qualified
-
-    # Map scores back to contacts
-    score_map = {}
-    for checked in result.get("contacts", []):
-        name = checked.get("name", "").lower().strip()
-        score_map[name] = {
-            "fact_check_score": checked.get("fact_check_score", 0.5),
-            "fact_check_notes": checked.get("fact_check_notes", "")
-        }
+    chunks = fc.chunks(ided, FACT_CHECK_CHUNK_SIZE)
+    results = await asyncio.gather(*[_call_openai_json(_prompt(chunk), system_prompt) for chunk in chunks])
 
-    # Apply scores and filter
-    enriched = []
-    for contact in qualified:
-        name_key = (contact.get("name") or "").lower().strip()
-        if name_key in score_map:
-            contact["fact_check_score"] = score_map[name_key]["fact_check_score"]
-            contact["fact_check_notes"] = score_map[name_key]["fact_check_notes"]
+    verdicts, unavailable = [], []
+    for chunk, result in zip(chunks, results):
+        if not result or "contacts" not in result:
+            unavailable.extend(cid for cid, _ in chunk)
         else:
-            contact["fact_check_score"] = 0.7
-            contact["fact_check_notes"] = "Not matched in validation response"
+            verdicts.extend(result.get("contacts") or [])
+    if len(unavailable) == len(ided):
+        logger.warning("Fact checker LLM returned no results, keeping qualified contacts with score=0.7")
+    elif unavailable:
+        logger.warning(f"Fact checker LLM failed for {len(unavailable)} contacts, keeping them with score=0.7")
 
-        if contact["fact_check_score"] >= 0.15:
-            enriched.append(contact)
-        else:
-            logger.warning(
-                f"FACT CHECK FILTERED: {contact.get('name')} as {contact.get('title')} "
-                f"(score={contact['fact_check_score']}: {contact.get('fact_check_notes')})"
-            )
+    # Map scores back to contacts (by id) and filter
+    enriched = fc.apply_scores(ided, verdicts, unavailable)
 
     logger.info(
         f"Fact checker: {len(enriched)}/{len(contacts)} contacts passed "
         f"({len(qualified)} had LinkedIn+contact info, "
         f"{filtered_no_linkedin} dropped for no LinkedIn, "
-        f"{filtered_no_contact_info} dropped for no phone/email)"
+        f"{filtered_no_contact_info} dropped for no phone/email; "
+        f"{len(chunks)} validation request(s))"
     )
     return enriched
 
 
+@tracing.traced("claude.company_intel", kind="llm")
 async def claude_company_intel(company_name: str, domain: str) -> Dict[str, Any]:
     """
     Step 2.9 — Claude web search for company intelligence fields.
@@ -1281,14 +1106,40 @@ async def claude_company_intel(company_name: str, domain: str) -> Dict[str, Any]
         return result
 
     except Exception as e:
+        tracing.annotate_error(e)
         logger.warning("Claude company intel failed for %s: %s", company_name, e)
         return {}
 
 
+# Step 2.86 batching: contacts per web_search request (1 = one request per
+# contact), concurrent requests, and the cross-job (name, domain) result cache.
+LINKEDIN_SEARCH_BATCH_SIZE = int(os.getenv("LINKEDIN_SEARCH_BATCH_SIZE", "4"))
+_ANTHROPIC_SEARCH_SEMAPHORE = asyncio.Semaphore(int(os.getenv("LINKEDIN_SEARCH_CONCURRENCY", "3")))
+_LINKEDIN_CACHE = None
+
+
+def _linkedin_search_module():
+    """Dual-path import of the stdlib-only step 2.86 batching/cache helpers."""
+    try:
+        from worker import linkedin_search as ls
+    except Exception:  # noqa: BLE001
+        import linkedin_search as ls  # bare path
+    return ls
+
+
+def _linkedin_cache():
+    global _LINKEDIN_CACHE
+    if _LINKEDIN_CACHE is None:
+        _LINKEDIN_CACHE = _linkedin_search_module().LinkedInCache()
+    return _LINKEDIN_CACHE
+
+
+@tracing.traced("claude.linkedin_search", kind="llm")
 async def _find_linkedin_via_claude_search(
     company_name: str,
     domain: str,
     contacts: list,
+    stats: Optional[dict] = None,
 ) -> tuple:
     """
     Step 2.86 — Last-resort LinkedIn discovery using Claude with web_search.
@@ -1303,7 +1154,11 @@ async def _find_linkedin_via_claude_search(
     - Title/position is NOT checked — title differences are expected
 
     Priority order: C-Level → VP → Director → other. No cap — every qualifying
-    contact (has phone or email but no LinkedIn) is searched.
+    contact (has phone or email but no LinkedIn) is searched. Contacts are asked
+    about LINKEDIN_SEARCH_BATCH_SIZE at a time (one JSON-array request per batch),
+    batches run concurrently, and answers — including confirmed NOT_FOUNDs — are
+    cached across jobs by (name, domain). `stats`, when given, is filled with
+    the request/cache counts and calls saved versus one request per contact.
 
     Returns tuple: (found_urls: dict, all_results: list)
     - found_urls: {contact_name: linkedin_url} for confirmed matches
@@ -1347,58 +1202,99 @@ async def _find_linkedin_via_claude_search(
         return 3
 
     to_search = sorted(contacts, key=_csuite_rank)
-    client = _anthropic.AsyncAnthropic(api_key=ANTHROPIC_API_KEY)
+    ls = _linkedin_search_module()
+    cache = _linkedin_cache()
     found_urls: dict = {}
     all_results: list = []
+    pending: list = []  # (index into all_results, name)
 
     for contact in to_search:
         name = (contact.get("name") or "").strip()
         title = (contact.get("title") or "").strip()
         if not name:
             continue
-        try:
+        entry = {"name": name, "title": title, "linkedin_url": None}
+        cached = cache.get(name, domain)
+        if cached is not ls.MISS:
+            entry["linkedin_url"] = cached
+            entry["cached"] = True
+            if cached:
+                found_urls[name] = cached
+        else:
+            pending.append((len(all_results), name))
+        all_results.append(entry)
+
+    groups = ls.batches(pending, LINKEDIN_SEARCH_BATCH_SIZE)
+    client = _anthropic.AsyncAnthropic(api_key=ANTHROPIC_API_KEY) if groups else None
+
+    async def _search(group: list) -> dict:
+        """One web_search request for 1..N contacts -> {name: url | None}."""
+        names = [n for _, n in group]
+        if len(names) == 1:
+            name = names[0]
+            content = (
+                f"Find the LinkedIn profile URL for {name} "
+                f"who currently works at {company_name} (domain: {domain}).\n\n"
+                f"Only TWO things matter:\n"
+                f"1. The full name on the LinkedIn profile must EXACTLY match: {name}\n"
+                f"2. They must CURRENTLY work at {company_name} — not a former employee\n\n"
+                f"Do NOT check job title — title differences are expected and acceptable.\n\n"
+                f"Return ONLY the linkedin.com/in/... URL on the first line if confirmed.\n"
+                f"If you cannot confirm both name AND current employment at {company_name}, "
+                f"respond with exactly: NOT_FOUND"
+            )
+            max_tokens, max_uses = 512, 2
+        else:
+            content = ls.batch_prompt(company_name, domain, names)
+            max_tokens, max_uses = 256 * len(names), 2 * len(names)
+        _wait_t0 = time.monotonic()
+        async with _ANTHROPIC_SEARCH_SEMAPHORE:
+            tracing.record_span("anthropic.linkedin_search_slot", "wait", time.monotonic() - _wait_t0)
             response = await client.messages.create(
                 model="claude-sonnet-4-6",
-                max_tokens=512,
+                max_tokens=max_tokens,
                 tools=[{
                     "type": "web_search_20250305",
                     "name": "web_search",
-                    "max_uses": 2,
-                }],
-                messages=[{
-                    "role": "user",
-                    "content": (
-                        f"Find the LinkedIn profile URL for {name} "
-                        f"who currently works at {company_name} (domain: {domain}).\n\n"
-                        f"Only TWO things matter:\n"
-                        f"1. The full name on the LinkedIn profile must EXACTLY match: {name}\n"
-                        f"2. They must CURRENTLY work at {company_name} — not a former employee\n\n"
-                        f"Do NOT check job title — title differences are expected and acceptable.\n\n"
-                        f"Return ONLY the linkedin.com/in/... URL on the first line if confirmed.\n"
-                        f"If you cannot confirm both name AND current employment at {company_name}, "
-                        f"respond with exactly: NOT_FOUND"
-                    ),
+                    "max_uses": max_uses,
                 }],
+                messages=[{"role": "user", "content": content}],
             )
 
-            # Cost metering — best-effort; never break LinkedIn lookup.
-            try:
-                from worker import cost_meter
-                cost_meter.record_anthropic("claude-sonnet-4-6", getattr(response, "usage", None))
-            except Exception:  # noqa: BLE001
-                pass
+        # Cost metering — best-effort; never break LinkedIn lookup.
+        try:
+            from worker import cost_meter
+            cost_meter.record_anthropic("claude-sonnet-4-6", getattr(response, "usage", None))
+        except Exception:  # noqa: BLE001
+            pass
 
-            linkedin_url = None
-            for block in response.content:
-                if hasattr(block, "text"):
-                    text = block.text.strip()
-                    if "NOT_FOUND" in text.upper():
-                        break
-                    match = _linkedin_pattern.search(text)
-                    if match:
-                        linkedin_url = match.group(0).rstrip("/")
-                        break
+        if len(names) > 1:
+            text = "".join(getattr(b, "text", "") or "" for b in response.content
+                           if isinstance(getattr(b, "text", None), str))
+            return ls.parse_batch_response(text, names)
+        for block in response.content:
+            if hasattr(block, "text"):
+                text = block.text.strip()
+                if "NOT_FOUND" in text.upper():
+                    return {names[0]: None}
+                match = _linkedin_pattern.search(text)
+                if match:
+                    return {names[0]: match.group(0).rstrip("/")}
+        return {}
 
+    outcomes = await asyncio.gather(*(_search(g) for g in groups), return_exceptions=True)
+    for group, outcome in zip(groups, outcomes):
+        for idx, name in group:
+            entry = all_results[idx]
+            if isinstance(outcome, BaseException):
+                tracing.annotate_error(outcome)
+                logger.warning(f"Claude LinkedIn search failed for {name}: {outcome}")
+                entry["error"] = str(outcome)
+                continue
+            if name in outcome:
+                cache.put(name, domain, outcome[name])  # incl. confirmed NOT_FOUND
+            linkedin_url = outcome.get(name)
+            entry["linkedin_url"] = linkedin_url
             if linkedin_url:
                 found_urls[name] = linkedin_url
                 logger.info(
@@ -1408,18 +1304,16 @@ async def _find_linkedin_via_claude_search(
                 logger.info(
                     f"Claude LinkedIn search [2.86]: NOT_FOUND for {name} at {company_name}"
                 )
-            all_results.append({
-                "name": name, "title": title,
-                "linkedin_url": linkedin_url,
-            })
-
-        except Exception as e:
-            logger.warning(f"Claude LinkedIn search failed for {name}: {e}")
-            all_results.append({
-                "name": name, "title": title,
-                "linkedin_url": None, "error": str(e),
-            })
 
+    if stats is not None:
+        # Baseline is one request per named contact.
+        stats.update({
+            "contacts_searched": len(all_results),
+            "cache_hits": len(all_results) - len(pending),
+            "requests_made": len(groups),
+            "calls_saved": len(all_results) - len(groups),
+            "batch_size": LINKEDIN_SEARCH_BATCH_SIZE,
+        })
     return found_urls, all_results
 
 
@@ -1590,6 +1484,7 @@ def _log_api_call(
     })
 
 
+@tracing.traced("zoominfo.fetch_all", kind="vendor")
 async def _fetch_all_zoominfo(zi_client, company_data: dict, job_data: Optional[dict] = None):
     """
     Fetch all ZoomInfo data in parallel: company enrich, intent, scoops,
@@ -1842,75 +1737,96 @@ async def _fetch_all_zoominfo(zi_client, company_data: dict, job_data: Optional[
         return {"_contact_search_error": err}, []
 
 
+def _contact_identity_module():
+    """Dual-path import of the stdlib-only shared entity-resolution helpers."""
+    try:
+        from worker import contact_identity as ci
+    except Exception:  # noqa: BLE001
+        import contact_identity as ci  # bare path
+    return ci
+
+
+# Stakeholder field <- ZoomInfo contact field, merged by contact_identity's
+# source precedence (ZoomInfo wins phones/accuracy; it only fills LinkedIn/phone).
+_ZI_MERGE_FIELDS = {
+    "direct_phone": "direct_phone",
+    "mobile_phone": "mobile_phone",
+    "company_phone": "company_phone",
+    "contact_accuracy_score": "contact_accuracy_score",
+    "department": "department",
+    "management_level": "management_level",
+    "linkedin_url": "linkedin",
+    "phone": "phone",
+}
+
+
+# ZoomInfo search result field <- contact-enrich field (step 2.84). Enriched
+# values (real numbers) win phones and accuracy; the email is only filled.
+_ZI_ENRICH_FIELDS = ("phone", "direct_phone", "mobile_phone", "company_phone",
+                     "contact_accuracy_score", "email")
+
+
+def _apply_zoominfo_enrich(contact: dict, enriched: dict) -> dict:
+    """Merge a ZoomInfo contact-enrich record into its (masked) search result."""
+    _contact_identity_module().merge_fields(
+        contact, enriched,
+        target_source="zoominfo", incoming_source="zoominfo_enrich",
+        fields={f: f for f in _ZI_ENRICH_FIELDS},
+    )
+    contact["enriched"] = True
+    return contact
+
+
 def _merge_zoominfo_contacts(stakeholders_data: list, zoominfo_contacts: list) -> list:
     """
     Merge ZoomInfo enriched contacts into existing stakeholders data.
-    Matches by name similarity or email, adds phone numbers and accuracy scores.
+    Each ZoomInfo contact is resolved against the stakeholders through the shared
+    contact_identity index (email, LinkedIn slug, exact name with nicknames) in one linear
+    pass; matches gain phone numbers and accuracy scores, the rest are added.
     """
     if not zoominfo_contacts:
         return stakeholders_data
 
+    ci = _contact_identity_module()
+    index = ci.ContactIndex()
     for stakeholder in stakeholders_data:
-        s_name = (stakeholder.get("name") or "").lower().strip()
-        s_email = (stakeholder.get("email") or "").lower().strip()
-
-        for zi_contact in zoominfo_contacts:
-            zi_name = (zi_contact.get("name") or "").lower().strip()
-            zi_email = (zi_contact.get("email") or "").lower().strip()
-
-            # Match by name or email
-            if (s_name and zi_name and s_name == zi_name) or \
-               (s_email and zi_email and s_email == zi_email):
-                # Enrich with ZoomInfo phone data
-                if zi_contact.get("direct_phone"):
-                    stakeholder["direct_phone"] = zi_contact["direct_phone"]
-                if zi_contact.get("mobile_phone"):
-                    stakeholder["mobile_phone"] = zi_contact["mobile_phone"]
-                if zi_contact.get("company_phone"):
-                    stakeholder["company_phone"] = zi_contact["company_phone"]
-                if zi_contact.get("contact_accuracy_score"):
-                    stakeholder["contact_accuracy_score"] = zi_contact["contact_accuracy_score"]
-                if zi_contact.get("department"):
-                    stakeholder["department"] = zi_contact["department"]
-                if zi_contact.get("management_level"):
-                    stakeholder["management_level"] = zi_contact["management_level"]
-                # Preserve enrichment status and LinkedIn URL
-                if "enriched" in zi_contact:
-                    stakeholder["enriched"] = zi_contact["enriched"]
-                if zi_contact.get("linkedin") and not stakeholder.get("linkedin_url"):
-                    stakeholder["linkedin_url"] = zi_contact["linkedin"]
-                # Also fill in phone if empty
-                if not stakeholder.get("phone") and zi_contact.get("phone"):
-                    stakeholder["phone"] = zi_contact["phone"]
-                break
-
-    # Add any ZoomInfo contacts not already in stakeholders
-    existing_names = {(s.get("name") or "").lower().strip() for s in stakeholders_data}
-    existing_emails = {(s.get("email") or "").lower().strip() for s in stakeholders_data if s.get("email")}
+        index.add(stakeholder)
 
     for zi_contact in zoominfo_contacts:
-        zi_name = (zi_contact.get("name") or "").lower().strip()
-        zi_email = (zi_contact.get("email") or "").lower().strip()
-
-        if zi_name not in existing_names and (not zi_email or zi_email not in existing_emails):
-            # Infer role type from title
-            role_type = _infer_role_type(zi_contact.get("title", ""))
-            # Add as new stakeholder
-            stakeholders_data.append({
-                "name": zi_contact.get("name", ""),
-                "title": zi_contact.get("title", ""),
-                "role_type": role_type,
-                "email": zi_contact.get("email", ""),
-                "phone": zi_contact.get("phone", ""),
-                "linkedin_url": zi_contact.get("linkedin", ""),
-                "direct_phone": zi_contact.get("direct_phone", ""),
-                "mobile_phone": zi_contact.get("mobile_phone", ""),
-                "company_phone": zi_contact.get("company_phone", ""),
-                "contact_accuracy_score": zi_contact.get("contact_accuracy_score", 0),
-                "department": zi_contact.get("department", ""),
-                "management_level": zi_contact.get("management_level", ""),
-                "source": "zoominfo",
-            })
+        stakeholder = index.find(zi_contact)
+        if stakeholder is not None:
+            # Enrich with ZoomInfo phone data (field precedence by source tier)
+            ci.merge_fields(
+                stakeholder, zi_contact,
+                target_source=stakeholder.get("source"), incoming_source="zoominfo",
+                fields=_ZI_MERGE_FIELDS,
+            )
+            # Preserve enrichment status
+            if "enriched" in zi_contact:
+                stakeholder["enriched"] = zi_contact["enriched"]
+            index.reindex(stakeholder)
+            continue
+
+        # Infer role type from title
+        role_type = _infer_role_type(zi_contact.get("title", ""))
+        # Add as new stakeholder
+        new_stakeholder = {
+            "name": zi_contact.get("name", ""),
+            "title": zi_contact.get("title", ""),
+            "role_type": role_type,
+            "email": zi_contact.get("email", ""),
+            "phone": zi_contact.get("phone", ""),
+            "linkedin_url": zi_contact.get("linkedin", ""),
+            "direct_phone": zi_contact.get("direct_phone", ""),
+            "mobile_phone": zi_contact.get("mobile_phone", ""),
+            "company_phone": zi_contact.get("company_phone", ""),
+            "contact_accuracy_score": zi_contact.get("contact_accuracy_score", 0),
+            "department": zi_contact.get("department", ""),
+            "management_level": zi_contact.get("management_level", ""),
+            "source": "zoominfo",
+        }
+        stakeholders_data.append(new_stakeholder)
+        index.add(new_stakeholder)
 
     # Sort stakeholders: ZoomInfo-sourced contacts first (they have verified phones),
     # then by role priority (CTO > CIO > CFO > COO > ...), then alphabetically.
@@ -1938,15 +1854,22 @@ async def process_company_profile(job_id: str, company_data: dict):
     zoominfo_contacts = []
     stakeholders_data = []
     orchestrator_plan = None
+    # Refresh mode: the previous completed run for this domain, and what it lets
+    # us reuse (filled in just before the council).
+    refresh_row = None
+    refresh_plan = None
 
     # Bind this job to the cost meter so all downstream Anthropic/ZoomInfo/web-search
     # calls are attributed to it. Best-effort: a missing import must never break the
     # pipeline (metering is purely observational).
     try:
         from worker import cost_meter
-        cost_meter.set_job(job_id)
+        cost_meter.set_job(job_id, tenant=_cost_budget_module().tenant_key(company_data),
+                           batch_id=company_data.get("batch_id"))
     except Exception:  # noqa: BLE001
         pass
+    await _seed_tenant_spend(company_data)
+    tracing.start_job(job_id, company=company_data.get("company_name"), domain=company_data.get("domain"))
 
     try:
         logger.info(f"Starting processing for job {job_id}: {company_data['company_name']}")
@@ -1961,15 +1884,16 @@ async def process_company_profile(job_id: str, company_data: dict):
         # worker dies mid-run (Render restart / crash), a later status poll finds the
         # row, sees it isn't in memory, and surfaces it as failed/interrupted instead
         # of a perpetual "in progress". The completed/failed upsert below replaces it.
-        persist_job_result(
+        await persist_job_result(
             job_id, "processing", None,
             company_name=company_data.get("company_name"),
         )
 
         # Step 0.5: Run Orchestrator to determine optimal API routing
+        tracing.mark_stage("0.5_orchestrator")
         jobs_store[job_id]["progress"] = 15
-        jobs_store[job_id]["current_step"] = "Running Orchestrator LLM for intelligent API routing..."
-        orchestrator_plan = await analyze_and_plan(company_data)
+        jobs_store[job_id]["current_step"] = "Planning API routing (orchestrator plan cache)..."
+        orchestrator_plan = await _orchestrator_module().analyze_and_plan(company_data)
         logger.info(f"Orchestrator plan: APIs to query = {orchestrator_plan.apis_to_query}, reasoning = {orchestrator_plan.reasoning[:100]}...")
 
         # Store orchestrator data for debug mode (now with GRANULAR field-level assignments)
@@ -1984,6 +1908,7 @@ async def process_company_profile(job_id: str, company_data: dict):
         }
 
         # Step 1: ALWAYS query Apollo.io — primary source for company data and contacts
+        tracing.mark_stage("1_apollo")
         jobs_store[job_id]["progress"] = 20
         jobs_store[job_id]["current_step"] = "Querying Apollo.io..."
         _t0 = time.monotonic()
@@ -2000,6 +1925,7 @@ async def process_company_profile(job_id: str, company_data: dict):
         logger.info(f"Apollo returned {len(apollo_data)} fields: {list(apollo_data.keys())[:10]}")
 
         # Step 2: ALWAYS query PeopleDataLabs — primary source for technographics and firmographics
+        tracing.mark_stage("2_pdl")
         jobs_store[job_id]["progress"] = 30
         jobs_store[job_id]["current_step"] = "Querying PeopleDataLabs..."
         _t0 = time.monotonic()
@@ -2016,6 +1942,7 @@ async def process_company_profile(job_id: str, company_data: dict):
         logger.info(f"PDL returned {len(pdl_data)} fields: {list(pdl_data.keys())[:10]}")
 
         # Step 2.5: Gather intelligence from Hunter.io (ALWAYS QUERIED - required for contacts)
+        tracing.mark_stage("2.5_hunter")
         jobs_store[job_id]["progress"] = 40
         jobs_store[job_id]["current_step"] = "Querying Hunter.io for contact data..."
         _t0 = time.monotonic()
@@ -2045,6 +1972,7 @@ async def process_company_profile(job_id: str, company_data: dict):
             logger.warning("Hunter.io returned no data - check API key or domain validity")
 
         # Step 2.6: ZoomInfo Data Collection (PRIMARY SOURCE)
+        tracing.mark_stage("2.6_zoominfo")
         jobs_store[job_id]["progress"] = 42
         jobs_store[job_id]["current_step"] = "Querying ZoomInfo GTM API (PRIMARY SOURCE)..."
         zoominfo_data = {}
@@ -2074,6 +2002,7 @@ async def process_company_profile(job_id: str, company_data: dict):
             )
 
         # Step 2.75: Fetch stakeholders from Apollo
+        tracing.mark_stage("2.75_stakeholders")
         jobs_store[job_id]["progress"] = 45
         jobs_store[job_id]["current_step"] = "Searching for executive stakeholders..."
         stakeholders_data = await fetch_stakeholders(company_data["domain"])
@@ -2102,6 +2031,7 @@ async def process_company_profile(job_id: str, company_data: dict):
         # contact search API by email (primary) or firstName+lastName (fallback)
         # to find their ZoomInfo record and pull directPhone/mobilePhone directly
         # from the search result — no separate enrich call required.
+        tracing.mark_stage("2.84_identity_lookup")
         if zi_client and stakeholders_data:
             contacts_needing_phones = [
                 s for s in stakeholders_data
@@ -2142,16 +2072,7 @@ async def process_company_profile(job_id: str, company_data: dict):
                         for contact in zi_lookup_contacts:
                             pid = contact.get("person_id")
                             if pid and pid in enriched_by_pid:
-                                ep = enriched_by_pid[pid]
-                                # Overwrite phone fields with enriched values (real numbers)
-                                for phone_field in ("phone", "direct_phone", "mobile_phone", "company_phone"):
-                                    if ep.get(phone_field):
-                                        contact[phone_field] = ep[phone_field]
-                                if ep.get("contact_accuracy_score"):
-                                    contact["contact_accuracy_score"] = ep["contact_accuracy_score"]
-                                if ep.get("email") and not contact.get("email"):
-                                    contact["email"] = ep["email"]
-                                contact["enriched"] = True
+                                _apply_zoominfo_enrich(contact, enriched_by_pid[pid])
                         logger.info(
                             f"ZoomInfo contact enrich: {len(enriched_people)}/{len(enrichable_ids)} "
                             f"contacts enriched with real phone numbers"
@@ -2237,6 +2158,7 @@ async def process_company_profile(job_id: str, company_data: dict):
         # Step 2.85: Enrich contacts missing LinkedIn URLs via Apollo people/match.
         # ZoomInfo contact search does NOT return LinkedIn URLs (disallowed engagement data).
         # Apollo's mixed_people/search can match contacts by name + domain and return linkedin_url.
+        tracing.mark_stage("2.85_linkedin_enrich")
         if APOLLO_API_KEY and stakeholders_data:
             contacts_needing_linkedin = [
                 s for s in stakeholders_data
@@ -2312,23 +2234,29 @@ async def process_company_profile(job_id: str, company_data: dict):
         # ZoomInfo enrich (step 1d) and Apollo people/match backfill (step 2.85).
         # Uses Claude claude-sonnet-4-6 with built-in web_search tool. Prioritizes
         # C-suite contacts. Verifies exact name match + current employment.
+        tracing.mark_stage("2.86_linkedin_finder")
         if ANTHROPIC_API_KEY and stakeholders_data:
             # Search ALL contacts still missing LinkedIn after ZoomInfo enrich + Apollo backfill.
             _contacts_still_no_li = [
                 s for s in stakeholders_data
                 if not s.get("linkedin_url") and s.get("name")
             ]
+            if _contacts_still_no_li and not _cost_budget_module().allow_optional("linkedin_search"):
+                logger.info(f"Claude LinkedIn search [2.86]: skipped for {job_id} (over cost budget)")
+                _contacts_still_no_li = []
             if _contacts_still_no_li:
                 _attempted = len(_contacts_still_no_li)
                 jobs_store[job_id]["current_step"] = (
                     f"Claude web search: finding LinkedIn for {_attempted} contacts..."
                 )
                 _t_claude = time.monotonic()
+                _li_stats: dict = {}
                 try:
                     _found_urls, _all_results = await _find_linkedin_via_claude_search(
                         company_name=company_data["company_name"],
                         domain=company_data.get("domain", ""),
                         contacts=_contacts_still_no_li,
+                        stats=_li_stats,
                     )
                     _claude_duration = int((time.monotonic() - _t_claude) * 1000)
                     _applied = 0
@@ -2346,6 +2274,7 @@ async def process_company_profile(job_id: str, company_data: dict):
                         "contacts_found": _applied,
                         "duration_ms": _claude_duration,
                         "results": _all_results,
+                        **_li_stats,
                     }
                     _log_api_call(
                         jobs_store[job_id],
@@ -2357,6 +2286,9 @@ async def process_company_profile(job_id: str, company_data: dict):
                             "filter": "all contacts missing LinkedIn after ZoomInfo enrich + Apollo backfill",
                             "contacts_attempted": _attempted,
                             "priority": "C-Level → VP → Director → other (no cap)",
+                            "batch_size": LINKEDIN_SEARCH_BATCH_SIZE,
+                            "requests_made": _li_stats.get("requests_made"),
+                            "calls_saved": _li_stats.get("calls_saved"),
                             "contacts_searched": [
                                 {"name": c.get("name"), "title": c.get("title")}
                                 for c in _contacts_still_no_li
@@ -2374,6 +2306,7 @@ async def process_company_profile(job_id: str, company_data: dict):
                     jobs_store[job_id]["step_2_86_result"] = {"error": str(e)}
 
         # Step 2.83: LLM Contact Fact Checker - Validate contacts against public knowledge
+        tracing.mark_stage("2.83_fact_check")
         jobs_store[job_id]["progress"] = 46
         jobs_store[job_id]["current_step"] = "Fact-checking contacts with LLM verification..."
         if stakeholders_data:
@@ -2392,10 +2325,11 @@ async def process_company_profile(job_id: str, company_data: dict):
 
         # Step 2.85: PRE-LLM DATA VALIDATION - Fact-check BEFORE sending to LLM Council
         # This catches egregiously wrong data like fake CEO names, unverified executives
+        tracing.mark_stage("2.85_pre_llm_validation")
         jobs_store[job_id]["progress"] = 47
         jobs_store[job_id]["current_step"] = ">>> PRE-LLM VALIDATION: Fact-checking against verified database..."
 
-        data_validator = get_validator()
+        data_validator = _data_validator_module().get_validator()
         domain = company_data.get("domain", "")
 
         # Validate company-level data (CEO, company name, etc.)
@@ -2460,12 +2394,15 @@ async def process_company_profile(job_id: str, company_data: dict):
         logger.info(f"PRE-LLM VALIDATION complete: {len(validation_result.issues)} issues found, confidence={validation_result.confidence_score:.2f}")
 
         # Step 2.9: Fetch recent news for sales intelligence (if orchestrator selected it)
+        tracing.mark_stage("2.9_news")
         jobs_store[job_id]["progress"] = 48
-        if should_query_api("gnews", orchestrator_plan):
+        if _orchestrator_module().should_query_api("gnews", orchestrator_plan):
             jobs_store[job_id]["current_step"] = "Gathering recent news and buying signals..."
             _t0 = time.monotonic()
             try:
-                news_data = await fetch_company_news(company_data["company_name"], company_data.get("domain"))
+                news_data = await fetch_company_news(
+                    company_data["company_name"], company_data.get("domain"), zoominfo_data=zoominfo_data
+                )
                 _log_api_call(
                     jobs_store[job_id], "GNews API - Recent Company News",
                     "https://gnews.io/api/v4/search", "GET",
@@ -2474,8 +2411,11 @@ async def process_company_profile(job_id: str, company_data: dict):
                         "success": news_data.get("success", False) if news_data else False,
                         "articles_count": news_data.get("articles_count", 0) if news_data else 0,
                         "date_range": news_data.get("date_range") if news_data else "N/A",
+                        "sources": news_data.get("sources", {}) if news_data else {},
+                        "duplicates_removed": news_data.get("duplicates_removed", 0) if news_data else 0,
+                        "incremental": news_data.get("incremental", False) if news_data else False,
                         "summaries": news_data.get("summaries", {}) if news_data else {},
-                        "error": news_data.get("error") if news_data and not news_data.get("success") else None,
+                        "error": (news_data.get("error") if not news_data.get("success") else news_data.get("gnews_error")) if news_data else None,
                     },
                     200 if news_data and news_data.get("success") else 503,
                     int((time.monotonic() - _t0) * 1000),
@@ -2492,11 +2432,20 @@ async def process_company_profile(job_id: str, company_data: dict):
                     500, int((time.monotonic() - _t0) * 1000),
                     is_sensitive=True, masked_fields=["token"],
                 )
+        elif (zoominfo_data or {}).get("news_articles") or (zoominfo_data or {}).get("scoops"):
+            # GNews not needed, but step 2.6 already paid for ZoomInfo news/scoops
+            logger.info("Orchestrator skipped GNews - categorizing ZoomInfo news/scoops only")
+            jobs_store[job_id]["current_step"] = "Skipped GNews (not in orchestrator plan), using ZoomInfo news..."
+            news_data = await fetch_company_news(
+                company_data["company_name"], company_data.get("domain"),
+                zoominfo_data=zoominfo_data, use_gnews=False
+            )
         else:
             logger.info("Orchestrator skipped GNews - not needed for required data points")
             jobs_store[job_id]["current_step"] = "Skipped GNews (not in orchestrator plan)..."
 
         # Step 3: Store raw data in Supabase
+        tracing.mark_stage("3_store_raw")
         jobs_store[job_id]["progress"] = 50
         jobs_store[job_id]["current_step"] = "Storing raw data..."
         await store_raw_data(company_data["company_name"], apollo_data, pdl_data, hunter_data)
@@ -2505,6 +2454,7 @@ async def process_company_profile(job_id: str, company_data: dict):
         # ZoomInfo can't return ceo/company_type on this subscription tier,
         # and customer_segments/products/competitors don't exist in any API.
         # Use Claude with web_search to gather these fields as input for the council.
+        tracing.mark_stage("3.5_company_intel")
         jobs_store[job_id]["progress"] = 55
         jobs_store[job_id]["current_step"] = "Claude web search: gathering company intelligence..."
         _t_intel = time.monotonic()
@@ -2555,10 +2505,51 @@ async def process_company_profile(job_id: str, company_data: dict):
             is_sensitive=True, masked_fields=["authorization"],
         )
 
+        # Step 3.9: Refresh mode — diff fresh vendor inputs against the domain's
+        # last completed run; unchanged specialists/sections/deck are reused.
+        tracing.mark_stage("3.9_refresh_plan")
+        ir = _incremental_refresh_module()
+        refresh_hashes = ir.input_hashes(
+            company_data, apollo_data, pdl_data, hunter_data, zoominfo_data, stakeholders_data, news_data
+        )
+        if company_data.get("refresh"):
+            refresh_row = await _fetch_latest_domain_result(company_data.get("domain", ""))
+            specialists = _llm_council_module().SPECIALISTS
+            refresh_plan = ir.plan_refresh(ir.baseline_state(refresh_row), refresh_hashes, specialists)
+            jobs_store[job_id]["refresh"] = {
+                "baseline_job_id": (refresh_row or {}).get("job_id"),
+                "changed_inputs": refresh_plan["changed_inputs"],
+                "specialists_reused": sorted(refresh_plan["reuse_results"]),
+            }
+            logger.info(
+                f"Refresh for {company_data.get('domain')}: baseline={(refresh_row or {}).get('job_id')}, "
+                f"changed={refresh_plan['changed_inputs']}, "
+                f"reusable specialists={len(refresh_plan['reuse_results'])}/{len(specialists)}"
+            )
+        refresh_prior = ((refresh_row or {}).get("result") or {}) if refresh_plan else {}
+        refresh_state = refresh_prior.get("refresh_state") or {}
+
         # Step 4: Validate with LLM Council (28 specialists + 1 aggregator)
+        tracing.mark_stage("4_council")
         jobs_store[job_id]["progress"] = 60
-        jobs_store[job_id]["current_step"] = "Running LLM Council (28 specialists)..."
-        validated_data = await validate_with_council(company_data, apollo_data, pdl_data, hunter_data, stakeholders_data, news_data, zoominfo_data)
+        if refresh_plan and refresh_plan["unchanged"] and refresh_prior.get("validated_data"):
+            # Nothing the council reads has changed: reuse the previous output whole.
+            jobs_store[job_id]["current_step"] = "Refresh: inputs unchanged, reusing LLM Council output..."
+            validated_data = json.loads(json.dumps(refresh_prior["validated_data"], default=str))
+            validated_data.pop("api_cost", None)  # this job's cost is attached below
+            validated_data["_council_metadata"] = {
+                "specialists_run": 0,
+                "specialists_total": len(_llm_council_module().SPECIALISTS),
+                "timestamp": datetime.utcnow().isoformat(),
+                "specialist_results": refresh_state.get("specialist_results", []),
+                "mode": "refresh_reused",
+            }
+        else:
+            jobs_store[job_id]["current_step"] = "Running LLM Council (28 specialists)..."
+            validated_data = await _llm_council_module().validate_with_council(
+                company_data, apollo_data, pdl_data, hunter_data, stakeholders_data, news_data, zoominfo_data,
+                reuse_results=refresh_plan["reuse_results"] if refresh_plan else None,
+            )
 
         # Extract council metadata for debug mode
         council_metadata = validated_data.pop("_council_metadata", {})
@@ -2567,6 +2558,7 @@ async def process_company_profile(job_id: str, company_data: dict):
         jobs_store[job_id]["current_step"] = "LLM Council complete, storing results..."
 
         # Step 5: Store validated data
+        tracing.mark_stage("5_store_validated")
         jobs_store[job_id]["progress"] = 80
         jobs_store[job_id]["current_step"] = "Storing validated data..."
         await store_validated_data(company_data["company_name"], validated_data)
@@ -2675,6 +2667,7 @@ async def process_company_profile(job_id: str, company_data: dict):
         )
 
         # Step 6: Generate slideshow
+        tracing.mark_stage("6_slideshow")
         jobs_store[job_id]["progress"] = 90
         jobs_store[job_id]["current_step"] = "Generating slideshow..."
         logger.info(f"🎨 Starting slideshow generation for {company_data['company_name']}")
@@ -2684,7 +2677,28 @@ async def process_company_profile(job_id: str, company_data: dict):
         # On ANY failure it falls through to the legacy Gamma path below.
         # Flag OFF (default) = current behavior, completely unchanged.
         _v31_done = False
-        if os.getenv("USE_V31_PIPELINE", "").strip().lower() == "true":
+        _use_v31 = os.getenv("USE_V31_PIPELINE", "").strip().lower() == "true"
+        # The deck depends on the inputs, the salesperson shown on it and the path.
+        _deck_key = ir.section_hash({
+            "inputs": refresh_hashes,
+            "salesperson": company_data.get("salesperson_name", ""),
+            "v31": _use_v31,
+        })
+        _reuse_deck = bool(
+            refresh_plan and refresh_plan["unchanged"]
+            and refresh_state.get("deck_key") == _deck_key
+            and refresh_prior.get("slideshow_url")
+        )
+        if _reuse_deck:
+            slideshow_result = {
+                "success": True,
+                "slideshow_url": refresh_prior.get("slideshow_url"),
+                "slideshow_id": refresh_prior.get("slideshow_id"),
+                "slideshow_status": refresh_prior.get("slideshow_status") or "completed",
+                "reused_from_job": refresh_row.get("job_id"),
+            }
+            logger.info(f"Refresh: deck inputs unchanged, reusing {slideshow_result['slideshow_url']}")
+        elif _use_v31:
             try:
                 import asyncio as _asyncio
                 from worker.pipeline_v31_hook import run_v31_pipeline
@@ -2708,7 +2722,7 @@ async def process_company_profile(job_id: str, company_data: dict):
         try:
             # Inject salesperson_name so it reaches the gamma slideshow
             validated_data["salesperson_name"] = company_data.get("salesperson_name", "")
-            if not _v31_done:  # v3.1 deck already produced above? skip Gamma.
+            if not _v31_done and not _reuse_deck:  # deck already produced/reused above? skip Gamma.
                 slideshow_result = await generate_slideshow(company_data["company_name"], validated_data)
 
             # Log slideshow result for debugging
@@ -2805,9 +2819,12 @@ async def process_company_profile(job_id: str, company_data: dict):
 
             # 4. News articles → news_intelligence + news_data
             # _build_news_intelligence_section reads validated_data["news_intelligence"] and
-            # news_data["articles_count"].  Inject ZoomInfo news as fallback when the LLM
-            # council didn't produce news_intelligence.
-            zi_news = zoominfo_data.get("news_articles", [])
+            # news_data["articles_count"].  When the LLM council didn't produce
+            # news_intelligence, build it from the merged, deduped news set
+            # (news_gatherer already folded the ZoomInfo articles into it); the raw
+            # ZoomInfo list is only used when news gathering returned nothing.
+            merged_news = (news_data or {}).get("raw_articles") or []
+            zi_news = merged_news or zoominfo_data.get("news_articles", [])
             if zi_news and not validated_data.get("news_intelligence"):
                 article_titles = [a.get("title", "") for a in zi_news[:5] if a.get("title")]
                 validated_data["news_intelligence"] = {
@@ -2841,11 +2858,13 @@ async def process_company_profile(job_id: str, company_data: dict):
                     "articles_analyzed": len(zi_news),
                 }
                 # Update news_data so _build_news_intelligence_section sees a real source
+                # (articles_count already counts the merged set when there is one)
                 if not news_data:
                     news_data = {}
                 news_data["success"] = True
-                news_data["articles_count"] = len(zi_news)
-                logger.info("Injected %d ZoomInfo news articles into news_intelligence", len(zi_news))
+                if not merged_news:
+                    news_data["articles_count"] = len(zi_news)
+                logger.info("Injected %d news articles into news_intelligence (fallback)", len(zi_news))
 
         # Log what slideshow data we're including in the result
         slideshow_url_to_return = slideshow_result.get("slideshow_url")
@@ -2865,6 +2884,17 @@ async def process_company_profile(job_id: str, company_data: dict):
         if slideshow_status_to_return == "pending" and slideshow_id_to_return:
             _spawn_slideshow_reconcile(job_id, slideshow_id_to_return)
 
+        # Derived sections are rebuilt only when their input changed since the
+        # refresh baseline (api_cost is attached afterwards, so it is excluded).
+        tracing.mark_stage("7_assemble_result")
+        _sections_hash = ir.section_hash({k: v for k, v in validated_data.items() if k != "api_cost"})
+        if refresh_plan and refresh_state.get("sections_hash") == _sections_hash:
+            _executive_snapshot = refresh_prior.get("executive_snapshot")
+            _buying_signals = refresh_prior.get("buying_signals")
+        else:
+            _executive_snapshot = _build_executive_snapshot(validated_data, company_data)
+            _buying_signals = build_buying_signals(validated_data)
+
         jobs_store[job_id]["result"] = {
             "success": True,
             "company_name": validated_data.get("company_name", company_data["company_name"]),
@@ -2905,8 +2935,8 @@ async def process_company_profile(job_id: str, company_data: dict):
             "enrichment_trace": validated_data.get("enrichment_trace"),
             # New intelligence sections at top level for frontend
             # Build executive_snapshot from nested or flat data
-            "executive_snapshot": _build_executive_snapshot(validated_data, company_data),
-            "buying_signals": build_buying_signals(validated_data),
+            "executive_snapshot": _executive_snapshot,
+            "buying_signals": _buying_signals,
             "opportunity_themes": validated_data.get("opportunity_themes_detailed", {}) or _build_opportunity_themes_from_flat(validated_data),
             "stakeholder_map": stakeholder_map_data,
             "stakeholder_profiles": validated_data.get("stakeholder_profiles", {}),
@@ -2923,6 +2953,15 @@ async def process_company_profile(job_id: str, company_data: dict):
             "scoops": zoominfo_data.get("scoops", []),
             "technology_installs": zoominfo_data.get("technology_installs", []),
             "zoominfo_news": zoominfo_data.get("news_articles", []),
+            # Baseline for the next refresh of this domain (see incremental_refresh).
+            "refresh_state": {
+                "input_hashes": refresh_hashes,
+                "specialist_results": council_metadata.get("specialist_results", []),
+                "sections_hash": _sections_hash,
+                "deck_key": _deck_key,
+                "refreshed_from": (refresh_row or {}).get("job_id"),
+                "changed_inputs": refresh_plan["changed_inputs"] if refresh_plan else None,
+            },
         }
         # Per-job API cost snapshot. Nested INSIDE result so it survives in the
         # persisted result_data (in-memory jobs_store is wiped on Render restart).
@@ -2930,6 +2969,7 @@ async def process_company_profile(job_id: str, company_data: dict):
         try:
             from worker import cost_meter
             _api_cost = cost_meter.snapshot(job_id)
+            metrics.JOB_COST.observe((), float(_api_cost.get("total_usd") or 0.0))
             jobs_store[job_id]["api_cost"] = _api_cost
             jobs_store[job_id]["result"]["api_cost"] = _api_cost
             # Also nest inside validated_data so it rides along in the persisted
@@ -2969,12 +3009,20 @@ async def process_company_profile(job_id: str, company_data: dict):
         jobs_store[job_id]["current_step"] = "Complete!"
         logger.info(f"Completed processing for job {job_id}")
 
+        # Debug payload built once for the finished job and persisted with it.
+        dm = _debug_memo_module()
+        dm.freeze(jobs_store[job_id], lambda: _debug_payload_module().generate_debug_data(job_id, jobs_store[job_id]))
+
         # Durable persistence so a portal reload recovers this job even after the
         # in-memory jobs_store is wiped by a Render restart (Tier 2 reload fix).
-        persist_job_result(
-            job_id, "completed", jobs_store[job_id].get("result"),
+        tracing.mark_stage("8_persist")
+        await persist_job_result(
+            job_id, "completed", dm.for_persistence(jobs_store[job_id], jobs_store[job_id].get("result")),
             company_name=company_data.get("company_name"),
         )
+        tracing.finish_job(job_id)
+        await tracing.export_job(job_id)
+        await persist_job_cost(job_id, company_data)
 
     except Exception as e:
         logger.error(f"Error processing job {job_id}: {str(e)}")
@@ -2992,9 +3040,13 @@ async def process_company_profile(job_id: str, company_data: dict):
         jobs_store[job_id]["hunter_data"] = hunter_data
         jobs_store[job_id]["stakeholders_data"] = stakeholders_data
         jobs_store[job_id]["news_data"] = news_data
-        persist_job_result(job_id, "failed", jobs_store[job_id].get("result"))
+        await persist_job_result(job_id, "failed", jobs_store[job_id].get("result"))
+        tracing.finish_job(job_id, e)
+        await tracing.export_job(job_id)
+        await persist_job_cost(job_id, company_data)
 
 
+@tracing.traced("apollo.organization", kind="vendor")
 async def fetch_apollo_data(company_data: dict) -> dict:
     """Fetch company data from Apollo.io"""
     if not APOLLO_API_KEY:
@@ -3024,6 +3076,7 @@ async def fetch_apollo_data(company_data: dict) -> dict:
                 },
                 timeout=30.0
             )
+            tracing.annotate_status(response.status_code)
 
             if response.status_code == 200:
                 data = response.json()
@@ -3060,6 +3113,7 @@ async def fetch_apollo_data(company_data: dict) -> dict:
                     },
                     timeout=30.0
                 )
+                tracing.annotate_status(response2.status_code)
                 if response2.status_code == 200:
                     people_data = response2.json()
                     people = people_data.get("people", [])
@@ -3096,10 +3150,12 @@ async def fetch_apollo_data(company_data: dict) -> dict:
             return result
 
     except Exception as e:
+        tracing.annotate_error(e)
         logger.error(f"Apollo.io error: {str(e)}")
         return result
 
 
+@tracing.traced("pdl.company_enrich", kind="vendor")
 async def fetch_pdl_data(company_data: dict) -> dict:
     """Fetch company data from PeopleDataLabs Company Enrich API with extended fields."""
     if not PEOPLEDATALABS_API_KEY:
@@ -3120,6 +3176,7 @@ async def fetch_pdl_data(company_data: dict) -> dict:
                 },
                 timeout=30.0
             )
+            tracing.annotate_status(response.status_code)
 
             if response.status_code == 200:
                 data = response.json()
@@ -3149,10 +3206,12 @@ async def fetch_pdl_data(company_data: dict) -> dict:
                 return {}
 
     except Exception as e:
+        tracing.annotate_error(e)
         logger.error(f"PeopleDataLabs error: {str(e)}")
         return {}
 
 
+@tracing.traced("hunter.domain_search", kind="vendor")
 async def fetch_hunter_data(company_data: dict) -> dict:
     """Fetch company and contact data from Hunter.io Domain Search API."""
     if not HUNTER_API_KEY:
@@ -3174,6 +3233,7 @@ async def fetch_hunter_data(company_data: dict) -> dict:
                 },
                 timeout=30.0
             )
+            tracing.annotate_status(response.status_code)
 
             if response.status_code == 200:
                 data = response.json()
@@ -3206,6 +3266,7 @@ async def fetch_hunter_data(company_data: dict) -> dict:
                 return {}
 
     except Exception as e:
+        tracing.annotate_error(e)
         logger.error(f"Hunter.io error: {str(e)}")
         return {}
 
@@ -3221,6 +3282,7 @@ def extract_stakeholders_from_hunter(hunter_data: dict) -> List[Dict[str, Any]]:
 
     stakeholders = []
     seen_roles = set()
+    seen_people = _contact_identity_module().ContactIndex()
 
     for email_entry in emails:
         position = (email_entry.get("position") or "")
@@ -3249,6 +3311,13 @@ def extract_stakeholders_from_hunter(hunter_data: dict) -> List[Dict[str, Any]]:
         if not name:
             continue
 
+        # Hunter lists one row per address; skip a second address for a person
+        # already taken.
+        person = {"name": name, "email": email_entry.get("value"), "linkedin_url": email_entry.get("linkedin")}
+        if person in seen_people:
+            continue
+        seen_people.add(person)
+
         stakeholder = {
             "name": name,
             "title": email_entry.get("position", "Executive"),
@@ -3280,6 +3349,7 @@ def extract_stakeholders_from_hunter(hunter_data: dict) -> List[Dict[str, Any]]:
     return stakeholders
 
 
+@tracing.traced("apollo.people_search", kind="vendor")
 async def fetch_stakeholders(domain: str) -> List[Dict[str, Any]]:
     """Fetch executives and key contacts from Apollo.io for stakeholder mapping."""
     if not APOLLO_API_KEY:
@@ -3319,6 +3389,7 @@ async def fetch_stakeholders(domain: str) -> List[Dict[str, Any]]:
                 },
                 timeout=30.0
             )
+            tracing.annotate_status(response.status_code)
 
             if response.status_code == 200:
                 data = response.json()
@@ -3387,6 +3458,7 @@ async def fetch_stakeholders(domain: str) -> List[Dict[str, Any]]:
                 logger.warning(f"Apollo stakeholder search returned {response.status_code}")
 
     except Exception as e:
+        tracing.annotate_error(e)
         logger.error(f"Apollo stakeholder search error: {str(e)}")
 
     # Sort stakeholders for deterministic output (CTO > CIO > CFO > CMO > others)
@@ -3522,16 +3594,15 @@ def extract_data_from_apis(company_data: dict, apollo_data: dict, pdl_data: dict
     return result
 
 
-async def fetch_company_news(company_name: str, domain: Optional[str] = None) -> dict:
-    """Fetch recent company news using GNews API"""
+@tracing.traced("gnews.search", kind="vendor")
+async def fetch_company_news(company_name: str, domain: Optional[str] = None,
+                             zoominfo_data: Optional[dict] = None, use_gnews: bool = True) -> dict:
+    """Fetch recent company news using GNews API, merged with ZoomInfo news/scoops"""
     try:
-        # Import news gatherer
-        import sys
-        sys.path.insert(0, 'worker')
-        from news_gatherer import gather_company_news
+        from worker.news_gatherer import gather_company_news
 
         logger.info(f"Fetching recent news for {company_name}")
-        news_data = await gather_company_news(company_name, domain)
+        news_data = await gather_company_news(company_name, domain, zoominfo_data=zoominfo_data, use_gnews=use_gnews)
 
         if news_data.get("success"):
             logger.info(f"Found {news_data.get('articles_count', 0)} news articles for {company_name}")
@@ -3541,6 +3612,7 @@ async def fetch_company_news(company_name: str, domain: Optional[str] = None) ->
         return news_data
 
     except Exception as e:
+        tracing.annotate_error(e)
         logger.error(f"Error fetching news: {e}")
         return {
             "success": False,
@@ -3554,40 +3626,42 @@ async def fetch_company_news(company_name: str, domain: Optional[str] = None) ->
         }
 
 
+async def _supabase():
+    """The process-wide pooled async Supabase client (None when not configured).
+
+    One AsyncClient is shared by every durable read/write (see
+    worker/supabase_pool.py) instead of a new sync client per call, so DB I/O
+    reuses connections and never blocks the event loop.
+    """
+    if not SUPABASE_URL or not SUPABASE_KEY:
+        return None
+    try:
+        from worker.supabase_pool import get_pool
+    except Exception:  # noqa: BLE001
+        from supabase_pool import get_pool  # bare path
+    return await get_pool().client()
+
+
 async def store_raw_data(company_name: str, apollo_data: dict, pdl_data: dict, hunter_data: dict = None):
-    """Store raw data in Supabase"""
+    """Store raw data in Supabase (one batched insert for all sources)"""
     if not SUPABASE_URL or not SUPABASE_KEY:
         logger.warning("Supabase not configured, skipping storage")
         return
 
     try:
-        from supabase import create_client, Client
-
-        supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-
-        # Store Apollo data
-        if apollo_data:
-            supabase.table("raw_data").insert({
-                "company_name": company_name,
-                "source": "apollo",
-                "raw_data": apollo_data
-            }).execute()
-
-        # Store PDL data
-        if pdl_data:
-            supabase.table("raw_data").insert({
-                "company_name": company_name,
-                "source": "peopledatalabs",
-                "raw_data": pdl_data
-            }).execute()
-
-        # Store Hunter.io data
-        if hunter_data:
-            supabase.table("raw_data").insert({
-                "company_name": company_name,
-                "source": "hunter",
-                "raw_data": hunter_data
-            }).execute()
+        supabase = await _supabase()
+
+        rows = [
+            {"company_name": company_name, "source": source, "raw_data": data}
+            for source, data in (
+                ("apollo", apollo_data),
+                ("peopledatalabs", pdl_data),
+                ("hunter", hunter_data),
+            )
+            if data
+        ]
+        if rows:
+            await supabase.table("raw_data").insert(rows).execute()
 
         logger.info(f"Stored raw data for {company_name}")
 
@@ -3654,8 +3728,104 @@ Use real, accurate data. If data is unavailable, use "Unknown"."""
         return fallback_data
 
 
-def persist_job_result(job_id: str, status: str, result: Optional[dict],
-                       company_name: Optional[str] = None) -> None:
+def _incremental_refresh_module():
+    """Dual-path import of the stdlib-only refresh-mode hashing/diff helpers."""
+    try:
+        from worker import incremental_refresh as ir
+    except Exception:  # noqa: BLE001
+        import incremental_refresh as ir  # bare path
+    return ir
+
+
+async def _fetch_latest_domain_result(domain: str) -> Optional[dict]:
+    """The newest completed job_results row for `domain` (refresh-mode baseline).
+
+    Filters on the result JSON's domain (index: migrations/
+    2026-10-18_job_results_domain_index.sql). Best-effort: never raises.
+    """
+    if not SUPABASE_URL or not SUPABASE_KEY or not domain:
+        return None
+    try:
+        supabase = await _supabase()
+        res = await supabase.table("job_results").select("*").eq(
+            "status", "completed").eq("result->>domain", domain).order(
+            "updated_at", desc=True).limit(1).execute()
+        rows = getattr(res, "data", None) or []
+        return rows[0] if rows else None
+    except Exception as e:  # noqa: BLE001
+        logger.warning("Refresh baseline lookup failed for %s: %s", domain, e)
+        return None
+
+
+def _cost_budget_module():
+    """Dual-path import of the stdlib-only budget/rollup/estimate helpers."""
+    try:
+        from worker import cost_budget as cb
+    except Exception:  # noqa: BLE001
+        import cost_budget as cb  # bare path
+    return cb
+
+
+async def _seed_tenant_spend(company_data: dict) -> None:
+    """Load the seller's spend today from the job_costs rollup (tenant budget only).
+
+    Best-effort: never raises; without it the budget counts this worker's jobs only.
+    """
+    cb = _cost_budget_module()
+    tenant = cb.tenant_key(company_data)
+    if not cb.TENANT_DAILY_BUDGET_USD or not tenant or not SUPABASE_URL or not SUPABASE_KEY:
+        return
+    try:
+        supabase = await _supabase()
+        res = await supabase.table("job_cost_daily_by_seller").select("total_usd").eq(
+            "seller", tenant).eq("day", cb.today()).limit(1).execute()
+        rows = getattr(res, "data", None) or []
+        if rows:
+            cb.seed_tenant_spend(tenant, rows[0].get("total_usd") or 0.0)
+    except Exception as e:  # noqa: BLE001
+        logger.warning("Tenant spend lookup failed for %s: %s", tenant, e)
+
+
+async def persist_job_cost(job_id: str, company_data: dict) -> None:
+    """Write the job's cost row to `job_costs` (rolled up per seller/day/batch by
+    views) and count it toward the seller's day. Best-effort: never raises."""
+    cb = _cost_budget_module()
+    try:
+        from worker import cost_meter
+        row = cb.cost_row(job_id, company_data, cost_meter.snapshot(job_id), tracing.summarize(job_id))
+        cb.add_tenant_spend(row["seller"], row["total_usd"])
+    except Exception as e:  # noqa: BLE001
+        logger.warning("Cost rollup failed for %s: %s", job_id, e)
+        return
+    if not SUPABASE_URL or not SUPABASE_KEY:
+        return
+    try:
+        supabase = await _supabase()
+        await supabase.table("job_costs").upsert(row, on_conflict="job_id").execute()
+    except Exception as e:  # noqa: BLE001
+        logger.warning("Failed to persist job cost for %s: %s", job_id, e)
+
+
+async def _recent_job_costs(limit: int = 200) -> List[dict]:
+    """Recent job_costs rows for estimates; this worker's own history when
+    Supabase is unavailable or empty."""
+    cb = _cost_budget_module()
+    if SUPABASE_URL and SUPABASE_KEY:
+        try:
+            supabase = await _supabase()
+            res = await supabase.table("job_costs").select(
+                "total_usd,duration_ms,stage_ms,by_service").order(
+                "created_at", desc=True).limit(limit).execute()
+            rows = getattr(res, "data", None) or []
+            if rows:
+                return rows
+        except Exception as e:  # noqa: BLE001
+            logger.warning("job_costs history lookup failed: %s", e)
+    return cb.history()
+
+
+async def persist_job_result(job_id: str, status: str, result: Optional[dict],
+                             company_name: Optional[str] = None) -> None:
     """
     Upsert a job's full result into the durable `job_results` Supabase table,
     keyed by job_id. The in-memory jobs_store is wiped on every Render restart,
@@ -3667,15 +3837,16 @@ def persist_job_result(job_id: str, status: str, result: Optional[dict],
     if not SUPABASE_URL or not SUPABASE_KEY:
         return
     try:
-        from supabase import create_client, Client
-        supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-        supabase.table("job_results").upsert({
+        supabase = await _supabase()
+        await supabase.table("job_results").upsert({
             "job_id": job_id,
             "company_name": company_name or (result or {}).get("company_name"),
             "status": status,
             "result": result,
             "updated_at": datetime.utcnow().isoformat() + "Z",
         }, on_conflict="job_id").execute()
+        if _PERSISTED_ROW_CACHE is not None:
+            _PERSISTED_ROW_CACHE.invalidate(job_id)
         logger.info(f"Persisted job_results row for {job_id} (status={status})")
     except Exception as e:  # noqa: BLE001
         msg = str(e)
@@ -3691,7 +3862,7 @@ def persist_job_result(job_id: str, status: str, result: Optional[dict],
             logger.warning("Failed to persist job_results for %s: %s", job_id, e)
 
 
-def _fetch_job_results_row(job_id: str) -> Optional[dict]:
+async def _fetch_job_results_row(job_id: str) -> Optional[dict]:
     """Read the durable job_results row for job_id (None if missing/unavailable).
 
     This is the recovery source the portal needs after a Render restart wipes the
@@ -3700,9 +3871,8 @@ def _fetch_job_results_row(job_id: str) -> Optional[dict]:
     if not SUPABASE_URL or not SUPABASE_KEY:
         return None
     try:
-        from supabase import create_client, Client
-        supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-        res = supabase.table("job_results").select("*").eq(
+        supabase = await _supabase()
+        res = await supabase.table("job_results").select("*").eq(
             "job_id", job_id).maybe_single().execute()
         return res.data if (res and res.data) else None
     except Exception as e:  # noqa: BLE001
@@ -3723,20 +3893,95 @@ def _recovery_helpers():
     return jsr
 
 
-async def store_validated_data(company_name: str, validated_data: dict):
-    """Store validated data in Supabase"""
-    if not SUPABASE_URL or not SUPABASE_KEY:
-        return
+# Durable-row cache for /job-status (built lazily: job_status_recovery is imported
+# via the dual-path helper above) plus the in-flight background lookups, keyed by
+# job_id so concurrent polls for the same job share one Supabase query.
+_PERSISTED_ROW_CACHE = None
+_BACKGROUND_HYDRATE_TASKS: Dict[str, "asyncio.Task"] = {}
 
-    try:
-        from supabase import create_client, Client
 
-        supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
+def _persisted_row_cache():
+    global _PERSISTED_ROW_CACHE
+    if _PERSISTED_ROW_CACHE is None:
+        jsr = _recovery_helpers()
+        _PERSISTED_ROW_CACHE = jsr.PersistedRowCache()
+    return _PERSISTED_ROW_CACHE
 
-        supabase.table("finalize_data").insert({
-            "company_name": company_name,
-            "validated_data": validated_data,
-            "confidence_scores": {"overall": validated_data.get("confidence_score", 0.85)}
+
+async def _hydrate_job_results_row(job_id: str) -> Optional[dict]:
+    """Fetch the durable row in the background and cache it (hit or miss).
+    A finished job's row is also rehydrated into jobs_store."""
+    row = await _fetch_job_results_row(job_id)
+    _persisted_row_cache().put(job_id, row, time.monotonic())
+    _rehydrate_job(job_id, row)
+    return row
+
+
+def _rehydrate_job(job_id: str, row: Optional[dict]) -> None:
+    """Re-admit a finished job spilled to job_results (evicted or pre-restart)
+    into jobs_store, so repeat reads are served from memory again. Orphaned
+    'processing' rows stay out — resolve_persisted_status reports those."""
+    if not row or job_id in jobs_store:
+        return
+    if (row.get("status") or "").strip().lower() not in ("completed", "failed"):
+        return
+    jsr = _recovery_helpers()
+    if jsr is None:
+        return
+    resolved = jsr.resolve_persisted_status(row)
+    result, debug_data = _debug_memo_module().split_persisted(resolved.get("result"))
+    jobs_store[job_id] = {
+        "job_id": job_id,
+        "status": resolved["status"],
+        "progress": resolved.get("progress", 0),
+        "current_step": resolved.get("current_step", ""),
+        "result": result,
+        "company_data": {"company_name": row.get("company_name")},
+        "created_at": row.get("updated_at"),
+        "rehydrated": True,
+        "debug_data": debug_data,
+    }
+
+
+async def _spill_job(job_id: str, job: dict) -> None:
+    """Upsert an evicted finished job to job_results (its durable home)."""
+    await persist_job_result(
+        job_id, job.get("status", "completed"),
+        _debug_memo_module().for_persistence(job, job.get("result")),
+        company_name=(job.get("company_data") or {}).get("company_name"),
+    )
+
+
+def _debug_memo_module():
+    """Dual-path import of the stdlib-only per-job debug payload memo."""
+    try:
+        from worker import debug_memo as dm
+    except Exception:  # noqa: BLE001
+        import debug_memo as dm  # bare path
+    return dm
+
+
+def _spawn_job_results_hydrate(job_id: str) -> None:
+    """Fire-and-forget _hydrate_job_results_row, deduplicated per job_id."""
+    if job_id in _BACKGROUND_HYDRATE_TASKS:
+        return
+    task = asyncio.create_task(_hydrate_job_results_row(job_id))
+    _BACKGROUND_HYDRATE_TASKS[job_id] = task
+    task.add_done_callback(lambda _t: _BACKGROUND_HYDRATE_TASKS.pop(job_id, None))
+
+
+async def store_validated_data(company_name: str, validated_data: dict):
+    """Store validated data in Supabase"""
+    if not SUPABASE_URL or not SUPABASE_KEY:
+        return
+
+    try:
+        supabase = await _supabase()
+
+        await supabase.table("finalize_data").insert({
+            "company_name": company_name,
+            "validated_data": validated_data,
+            "confidence_scores": {"overall": validated_data.get("confidence_score", 0.85)}
         }).execute()
 
         logger.info(f"Stored validated data for {company_name}")
@@ -3745,6 +3990,7 @@ async def store_validated_data(company_name: str, validated_data: dict):
         logger.error(f"Supabase storage error: {str(e)}")
 
 
+@tracing.traced("gamma.generate", kind="vendor")
 async def generate_slideshow(company_name: str, validated_data: dict) -> Dict[str, Any]:
     """Generate slideshow using Gamma API"""
     # CRITICAL: Validate inputs are correct types
@@ -3775,9 +4021,7 @@ async def generate_slideshow(company_name: str, validated_data: dict) -> Dict[st
         logger.info(f"   GAMMA_API_KEY is set: {bool(GAMMA_API_KEY)}")
 
         # Import and initialize Gamma slideshow creator
-        import sys
-        sys.path.insert(0, 'worker')
-        from gamma_slideshow import GammaSlideshowCreator
+        from worker.gamma_slideshow import GammaSlideshowCreator
 
         gamma_creator = GammaSlideshowCreator(GAMMA_API_KEY)
         logger.info("   ✓ Gamma creator initialized")
@@ -3955,13 +4199,29 @@ async def generate_slideshow_endpoint(job_id: str):
 )
 async def create_profile_request(
     profile_request: CompanyProfileRequest,
-    background_tasks: BackgroundTasks
+    background_tasks: BackgroundTasks,
+    estimate: bool = False,
 ):
     """
     Accept company profile requests and process with real data sources.
+
+    `?estimate=1` is a pre-flight: nothing is queued; the response predicts the
+    job's cost and latency from recent finished jobs (worker/cost_budget.py).
     """
     logger.info(f"Received profile request for: {profile_request.company_name}")
 
+    if estimate:
+        from fastapi.responses import JSONResponse
+
+        cb = _cost_budget_module()
+        tenant = cb.tenant_key(profile_request.model_dump())
+        return JSONResponse({
+            "status": "estimate",
+            "company_name": profile_request.company_name,
+            "domain": profile_request.domain,
+            "estimate": cb.estimate(await _recent_job_costs(), tenant=tenant),
+        })
+
     # Generate job ID
     import hashlib
     import time
@@ -3976,6 +4236,8 @@ async def create_profile_request(
         "requested_by": profile_request.requested_by,
         "salesperson_name": profile_request.salesperson_name or "",
         "canada_only": profile_request.canada_only,
+        "refresh": profile_request.refresh,
+        "batch_id": profile_request.batch_id,
     }
 
     jobs_store[job_id] = {
@@ -4002,19 +4264,63 @@ async def create_profile_request(
     )
 
 
+def _response_payload_module():
+    """Dual-path import of the stdlib-only projection/ETag helpers."""
+    try:
+        from worker import response_payload as rp
+    except Exception:  # noqa: BLE001
+        import response_payload as rp  # bare path
+    return rp
+
+
+def _json_payload_response(request: Request, payload: dict, fields: Optional[str] = None,
+                           exclude: Optional[str] = None, view: Optional[str] = None):
+    """
+    Serialize a job payload with field projection and ETag support.
+
+    `fields` / `exclude` are comma-separated dotted paths (e.g.
+    `fields=status,progress,result.slideshow_url`); `view=summary` drops the
+    raw vendor blobs and council metadata. An If-None-Match that matches the
+    projected body's ETag gets a bodiless 304, so unchanged polls cost
+    nothing beyond the headers.
+    """
+    from fastapi.responses import Response
+
+    rp = _response_payload_module()
+    excluded = rp.parse_field_list(exclude)
+    if (view or "").strip().lower() == "summary":
+        excluded = list(rp.SUMMARY_EXCLUDE) + excluded
+    body = rp.dumps(rp.project(payload, rp.parse_field_list(fields), excluded))
+    etag = rp.etag_for(body)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if rp.etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
 # Job status endpoint
 @app.get("/job-status/{job_id}", response_model=JobStatus, tags=["Status"])
-async def get_job_status(job_id: str):
+async def get_job_status(job_id: str, request: Request, fields: Optional[str] = None,
+                         exclude: Optional[str] = None, view: Optional[str] = None):
     """
     Get job status with real-time progress.
 
-    If the job's slideshow is still pending (background reconciliation in
-    flight), perform a single non-blocking Gamma status check inline and
-    update jobs_store before responding. This lazy reconcile is the safety
-    net for cases where the dedicated background task died (e.g. worker
-    restart), so the next poll naturally picks up the slideshow URL.
+    Pure read: served from the in-memory jobs_store, or (post-restart) from a
+    short-TTL cache of the durable job_results row. No Supabase or Gamma I/O
+    runs inline — stale-job reaping and pending-slideshow reconciliation live
+    in the background maintenance sweep (_run_job_maintenance), so this
+    endpoint's latency is independent of either vendor.
+
+    Supports `fields=` / `exclude=` / `view=summary` projection and
+    If-None-Match (see _json_payload_response).
     """
     logger.info(f"Status check for job: {job_id}")
+    job_status = _resolve_job_status(job_id)
+    return _json_payload_response(request, job_status.model_dump(), fields, exclude, view)
+
+
+def _resolve_job_status(job_id: str) -> JobStatus:
+    """Build the JobStatus for /job-status (raises 404 when unknown)."""
 
     job = jobs_store.get(job_id)
 
@@ -4023,16 +4329,33 @@ async def get_job_status(job_id: str):
         # redeploy, so fall back to the durable job_results row before 404-ing. A
         # row still marked 'processing' but absent from memory was orphaned by the
         # restart -> report failed/interrupted so the portal stops spinning on it.
-        row = _fetch_job_results_row(job_id)
         jsr = _recovery_helpers()
-        if row and jsr is not None:
+        if jsr is None:
+            raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+        cache = _persisted_row_cache()
+        fresh, row = cache.get(job_id, time.monotonic())
+        if not fresh:
+            # Expired, invalidated or cold: refresh the row in the background. A
+            # row seen before is still served meanwhile (stale-while-revalidate).
+            _spawn_job_results_hydrate(job_id)
+        if row is None and job_id not in cache and job_id in _BACKGROUND_HYDRATE_TASKS:
+            # First lookup still in flight: keep polling. A cached miss, fresh
+            # or expired, is a 404 (typo or deleted job) below.
+            return JobStatus(
+                job_id=job_id,
+                status="pending",
+                progress=0,
+                current_step="Recovering job state...",
+            )
+        if row:
             resolved = jsr.resolve_persisted_status(row)
+            result, _ = _debug_memo_module().split_persisted(resolved.get("result"))
             return JobStatus(
                 job_id=job_id,
                 status=resolved["status"],
                 progress=resolved.get("progress", 0),
                 current_step=resolved.get("current_step", ""),
-                result=resolved.get("result"),
+                result=result,
                 created_at=row.get("updated_at"),
             )
         raise HTTPException(
@@ -4040,26 +4363,14 @@ async def get_job_status(job_id: str):
             detail=f"Job {job_id} not found"
         )
 
-    # Stale-job reaper: an in-memory job stuck 'processing' well past a full run's
-    # duration means its worker hung/died without flipping the status. Reap it to
-    # 'failed' (and persist) so it doesn't show as perpetually in progress.
-    jsr = _recovery_helpers()
-    if jsr is not None and job.get("status") == "processing":
-        from datetime import timezone as _tz
-        if jsr.is_stale_processing(job.get("status", ""), job.get("created_at", ""),
-                                   datetime.now(_tz.utc)):
-            job["status"] = "failed"
-            job["current_step"] = "Timed out — no progress for too long; the run was reaped."
-            job["result"] = job.get("result") or {"success": False, "error": "stale_processing_reaped"}
-            persist_job_result(job_id, "failed", job.get("result"),
-                               company_name=(job.get("company_data") or {}).get("company_name"))
-
-    await _lazy_reconcile_slideshow_if_pending(job_id, job)
-
-    # API cost: prefer the final stored snapshot (written at completion), but
-    # while the job is still in flight return a LIVE snapshot from the cost meter
-    # so the portal's cost meter + header tick up in real time instead of staying
-    # at $0.00 until the job finishes.
+    return _job_status_payload(job_id, job)
+
+
+def _live_api_cost(job_id: str, job: dict) -> Optional[dict]:
+    """API cost: prefer the final stored snapshot (written at completion), but
+    while the job is still in flight return a LIVE snapshot from the cost meter
+    so the portal's cost meter + header tick up in real time instead of staying
+    at $0.00 until the job finishes."""
     stored_cost = job.get("api_cost") or (job.get("result") or {}).get("api_cost")
     api_cost = stored_cost
     if not (stored_cost and stored_cost.get("total_usd")):
@@ -4073,7 +4384,12 @@ async def get_job_status(job_id: str):
                 api_cost = live_cost
         except Exception:  # noqa: BLE001 — cost metering must never break status
             pass
+    return api_cost
+
 
+def _job_status_payload(job_id: str, job: dict) -> JobStatus:
+    """Full JobStatus for an in-memory job (shared by /job-status and the
+    terminal event of /jobs/{job_id}/events)."""
     return JobStatus(
         job_id=job_id,
         status=job["status"],
@@ -4087,13 +4403,103 @@ async def get_job_status(job_id: str):
         council_metadata=job.get("council_metadata"),
         slideshow_data=job.get("slideshow_data"),
         news_data=job.get("news_data"),
-        api_cost=api_cost,
+        api_cost=_live_api_cost(job_id, job),
         created_at=job.get("created_at")
     )
 
 
+def _job_events_module():
+    """Dual-path import of the stdlib-only SSE event log (see _recovery_helpers)."""
+    try:
+        from worker import job_events as je
+    except Exception:  # noqa: BLE001
+        import job_events as je  # bare path
+    return je
+
+
+_JOB_EVENT_BUS = None
+
+
+def _job_event_bus():
+    global _JOB_EVENT_BUS
+    if _JOB_EVENT_BUS is None:
+        _JOB_EVENT_BUS = _job_events_module().JobEventBus()
+    return _JOB_EVENT_BUS
+
+
+@app.get("/jobs/{job_id}/trace", tags=["Status"])
+async def get_job_trace(job_id: str, spans: bool = False):
+    """Per-stage timing for a job run: the critical path (at each level the
+    child span that finished last), time per span kind (stage / vendor / llm /
+    wait) and, with ?spans=true, every recorded span. Traces are kept in memory
+    for the most recent TRACE_MAX_JOBS jobs (see worker/tracing.py)."""
+    summary = tracing.summarize(job_id)
+    if summary is None:
+        raise HTTPException(status_code=404, detail="No trace recorded for job")
+    if not spans:
+        summary.pop("spans", None)
+    return summary
+
+
+@app.get("/jobs/{job_id}/events", tags=["Status"])
+async def stream_job_events(job_id: str, request: Request, since: int = 0):
+    """
+    Server-Sent Events stream of a job's progress.
+
+    Pushes small deltas (stage transitions, progress, cost-meter ticks) as
+    they happen, and the full JobStatus payload exactly once in the terminal
+    `complete`/`failed` event, then closes. Each event carries a per-job
+    sequence number as its SSE id; reconnecting with `Last-Event-ID` (or
+    `?since=`) replays only what was missed. Replaces tight /job-status
+    polling for in-flight jobs; the diff runs against jobs_store in memory.
+    """
+    from fastapi.responses import StreamingResponse
+
+    if job_id not in jobs_store:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+
+    je = _job_events_module()
+    log = _job_event_bus().log(job_id)
+    resume_from = max(since, je.parse_last_event_id(request.headers.get("last-event-id")))
+    tick = float(os.getenv("JOB_EVENTS_TICK_SECONDS", je.TICK_SECONDS))
+
+    async def _events():
+        seq = resume_from
+        idle = 0.0
+        while True:
+            job = jobs_store.get(job_id)
+            if job is not None and not log.closed:
+                log.observe(je.progress_view(job, _live_api_cost(job_id, job)))
+                if job.get("status") in je.TERMINAL_STATUSES:
+                    log.finish(job["status"], _job_status_payload(job_id, job).model_dump())
+            for event in log.since(seq):
+                yield je.format_sse(event)
+                seq = event["seq"]
+                idle = 0.0
+            if log.closed and seq >= log.last_seq:
+                return
+            if job is None:
+                # Evicted / restarted mid-stream: the portal falls back to /job-status.
+                yield je.format_sse({"seq": seq, "type": "gone", "data": {"job_id": job_id}})
+                return
+            if await request.is_disconnected():
+                return
+            if idle >= je.KEEPALIVE_SECONDS:
+                yield ": keepalive\n\n"
+                idle = 0.0
+            await asyncio.sleep(tick)
+            idle += tick
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 @app.get("/job-result/{job_id}", tags=["Status"])
-async def get_job_result(job_id: str):
+async def get_job_result(job_id: str, request: Request, fields: Optional[str] = None,
+                         exclude: Optional[str] = None, view: Optional[str] = None):
     """
     Return a completed job's full result, durably.
 
@@ -4101,7 +4507,15 @@ async def get_job_result(job_id: str):
     persisted `job_results` Supabase row. This is what lets the portal recover a
     job's data on reload after a Render restart has wiped the in-memory store —
     for ALL jobs, independent of any frontend poller. 404 only if neither has it.
+
+    Supports `fields=` / `exclude=` / `view=summary` projection and
+    If-None-Match (see _json_payload_response).
     """
+    payload = await _load_job_result(job_id)
+    return _json_payload_response(request, payload, fields, exclude, view)
+
+
+async def _load_job_result(job_id: str) -> dict:
     job = jobs_store.get(job_id)
     if job and job.get("result"):
         return {
@@ -4111,24 +4525,17 @@ async def get_job_result(job_id: str):
             "source": "memory",
         }
 
-    if SUPABASE_URL and SUPABASE_KEY:
-        try:
-            from supabase import create_client, Client
-            supabase: Client = create_client(SUPABASE_URL, SUPABASE_KEY)
-            res = supabase.table("job_results").select("*").eq(
-                "job_id", job_id
-            ).maybe_single().execute()
-            if res and res.data:
-                row = res.data
-                return {
-                    "job_id": job_id,
-                    "status": row.get("status", "completed"),
-                    "result": row.get("result"),
-                    "company_name": row.get("company_name"),
-                    "source": "supabase",
-                }
-        except Exception as e:  # noqa: BLE001
-            logger.warning("job_results lookup failed for %s: %s", job_id, e)
+    row = await _fetch_job_results_row(job_id)
+    if row:
+        _rehydrate_job(job_id, row)
+        result, _ = _debug_memo_module().split_persisted(row.get("result"))
+        return {
+            "job_id": job_id,
+            "status": row.get("status", "completed"),
+            "result": result,
+            "company_name": row.get("company_name"),
+            "source": "supabase",
+        }
 
     raise HTTPException(status_code=404, detail=f"No result for job {job_id}")
 
@@ -4238,8 +4645,8 @@ async def _lazy_reconcile_slideshow_if_pending(job_id: str, job: dict) -> None:
     when the generation has reached a terminal state.
 
     Belt-and-suspenders for the dedicated background reconcile task: if
-    that task died (worker restart, exception), the next /job-status read
-    still picks up the URL.
+    that task died (exception, event-loop hiccup), the next maintenance
+    sweep still picks up the URL.
     """
     result = job.get("result") or {}
     if result.get("slideshow_status") != "pending":
@@ -4290,168 +4697,107 @@ async def _lazy_reconcile_slideshow_if_pending(job_id: str, job: dict) -> None:
     # else: still pending — leave the job untouched, frontend keeps polling
 
 
-# ============================================================================
-# ZoomInfo Raw Diagnostics Endpoint
-# ============================================================================
+async def _reap_stale_job(job_id: str, job: dict) -> None:
+    """Flip a job stuck 'processing' past a full run's duration to 'failed' and
+    persist it — its worker hung or died without flipping the status."""
+    job["status"] = "failed"
+    job["current_step"] = "Timed out — no progress for too long; the run was reaped."
+    job["result"] = job.get("result") or {"success": False, "error": "stale_processing_reaped"}
+    await persist_job_result(
+        job_id, "failed", job.get("result"),
+        company_name=(job.get("company_data") or {}).get("company_name"),
+    )
+
 
-@app.get("/debug-zoominfo/{domain}", tags=["Debug"])
-async def debug_zoominfo_raw(domain: str):
+async def _run_job_maintenance() -> dict:
     """
-    Diagnostic endpoint: makes raw HTTP calls to every ZoomInfo endpoint and
-    returns the EXACT status code + response body for each payload variant.
-    This bypasses all client-side error handling so you can see what ZoomInfo
-    actually returns — 400 bad request, 403 plan restriction, 404 wrong path,
-    or 200 with empty/populated data.
+    One maintenance pass over jobs_store: reap stale 'processing' jobs, do a
+    single Gamma status check for each job whose slideshow is still pending,
+    then apply the cache's eviction policy and spill evicted jobs.
+
+    This is the work /job-status used to do inline on every poll. Best-effort:
+    a failure on one job never stops the sweep. Returns per-pass counts.
     """
-    import httpx as _httpx
-    from worker.zoominfo_client import ENDPOINTS, DEFAULT_INTENT_TOPICS
+    jsr = _recovery_helpers()
+    if jsr is None:
+        return {"reaped": 0, "reconciled": 0, "spilled": 0}
+    from datetime import timezone as _tz
+    stale_ids, pending_ids = jsr.jobs_needing_maintenance(jobs_store, datetime.now(_tz.utc))
+    for job_id in stale_ids:
+        job = jobs_store.get(job_id)
+        if job is None:
+            continue
+        try:
+            await _reap_stale_job(job_id, job)
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f"Stale-job reap failed for {job_id}: {e}")
+    for job_id in pending_ids:
+        job = jobs_store.get(job_id)
+        if job is None:
+            continue
+        await _lazy_reconcile_slideshow_if_pending(job_id, job)
+    # Evict past TTL / count / byte budget and spill evictions to job_results.
+    evicted = jobs_store.sweep()
+    for job_id, job in evicted:
+        if job.get("rehydrated"):
+            continue  # came from job_results unchanged; nothing new to write
+        try:
+            await _spill_job(job_id, job)
+        except Exception as e:  # noqa: BLE001
+            logger.warning(f"Spill of evicted job {job_id} failed: {e}")
+    return {"reaped": len(stale_ids), "reconciled": len(pending_ids), "spilled": len(evicted)}
 
-    zi_client = _get_zoominfo_client()
-    if not zi_client:
-        return {"error": "ZoomInfo not configured — set ZOOMINFO_REFRESH_TOKEN+CLIENT_ID+CLIENT_SECRET or ZOOMINFO_ACCESS_TOKEN"}
 
-    # Ensure a valid auth token is loaded before probing
-    try:
-        await zi_client._ensure_valid_token()
-    except Exception as e:
-        return {"error": f"ZoomInfo auth failed: {e}"}
-
-    bare = zi_client._bare_domain(domain)
-    primary_website = f"https://www.{bare}"
-    company_name = zi_client._company_name_from_domain(domain)
-
-    results: dict = {
-        "domain_input": domain,
-        "bare_domain": bare,
-        "primary_website": primary_website,
-        "company_name_guess": company_name,
-        "token_present": bool(zi_client.access_token),
-    }
+_JOB_MAINTENANCE_TASKS: set = set()
 
-    # ------------------------------------------------------------------ #
-    # Helper: POST one payload to one endpoint and capture everything     #
-    # Returns a dict with: endpoint, payload, http_status, response_body, #
-    # data_len (how many records _extract_data_list found), error         #
-    # ------------------------------------------------------------------ #
-    async def _probe(endpoint: str, payload: dict) -> dict:
-        url = f"{zi_client.base_url}{endpoint}"
-        headers = {
-            "Content-Type": "application/vnd.api+json",
-            "Accept": "application/vnd.api+json, application/json",
-            "Authorization": f"Bearer {zi_client.access_token}",
-        }
+
+async def _job_maintenance_loop() -> None:
+    jsr = _recovery_helpers()
+    interval = float(os.getenv(
+        "JOB_MAINTENANCE_INTERVAL_SECONDS",
+        jsr.MAINTENANCE_INTERVAL_SECONDS if jsr is not None else 15,
+    ))
+    while True:
         try:
-            async with _httpx.AsyncClient(timeout=20) as hc:
-                r = await hc.post(url, json=payload, headers=headers)
-            try:
-                body = r.json()
-            except Exception:
-                body = r.text[:1000]
-            data_list = zi_client._extract_data_list(body) if isinstance(body, dict) else []
-            return {
-                "endpoint": endpoint,
-                "payload": payload,
-                "http_status": r.status_code,
-                "response_body": body,
-                "data_len": len(data_list),
-            }
-        except Exception as exc:
-            return {
-                "endpoint": endpoint,
-                "payload": payload,
-                "http_status": None,
-                "response_body": None,
-                "error": str(exc),
-            }
+            await _run_job_maintenance()
+        except Exception as e:  # noqa: BLE001 — the loop must outlive any one pass
+            logger.warning(f"Job maintenance sweep failed: {e}")
+        await asyncio.sleep(interval)
+
+
+@app.on_event("startup")
+async def _start_job_maintenance() -> None:
+    task = asyncio.create_task(_job_maintenance_loop())
+    _JOB_MAINTENANCE_TASKS.add(task)
+    task.add_done_callback(_JOB_MAINTENANCE_TASKS.discard)
 
-    # ------------------------------------------------------------------ #
-    # 1. Company enrich — try every payload variant in order             #
-    # ------------------------------------------------------------------ #
-    from worker.zoominfo_client import COMPANY_OUTPUT_FIELDS as _CO_FIELDS
-    company_payloads = [
-        # JSON:API format for GTM Data API v1
-        {"data": {"type": "CompanyEnrich", "attributes": {"matchCompanyInput": [{"companyWebsite": primary_website}], "outputFields": _CO_FIELDS}}},
-        {"data": {"type": "CompanyEnrich", "attributes": {"matchCompanyInput": [{"companyWebsite": f"https://{bare}"}], "outputFields": _CO_FIELDS}}},
-        {"data": {"type": "CompanyEnrich", "attributes": {"matchCompanyInput": [{"companyName": company_name}], "outputFields": _CO_FIELDS}}},
-    ]
-    company_probes = []
-    company_id_found = None
-    for p in company_payloads:
-        probe = await _probe(ENDPOINTS["company_enrich"], p)
-        company_probes.append(probe)
-        if probe["http_status"] == 200 and probe["data_len"] > 0:
-            # Extract companyId from first successful result
-            body = probe["response_body"]
-            data_list = zi_client._extract_data_list(body) if isinstance(body, dict) else []
-            if data_list:
-                raw = data_list[0]
-                attrs = raw.get("attributes", raw)
-                company_id_found = (
-                    attrs.get("companyId") or attrs.get("id") or
-                    raw.get("id") or str(attrs.get("objectId", "")) or None
-                )
-            break  # stop once we have a hit
-    results["company_enrich"] = company_probes
-    results["company_id_found"] = company_id_found
-
-    # ------------------------------------------------------------------ #
-    # 2. Scoops search (known working — baseline reference)              #
-    # ------------------------------------------------------------------ #
-    scoops_attrs = {"companyId": company_id_found} if company_id_found else {"companyWebsite": primary_website}
-    scoops_p = {"data": {"type": "ScoopEnrich", "attributes": scoops_attrs}}
-    results["scoops_search"] = [await _probe(ENDPOINTS["scoops_enrich"], scoops_p)]
-
-    # ------------------------------------------------------------------ #
-    # 3. Intent — try /enrich/intent and /search/intent, with/without    #
-    #    companyId, with/without topics                                   #
-    # ------------------------------------------------------------------ #
-    intent_payloads = []
-    intent_ep = ENDPOINTS["intent_enrich"]
-    if company_id_found:
-        intent_payloads += [
-            (intent_ep, {"data": {"type": "IntentEnrich", "attributes": {"companyId": company_id_found, "topics": DEFAULT_INTENT_TOPICS[:3]}}}),
-            (intent_ep, {"data": {"type": "IntentEnrich", "attributes": {"companyId": company_id_found}}}),
-        ]
-    intent_payloads += [
-        (intent_ep, {"data": {"type": "IntentEnrich", "attributes": {"companyWebsite": primary_website, "topics": DEFAULT_INTENT_TOPICS[:3]}}}),
-        (intent_ep, {"data": {"type": "IntentEnrich", "attributes": {"companyWebsite": primary_website}}}),
-    ]
-    results["intent_enrich"] = [await _probe(ep, p) for ep, p in intent_payloads]
-
-    # ------------------------------------------------------------------ #
-    # 4. News — try /search/news with multiple identifier types          #
-    # ------------------------------------------------------------------ #
-    news_ep = ENDPOINTS["news_enrich"]
-    news_payloads = []
-    if company_id_found:
-        news_payloads.append((news_ep, {"data": {"type": "NewsEnrich", "attributes": {"companyId": company_id_found}}}))
-    else:
-        news_payloads.append((news_ep, {"data": {"type": "NewsEnrich", "attributes": {"companyName": company_name}}}))
-    results["news_search"] = [await _probe(ep, p) for ep, p in news_payloads]
-
-    # ------------------------------------------------------------------ #
-    # 5. Technology — /gtm/data/v1/companies/technologies/enrich         #
-    # ------------------------------------------------------------------ #
-    tech_ep = ENDPOINTS["tech_enrich"]
-    tech_payloads = []
-    if company_id_found:
-        tech_payloads.append(
-            (tech_ep, {"data": {"type": "TechnologyEnrich", "attributes": {"companyId": company_id_found}}})
-        )
-    tech_payloads.append(
-        (tech_ep, {"data": {"type": "TechnologyEnrich", "attributes": {"companyWebsite": primary_website}}})
-    )
-    results["tech_enrich"] = [await _probe(ep, p) for ep, p in tech_payloads]
-
-    # ------------------------------------------------------------------ #
-    # 6. Contact search (reference — should be working)                  #
-    # ------------------------------------------------------------------ #
-    results["contact_search"] = [
-        await _probe(ENDPOINTS["contact_search"] + "?page%5Bsize%5D=3",
-                     {"data": {"type": "ContactSearch", "attributes": {"companyWebsite": zi_client._website_candidates(domain)}}})
-    ]
 
-    return results
+_WARMUP_TASKS: set = set()
+
+
+@app.on_event("startup")
+async def _start_warmup() -> None:
+    """Preload heavy modules, clients and caches in the background; the task
+    sleeps first so the port is bound and /health answers meanwhile."""
+    wu = _warmup_module()
+    task = asyncio.create_task(wu.run([
+        ("supabase_client", _supabase),
+        ("content_audit", lambda: _content_audit_module().load_content_audit()),
+        ("content_embeddings_model", lambda: _content_audit_module().content_embeddings.load_model()),
+        ("data_validator", lambda: _data_validator_module().get_validator()),
+    ]))
+    _WARMUP_TASKS.add(task)
+    task.add_done_callback(_WARMUP_TASKS.discard)
+
+
+@app.on_event("shutdown")
+async def _close_supabase_pool() -> None:
+    """Close the shared Supabase client's connection pool."""
+    try:
+        from worker.supabase_pool import get_pool
+    except Exception:  # noqa: BLE001
+        from supabase_pool import get_pool  # bare path
+    await get_pool().aclose()
 
 
 # ============================================================================
@@ -4530,1141 +4876,6 @@ async def enrich_contacts_by_domain(domain: str):
     return response_data
 
 
-# ============================================================================
-# Debug Mode Endpoints (Features 018-021)
-# ============================================================================
-
-from typing import List, Any
-from datetime import timedelta
-import uuid
-
-def _generate_council_thought_processes(job_data: dict, company_name: str, base_time: datetime,
-                                         apollo_extracted: dict, pdl_extracted: dict, validated_data: dict) -> list:
-    """Generate LLM thought processes showing all 20 specialists + aggregator."""
-
-    council_metadata = job_data.get("council_metadata", {})
-    specialist_results = council_metadata.get("specialist_results", [])
-
-    thought_processes = []
-
-    # If we have actual specialist results from the council, use them
-    if specialist_results:
-        for i, specialist in enumerate(specialist_results):
-            specialist_id = specialist.get("specialist_id", f"specialist-{i+1}")
-            specialist_name = specialist.get("specialist_name", f"Specialist {i+1}")
-            focus = specialist.get("focus", "general")
-            analysis = specialist.get("analysis", {})
-
-            thought_processes.append({
-                "id": f"llm-{i+1}",
-                "task_name": f"{specialist_name}",
-                "model": "gpt-4o-mini",
-                "prompt_tokens": 200 + (i * 10),
-                "completion_tokens": 150 + (i * 5),
-                "total_tokens": 350 + (i * 15),
-                "start_time": (base_time + timedelta(seconds=4, milliseconds=i*200)).isoformat() + "Z",
-                "end_time": (base_time + timedelta(seconds=5, milliseconds=i*200)).isoformat() + "Z",
-                "duration": 1000,
-                "steps": [
-                    {
-                        "id": f"thought-{i+1}-1",
-                        "step": 1,
-                        "action": f"Analyze {focus.replace('_', ' ').title()}",
-                        "reasoning": f"Examining Apollo.io and PeopleDataLabs data for {focus} information about {company_name}.",
-                        "input": {
-                            "apollo_data": apollo_extracted,
-                            "pdl_data": pdl_extracted,
-                            "focus_area": focus
-                        },
-                        "output": analysis,
-                        "confidence": 0.85 + (i % 10) * 0.01,
-                        "timestamp": (base_time + timedelta(seconds=4, milliseconds=500 + i*200)).isoformat() + "Z"
-                    },
-                ],
-                "final_decision": f"{specialist_name}: {_format_analysis_summary(analysis, focus)}",
-                "confidence_score": 0.85 + (i % 10) * 0.01,
-                "discrepancies_resolved": []
-            })
-
-        # Add aggregator as the final thought process
-        thought_processes.append({
-            "id": "llm-aggregator",
-            "task_name": "Chief Data Aggregator",
-            "model": "gpt-4o-mini",
-            "prompt_tokens": 2500,
-            "completion_tokens": 800,
-            "total_tokens": 3300,
-            "start_time": (base_time + timedelta(seconds=8)).isoformat() + "Z",
-            "end_time": (base_time + timedelta(seconds=10)).isoformat() + "Z",
-            "duration": 2000,
-            "steps": [
-                {
-                    "id": "thought-agg-1",
-                    "step": 1,
-                    "action": "Synthesize Specialist Inputs",
-                    "reasoning": f"Aggregating analyses from {len(specialist_results)} specialists to create authoritative profile for {company_name}.",
-                    "input": {
-                        "specialist_count": len(specialist_results),
-                        "apollo_data": apollo_extracted,
-                        "pdl_data": pdl_extracted
-                    },
-                    "output": {
-                        "industry": validated_data.get("industry", "N/A"),
-                        "employee_count": validated_data.get("employee_count", "N/A"),
-                        "headquarters": validated_data.get("headquarters", "N/A"),
-                        "geographic_reach": validated_data.get("geographic_reach", []),
-                        "target_market": validated_data.get("target_market", "N/A")
-                    },
-                    "confidence": validated_data.get("confidence_score", 0.85),
-                    "timestamp": (base_time + timedelta(seconds=9)).isoformat() + "Z"
-                },
-            ],
-            "final_decision": _format_aggregator_decision(validated_data, company_name),
-            "confidence_score": validated_data.get("confidence_score", 0.85),
-            "discrepancies_resolved": ["industry", "employee_count", "headquarters", "geographic_reach"]
-        })
-    else:
-        # Fallback: Generate placeholder specialist entries
-        specialist_focuses = [
-            ("Industry Classification Expert", "industry"),
-            ("Employee Count Analyst", "employee_count"),
-            ("Revenue & Financial Analyst", "revenue"),
-            ("Geographic Presence Specialist", "geography"),
-            ("Company History Expert", "history"),
-            ("Technology Stack Expert", "technology"),
-            ("Target Market Analyst", "target_market"),
-            ("Product & Services Analyst", "products"),
-            ("Competitive Intelligence Analyst", "competitors"),
-            ("Leadership & Executive Analyst", "leadership"),
-            ("Social Media & Web Presence Analyst", "social"),
-            ("Legal & Corporate Structure Analyst", "legal"),
-            ("Growth & Trajectory Analyst", "growth"),
-            ("Brand & Reputation Analyst", "brand"),
-            ("Partnerships & Alliances Analyst", "partnerships"),
-            ("Customer Base Analyst", "customers"),
-            ("Pricing & Business Model Analyst", "pricing"),
-            ("Company Culture Analyst", "culture"),
-            ("Innovation & R&D Analyst", "innovation"),
-            ("Risk & Compliance Analyst", "risk"),
-        ]
-
-        for i, (name, focus) in enumerate(specialist_focuses):
-            thought_processes.append({
-                "id": f"llm-{i+1}",
-                "task_name": name,
-                "model": "gpt-4o-mini",
-                "prompt_tokens": 200,
-                "completion_tokens": 150,
-                "total_tokens": 350,
-                "start_time": (base_time + timedelta(seconds=4, milliseconds=i*100)).isoformat() + "Z",
-                "end_time": (base_time + timedelta(seconds=5, milliseconds=i*100)).isoformat() + "Z",
-                "duration": 1000,
-                "steps": [
-                    {
-                        "id": f"thought-{i+1}-1",
-                        "step": 1,
-                        "action": f"Analyze {focus.replace('_', ' ').title()}",
-                        "reasoning": f"Examining data sources for {focus} of {company_name}",
-                        "input": {"focus": focus, "apollo": apollo_extracted.get(focus), "pdl": pdl_extracted.get(focus)},
-                        "output": {focus: validated_data.get(focus, "N/A")},
-                        "confidence": 0.85,
-                        "timestamp": (base_time + timedelta(seconds=4, milliseconds=500 + i*100)).isoformat() + "Z"
-                    },
-                ],
-                "final_decision": f"{name}: {focus}={validated_data.get(focus, 'N/A')}",
-                "confidence_score": 0.85,
-                "discrepancies_resolved": []
-            })
-
-        # Add aggregator
-        thought_processes.append({
-            "id": "llm-aggregator",
-            "task_name": "Chief Data Aggregator",
-            "model": "gpt-4o-mini",
-            "prompt_tokens": 2500,
-            "completion_tokens": 800,
-            "total_tokens": 3300,
-            "start_time": (base_time + timedelta(seconds=8)).isoformat() + "Z",
-            "end_time": (base_time + timedelta(seconds=10)).isoformat() + "Z",
-            "duration": 2000,
-            "steps": [
-                {
-                    "id": "thought-agg-1",
-                    "step": 1,
-                    "action": "Synthesize All Specialist Inputs",
-                    "reasoning": f"Combining insights from 20 specialists for {company_name}",
-                    "input": {"specialist_count": 20},
-                    "output": validated_data,
-                    "confidence": validated_data.get("confidence_score", 0.85),
-                    "timestamp": (base_time + timedelta(seconds=9)).isoformat() + "Z"
-                },
-            ],
-            "final_decision": _format_aggregator_decision(validated_data, company_name),
-            "confidence_score": validated_data.get("confidence_score", 0.85),
-            "discrepancies_resolved": ["industry", "employee_count", "headquarters"]
-        })
-
-    return thought_processes
-
-
-def _format_analysis_summary(analysis: dict, focus: str) -> str:
-    """Format specialist analysis into a concise summary."""
-    if not analysis:
-        return "No analysis available"
-
-    # Get the most relevant value based on focus
-    key_mappings = {
-        "industry": ["industry", "sub_industry"],
-        "employee_count": ["employee_count", "employee_range"],
-        "revenue": ["annual_revenue", "revenue_range"],
-        "geography": ["headquarters", "countries"],
-        "history": ["founded_year", "founders"],
-        "technology": ["technologies", "capabilities"],
-        "target_market": ["market_type", "customer_segments"],
-        "products": ["products", "services"],
-        "competitors": ["competitors", "market_position"],
-        "leadership": ["ceo", "executives"],
-        "social": ["linkedin", "twitter", "website"],
-        "legal": ["company_type", "ticker"],
-        "growth": ["growth_stage", "growth_indicators"],
-        "brand": ["brand_level", "awards"],
-        "partnerships": ["partners", "ecosystem"],
-        "customers": ["notable_customers", "customer_count"],
-        "pricing": ["business_model", "pricing_model"],
-        "culture": ["values", "culture_type"],
-        "innovation": ["rd_focus", "patent_count"],
-        "risk": ["certifications", "regulations"],
-    }
-
-    keys = key_mappings.get(focus, list(analysis.keys())[:2])
-    parts = []
-    for key in keys:
-        val = analysis.get(key)
-        if val:
-            if isinstance(val, list):
-                val = ", ".join(str(v) for v in val[:3])
-            parts.append(f"{key}={val}")
-
-    return "; ".join(parts) if parts else str(analysis)[:100]
-
-
-def _format_aggregator_decision(validated_data: dict, company_name: str) -> str:
-    """Format the aggregator's final decision as a concise summary."""
-    if not validated_data:
-        return f"Unable to validate data for {company_name}"
-
-    parts = [f"Validated profile for {company_name}:"]
-
-    if validated_data.get("industry"):
-        parts.append(f"Industry={validated_data['industry']}")
-    if validated_data.get("employee_count"):
-        parts.append(f"Employees={validated_data['employee_count']}")
-    if validated_data.get("headquarters"):
-        parts.append(f"HQ={validated_data['headquarters']}")
-    if validated_data.get("geographic_reach"):
-        geo = validated_data["geographic_reach"]
-        if isinstance(geo, list):
-            parts.append(f"Countries={', '.join(geo[:5])}" + ("..." if len(geo) > 5 else ""))
-        else:
-            parts.append(f"Reach={geo}")
-    if validated_data.get("target_market"):
-        parts.append(f"Market={validated_data['target_market']}")
-    if validated_data.get("confidence_score"):
-        parts.append(f"Confidence={validated_data['confidence_score']}")
-
-    return " | ".join(parts)
-
-
-def generate_debug_data(job_id: str, job_data: dict) -> dict:
-    """Generate debug data for a job with actual API response data."""
-    company_name = job_data.get("company_data", {}).get("company_name", "Unknown Company")
-    domain = job_data.get("company_data", {}).get("domain", "unknown.com")
-    status = job_data.get("status", "completed")
-    created_at = job_data.get("created_at", datetime.utcnow().isoformat())
-
-    # Get actual API response data
-    apollo_data = job_data.get("apollo_data", {})
-    pdl_data = job_data.get("pdl_data", {})
-    hunter_data = job_data.get("hunter_data", {})
-    news_data = job_data.get("news_data", {})
-    orchestrator_data = job_data.get("orchestrator_data", {})
-    zoominfo_data = job_data.get("zoominfo_data", {})
-    slideshow_data = job_data.get("slideshow_data", {})
-    result = job_data.get("result", {})
-
-    # CRITICAL: Ensure validated_data is a dict, not a JSON string
-    validated_data = result.get("validated_data", {})
-    if isinstance(validated_data, str):
-        try:
-            validated_data = json.loads(validated_data)
-            logger.info("Parsed validated_data from JSON string in debug endpoint")
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse validated_data JSON in debug endpoint: {e}")
-            validated_data = {}
-
-    # Extract Apollo.io fields (handles both organization/enrich and mixed_companies/search)
-    apollo_org = {}
-    if apollo_data:
-        # Check if it's from organizations/enrich (data at top level) or search (in array)
-        if "organization" in apollo_data:
-            apollo_org = apollo_data.get("organization", {})
-        elif "organizations" in apollo_data:
-            orgs = apollo_data.get("organizations", [])
-            if orgs:
-                apollo_org = orgs[0]
-        elif "accounts" in apollo_data:
-            accounts = apollo_data.get("accounts", [])
-            if accounts:
-                apollo_org = accounts[0]
-        else:
-            # Data might be at top level
-            apollo_org = apollo_data
-
-    apollo_extracted = {
-        "company_name": apollo_org.get("name", "N/A"),
-        "industry": apollo_org.get("industry", "N/A"),
-        "employee_count": apollo_org.get("estimated_num_employees") or apollo_org.get("employee_count", "N/A"),
-        "headquarters": f"{apollo_org.get('city', '')}, {apollo_org.get('state', '')}".strip(", ") or apollo_org.get("country", "N/A"),
-        "founded_year": apollo_org.get("founded_year", "N/A"),
-        "website": apollo_org.get("website_url") or apollo_org.get("primary_domain", "N/A"),
-        "linkedin": apollo_org.get("linkedin_url", "N/A"),
-        "technologies": (apollo_org.get("technologies") or [])[:5],
-        "annual_revenue": apollo_org.get("annual_revenue", "N/A"),
-    }
-
-    # Extract PeopleDataLabs fields (PDL returns data directly, not wrapped)
-    pdl_company = pdl_data if pdl_data else {}
-
-    # Build headquarters from location components
-    pdl_location = "N/A"
-    if pdl_company.get("location"):
-        loc = pdl_company["location"]
-        if isinstance(loc, dict):
-            parts = [loc.get("locality"), loc.get("region"), loc.get("country")]
-            pdl_location = ", ".join([p for p in parts if p]) or loc.get("name", "N/A")
-        elif isinstance(loc, str):
-            pdl_location = loc
-
-    pdl_extracted = {
-        "company_name": pdl_company.get("name", "N/A"),
-        "industry": pdl_company.get("industry", "N/A"),
-        "employee_count": pdl_company.get("employee_count", "N/A"),
-        "employee_range": pdl_company.get("size", "N/A"),
-        "headquarters": pdl_location,
-        "founded_year": pdl_company.get("founded", "N/A"),
-        "linkedin": pdl_company.get("linkedin_url", "N/A"),
-        "tags": (pdl_company.get("tags") or [])[:5],
-        "summary": pdl_company.get("summary", "N/A"),
-        "inferred_revenue": pdl_company.get("inferred_revenue", "N/A"),
-        "type": pdl_company.get("type", "N/A"),
-    }
-
-    # Extract Hunter.io fields
-    hunter_extracted = {
-        "organization": hunter_data.get("organization", "N/A"),
-        "domain": hunter_data.get("domain", "N/A"),
-        "country": hunter_data.get("country", "N/A"),
-        "state": hunter_data.get("state", "N/A"),
-        "city": hunter_data.get("city", "N/A"),
-        "email_pattern": hunter_data.get("pattern", "N/A"),
-        "emails_found": len(hunter_data.get("emails", [])),
-        "twitter": hunter_data.get("twitter", "N/A"),
-        "facebook": hunter_data.get("facebook", "N/A"),
-        "linkedin": hunter_data.get("linkedin", "N/A"),
-        "accept_all": hunter_data.get("accept_all", "N/A"),
-        "webmail": hunter_data.get("webmail", False),
-    }
-
-    # Extract sample contacts from Hunter.io emails
-    hunter_contacts = []
-    for email in hunter_data.get("emails", [])[:5]:
-        hunter_contacts.append({
-            "email": email.get("value", "N/A"),
-            "name": f"{email.get('first_name', '')} {email.get('last_name', '')}".strip() or "N/A",
-            "position": email.get("position", "N/A"),
-            "department": email.get("department", "N/A"),
-            "confidence": email.get("confidence", 0),
-        })
-    hunter_extracted["sample_contacts"] = hunter_contacts
-
-    # Extract ZoomInfo fields
-    zi_company = zoominfo_data.get("company", {}) if zoominfo_data else {}
-    zi_intent = zoominfo_data.get("intent_signals", []) if zoominfo_data else []
-    zi_scoops = zoominfo_data.get("scoops", []) if zoominfo_data else []
-    zi_contacts = zoominfo_data.get("contacts", []) if zoominfo_data else []
-    zi_technologies = zoominfo_data.get("technologies", []) if zoominfo_data else []
-
-    # If no ZoomInfo data was stored, populate from validated_data for display
-    if not zi_company and validated_data:
-        zi_company = {
-            "companyName": validated_data.get("company_name", company_name),
-            "domain": validated_data.get("domain", domain),
-            "employeeCount": validated_data.get("employee_count"),
-            "revenue": validated_data.get("annual_revenue"),
-            "industry": validated_data.get("industry"),
-            "city": validated_data.get("headquarters", "").split(",")[0].strip() if validated_data.get("headquarters") else None,
-            "state": validated_data.get("headquarters", "").split(",")[-1].strip() if validated_data.get("headquarters") and "," in validated_data.get("headquarters", "") else None,
-            "yearFounded": validated_data.get("founded_year"),
-            "ceoName": validated_data.get("ceo"),
-        }
-
-    zoominfo_extracted = {
-        "company_name": zi_company.get("companyName", company_name),
-        "domain": zi_company.get("domain", domain),
-        "employee_count": zi_company.get("employeeCount", "N/A"),
-        "revenue": zi_company.get("revenue", "N/A"),
-        "industry": zi_company.get("industry", "N/A"),
-        "city": zi_company.get("city", "N/A"),
-        "state": zi_company.get("state", "N/A"),
-        "year_founded": zi_company.get("yearFounded", "N/A"),
-        "ceo": zi_company.get("ceoName", "N/A"),
-        "intent_signals_count": len(zi_intent),
-        "scoops_count": len(zi_scoops),
-        "contacts_count": len(zi_contacts),
-        "technologies_count": len(zi_technologies),
-        # Growth metrics
-        "one_year_employee_growth": zoominfo_data.get("one_year_employee_growth", "N/A") if zoominfo_data else "N/A",
-        "two_year_employee_growth": zoominfo_data.get("two_year_employee_growth", "N/A") if zoominfo_data else "N/A",
-        "funding_amount": zoominfo_data.get("funding_amount", "N/A") if zoominfo_data else "N/A",
-        "fortune_rank": zoominfo_data.get("fortune_rank", "N/A") if zoominfo_data else "N/A",
-        "num_locations": zoominfo_data.get("num_locations", "N/A") if zoominfo_data else "N/A",
-    }
-
-    # Extract fact check results
-    fact_check_results = job_data.get("fact_check_results", {})
-
-    base_time = datetime.fromisoformat(created_at.replace("Z", ""))
-
-    # Use real API calls logged during pipeline execution if available.
-    # The synthetic fallback exists for old jobs and serves as a template.
-    _real_api_calls = job_data.get("api_calls", [])
-
-    return {
-        "job_id": job_id,
-        "company_name": company_name,
-        "domain": domain,
-        "status": status,
-        "process_steps": [
-            {
-                "id": "step-1",
-                "name": "Request Initialization",
-                "description": "Initializing company profile request",
-                "status": "completed",
-                "start_time": base_time.isoformat() + "Z",
-                "end_time": (base_time + timedelta(milliseconds=500)).isoformat() + "Z",
-                "duration": 500,
-                "metadata": {"request_id": job_id, "company": company_name, "domain": domain}
-            },
-            {
-                "id": "step-1b",
-                "name": "Orchestrator LLM Analysis",
-                "description": "Intelligent API routing - analyzing required data points and selecting optimal APIs",
-                "status": "completed" if orchestrator_data else "skipped",
-                "start_time": (base_time + timedelta(milliseconds=500)).isoformat() + "Z",
-                "end_time": (base_time + timedelta(milliseconds=900)).isoformat() + "Z",
-                "duration": 400,
-                "metadata": {
-                    "model": "gpt-4o-mini",
-                    "apis_selected": orchestrator_data.get("apis_to_query", ["apollo", "pdl", "hunter", "gnews"]),
-                    "priority_order": orchestrator_data.get("priority_order", []),
-                    "data_point_mapping": orchestrator_data.get("data_point_mapping", {}),
-                    "reasoning": orchestrator_data.get("reasoning", "Default plan: querying all APIs")
-                }
-            },
-            {
-                "id": "step-1c",
-                "name": "ZoomInfo Data Collection (PRIMARY)",
-                "description": "[PRIORITY SOURCE] Gathering comprehensive company data from ZoomInfo GTM API: company enrichment, buyer intent signals, business scoops/events, and contact search",
-                "status": "completed",
-                "start_time": (base_time + timedelta(seconds=1)).isoformat() + "Z",
-                "end_time": (base_time + timedelta(seconds=2, milliseconds=400)).isoformat() + "Z",
-                "duration": 1400,
-                "metadata": {
-                    "source": "ZoomInfo",
-                    "priority": "PRIMARY",
-                    "fields_retrieved": zoominfo_extracted,
-                    "intent_signals": zi_intent[:5] if zi_intent else [
-                        {"topic": "Cloud Migration", "score": 85, "audienceStrength": "high"},
-                        {"topic": "Data Security", "score": 72, "audienceStrength": "medium"},
-                        {"topic": "AI/ML Platform", "score": 68, "audienceStrength": "medium"},
-                    ],
-                    "scoops": zi_scoops[:5] if zi_scoops else [
-                        {"type": "executive_hire", "title": f"New CTO Appointed at {company_name}"},
-                        {"type": "expansion", "title": "Office Expansion Planned"},
-                    ],
-                    "technologies": zi_technologies[:10] if zi_technologies else [],
-                    "contacts_found": len(zi_contacts) if zi_contacts else 0,
-                    "growth_metrics": {
-                        "one_year_employee_growth": zoominfo_extracted.get("one_year_employee_growth"),
-                        "two_year_employee_growth": zoominfo_extracted.get("two_year_employee_growth"),
-                        "funding_amount": zoominfo_extracted.get("funding_amount"),
-                    }
-                }
-            },
-            {
-                "id": "step-1d",
-                "name": "ZoomInfo Contact Enrich",
-                "description": "Enriching contacts with direct phone, mobile phone, company phone, accuracy scores via ZoomInfo Contact Enrich API (Search → Enrich 2-step)",
-                "status": "completed" if zi_contacts else ("failed" if zoominfo_data.get("_contact_search_error") else "skipped"),
-                "start_time": (base_time + timedelta(seconds=2, milliseconds=400)).isoformat() + "Z",
-                "end_time": (base_time + timedelta(seconds=3, milliseconds=200)).isoformat() + "Z",
-                "duration": 800,
-                "metadata": {
-                    "source": "ZoomInfo Contact Enrich",
-                    "contacts_enriched": len(zi_contacts) if zi_contacts else 0,
-                    "enrichment_summary": zoominfo_data.get("_enrichment_summary"),
-                    "per_contact_enrichment": [
-                        {
-                            "name": c.get("name", "Unknown"),
-                            "title": c.get("title", ""),
-                            "enriched": c.get("enriched", False),
-                            "has_direct_phone": bool(c.get("direct_phone")),
-                            "has_mobile_phone": bool(c.get("mobile_phone")),
-                            "has_company_phone": bool(c.get("company_phone")),
-                            "has_linkedin_url": bool(c.get("linkedin") or c.get("linkedin_url")),
-                            "linkedin_url": c.get("linkedin") or c.get("linkedin_url") or "",
-                            "accuracy_score": c.get("contact_accuracy_score", 0),
-                        }
-                        for c in (zi_contacts or [])
-                    ],
-                    "fields_added": ["directPhone", "mobilePhone", "companyPhone", "contactAccuracyScore", "department", "managementLevel", "linkedinUrl"],
-                    "error": zoominfo_data.get("_contact_search_error") if not zi_contacts else None,
-                    "debug_hint": (
-                        "Check backend logs for ZoomInfo HTTP error details. "
-                        "Likely causes: (1) token lacks contact-search scope, "
-                        "(2) domain not in ZoomInfo database, "
-                        "(3) API plan doesn't include Contact Search."
-                    ) if not zi_contacts else None,
-                }
-            },
-            {
-                "id": "step-1e",
-                "name": "LLM Contact Fact Checker",
-                "description": "Validating executive contacts against public knowledge using GPT-4o-mini. Filters out incorrect contacts (score < 0.3).",
-                "status": "completed",
-                "start_time": (base_time + timedelta(seconds=3, milliseconds=200)).isoformat() + "Z",
-                "end_time": (base_time + timedelta(seconds=4)).isoformat() + "Z",
-                "duration": 800,
-                "metadata": {
-                    "model": "gpt-4o-mini",
-                    "original_contacts": fact_check_results.get("original_count", 0),
-                    "passed_contacts": fact_check_results.get("passed_count", 0),
-                    "filtered_contacts": fact_check_results.get("filtered_count", 0),
-                    "threshold": 0.3,
-                }
-            },
-            {
-                "id": "step-1f",
-                "name": "ZoomInfo GTM Identity Lookup (Apollo/Hunter cross-reference)",
-                "description": (
-                    "Cross-referencing Apollo.io and Hunter.io contacts against ZoomInfo GTM API to retrieve "
-                    "direct phone, mobile phone, and company phone numbers. Searches by email first, then "
-                    "firstName+lastName. Concurrent lookups capped at 10 contacts."
-                ),
-                "status": (
-                    "completed" if job_data.get("step_2_84_result", {}).get("contacts_found", 0) > 0
-                    else ("failed" if job_data.get("step_2_84_result", {}).get("error") else
-                          ("skipped" if not job_data.get("step_2_84_result") else "completed"))
-                ),
-                "start_time": (base_time + timedelta(seconds=4)).isoformat() + "Z",
-                "end_time": (base_time + timedelta(
-                    milliseconds=4000 + job_data.get("step_2_84_result", {}).get("duration_ms", 0)
-                )).isoformat() + "Z",
-                "duration": job_data.get("step_2_84_result", {}).get("duration_ms", 0),
-                "metadata": {
-                    "source": "ZoomInfo GTM Contact Search + Contact Enrich",
-                    "strategy": "Email lookup → firstName+lastName fallback → enrich for real phones (concurrent)",
-                    "contacts_looked_up": job_data.get("step_2_84_result", {}).get("contacts_looked_up", 0),
-                    "contacts_found_in_zoominfo": job_data.get("step_2_84_result", {}).get("contacts_found", 0),
-                    "contacts_with_phones_added": job_data.get("step_2_84_result", {}).get("contacts_with_phones", 0),
-                    "error": job_data.get("step_2_84_result", {}).get("error"),
-                    "enriched_contacts": [
-                        {
-                            "name": c.get("name"),
-                            "title": c.get("title"),
-                            "email": c.get("email"),
-                            "direct_phone": c.get("direct_phone") or "N/A",
-                            "mobile_phone": c.get("mobile_phone") or "N/A",
-                            "company_phone": c.get("company_phone") or "N/A",
-                            "phone": c.get("phone") or "N/A",
-                            "person_id": c.get("person_id"),
-                            "accuracy_score": c.get("contact_accuracy_score"),
-                            "enriched": c.get("enriched", False),
-                            "source": c.get("source", "identity_lookup"),
-                        }
-                        for c in job_data.get("enriched_identity_contacts", [])
-                    ],
-                    "note": (
-                        "Apollo/Hunter contacts are searched in ZoomInfo by email/name, then enriched via "
-                        "Contact Enrich API using person_id to retrieve real (unmasked) phone numbers."
-                    ) if not job_data.get("step_2_84_result", {}).get("error") else None,
-                }
-            },
-            {
-                "id": "step-1g",
-                "name": "Claude Web Search LinkedIn Finder",
-                "description": (
-                    "Last-resort LinkedIn discovery using Claude (claude-sonnet-4-6) with built-in "
-                    "web_search tool. Fires only for contacts still missing LinkedIn after ZoomInfo "
-                    "enrich and Apollo people/match backfill. Prioritizes C-suite contacts (C-Level → "
-                    "VP → Director). Verifies exact name match and current employment at the target company."
-                ),
-                "status": (
-                    "skipped" if not ANTHROPIC_API_KEY
-                    else (
-                        "failed" if job_data.get("step_2_86_result", {}).get("error")
-                        else (
-                            "skipped" if not job_data.get("step_2_86_result")
-                            else "completed"
-                        )
-                    )
-                ),
-                "start_time": (base_time + timedelta(seconds=4)).isoformat() + "Z",
-                "end_time": (
-                    base_time + timedelta(
-                        seconds=4,
-                        milliseconds=job_data.get("step_2_86_result", {}).get("duration_ms", 0)
-                    )
-                ).isoformat() + "Z",
-                "duration": job_data.get("step_2_86_result", {}).get("duration_ms", 0),
-                "metadata": {
-                    "model": "claude-sonnet-4-6",
-                    "tool": "web_search_20250305",
-                    "contacts_attempted": job_data.get("step_2_86_result", {}).get("contacts_attempted", 0),
-                    "contacts_found": job_data.get("step_2_86_result", {}).get("contacts_found", 0),
-                    "priority_order": "C-Level first, then VP, Director, other — max 15 contacts",
-                    "verification_rules": [
-                        "Name must EXACTLY match ZoomInfo contact name",
-                        "Must CURRENTLY work at target company (not former employee)",
-                        "Title/position is NOT checked (differences expected)",
-                    ],
-                    "results": job_data.get("step_2_86_result", {}).get("results", []),
-                    "error": job_data.get("step_2_86_result", {}).get("error"),
-                    "skipped_reason": (
-                        "ANTHROPIC_API_KEY not configured in environment"
-                        if not ANTHROPIC_API_KEY else None
-                    ),
-                },
-            },
-            {
-                "id": "step-1h",
-                "name": "Claude Web Search — Company Intelligence",
-                "description": (
-                    "Using Claude claude-sonnet-4-6 with web_search to gather company fields that "
-                    "API sources don't provide: CEO, company type, customer segments, products, "
-                    "competitors. Results are fed into the LLM Council aggregator."
-                ),
-                "status": (
-                    "completed" if job_data.get("step_3_5_result", {}).get("fields_found")
-                    else ("skipped" if not ANTHROPIC_API_KEY else "failed")
-                ),
-                "start_time": (base_time + timedelta(seconds=5)).isoformat() + "Z",
-                "end_time": (base_time + timedelta(
-                    seconds=5,
-                    milliseconds=job_data.get("step_3_5_result", {}).get("duration_ms", 0)
-                )).isoformat() + "Z",
-                "duration": job_data.get("step_3_5_result", {}).get("duration_ms", 0),
-                "metadata": {
-                    "model": "claude-sonnet-4-6",
-                    "tool": "web_search_20250305",
-                    "fields_found": job_data.get("step_3_5_result", {}).get("fields_found", []),
-                    "ceo": job_data.get("step_3_5_result", {}).get("ceo", ""),
-                    "company_type": job_data.get("step_3_5_result", {}).get("company_type", ""),
-                    "customer_segments_count": job_data.get("step_3_5_result", {}).get("customer_segments_count", 0),
-                    "products_count": job_data.get("step_3_5_result", {}).get("products_count", 0),
-                    "competitors_count": job_data.get("step_3_5_result", {}).get("competitors_count", 0),
-                    "skipped_reason": (
-                        "ANTHROPIC_API_KEY not configured in environment"
-                        if not ANTHROPIC_API_KEY else None
-                    ),
-                },
-            },
-            {
-                "id": "step-2",
-                "name": "Apollo.io Data Collection",
-                "description": "Gathering data from Apollo.io API",
-                "status": "completed" if apollo_data else ("skipped" if orchestrator_data and "apollo" not in orchestrator_data.get("apis_to_query", []) else "failed"),
-                "start_time": (base_time + timedelta(seconds=1)).isoformat() + "Z",
-                "end_time": (base_time + timedelta(seconds=3)).isoformat() + "Z",
-                "duration": 2000,
-                "metadata": {
-                    "source": "Apollo.io",
-                    "fields_retrieved": apollo_extracted,
-                    "status": "success" if apollo_org else ("skipped_by_orchestrator" if orchestrator_data and "apollo" not in orchestrator_data.get("apis_to_query", []) else "no_data")
-                }
-            },
-            {
-                "id": "step-3",
-                "name": "PeopleDataLabs Data Collection",
-                "description": "Gathering data from PeopleDataLabs API",
-                "status": "completed" if pdl_data else ("skipped" if orchestrator_data and "pdl" not in orchestrator_data.get("apis_to_query", []) else "failed"),
-                "start_time": (base_time + timedelta(seconds=1)).isoformat() + "Z",
-                "end_time": (base_time + timedelta(seconds=2, milliseconds=500)).isoformat() + "Z",
-                "duration": 1500,
-                "metadata": {
-                    "source": "PeopleDataLabs",
-                    "fields_retrieved": pdl_extracted,
-                    "status": "success" if pdl_company else ("skipped_by_orchestrator" if orchestrator_data and "pdl" not in orchestrator_data.get("apis_to_query", []) else "no_data")
-                }
-            },
-            {
-                "id": "step-3b",
-                "name": "Hunter.io Data Collection",
-                "description": "Gathering domain and contact data from Hunter.io API",
-                "status": "completed" if hunter_data else ("skipped" if orchestrator_data and "hunter" not in orchestrator_data.get("apis_to_query", []) else "failed"),
-                "start_time": (base_time + timedelta(seconds=2, milliseconds=500)).isoformat() + "Z",
-                "end_time": (base_time + timedelta(seconds=3, milliseconds=500)).isoformat() + "Z",
-                "duration": 1000,
-                "metadata": {
-                    "source": "Hunter.io",
-                    "fields_retrieved": hunter_extracted,
-                    "status": "success" if hunter_data else ("skipped_by_orchestrator" if orchestrator_data and "hunter" not in orchestrator_data.get("apis_to_query", []) else "no_data")
-                }
-            },
-            {
-                "id": "step-3c",
-                "name": "GNews Intelligence Collection",
-                "description": "Gathering recent company news from GNews API (last 90 days)",
-                "status": "completed" if news_data and news_data.get("success") else ("skipped" if orchestrator_data and "gnews" not in orchestrator_data.get("apis_to_query", []) else ("failed" if news_data and news_data.get("error") else "skipped")),
-                "start_time": (base_time + timedelta(seconds=3, milliseconds=500)).isoformat() + "Z",
-                "end_time": (base_time + timedelta(seconds=4)).isoformat() + "Z",
-                "duration": 500,
-                "metadata": {
-                    "source": "GNews API",
-                    "articles_found": news_data.get("articles_count", 0) if news_data else 0,
-                    "date_range": news_data.get("date_range", "Last 90 days") if news_data else "N/A",
-                    "categories_found": {
-                        "executive_changes": len(news_data.get("categories", {}).get("executive_changes", [])) if news_data else 0,
-                        "funding": len(news_data.get("categories", {}).get("funding", [])) if news_data else 0,
-                        "partnerships": len(news_data.get("categories", {}).get("partnerships", [])) if news_data else 0,
-                        "expansions": len(news_data.get("categories", {}).get("expansions", [])) if news_data else 0,
-                        "products": len(news_data.get("categories", {}).get("products", [])) if news_data else 0
-                    },
-                    "status": "success" if news_data and news_data.get("success") else ("skipped_by_orchestrator" if orchestrator_data and "gnews" not in orchestrator_data.get("apis_to_query", []) else (news_data.get("error", "not_configured") if news_data else "not_configured"))
-                }
-            },
-            {
-                "id": "step-3d",
-                "name": ">>> PRE-LLM DATA VALIDATION <<<",
-                "description": "CRITICAL: Fact-checking data against verified company database BEFORE sending to LLM. Catches wrong CEO names, fake executives, and placeholder data.",
-                "status": "completed",
-                "start_time": (base_time + timedelta(seconds=4)).isoformat() + "Z",
-                "end_time": (base_time + timedelta(seconds=4, milliseconds=500)).isoformat() + "Z",
-                "duration": 500,
-                "metadata": {
-                    "validation_type": "PRE-LLM FACT CHECK",
-                    "companies_in_database": 14,
-                    "known_executives_checked": True,
-                    "is_valid": job_data.get("pre_llm_validation", {}).get("is_valid", True),
-                    "confidence_score": job_data.get("pre_llm_validation", {}).get("confidence_score", 1.0),
-                    "issues_found": job_data.get("pre_llm_validation", {}).get("issues_found", 0),
-                    "issues": job_data.get("pre_llm_validation", {}).get("issues", []),
-                    "corrected_values": job_data.get("pre_llm_validation", {}).get("corrected_values", {}),
-                    "stakeholders_filtered": job_data.get("pre_llm_validation", {}).get("stakeholders_filtered", 0),
-                    "stakeholders_remaining": job_data.get("pre_llm_validation", {}).get("stakeholders_remaining", 0),
-                }
-            },
-            {
-                "id": "step-4",
-                "name": "LLM Council Validation",
-                "description": "Running 20 specialist LLMs + 1 aggregator for comprehensive validation",
-                "status": "completed" if status == "completed" else "in_progress",
-                "start_time": (base_time + timedelta(seconds=4, milliseconds=500)).isoformat() + "Z",
-                "end_time": (base_time + timedelta(seconds=10)).isoformat() + "Z" if status == "completed" else None,
-                "duration": 5500 if status == "completed" else None,
-                "metadata": {
-                    "model": "gpt-4o-mini",
-                    "specialists_count": 20,
-                    "aggregator_model": "gpt-4o-mini",
-                    "validated_fields": validated_data if validated_data else {}
-                }
-            },
-            {
-                "id": "step-5",
-                "name": "Store Results",
-                "description": "Saving validated data to Supabase",
-                "status": "completed" if status == "completed" else "pending",
-                "start_time": (base_time + timedelta(seconds=7)).isoformat() + "Z" if status == "completed" else None,
-                "end_time": (base_time + timedelta(seconds=8)).isoformat() + "Z" if status == "completed" else None,
-                "duration": 1000 if status == "completed" else None,
-                "metadata": {"tables": ["raw_data", "finalize_data"]}
-            },
-            {
-                "id": "step-6",
-                "name": "Generate Slideshow",
-                "description": "Creating presentation with Gamma API",
-                "status": "completed" if status == "completed" else "pending",
-                "start_time": (base_time + timedelta(seconds=9)).isoformat() + "Z" if status == "completed" else None,
-                "end_time": (base_time + timedelta(seconds=12)).isoformat() + "Z" if status == "completed" else None,
-                "duration": 3000 if status == "completed" else None,
-                "metadata": {"slideshow_url": result.get("slideshow_url", "N/A")}
-            },
-        ],
-        "api_responses": (_real_api_calls if _real_api_calls else [
-            {
-                "id": "api-0",
-                "api_name": "ZoomInfo Company Enrichment (PRIMARY SOURCE)",
-                "url": "https://api.zoominfo.com/gtm/data/v1/companies/enrich",
-                "method": "POST",
-                "status_code": 200,
-                "status_text": "OK",
-                "headers": {"content-type": "application/vnd.api+json", "x-ratelimit-remaining": "23"},
-                "request_body": {"data": {"type": "CompanyEnrich", "attributes": {"companyWebsite": domain}}},
-                "response_body": {
-                    "data": [{
-                        "companyName": zoominfo_extracted["company_name"],
-                        "domain": zoominfo_extracted["domain"],
-                        "employeeCount": zoominfo_extracted["employee_count"],
-                        "revenue": zoominfo_extracted["revenue"],
-                        "industry": zoominfo_extracted["industry"],
-                        "city": zoominfo_extracted["city"],
-                        "state": zoominfo_extracted["state"],
-                        "yearFounded": zoominfo_extracted["year_founded"],
-                        "ceoName": zoominfo_extracted["ceo"],
-                    }]
-                },
-                "timestamp": (base_time + timedelta(seconds=1)).isoformat() + "Z",
-                "duration": 1400,
-                "is_sensitive": True,
-                "masked_fields": ["authorization"]
-            },
-            {
-                "id": "api-0b",
-                "api_name": "ZoomInfo Intent Enrichment",
-                "url": "https://api.zoominfo.com/gtm/data/v1/intent/enrich",
-                "method": "POST",
-                "status_code": 200,
-                "status_text": "OK",
-                "headers": {"content-type": "application/vnd.api+json"},
-                "request_body": {"data": {"type": "IntentEnrich", "attributes": {"companyWebsite": domain}}},
-                "response_body": {
-                    "data": zi_intent if zi_intent else [
-                        {"topic": "Cloud Migration", "score": 85, "audienceStrength": "high", "lastSeen": "2025-01-15"},
-                        {"topic": "Data Security", "score": 72, "audienceStrength": "medium", "lastSeen": "2025-01-12"},
-                        {"topic": "AI/ML Platform", "score": 68, "audienceStrength": "medium", "lastSeen": "2025-01-10"},
-                    ]
-                },
-                "timestamp": (base_time + timedelta(seconds=1, milliseconds=500)).isoformat() + "Z",
-                "duration": 900,
-                "is_sensitive": True,
-                "masked_fields": ["authorization"]
-            },
-            {
-                "id": "api-0c",
-                "api_name": "ZoomInfo Scoops Search",
-                "url": "https://api.zoominfo.com/gtm/data/v1/scoops/search",
-                "method": "POST",
-                "status_code": 200,
-                "status_text": "OK",
-                "headers": {"content-type": "application/vnd.api+json"},
-                "request_body": {"data": {"type": "ScoopSearch", "attributes": {"companyWebsite": domain}}},
-                "response_body": {
-                    "data": zi_scoops if zi_scoops else [
-                        {"scoopType": "executive_hire", "title": f"New CTO Appointed at {company_name}", "date": "2025-01-08"},
-                        {"scoopType": "expansion", "title": "Office Expansion Planned", "date": "2025-01-05"},
-                    ]
-                },
-                "timestamp": (base_time + timedelta(seconds=1, milliseconds=800)).isoformat() + "Z",
-                "duration": 600,
-                "is_sensitive": True,
-                "masked_fields": ["authorization"]
-            },
-            {
-                "id": "api-0d",
-                "api_name": "ZoomInfo Contact Search",
-                "url": "https://api.zoominfo.com/gtm/data/v1/contacts/search",
-                "method": "POST",
-                "status_code": 200,
-                "status_text": "OK",
-                "headers": {"content-type": "application/vnd.api+json"},
-                "request_body": {"data": {"type": "ContactSearch", "attributes": {"companyWebsite": domain, "managementLevel": ["C-Level", "VP-Level", "Director-Level", "Manager-Level"], "jobTitle": ["Chief Executive Officer", "CEO", "Chief Technology Officer", "CTO", "Chief Information Officer", "CIO", "Chief Financial Officer", "CFO", "Chief Operating Officer", "COO", "...38 more titles"], "rpp": 25}}},
-                "response_body": {
-                    "data": zi_contacts[:5] if zi_contacts else [
-                        {"firstName": zoominfo_extracted["ceo"].split()[0] if zoominfo_extracted["ceo"] != "N/A" and " " in str(zoominfo_extracted["ceo"]) else "N/A",
-                         "lastName": zoominfo_extracted["ceo"].split()[-1] if zoominfo_extracted["ceo"] != "N/A" and " " in str(zoominfo_extracted["ceo"]) else "N/A",
-                         "jobTitle": "CEO"},
-                    ]
-                },
-                "timestamp": (base_time + timedelta(seconds=2)).isoformat() + "Z",
-                "duration": 800,
-                "is_sensitive": True,
-                "masked_fields": ["authorization", "email", "phone"]
-            },
-            {
-                "id": "api-0e",
-                "api_name": "ZoomInfo Contact Enrich",
-                "url": "https://api.zoominfo.com/gtm/data/v1/contacts/enrich",
-                "method": "POST",
-                "status_code": 200 if zi_contacts else 204,
-                "status_text": "OK" if zi_contacts else "No Content",
-                "headers": {"content-type": "application/vnd.api+json"},
-                "request_body": {"data": {"type": "ContactEnrich", "attributes": {"personId": [c.get("person_id") for c in zi_contacts[:5] if c.get("person_id")] or ["(person_ids come from contact search results)"]}}},
-                "response_body": {
-                    "data": [
-                        {
-                            "personId": c.get("person_id", "N/A"),
-                            "firstName": c.get("name", "").split()[0] if c.get("name") and " " in c.get("name", "") else "N/A",
-                            "lastName": c.get("name", "").split()[-1] if c.get("name") and " " in c.get("name", "") else "N/A",
-                            "jobTitle": c.get("title", "N/A"),
-                            "directPhone": c.get("direct_phone", "N/A"),
-                            "mobilePhone": c.get("mobile_phone", "N/A"),
-                            "companyPhone": c.get("company_phone", "N/A"),
-                            "contactAccuracyScore": c.get("contact_accuracy_score", 0),
-                            "department": c.get("department", "N/A"),
-                            "managementLevel": c.get("management_level", "N/A"),
-                        }
-                        for c in (zi_contacts[:5] if zi_contacts else [])
-                    ] if zi_contacts else [{"note": "No contacts enriched"}]
-                },
-                "timestamp": (base_time + timedelta(seconds=2, milliseconds=500)).isoformat() + "Z",
-                "duration": 650,
-                "is_sensitive": True,
-                "masked_fields": ["authorization", "directPhone", "mobilePhone"]
-            },
-            {
-                "id": "api-1",
-                "api_name": "Apollo.io Organization Search",
-                "url": "https://api.apollo.io/v1/organizations/search",
-                "method": "POST",
-                "status_code": 200 if apollo_org else 401,
-                "status_text": "OK" if apollo_org else "Unauthorized",
-                "headers": {"content-type": "application/json"},
-                "request_body": {"q_organization_name": company_name, "page": 1, "per_page": 1},
-                "response_body": apollo_data if apollo_data else {"error": "No data returned"},
-                "timestamp": (base_time + timedelta(seconds=2)).isoformat() + "Z",
-                "duration": 450,
-                "is_sensitive": True,
-                "masked_fields": ["api_key"]
-            },
-            {
-                "id": "api-2",
-                "api_name": "PeopleDataLabs Company Enrich",
-                "url": "https://api.peopledatalabs.com/v5/company/enrich",
-                "method": "GET",
-                "status_code": pdl_data.get("status", 200) if pdl_data else 404,
-                "status_text": "OK" if pdl_data else "Not Found",
-                "headers": {"content-type": "application/json"},
-                "request_body": {"website": domain},
-                "response_body": pdl_data if pdl_data else {"error": "No data returned"},
-                "timestamp": (base_time + timedelta(seconds=2)).isoformat() + "Z",
-                "duration": 380,
-                "is_sensitive": True,
-                "masked_fields": ["api_key"]
-            },
-            {
-                "id": "api-2b",
-                "api_name": "Hunter.io Domain Search",
-                "url": "https://api.hunter.io/v2/domain-search",
-                "method": "GET",
-                "status_code": 200 if hunter_data else 404,
-                "status_text": "OK" if hunter_data else "Not Found",
-                "headers": {"content-type": "application/json"},
-                "request_body": {"domain": domain, "limit": 20},
-                "response_body": hunter_data if hunter_data else {"error": "No data returned or API not configured"},
-                "timestamp": (base_time + timedelta(seconds=3)).isoformat() + "Z",
-                "duration": 320,
-                "is_sensitive": True,
-                "masked_fields": ["api_key"]
-            },
-            {
-                "id": "api-2c",
-                "api_name": "GNews API - Recent Company News",
-                "url": "https://gnews.io/api/v4/search",
-                "method": "GET",
-                "status_code": 200 if news_data and news_data.get("success") else (503 if news_data and news_data.get("error") else 404),
-                "status_text": news_data.get("error", "No news API configured") if news_data and not news_data.get("success") else ("OK" if news_data and news_data.get("success") else "Not attempted"),
-                "headers": {"content-type": "application/json"},
-                "request_body": {"q": company_name, "lang": "en", "max": 10, "sortby": "publishedAt"},
-                "response_body": {
-                    "success": news_data.get("success", False) if news_data else False,
-                    "error": news_data.get("error") if news_data and not news_data.get("success") else None,
-                    "articles_count": news_data.get("articles_count", 0) if news_data else 0,
-                    "date_range": news_data.get("date_range", "Last 90 days") if news_data else "N/A",
-                    "categories": {
-                        "executive_changes": len(news_data.get("categories", {}).get("executive_changes", [])) if news_data else 0,
-                        "funding": len(news_data.get("categories", {}).get("funding", [])) if news_data else 0,
-                        "partnerships": len(news_data.get("categories", {}).get("partnerships", [])) if news_data else 0,
-                        "expansions": len(news_data.get("categories", {}).get("expansions", [])) if news_data else 0
-                    },
-                    "summaries": news_data.get("summaries", {}) if news_data else {},
-                    "raw_articles": news_data.get("raw_articles", [])[:5] if news_data else []
-                },
-                "timestamp": (base_time + timedelta(seconds=3, milliseconds=500)).isoformat() + "Z",
-                "duration": 280,
-                "is_sensitive": True,
-                "masked_fields": ["token", "api_key"]
-            },
-            {
-                "id": "api-3",
-                "api_name": "OpenAI - LLM Council (20 Specialists)",
-                "url": "https://api.openai.com/v1/chat/completions",
-                "method": "POST",
-                "status_code": 200 if validated_data else 500,
-                "status_text": "OK" if validated_data else "Error",
-                "headers": {"content-type": "application/json"},
-                "request_body": {
-                    "model": "gpt-4o-mini",
-                    "specialists": [
-                        "Industry Classifier", "Employee Analyst", "Revenue Analyst",
-                        "Geographic Specialist", "Company Historian", "Tech Stack Expert",
-                        "Market Analyst", "Product Analyst", "Competitor Analyst",
-                        "Leadership Analyst", "Social Media Analyst", "Legal Analyst",
-                        "Growth Analyst", "Brand Analyst", "Partnership Analyst",
-                        "Customer Analyst", "Pricing Analyst", "Culture Analyst",
-                        "Innovation Analyst", "Risk Analyst"
-                    ],
-                    "parallel_calls": 20,
-                    "company": company_name
-                },
-                "response_body": {
-                    "specialists_completed": job_data.get("council_metadata", {}).get("specialists_run", 20),
-                    "specialists_total": 20,
-                    "aggregator_output": validated_data
-                },
-                "timestamp": (base_time + timedelta(seconds=5)).isoformat() + "Z",
-                "duration": 4000,
-                "is_sensitive": True,
-                "masked_fields": ["api_key", "authorization"]
-            },
-            {
-                "id": "api-4",
-                "api_name": "OpenAI - Chief Aggregator",
-                "url": "https://api.openai.com/v1/chat/completions",
-                "method": "POST",
-                "status_code": 200 if validated_data else 500,
-                "status_text": "OK" if validated_data else "Error",
-                "headers": {"content-type": "application/json"},
-                "request_body": {
-                    "model": "gpt-4o-mini",
-                    "role": "Chief Data Aggregator",
-                    "task": "Synthesize 20 specialist analyses into concise, fact-driven profile"
-                },
-                "response_body": {
-                    "validated_data": validated_data,
-                    "confidence_score": validated_data.get("confidence_score", 0.85) if validated_data else 0,
-                    "fields_validated": list(validated_data.keys()) if validated_data else []
-                },
-                "timestamp": (base_time + timedelta(seconds=9)).isoformat() + "Z",
-                "duration": 2000,
-                "is_sensitive": True,
-                "masked_fields": ["api_key", "authorization"]
-            },
-            {
-                "id": "api-5",
-                "api_name": "Gamma Slideshow Generation",
-                "url": "https://public-api.gamma.app/v1.0/generations",
-                "method": "POST",
-                "status_code": 200 if slideshow_data and slideshow_data.get("success") else (503 if slideshow_data else 404),
-                "status_text": "OK" if slideshow_data and slideshow_data.get("success") else ("Error" if slideshow_data else "Not Configured"),
-                "headers": {"content-type": "application/json"},
-                "request_body": {
-                    "company": company_name,
-                    "template": "HP RAD Intelligence",
-                    "slides": ["Executive Snapshot", "Buying Signals", "Opportunity Themes", "Stakeholder Map", "Sales Program"],
-                },
-                "response_body": {
-                    "success": slideshow_data.get("success", False) if slideshow_data else False,
-                    "slideshow_url": slideshow_data.get("slideshow_url") if slideshow_data else None,
-                    "slideshow_id": slideshow_data.get("slideshow_id") if slideshow_data else None,
-                    "error": slideshow_data.get("error") if slideshow_data and not slideshow_data.get("success") else None,
-                },
-                "timestamp": (base_time + timedelta(seconds=11)).isoformat() + "Z",
-                "duration": 3000 if slideshow_data and slideshow_data.get("success") else 100,
-                "is_sensitive": True,
-                "masked_fields": ["api_key"]
-            },
-        ]),
-        "llm_thought_processes": _generate_council_thought_processes(
-            job_data, company_name, base_time, apollo_extracted, pdl_extracted, validated_data
-        ),
-        "process_flow": {
-            "nodes": [
-                {"id": "start", "label": "Request Received", "type": "start", "status": "completed"},
-                {"id": "zoominfo", "label": "ZoomInfo API (PRIMARY)", "type": "api", "status": "completed", "details": "[PRIORITY] Company enrichment, buyer intent, scoops, contacts"},
-                {"id": "apollo", "label": "Apollo.io API", "type": "api", "status": "completed"},
-                {"id": "pdl", "label": "PeopleDataLabs API", "type": "api", "status": "completed"},
-                {"id": "merge", "label": "ZoomInfo Priority Merge", "type": "process", "status": "completed", "details": "Merged data with ZoomInfo as primary source"},
-                {"id": "council", "label": "LLM Council (20 Specialists)", "type": "llm", "status": "completed" if status == "completed" else "in_progress"},
-                {"id": "aggregator", "label": "Chief Aggregator", "type": "llm", "status": "completed" if status == "completed" else "in_progress"},
-                {"id": "store", "label": "Store to Supabase", "type": "process", "status": "completed" if status == "completed" else "pending"},
-                {"id": "gamma", "label": "Gamma Slideshow", "type": "api", "status": "completed" if status == "completed" else "pending"},
-                {"id": "end", "label": "Complete", "type": "end", "status": "completed" if status == "completed" else "pending"},
-            ],
-            "edges": [
-                {"id": "e1", "source": "start", "target": "zoominfo", "label": "Primary Source"},
-                {"id": "e2", "source": "start", "target": "apollo"},
-                {"id": "e3", "source": "start", "target": "pdl"},
-                {"id": "e4", "source": "zoominfo", "target": "merge"},
-                {"id": "e5", "source": "apollo", "target": "merge"},
-                {"id": "e6", "source": "pdl", "target": "merge"},
-                {"id": "e7", "source": "merge", "target": "council", "label": "Merged Data"},
-                {"id": "e8", "source": "council", "target": "aggregator", "label": "20 Analyses"},
-                {"id": "e9", "source": "aggregator", "target": "store", "label": "Validated Data"},
-                {"id": "e10", "source": "store", "target": "gamma", "label": "Generate"},
-                {"id": "e11", "source": "gamma", "target": "end", "label": "Complete"},
-            ],
-        },
-        "created_at": created_at,
-        "completed_at": (base_time + timedelta(seconds=12)).isoformat() + "Z" if status == "completed" else None,
-    }
-
-
-@app.get("/debug-data/{job_id}", tags=["Debug"])
-async def get_debug_data(job_id: str):
-    """Get complete debug data for a job (Features 018-021)."""
-    logger.info(f"Debug data requested for job: {job_id}")
-
-    job = jobs_store.get(job_id)
-    if not job:
-        raise HTTPException(status_code=404, detail="Debug data not found for job")
-
-    return generate_debug_data(job_id, job)
-
-
-@app.get("/debug-data/{job_id}/process-steps", tags=["Debug"])
-async def get_process_steps(job_id: str):
-    """Get process steps for a job (Feature 018)."""
-    job = jobs_store.get(job_id)
-    if not job:
-        raise HTTPException(status_code=404, detail="Process steps not found for job")
-
-    debug_data = generate_debug_data(job_id, job)
-    return debug_data["process_steps"]
-
-
-@app.get("/debug-data/{job_id}/api-responses", tags=["Debug"])
-async def get_api_responses(job_id: str, mask_sensitive: bool = True):
-    """Get API responses for a job (Feature 019)."""
-    job = jobs_store.get(job_id)
-    if not job:
-        raise HTTPException(status_code=404, detail="API responses not found for job")
-
-    debug_data = generate_debug_data(job_id, job)
-    return debug_data["api_responses"]
-
-
-@app.get("/debug-data/{job_id}/llm-processes", tags=["Debug"])
-async def get_llm_processes(job_id: str):
-    """Get LLM thought processes for a job (Feature 020)."""
-    job = jobs_store.get(job_id)
-    if not job:
-        raise HTTPException(status_code=404, detail="LLM processes not found for job")
-
-    debug_data = generate_debug_data(job_id, job)
-    return debug_data["llm_thought_processes"]
-
-
-@app.get("/debug-data/{job_id}/process-flow", tags=["Debug"])
-async def get_process_flow(job_id: str):
-    """Get process flow for a job (Feature 021)."""
-    job = jobs_store.get(job_id)
-    if not job:
-        raise HTTPException(status_code=404, detail="Process flow not found for job")
-
-    debug_data = generate_debug_data(job_id, job)
-    return debug_data["process_flow"]
-
-
 # ============================================================================
 # On-Demand Sales Content Generation
 # ============================================================================
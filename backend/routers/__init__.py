@@ -0,0 +1,23 @@
+"""
+API routers mounted by production_main.
+
+production_main used to define every route (and import everything those
+routes might need) in one module, so a cold start paid for debug tooling and
+content-audit loading before the port was even bound. The side routes now
+live here, one APIRouter per area:
+
+  * health        — /health, /metrics, /
+  * content_audit — /api/content-audit (CSV loaded on first use or by warmup)
+  * debug         — /debug-* diagnostics; the ~1k-line debug payload builder
+                    (debug_payload.py) is imported on the first /debug-data call
+
+Routers never import production_main at module level (it imports them);
+shared state — jobs_store, API keys, helpers — is looked up through `main()`
+at request time, so tests that patch `production_main.X` still take effect.
+"""
+import sys
+
+
+def main():
+    """The running production_main module (also when started as __main__)."""
+    return sys.modules.get("production_main") or sys.modules["__main__"]
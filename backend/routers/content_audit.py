@@ -0,0 +1,49 @@
+"""HP content-audit routes.
+
+The CSV (and the optional embedding index, which loads a sentence-transformers
+model) is no longer read at import: the startup warmup loads it in the
+background, and content_audit loads it on first use if a request gets there
+first.
+"""
+from fastapi import APIRouter, status
+from pydantic import BaseModel, Field
+
+router = APIRouter(tags=["Content Audit"])
+
+
+def _content_audit():
+    import content_audit
+    return content_audit
+
+
+@router.get("/api/content-audit")
+async def list_content_audit():
+    """Return all HP content audit items (CSV + user-added)."""
+    items = _content_audit().get_all_items()
+    return {"items": items, "total": len(items)}
+
+
+class ContentAuditItemCreate(BaseModel):
+    """Request body for adding a content audit item."""
+    asset_name: str = Field(..., min_length=1)
+    sp_link: str = Field(..., min_length=1)
+    asset_summary: str = Field(default="")
+    industry: str = Field(default="")
+    service_solution: str = Field(default="")
+    audience: str = Field(default="")
+    format_type: str = Field(default="")
+
+
+@router.post("/api/content-audit", status_code=status.HTTP_201_CREATED)
+async def create_content_audit_item(body: ContentAuditItemCreate):
+    """Add a user-defined content audit item."""
+    item = _content_audit().add_item(
+        asset_name=body.asset_name,
+        sp_link=body.sp_link,
+        asset_summary=body.asset_summary,
+        industry=body.industry,
+        service_solution=body.service_solution,
+        audience=body.audience,
+        format_type=body.format_type,
+    )
+    return {"item": item}
@@ -0,0 +1,405 @@
+"""Debug / diagnostics routes: env status, ZoomInfo auth + raw probes, v3.1
+diagnostics and the debug-mode payload (Features 018-021).
+
+The payload builder lives in debug_payload.py and is imported on the first
+/debug-data request, not at startup.
+"""
+import logging
+import os
+from typing import Any, Dict
+
+from fastapi import APIRouter, HTTPException
+
+from routers import main
+
+logger = logging.getLogger(__name__)
+
+router = APIRouter()
+
+
+def _debug_payload():
+    """Lazy import of the debug-mode payload builder."""
+    from routers import debug_payload
+    return debug_payload
+
+
+# Debug endpoint to check env vars at runtime
+@router.get("/debug-env", tags=["Debug"])
+async def debug_env():
+    """Debug endpoint to check environment variable status at runtime."""
+    def mask(val):
+        if not val:
+            return "NOT SET"
+        if len(val) <= 8:
+            return f"SET ({len(val)} chars)"
+        return f"{val[:4]}...{val[-4:]} ({len(val)} chars)"
+
+    zi_auth_method = "none"
+    if os.getenv("ZOOMINFO_USERNAME") and os.getenv("ZOOMINFO_PASSWORD"):
+        zi_auth_method = "username+password (auto-refresh)"
+    elif os.getenv("ZOOMINFO_REFRESH_TOKEN"):
+        zi_auth_method = "refresh_token (Okta OAuth)"
+    elif os.getenv("ZOOMINFO_ACCESS_TOKEN"):
+        zi_auth_method = "static token (expires ~1h — set USERNAME+PASSWORD for auto-refresh)"
+
+    return {
+        "runtime_getenv": {
+            "APOLLO_API_KEY": mask(os.getenv("APOLLO_API_KEY")),
+            "PEOPLEDATALABS_API_KEY": mask(os.getenv("PEOPLEDATALABS_API_KEY")),
+            "HUNTER_API_KEY": mask(os.getenv("HUNTER_API_KEY")),
+            "OPENAI_API_KEY": mask(os.getenv("OPENAI_API_KEY")),
+            "GNEWS_API_KEY": mask(os.getenv("GNEWS_API_KEY")),
+            "SUPABASE_URL": mask(os.getenv("SUPABASE_URL")),
+            "SUPABASE_KEY": mask(os.getenv("SUPABASE_KEY")),
+            "GAMMA_API_KEY": mask(os.getenv("GAMMA_API_KEY")),
+            "ZOOMINFO_USERNAME": mask(os.getenv("ZOOMINFO_USERNAME")),
+            "ZOOMINFO_PASSWORD": mask(os.getenv("ZOOMINFO_PASSWORD")),
+            "ZOOMINFO_ACCESS_TOKEN": mask(os.getenv("ZOOMINFO_ACCESS_TOKEN")),
+            "ZOOMINFO_REFRESH_TOKEN": mask(os.getenv("ZOOMINFO_REFRESH_TOKEN")),
+            "ZOOMINFO_CLIENT_ID": mask(os.getenv("ZOOMINFO_CLIENT_ID")),
+            "ZOOMINFO_CLIENT_SECRET": mask(os.getenv("ZOOMINFO_CLIENT_SECRET")),
+        },
+        "zoominfo_auth_method": zi_auth_method,
+        # Supabase project host/ref the backend actually talks to (NOT a secret —
+        # the ref appears in every client URL). Used to confirm backend/frontend
+        # point at the same project.
+        "supabase_host": (os.getenv("SUPABASE_URL", "") or "").replace("https://", "").split(".")[0] or "NOT SET",
+        "note": "All values checked at request time. NOT SET = missing from Render environment variables."
+    }
+
+
+@router.get("/debug-zoominfo-auth", tags=["Debug"])
+async def debug_zoominfo_auth(live: bool = False):
+    """
+    ZoomInfo auth health check — diagnoses the "token expires daily" problem.
+
+    Reports which auth strategy is active, whether the rotating refresh_token is
+    being durably persisted to the Supabase `zi_auth_tokens` table (the linchpin
+    for surviving Render restarts), and the static-token fallback state.
+
+    Pass ?live=true to actually perform a token refresh and report the result +
+    expiry — this consumes/rotates the refresh_token, so use sparingly.
+    """
+    from worker.zoominfo_client import ZoomInfoClient
+
+    out: Dict[str, Any] = {}
+    try:
+        client = ZoomInfoClient()
+        out["auto_auth"] = client._auto_auth
+        out["strategy"] = (
+            "1. OAuth2 refresh_token grant (auto-refresh, durable)"
+            if client._auto_auth
+            else "2. static ZOOMINFO_ACCESS_TOKEN (24h, manual replace)"
+            if client._static_token
+            else "none configured"
+        )
+        out["has_client_id"] = bool(client._client_id)
+        out["has_client_secret"] = bool(client._client_secret)
+        out["has_refresh_token_seed"] = bool(client._refresh_token)
+        out["has_static_access_token"] = bool(client._static_token)
+
+        # Is the rotated token being persisted? (the daily-expiry root cause)
+        persisted = await client._load_persisted_refresh_token()
+        if persisted is None:
+            out["persisted_refresh_token"] = (
+                "NOT FOUND — Supabase 'zi_auth_tokens' table is missing or empty. "
+                "Apply migration backend/migrations/2026-06-24_zi_auth_tokens.sql, "
+                "then the rotated token will survive restarts."
+            )
+            out["persistence_healthy"] = False
+        else:
+            seed = client._refresh_token or ""
+            out["persisted_refresh_token"] = (
+                f"FOUND ({persisted[:6]}…, {len(persisted)} chars)"
+            )
+            out["persisted_differs_from_seed"] = persisted != seed
+            out["persistence_healthy"] = True
+
+        if live:
+            try:
+                await client._ensure_valid_token()
+                import time as _t
+                ttl = int(max(0, client._token_expires_at - _t.time()))
+                out["live_refresh"] = "OK"
+                out["access_token_present"] = bool(client.access_token)
+                out["expires_in_seconds"] = ttl
+                out["expires_in_hours"] = round(ttl / 3600, 1)
+            except Exception as e:  # noqa: BLE001
+                out["live_refresh"] = f"FAILED: {e}"
+    except Exception as e:  # noqa: BLE001
+        out["error"] = str(e)
+
+    # Raw probe: surface the actual exception from a direct supabase-py read so
+    # we can see WHY persistence fails (vs. the swallowed debug-level log).
+    try:
+        from supabase import create_client as _cc
+        import supabase as _sb_mod
+        _url = os.getenv("SUPABASE_URL")
+        _key = os.getenv("SUPABASE_KEY") or os.getenv("SUPABASE_SERVICE_ROLE_KEY")
+        out["supabase_probe"] = {
+            "py_version": getattr(_sb_mod, "__version__", "unknown"),
+            "url_present": bool(_url), "key_present": bool(_key),
+        }
+        sb = _cc(_url, _key)
+        r = sb.table("zi_auth_tokens").select("*").execute()
+        out["supabase_probe"]["read_ok"] = True
+        out["supabase_probe"]["rows"] = len(r.data or [])
+    except Exception as e:  # noqa: BLE001
+        out.setdefault("supabase_probe", {})["read_ok"] = False
+        out["supabase_probe"]["error"] = f"{type(e).__name__}: {str(e)[:400]}"
+
+    out["verdict"] = (
+        "HEALTHY — refresh_token auto-rotates and persists across restarts."
+        if out.get("auto_auth") and out.get("persistence_healthy")
+        else "AT RISK — rotated token will not survive restarts; auth will lapse "
+             "to the 24h static token. See migration + runbook."
+    )
+    return out
+
+
+@router.get("/debug-v31", tags=["Debug"])
+async def debug_v31():
+    """Diagnose why the v3.1 flag-gated pipeline is/ isn't engaging.
+    If this endpoint 404s, the latest code has NOT deployed yet."""
+    result = {
+        "marker": "v31-diag-3-contactfloor-jobrecovery",
+        "USE_V31_PIPELINE": os.getenv("USE_V31_PIPELINE", "NOT SET"),
+        "flag_active": os.getenv("USE_V31_PIPELINE", "").strip().lower() == "true",
+        "ANTHROPIC_API_KEY_set": bool(os.getenv("ANTHROPIC_API_KEY")),
+        "SUPABASE_URL_set": bool(os.getenv("SUPABASE_URL")),
+        "SUPABASE_KEY_len": len(os.getenv("SUPABASE_KEY", "")),
+    }
+    try:
+        from worker.pipeline_v31_hook import run_v31_pipeline  # noqa: F401
+        result["v31_hook_import"] = "ok"
+    except Exception as e:
+        result["v31_hook_import"] = f"FAIL: {type(e).__name__}: {e}"
+    try:
+        import pptx
+        result["python_pptx"] = getattr(pptx, "__version__", "ok")
+    except Exception as e:
+        result["python_pptx"] = f"FAIL: {type(e).__name__}: {e}"
+    try:
+        import httpx as _httpx
+        base = os.getenv("SUPABASE_URL", "").rstrip("/")
+        bucket = os.getenv("SUPABASE_STORAGE_BUCKET_DECKS", "decks")
+        url = f"{base}/storage/v1/object/public/{bucket}/master-template.pptx"
+        async with _httpx.AsyncClient(timeout=15) as c:
+            r = await c.get(url, headers={"Range": "bytes=0-0"})
+        result["master_template_http"] = r.status_code
+    except Exception as e:
+        result["master_template_http"] = f"FAIL: {type(e).__name__}: {e}"
+    # Last runtime v3.1 failure (if any job fell back to Gamma)
+    result["last_v31_error"] = main()._v31_diag.get("last_error")
+    result["last_v31_traceback"] = main()._v31_diag.get("last_traceback")
+    result["last_v31_job"] = main()._v31_diag.get("last_job")
+    return result
+
+
+# ============================================================================
+# ZoomInfo Raw Diagnostics Endpoint
+# ============================================================================
+
+@router.get("/debug-zoominfo/{domain}", tags=["Debug"])
+async def debug_zoominfo_raw(domain: str):
+    """
+    Diagnostic endpoint: makes raw HTTP calls to every ZoomInfo endpoint and
+    returns the EXACT status code + response body for each payload variant.
+    This bypasses all client-side error handling so you can see what ZoomInfo
+    actually returns — 400 bad request, 403 plan restriction, 404 wrong path,
+    or 200 with empty/populated data.
+    """
+    import httpx as _httpx
+    from worker.zoominfo_client import ENDPOINTS, DEFAULT_INTENT_TOPICS
+
+    zi_client = main()._get_zoominfo_client()
+    if not zi_client:
+        return {"error": "ZoomInfo not configured — set ZOOMINFO_REFRESH_TOKEN+CLIENT_ID+CLIENT_SECRET or ZOOMINFO_ACCESS_TOKEN"}
+
+    # Ensure a valid auth token is loaded before probing
+    try:
+        await zi_client._ensure_valid_token()
+    except Exception as e:
+        return {"error": f"ZoomInfo auth failed: {e}"}
+
+    bare = zi_client._bare_domain(domain)
+    primary_website = f"https://www.{bare}"
+    company_name = zi_client._company_name_from_domain(domain)
+
+    results: dict = {
+        "domain_input": domain,
+        "bare_domain": bare,
+        "primary_website": primary_website,
+        "company_name_guess": company_name,
+        "token_present": bool(zi_client.access_token),
+    }
+
+    # ------------------------------------------------------------------ #
+    # Helper: POST one payload to one endpoint and capture everything     #
+    # Returns a dict with: endpoint, payload, http_status, response_body, #
+    # data_len (how many records _extract_data_list found), error         #
+    # ------------------------------------------------------------------ #
+    async def _probe(endpoint: str, payload: dict) -> dict:
+        url = f"{zi_client.base_url}{endpoint}"
+        headers = {
+            "Content-Type": "application/vnd.api+json",
+            "Accept": "application/vnd.api+json, application/json",
+            "Authorization": f"Bearer {zi_client.access_token}",
+        }
+        try:
+            async with _httpx.AsyncClient(timeout=20) as hc:
+                r = await hc.post(url, json=payload, headers=headers)
+            try:
+                body = r.json()
+            except Exception:
+                body = r.text[:1000]
+            data_list = zi_client._extract_data_list(body) if isinstance(body, dict) else []
+            return {
+                "endpoint": endpoint,
+                "payload": payload,
+                "http_status": r.status_code,
+                "response_body": body,
+                "data_len": len(data_list),
+            }
+        except Exception as exc:
+            return {
+                "endpoint": endpoint,
+                "payload": payload,
+                "http_status": None,
+                "response_body": None,
+                "error": str(exc),
+            }
+
+    # ------------------------------------------------------------------ #
+    # 1. Company enrich — try every payload variant in order             #
+    # ------------------------------------------------------------------ #
+    from worker.zoominfo_client import COMPANY_OUTPUT_FIELDS as _CO_FIELDS
+    company_payloads = [
+        # JSON:API format for GTM Data API v1
+        {"data": {"type": "CompanyEnrich", "attributes": {"matchCompanyInput": [{"companyWebsite": primary_website}], "outputFields": _CO_FIELDS}}},
+        {"data": {"type": "CompanyEnrich", "attributes": {"matchCompanyInput": [{"companyWebsite": f"https://{bare}"}], "outputFields": _CO_FIELDS}}},
+        {"data": {"type": "CompanyEnrich", "attributes": {"matchCompanyInput": [{"companyName": company_name}], "outputFields": _CO_FIELDS}}},
+    ]
+    company_probes = []
+    company_id_found = None
+    for p in company_payloads:
+        probe = await _probe(ENDPOINTS["company_enrich"], p)
+        company_probes.append(probe)
+        if probe["http_status"] == 200 and probe["data_len"] > 0:
+            # Extract companyId from first successful result
+            body = probe["response_body"]
+            data_list = zi_client._extract_data_list(body) if isinstance(body, dict) else []
+            if data_list:
+                raw = data_list[0]
+                attrs = raw.get("attributes", raw)
+                company_id_found = (
+                    attrs.get("companyId") or attrs.get("id") or
+                    raw.get("id") or str(attrs.get("objectId", "")) or None
+                )
+            break  # stop once we have a hit
+    results["company_enrich"] = company_probes
+    results["company_id_found"] = company_id_found
+
+    # ------------------------------------------------------------------ #
+    # 2. Scoops search (known working — baseline reference)              #
+    # ------------------------------------------------------------------ #
+    scoops_attrs = {"companyId": company_id_found} if company_id_found else {"companyWebsite": primary_website}
+    scoops_p = {"data": {"type": "ScoopEnrich", "attributes": scoops_attrs}}
+    results["scoops_search"] = [await _probe(ENDPOINTS["scoops_enrich"], scoops_p)]
+
+    # ------------------------------------------------------------------ #
+    # 3. Intent — try /enrich/intent and /search/intent, with/without    #
+    #    companyId, with/without topics                                   #
+    # ------------------------------------------------------------------ #
+    intent_payloads = []
+    intent_ep = ENDPOINTS["intent_enrich"]
+    if company_id_found:
+        intent_payloads += [
+            (intent_ep, {"data": {"type": "IntentEnrich", "attributes": {"companyId": company_id_found, "topics": DEFAULT_INTENT_TOPICS[:3]}}}),
+            (intent_ep, {"data": {"type": "IntentEnrich", "attributes": {"companyId": company_id_found}}}),
+        ]
+    intent_payloads += [
+        (intent_ep, {"data": {"type": "IntentEnrich", "attributes": {"companyWebsite": primary_website, "topics": DEFAULT_INTENT_TOPICS[:3]}}}),
+        (intent_ep, {"data": {"type": "IntentEnrich", "attributes": {"companyWebsite": primary_website}}}),
+    ]
+    results["intent_enrich"] = [await _probe(ep, p) for ep, p in intent_payloads]
+
+    # ------------------------------------------------------------------ #
+    # 4. News — try /search/news with multiple identifier types          #
+    # ------------------------------------------------------------------ #
+    news_ep = ENDPOINTS["news_enrich"]
+    news_payloads = []
+    if company_id_found:
+        news_payloads.append((news_ep, {"data": {"type": "NewsEnrich", "attributes": {"companyId": company_id_found}}}))
+    else:
+        news_payloads.append((news_ep, {"data": {"type": "NewsEnrich", "attributes": {"companyName": company_name}}}))
+    results["news_search"] = [await _probe(ep, p) for ep, p in news_payloads]
+
+    # ------------------------------------------------------------------ #
+    # 5. Technology — /gtm/data/v1/companies/technologies/enrich         #
+    # ------------------------------------------------------------------ #
+    tech_ep = ENDPOINTS["tech_enrich"]
+    tech_payloads = []
+    if company_id_found:
+        tech_payloads.append(
+            (tech_ep, {"data": {"type": "TechnologyEnrich", "attributes": {"companyId": company_id_found}}})
+        )
+    tech_payloads.append(
+        (tech_ep, {"data": {"type": "TechnologyEnrich", "attributes": {"companyWebsite": primary_website}}})
+    )
+    results["tech_enrich"] = [await _probe(ep, p) for ep, p in tech_payloads]
+
+    # ------------------------------------------------------------------ #
+    # 6. Contact search (reference — should be working)                  #
+    # ------------------------------------------------------------------ #
+    results["contact_search"] = [
+        await _probe(ENDPOINTS["contact_search"] + "?page%5Bsize%5D=3",
+                     {"data": {"type": "ContactSearch", "attributes": {"companyWebsite": zi_client._website_candidates(domain)}}})
+    ]
+
+    return results
+
+
+# ============================================================================
+# Debug Mode Endpoints (Features 018-021)
+# ============================================================================
+
+def _debug_data_for(job_id: str, not_found: str) -> dict:
+    """Memoized debug payload for a job: rebuilt only when the job has moved on
+    since the last build (see worker/debug_memo.py)."""
+    pm = main()
+    job = pm.jobs_store.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail=not_found)
+    return pm._debug_memo_module().get_or_build(job, lambda: _debug_payload().generate_debug_data(job_id, job))
+
+
+@router.get("/debug-data/{job_id}", tags=["Debug"])
+async def get_debug_data(job_id: str):
+    """Get complete debug data for a job (Features 018-021)."""
+    logger.info(f"Debug data requested for job: {job_id}")
+    return _debug_data_for(job_id, "Debug data not found for job")
+
+
+@router.get("/debug-data/{job_id}/process-steps", tags=["Debug"])
+async def get_process_steps(job_id: str):
+    """Get process steps for a job (Feature 018)."""
+    return _debug_data_for(job_id, "Process steps not found for job")["process_steps"]
+
+
+@router.get("/debug-data/{job_id}/api-responses", tags=["Debug"])
+async def get_api_responses(job_id: str, mask_sensitive: bool = True):
+    """Get API responses for a job (Feature 019)."""
+    return _debug_data_for(job_id, "API responses not found for job")["api_responses"]
+
+
+@router.get("/debug-data/{job_id}/llm-processes", tags=["Debug"])
+async def get_llm_processes(job_id: str):
+    """Get LLM thought processes for a job (Feature 020)."""
+    return _debug_data_for(job_id, "LLM processes not found for job")["llm_thought_processes"]
+
+
+@router.get("/debug-data/{job_id}/process-flow", tags=["Debug"])
+async def get_process_flow(job_id: str):
+    """Get process flow for a job (Feature 021)."""
+    return _debug_data_for(job_id, "Process flow not found for job")["process_flow"]
@@ -0,0 +1,1082 @@
+"""
+Debug-mode payload builder (Features 018-021): process steps, API responses,
+LLM thought processes and process flow for a job, assembled from its stored
+data. Only /debug-data needs it, so routers/debug.py imports it on first use.
+"""
+import json
+import logging
+from datetime import datetime, timedelta
+
+from routers import main
+
+logger = logging.getLogger(__name__)
+
+
+def _generate_council_thought_processes(job_data: dict, company_name: str, base_time: datetime,
+                                         apollo_extracted: dict, pdl_extracted: dict, validated_data: dict) -> list:
+    """Generate LLM thought processes showing all 20 specialists + aggregator."""
+
+    council_metadata = job_data.get("council_metadata", {})
+    specialist_results = council_metadata.get("specialist_results", [])
+
+    thought_processes = []
+
+    # If we have actual specialist results from the council, use them
+    if specialist_results:
+        for i, specialist in enumerate(specialist_results):
+            specialist_name = specialist.get("specialist_name", f"Specialist {i+1}")
+            focus = specialist.get("focus", "general")
+            analysis = specialist.get("analysis", {})
+
+            thought_processes.append({
+                "id": f"llm-{i+1}",
+                "task_name": f"{specialist_name}",
+                "model": "gpt-4o-mini",
+                "prompt_tokens": 200 + (i * 10),
+                "completion_tokens": 150 + (i * 5),
+                "total_tokens": 350 + (i * 15),
+                "start_time": (base_time + timedelta(seconds=4, milliseconds=i*200)).isoformat() + "Z",
+                "end_time": (base_time + timedelta(seconds=5, milliseconds=i*200)).isoformat() + "Z",
+                "duration": 1000,
+                "steps": [
+                    {
+                        "id": f"thought-{i+1}-1",
+                        "step": 1,
+                        "action": f"Analyze {focus.replace('_', ' ').title()}",
+                        "reasoning": f"Examining Apollo.io and PeopleDataLabs data for {focus} information about {company_name}.",
+                        "input": {
+                            "apollo_data": apollo_extracted,
+                            "pdl_data": pdl_extracted,
+                            "focus_area": focus
+                        },
+                        "output": analysis,
+                        "confidence": 0.85 + (i % 10) * 0.01,
+                        "timestamp": (base_time + timedelta(seconds=4, milliseconds=500 + i*200)).isoformat() + "Z"
+                    },
+                ],
+                "final_decision": f"{specialist_name}: {_format_analysis_summary(analysis, focus)}",
+                "confidence_score": 0.85 + (i % 10) * 0.01,
+                "discrepancies_resolved": []
+            })
+
+        # Add aggregator as the final thought process
+        thought_processes.append({
+            "id": "llm-aggregator",
+            "task_name": "Chief Data Aggregator",
+            "model": "gpt-4o-mini",
+            "prompt_tokens": 2500,
+            "completion_tokens": 800,
+            "total_tokens": 3300,
+            "start_time": (base_time + timedelta(seconds=8)).isoformat() + "Z",
+            "end_time": (base_time + timedelta(seconds=10)).isoformat() + "Z",
+            "duration": 2000,
+            "steps": [
+                {
+                    "id": "thought-agg-1",
+                    "step": 1,
+                    "action": "Synthesize Specialist Inputs",
+                    "reasoning": f"Aggregating analyses from {len(specialist_results)} specialists to create authoritative profile for {company_name}.",
+                    "input": {
+                        "specialist_count": len(specialist_results),
+                        "apollo_data": apollo_extracted,
+                        "pdl_data": pdl_extracted
+                    },
+                    "output": {
+                        "industry": validated_data.get("industry", "N/A"),
+                        "employee_count": validated_data.get("employee_count", "N/A"),
+                        "headquarters": validated_data.get("headquarters", "N/A"),
+                        "geographic_reach": validated_data.get("geographic_reach", []),
+                        "target_market": validated_data.get("target_market", "N/A")
+                    },
+                    "confidence": validated_data.get("confidence_score", 0.85),
+                    "timestamp": (base_time + timedelta(seconds=9)).isoformat() + "Z"
+                },
+            ],
+            "final_decision": _format_aggregator_decision(validated_data, company_name),
+            "confidence_score": validated_data.get("confidence_score", 0.85),
+            "discrepancies_resolved": ["industry", "employee_count", "headquarters", "geographic_reach"]
+        })
+    else:
+        # Fallback: Generate placeholder specialist entries
+        specialist_focuses = [
+            ("Industry Classification Expert", "industry"),
+            ("Employee Count Analyst", "employee_count"),
+            ("Revenue & Financial Analyst", "revenue"),
+            ("Geographic Presence Specialist", "geography"),
+            ("Company History Expert", "history"),
+            ("Technology Stack Expert", "technology"),
+            ("Target Market Analyst", "target_market"),
+            ("Product & Services Analyst", "products"),
+            ("Competitive Intelligence Analyst", "competitors"),
+            ("Leadership & Executive Analyst", "leadership"),
+            ("Social Media & Web Presence Analyst", "social"),
+            ("Legal & Corporate Structure Analyst", "legal"),
+            ("Growth & Trajectory Analyst", "growth"),
+            ("Brand & Reputation Analyst", "brand"),
+            ("Partnerships & Alliances Analyst", "partnerships"),
+            ("Customer Base Analyst", "customers"),
+            ("Pricing & Business Model Analyst", "pricing"),
+            ("Company Culture Analyst", "culture"),
+            ("Innovation & R&D Analyst", "innovation"),
+            ("Risk & Compliance Analyst", "risk"),
+        ]
+
+        for i, (name, focus) in enumerate(specialist_focuses):
+            thought_processes.append({
+                "id": f"llm-{i+1}",
+                "task_name": name,
+                "model": "gpt-4o-mini",
+                "prompt_tokens": 200,
+                "completion_tokens": 150,
+                "total_tokens": 350,
+                "start_time": (base_time + timedelta(seconds=4, milliseconds=i*100)).isoformat() + "Z",
+                "end_time": (base_time + timedelta(seconds=5, milliseconds=i*100)).isoformat() + "Z",
+                "duration": 1000,
+                "steps": [
+                    {
+                        "id": f"thought-{i+1}-1",
+                        "step": 1,
+                        "action": f"Analyze {focus.replace('_', ' ').title()}",
+                        "reasoning": f"Examining data sources for {focus} of {company_name}",
+                        "input": {"focus": focus, "apollo": apollo_extracted.get(focus), "pdl": pdl_extracted.get(focus)},
+                        "output": {focus: validated_data.get(focus, "N/A")},
+                        "confidence": 0.85,
+                        "timestamp": (base_time + timedelta(seconds=4, milliseconds=500 + i*100)).isoformat() + "Z"
+                    },
+                ],
+                "final_decision": f"{name}: {focus}={validated_data.get(focus, 'N/A')}",
+                "confidence_score": 0.85,
+                "discrepancies_resolved": []
+            })
+
+        # Add aggregator
+        thought_processes.append({
+            "id": "llm-aggregator",
+            "task_name": "Chief Data Aggregator",
+            "model": "gpt-4o-mini",
+            "prompt_tokens": 2500,
+            "completion_tokens": 800,
+            "total_tokens": 3300,
+            "start_time": (base_time + timedelta(seconds=8)).isoformat() + "Z",
+            "end_time": (base_time + timedelta(seconds=10)).isoformat() + "Z",
+            "duration": 2000,
+            "steps": [
+                {
+                    "id": "thought-agg-1",
+                    "step": 1,
+                    "action": "Synthesize All Specialist Inputs",
+                    "reasoning": f"Combining insights from 20 specialists for {company_name}",
+                    "input": {"specialist_count": 20},
+                    "output": validated_data,
+                    "confidence": validated_data.get("confidence_score", 0.85),
+                    "timestamp": (base_time + timedelta(seconds=9)).isoformat() + "Z"
+                },
+            ],
+            "final_decision": _format_aggregator_decision(validated_data, company_name),
+            "confidence_score": validated_data.get("confidence_score", 0.85),
+            "discrepancies_resolved": ["industry", "employee_count", "headquarters"]
+        })
+
+    return thought_processes
+
+
+def _format_analysis_summary(analysis: dict, focus: str) -> str:
+    """Format specialist analysis into a concise summary."""
+    if not analysis:
+        return "No analysis available"
+
+    # Get the most relevant value based on focus
+    key_mappings = {
+        "industry": ["industry", "sub_industry"],
+        "employee_count": ["employee_count", "employee_range"],
+        "revenue": ["annual_revenue", "revenue_range"],
+        "geography": ["headquarters", "countries"],
+        "history": ["founded_year", "founders"],
+        "technology": ["technologies", "capabilities"],
+        "target_market": ["market_type", "customer_segments"],
+        "products": ["products", "services"],
+        "competitors": ["competitors", "market_position"],
+        "leadership": ["ceo", "executives"],
+        "social": ["linkedin", "twitter", "website"],
+        "legal": ["company_type", "ticker"],
+        "growth": ["growth_stage", "growth_indicators"],
+        "brand": ["brand_level", "awards"],
+        "partnerships": ["partners", "ecosystem"],
+        "customers": ["notable_customers", "customer_count"],
+        "pricing": ["business_model", "pricing_model"],
+        "culture": ["values", "culture_type"],
+        "innovation": ["rd_focus", "patent_count"],
+        "risk": ["certifications", "regulations"],
+    }
+
+    keys = key_mappings.get(focus, list(analysis.keys())[:2])
+    parts = []
+    for key in keys:
+        val = analysis.get(key)
+        if val:
+            if isinstance(val, list):
+                val = ", ".join(str(v) for v in val[:3])
+            parts.append(f"{key}={val}")
+
+    return "; ".join(parts) if parts else str(analysis)[:100]
+
+
+def _format_aggregator_decision(validated_data: dict, company_name: str) -> str:
+    """Format the aggregator's final decision as a concise summary."""
+    if not validated_data:
+        return f"Unable to validate data for {company_name}"
+
+    parts = [f"Validated profile for {company_name}:"]
+
+    if validated_data.get("industry"):
+        parts.append(f"Industry={validated_data['industry']}")
+    if validated_data.get("employee_count"):
+        parts.append(f"Employees={validated_data['employee_count']}")
+    if validated_data.get("headquarters"):
+        parts.append(f"HQ={validated_data['headquarters']}")
+    if validated_data.get("geographic_reach"):
+        geo = validated_data["geographic_reach"]
+        if isinstance(geo, list):
+            parts.append(f"Countries={', '.join(geo[:5])}" + ("..." if len(geo) > 5 else ""))
+        else:
+            parts.append(f"Reach={geo}")
+    if validated_data.get("target_market"):
+        parts.append(f"Market={validated_data['target_market']}")
+    if validated_data.get("confidence_score"):
+        parts.append(f"Confidence={validated_data['confidence_score']}")
+
+    return " | ".join(parts)
+
+
+def generate_debug_data(job_id: str, job_data: dict) -> dict:
+    """Generate debug data for a job with actual API response data."""
+    company_name = job_data.get("company_data", {}).get("company_name", "Unknown Company")
+    domain = job_data.get("company_data", {}).get("domain", "unknown.com")
+    status = job_data.get("status", "completed")
+    created_at = job_data.get("created_at", datetime.utcnow().isoformat())
+
+    # Get actual API response data
+    apollo_data = job_data.get("apollo_data", {})
+    pdl_data = job_data.get("pdl_data", {})
+    hunter_data = job_data.get("hunter_data", {})
+    news_data = job_data.get("news_data", {})
+    orchestrator_data = job_data.get("orchestrator_data", {})
+    zoominfo_data = job_data.get("zoominfo_data", {})
+    slideshow_data = job_data.get("slideshow_data", {})
+    result = job_data.get("result", {})
+
+    # CRITICAL: Ensure validated_data is a dict, not a JSON string
+    validated_data = result.get("validated_data", {})
+    if isinstance(validated_data, str):
+        try:
+            validated_data = json.loads(validated_data)
+            logger.info("Parsed validated_data from JSON string in debug endpoint")
+        except json.JSONDecodeError as e:
+            logger.error(f"Failed to parse validated_data JSON in debug endpoint: {e}")
+            validated_data = {}
+
+    # Extract Apollo.io fields (handles both organization/enrich and mixed_companies/search)
+    apollo_org = {}
+    if apollo_data:
+        # Check if it's from organizations/enrich (data at top level) or search (in array)
+        if "organization" in apollo_data:
+            apollo_org = apollo_data.get("organization", {})
+        elif "organizations" in apollo_data:
+            orgs = apollo_data.get("organizations", [])
+            if orgs:
+                apollo_org = orgs[0]
+        elif "accounts" in apollo_data:
+            accounts = apollo_data.get("accounts", [])
+            if accounts:
+                apollo_org = accounts[0]
+        else:
+            # Data might be at top level
+            apollo_org = apollo_data
+
+    apollo_extracted = {
+        "company_name": apollo_org.get("name", "N/A"),
+        "industry": apollo_org.get("industry", "N/A"),
+        "employee_count": apollo_org.get("estimated_num_employees") or apollo_org.get("employee_count", "N/A"),
+        "headquarters": f"{apollo_org.get('city', '')}, {apollo_org.get('state', '')}".strip(", ") or apollo_org.get("country", "N/A"),
+        "founded_year": apollo_org.get("founded_year", "N/A"),
+        "website": apollo_org.get("website_url") or apollo_org.get("primary_domain", "N/A"),
+        "linkedin": apollo_org.get("linkedin_url", "N/A"),
+        "technologies": (apollo_org.get("technologies") or [])[:5],
+        "annual_revenue": apollo_org.get("annual_revenue", "N/A"),
+    }
+
+    # Extract PeopleDataLabs fields (PDL returns data directly, not wrapped)
+    pdl_company = pdl_data if pdl_data else {}
+
+    # Build headquarters from location components
+    pdl_location = "N/A"
+    if pdl_company.get("location"):
+        loc = pdl_company["location"]
+        if isinstance(loc, dict):
+            parts = [loc.get("locality"), loc.get("region"), loc.get("country")]
+            pdl_location = ", ".join([p for p in parts if p]) or loc.get("name", "N/A")
+        elif isinstance(loc, str):
+            pdl_location = loc
+
+    pdl_extracted = {
+        "company_name": pdl_company.get("name", "N/A"),
+        "industry": pdl_company.get("industry", "N/A"),
+        "employee_count": pdl_company.get("employee_count", "N/A"),
+        "employee_range": pdl_company.get("size", "N/A"),
+        "headquarters": pdl_location,
+        "founded_year": pdl_company.get("founded", "N/A"),
+        "linkedin": pdl_company.get("linkedin_url", "N/A"),
+        "tags": (pdl_company.get("tags") or [])[:5],
+        "summary": pdl_company.get("summary", "N/A"),
+        "inferred_revenue": pdl_company.get("inferred_revenue", "N/A"),
+        "type": pdl_company.get("type", "N/A"),
+    }
+
+    # Extract Hunter.io fields
+    hunter_extracted = {
+        "organization": hunter_data.get("organization", "N/A"),
+        "domain": hunter_data.get("domain", "N/A"),
+        "country": hunter_data.get("country", "N/A"),
+        "state": hunter_data.get("state", "N/A"),
+        "city": hunter_data.get("city", "N/A"),
+        "email_pattern": hunter_data.get("pattern", "N/A"),
+        "emails_found": len(hunter_data.get("emails", [])),
+        "twitter": hunter_data.get("twitter", "N/A"),
+        "facebook": hunter_data.get("facebook", "N/A"),
+        "linkedin": hunter_data.get("linkedin", "N/A"),
+        "accept_all": hunter_data.get("accept_all", "N/A"),
+        "webmail": hunter_data.get("webmail", False),
+    }
+
+    # Extract sample contacts from Hunter.io emails
+    hunter_contacts = []
+    for email in hunter_data.get("emails", [])[:5]:
+        hunter_contacts.append({
+            "email": email.get("value", "N/A"),
+            "name": f"{email.get('first_name', '')} {email.get('last_name', '')}".strip() or "N/A",
+            "position": email.get("position", "N/A"),
+            "department": email.get("department", "N/A"),
+            "confidence": email.get("confidence", 0),
+        })
+    hunter_extracted["sample_contacts"] = hunter_contacts
+
+    # Extract ZoomInfo fields
+    zi_company = zoominfo_data.get("company", {}) if zoominfo_data else {}
+    zi_intent = zoominfo_data.get("intent_signals", []) if zoominfo_data else []
+    zi_scoops = zoominfo_data.get("scoops", []) if zoominfo_data else []
+    zi_contacts = zoominfo_data.get("contacts", []) if zoominfo_data else []
+    zi_technologies = zoominfo_data.get("technologies", []) if zoominfo_data else []
+
+    # If no ZoomInfo data was stored, populate from validated_data for display
+    if not zi_company and validated_data:
+        zi_company = {
+            "companyName": validated_data.get("company_name", company_name),
+            "domain": validated_data.get("domain", domain),
+            "employeeCount": validated_data.get("employee_count"),
+            "revenue": validated_data.get("annual_revenue"),
+            "industry": validated_data.get("industry"),
+            "city": validated_data.get("headquarters", "").split(",")[0].strip() if validated_data.get("headquarters") else None,
+            "state": validated_data.get("headquarters", "").split(",")[-1].strip() if validated_data.get("headquarters") and "," in validated_data.get("headquarters", "") else None,
+            "yearFounded": validated_data.get("founded_year"),
+            "ceoName": validated_data.get("ceo"),
+        }
+
+    zoominfo_extracted = {
+        "company_name": zi_company.get("companyName", company_name),
+        "domain": zi_company.get("domain", domain),
+        "employee_count": zi_company.get("employeeCount", "N/A"),
+        "revenue": zi_company.get("revenue", "N/A"),
+        "industry": zi_company.get("industry", "N/A"),
+        "city": zi_company.get("city", "N/A"),
+        "state": zi_company.get("state", "N/A"),
+        "year_founded": zi_company.get("yearFounded", "N/A"),
+        "ceo": zi_company.get("ceoName", "N/A"),
+        "intent_signals_count": len(zi_intent),
+        "scoops_count": len(zi_scoops),
+        "contacts_count": len(zi_contacts),
+        "technologies_count": len(zi_technologies),
+        # Growth metrics
+        "one_year_employee_growth": zoominfo_data.get("one_year_employee_growth", "N/A") if zoominfo_data else "N/A",
+        "two_year_employee_growth": zoominfo_data.get("two_year_employee_growth", "N/A") if zoominfo_data else "N/A",
+        "funding_amount": zoominfo_data.get("funding_amount", "N/A") if zoominfo_data else "N/A",
+        "fortune_rank": zoominfo_data.get("fortune_rank", "N/A") if zoominfo_data else "N/A",
+        "num_locations": zoominfo_data.get("num_locations", "N/A") if zoominfo_data else "N/A",
+    }
+
+    # Extract fact check results
+    fact_check_results = job_data.get("fact_check_results", {})
+
+    base_time = datetime.fromisoformat(created_at.replace("Z", ""))
+
+    # Use real API calls logged during pipeline execution if available.
+    # The synthetic fallback exists for old jobs and serves as a template.
+    _real_api_calls = job_data.get("api_calls", [])
+
+    return {
+        "job_id": job_id,
+        "company_name": company_name,
+        "domain": domain,
+        "status": status,
+        "process_steps": [
+            {
+                "id": "step-1",
+                "name": "Request Initialization",
+                "description": "Initializing company profile request",
+                "status": "completed",
+                "start_time": base_time.isoformat() + "Z",
+                "end_time": (base_time + timedelta(milliseconds=500)).isoformat() + "Z",
+                "duration": 500,
+                "metadata": {"request_id": job_id, "company": company_name, "domain": domain}
+            },
+            {
+                "id": "step-1b",
+                "name": "Orchestrator LLM Analysis",
+                "description": "Intelligent API routing - analyzing required data points and selecting optimal APIs",
+                "status": "completed" if orchestrator_data else "skipped",
+                "start_time": (base_time + timedelta(milliseconds=500)).isoformat() + "Z",
+                "end_time": (base_time + timedelta(milliseconds=900)).isoformat() + "Z",
+                "duration": 400,
+                "metadata": {
+                    "model": "gpt-4o-mini",
+                    "apis_selected": orchestrator_data.get("apis_to_query", ["apollo", "pdl", "hunter", "gnews"]),
+                    "priority_order": orchestrator_data.get("priority_order", []),
+                    "data_point_mapping": orchestrator_data.get("data_point_mapping", {}),
+                    "reasoning": orchestrator_data.get("reasoning", "Default plan: querying all APIs")
+                }
+            },
+            {
+                "id": "step-1c",
+                "name": "ZoomInfo Data Collection (PRIMARY)",
+                "description": "[PRIORITY SOURCE] Gathering comprehensive company data from ZoomInfo GTM API: company enrichment, buyer intent signals, business scoops/events, and contact search",
+                "status": "completed",
+                "start_time": (base_time + timedelta(seconds=1)).isoformat() + "Z",
+                "end_time": (base_time + timedelta(seconds=2, milliseconds=400)).isoformat() + "Z",
+                "duration": 1400,
+                "metadata": {
+                    "source": "ZoomInfo",
+                    "priority": "PRIMARY",
+                    "fields_retrieved": zoominfo_extracted,
+                    "intent_signals": zi_intent[:5] if zi_intent else [
+                        {"topic": "Cloud Migration", "score": 85, "audienceStrength": "high"},
+                        {"topic": "Data Security", "score": 72, "audienceStrength": "medium"},
+                        {"topic": "AI/ML Platform", "score": 68, "audienceStrength": "medium"},
+                    ],
+                    "scoops": zi_scoops[:5] if zi_scoops else [
+                        {"type": "executive_hire", "title": f"New CTO Appointed at {company_name}"},
+                        {"type": "expansion", "title": "Office Expansion Planned"},
+                    ],
+                    "technologies": zi_technologies[:10] if zi_technologies else [],
+                    "contacts_found": len(zi_contacts) if zi_contacts else 0,
+                    "growth_metrics": {
+                        "one_year_employee_growth": zoominfo_extracted.get("one_year_employee_growth"),
+                        "two_year_employee_growth": zoominfo_extracted.get("two_year_employee_growth"),
+                        "funding_amount": zoominfo_extracted.get("funding_amount"),
+                    }
+                }
+            },
+            {
+                "id": "step-1d",
+                "name": "ZoomInfo Contact Enrich",
+                "description": "Enriching contacts with direct phone, mobile phone, company phone, accuracy scores via ZoomInfo Contact Enrich API (Search → Enrich 2-step)",
+                "status": "completed" if zi_contacts else ("failed" if zoominfo_data.get("_contact_search_error") else "skipped"),
+                "start_time": (base_time + timedelta(seconds=2, milliseconds=400)).isoformat() + "Z",
+                "end_time": (base_time + timedelta(seconds=3, milliseconds=200)).isoformat() + "Z",
+                "duration": 800,
+                "metadata": {
+                    "source": "ZoomInfo Contact Enrich",
+                    "contacts_enriched": len(zi_contacts) if zi_contacts else 0,
+                    "enrichment_summary": zoominfo_data.get("_enrichment_summary"),
+                    "per_contact_enrichment": [
+                        {
+                            "name": c.get("name", "Unknown"),
+                            "title": c.get("title", ""),
+                            "enriched": c.get("enriched", False),
+                            "has_direct_phone": bool(c.get("direct_phone")),
+                            "has_mobile_phone": bool(c.get("mobile_phone")),
+                            "has_company_phone": bool(c.get("company_phone")),
+                            "has_linkedin_url": bool(c.get("linkedin") or c.get("linkedin_url")),
+                            "linkedin_url": c.get("linkedin") or c.get("linkedin_url") or "",
+                            "accuracy_score": c.get("contact_accuracy_score", 0),
+                        }
+                        for c in (zi_contacts or [])
+                    ],
+                    "fields_added": ["directPhone", "mobilePhone", "companyPhone", "contactAccuracyScore", "department", "managementLevel", "linkedinUrl"],
+                    "error": zoominfo_data.get("_contact_search_error") if not zi_contacts else None,
+                    "debug_hint": (
+                        "Check backend logs for ZoomInfo HTTP error details. "
+                        "Likely causes: (1) token lacks contact-search scope, "
+                        "(2) domain not in ZoomInfo database, "
+                        "(3) API plan doesn't include Contact Search."
+                    ) if not zi_contacts else None,
+                }
+            },
+            {
+                "id": "step-1e",
+                "name": "LLM Contact Fact Checker",
+                "description": "Validating executive contacts against public knowledge using GPT-4o-mini. Filters out incorrect contacts (score < 0.3).",
+                "status": "completed",
+                "start_time": (base_time + timedelta(seconds=3, milliseconds=200)).isoformat() + "Z",
+                "end_time": (base_time + timedelta(seconds=4)).isoformat() + "Z",
+                "duration": 800,
+                "metadata": {
+                    "model": "gpt-4o-mini",
+                    "original_contacts": fact_check_results.get("original_count", 0),
+                    "passed_contacts": fact_check_results.get("passed_count", 0),
+                    "filtered_contacts": fact_check_results.get("filtered_count", 0),
+                    "threshold": 0.3,
+                }
+            },
+            {
+                "id": "step-1f",
+                "name": "ZoomInfo GTM Identity Lookup (Apollo/Hunter cross-reference)",
+                "description": (
+                    "Cross-referencing Apollo.io and Hunter.io contacts against ZoomInfo GTM API to retrieve "
+                    "direct phone, mobile phone, and company phone numbers. Searches by email first, then "
+                    "firstName+lastName. Concurrent lookups capped at 10 contacts."
+                ),
+                "status": (
+                    "completed" if job_data.get("step_2_84_result", {}).get("contacts_found", 0) > 0
+                    else ("failed" if job_data.get("step_2_84_result", {}).get("error") else
+                          ("skipped" if not job_data.get("step_2_84_result") else "completed"))
+                ),
+                "start_time": (base_time + timedelta(seconds=4)).isoformat() + "Z",
+                "end_time": (base_time + timedelta(
+                    milliseconds=4000 + job_data.get("step_2_84_result", {}).get("duration_ms", 0)
+                )).isoformat() + "Z",
+                "duration": job_data.get("step_2_84_result", {}).get("duration_ms", 0),
+                "metadata": {
+                    "source": "ZoomInfo GTM Contact Search + Contact Enrich",
+                    "strategy": "Email lookup → firstName+lastName fallback → enrich for real phones (concurrent)",
+                    "contacts_looked_up": job_data.get("step_2_84_result", {}).get("contacts_looked_up", 0),
+                    "contacts_found_in_zoominfo": job_data.get("step_2_84_result", {}).get("contacts_found", 0),
+                    "contacts_with_phones_added": job_data.get("step_2_84_result", {}).get("contacts_with_phones", 0),
+                    "error": job_data.get("step_2_84_result", {}).get("error"),
+                    "enriched_contacts": [
+                        {
+                            "name": c.get("name"),
+                            "title": c.get("title"),
+                            "email": c.get("email"),
+                            "direct_phone": c.get("direct_phone") or "N/A",
+                            "mobile_phone": c.get("mobile_phone") or "N/A",
+                            "company_phone": c.get("company_phone") or "N/A",
+                            "phone": c.get("phone") or "N/A",
+                            "person_id": c.get("person_id"),
+                            "accuracy_score": c.get("contact_accuracy_score"),
+                            "enriched": c.get("enriched", False),
+                            "source": c.get("source", "identity_lookup"),
+                        }
+                        for c in job_data.get("enriched_identity_contacts", [])
+                    ],
+                    "note": (
+                        "Apollo/Hunter contacts are searched in ZoomInfo by email/name, then enriched via "
+                        "Contact Enrich API using person_id to retrieve real (unmasked) phone numbers."
+                    ) if not job_data.get("step_2_84_result", {}).get("error") else None,
+                }
+            },
+            {
+                "id": "step-1g",
+                "name": "Claude Web Search LinkedIn Finder",
+                "description": (
+                    "Last-resort LinkedIn discovery using Claude (claude-sonnet-4-6) with built-in "
+                    "web_search tool. Fires only for contacts still missing LinkedIn after ZoomInfo "
+                    "enrich and Apollo people/match backfill. Prioritizes C-suite contacts (C-Level → "
+                    "VP → Director). Verifies exact name match and current employment at the target company."
+                ),
+                "status": (
+                    "skipped" if not main().ANTHROPIC_API_KEY
+                    else (
+                        "failed" if job_data.get("step_2_86_result", {}).get("error")
+                        else (
+                            "skipped" if not job_data.get("step_2_86_result")
+                            else "completed"
+                        )
+                    )
+                ),
+                "start_time": (base_time + timedelta(seconds=4)).isoformat() + "Z",
+                "end_time": (
+                    base_time + timedelta(
+                        seconds=4,
+                        milliseconds=job_data.get("step_2_86_result", {}).get("duration_ms", 0)
+                    )
+                ).isoformat() + "Z",
+                "duration": job_data.get("step_2_86_result", {}).get("duration_ms", 0),
+                "metadata": {
+                    "model": "claude-sonnet-4-6",
+                    "tool": "web_search_20250305",
+                    "contacts_attempted": job_data.get("step_2_86_result", {}).get("contacts_attempted", 0),
+                    "contacts_found": job_data.get("step_2_86_result", {}).get("contacts_found", 0),
+                    "priority_order": "C-Level first, then VP, Director, other — max 15 contacts",
+                    "verification_rules": [
+                        "Name must EXACTLY match ZoomInfo contact name",
+                        "Must CURRENTLY work at target company (not former employee)",
+                        "Title/position is NOT checked (differences expected)",
+                    ],
+                    "results": job_data.get("step_2_86_result", {}).get("results", []),
+                    "error": job_data.get("step_2_86_result", {}).get("error"),
+                    "skipped_reason": (
+                        "ANTHROPIC_API_KEY not configured in environment"
+                        if not main().ANTHROPIC_API_KEY else None
+                    ),
+                },
+            },
+            {
+                "id": "step-1h",
+                "name": "Claude Web Search — Company Intelligence",
+                "description": (
+                    "Using Claude claude-sonnet-4-6 with web_search to gather company fields that "
+                    "API sources don't provide: CEO, company type, customer segments, products, "
+                    "competitors. Results are fed into the LLM Council aggregator."
+                ),
+                "status": (
+                    "completed" if job_data.get("step_3_5_result", {}).get("fields_found")
+                    else ("skipped" if not main().ANTHROPIC_API_KEY else "failed")
+                ),
+                "start_time": (base_time + timedelta(seconds=5)).isoformat() + "Z",
+                "end_time": (base_time + timedelta(
+                    seconds=5,
+                    milliseconds=job_data.get("step_3_5_result", {}).get("duration_ms", 0)
+                )).isoformat() + "Z",
+                "duration": job_data.get("step_3_5_result", {}).get("duration_ms", 0),
+                "metadata": {
+                    "model": "claude-sonnet-4-6",
+                    "tool": "web_search_20250305",
+                    "fields_found": job_data.get("step_3_5_result", {}).get("fields_found", []),
+                    "ceo": job_data.get("step_3_5_result", {}).get("ceo", ""),
+                    "company_type": job_data.get("step_3_5_result", {}).get("company_type", ""),
+                    "customer_segments_count": job_data.get("step_3_5_result", {}).get("customer_segments_count", 0),
+                    "products_count": job_data.get("step_3_5_result", {}).get("products_count", 0),
+                    "competitors_count": job_data.get("step_3_5_result", {}).get("competitors_count", 0),
+                    "skipped_reason": (
+                        "ANTHROPIC_API_KEY not configured in environment"
+                        if not main().ANTHROPIC_API_KEY else None
+                    ),
+                },
+            },
+            {
+                "id": "step-2",
+                "name": "Apollo.io Data Collection",
+                "description": "Gathering data from Apollo.io API",
+                "status": "completed" if apollo_data else ("skipped" if orchestrator_data and "apollo" not in orchestrator_data.get("apis_to_query", []) else "failed"),
+                "start_time": (base_time + timedelta(seconds=1)).isoformat() + "Z",
+                "end_time": (base_time + timedelta(seconds=3)).isoformat() + "Z",
+                "duration": 2000,
+                "metadata": {
+                    "source": "Apollo.io",
+                    "fields_retrieved": apollo_extracted,
+                    "status": "success" if apollo_org else ("skipped_by_orchestrator" if orchestrator_data and "apollo" not in orchestrator_data.get("apis_to_query", []) else "no_data")
+                }
+            },
+            {
+                "id": "step-3",
+                "name": "PeopleDataLabs Data Collection",
+                "description": "Gathering data from PeopleDataLabs API",
+                "status": "completed" if pdl_data else ("skipped" if orchestrator_data and "pdl" not in orchestrator_data.get("apis_to_query", []) else "failed"),
+                "start_time": (base_time + timedelta(seconds=1)).isoformat() + "Z",
+                "end_time": (base_time + timedelta(seconds=2, milliseconds=500)).isoformat() + "Z",
+                "duration": 1500,
+                "metadata": {
+                    "source": "PeopleDataLabs",
+                    "fields_retrieved": pdl_extracted,
+                    "status": "success" if pdl_company else ("skipped_by_orchestrator" if orchestrator_data and "pdl" not in orchestrator_data.get("apis_to_query", []) else "no_data")
+                }
+            },
+            {
+                "id": "step-3b",
+                "name": "Hunter.io Data Collection",
+                "description": "Gathering domain and contact data from Hunter.io API",
+                "status": "completed" if hunter_data else ("skipped" if orchestrator_data and "hunter" not in orchestrator_data.get("apis_to_query", []) else "failed"),
+                "start_time": (base_time + timedelta(seconds=2, milliseconds=500)).isoformat() + "Z",
+                "end_time": (base_time + timedelta(seconds=3, milliseconds=500)).isoformat() + "Z",
+                "duration": 1000,
+                "metadata": {
+                    "source": "Hunter.io",
+                    "fields_retrieved": hunter_extracted,
+                    "status": "success" if hunter_data else ("skipped_by_orchestrator" if orchestrator_data and "hunter" not in orchestrator_data.get("apis_to_query", []) else "no_data")
+                }
+            },
+            {
+                "id": "step-3c",
+                "name": "GNews Intelligence Collection",
+                "description": "Gathering recent company news from GNews API (last 90 days)",
+                "status": "completed" if news_data and news_data.get("success") else ("skipped" if orchestrator_data and "gnews" not in orchestrator_data.get("apis_to_query", []) else ("failed" if news_data and news_data.get("error") else "skipped")),
+                "start_time": (base_time + timedelta(seconds=3, milliseconds=500)).isoformat() + "Z",
+                "end_time": (base_time + timedelta(seconds=4)).isoformat() + "Z",
+                "duration": 500,
+                "metadata": {
+                    "source": "GNews API",
+                    "articles_found": news_data.get("articles_count", 0) if news_data else 0,
+                    "date_range": news_data.get("date_range", "Last 90 days") if news_data else "N/A",
+                    "categories_found": {
+                        "executive_changes": len(news_data.get("categories", {}).get("executive_changes", [])) if news_data else 0,
+                        "funding": len(news_data.get("categories", {}).get("funding", [])) if news_data else 0,
+                        "partnerships": len(news_data.get("categories", {}).get("partnerships", [])) if news_data else 0,
+                        "expansions": len(news_data.get("categories", {}).get("expansions", [])) if news_data else 0,
+                        "products": len(news_data.get("categories", {}).get("products", [])) if news_data else 0
+                    },
+                    "status": "success" if news_data and news_data.get("success") else ("skipped_by_orchestrator" if orchestrator_data and "gnews" not in orchestrator_data.get("apis_to_query", []) else (news_data.get("error", "not_configured") if news_data else "not_configured"))
+                }
+            },
+            {
+                "id": "step-3d",
+                "name": ">>> PRE-LLM DATA VALIDATION <<<",
+                "description": "CRITICAL: Fact-checking data against verified company database BEFORE sending to LLM. Catches wrong CEO names, fake executives, and placeholder data.",
+                "status": "completed",
+                "start_time": (base_time + timedelta(seconds=4)).isoformat() + "Z",
+                "end_time": (base_time + timedelta(seconds=4, milliseconds=500)).isoformat() + "Z",
+                "duration": 500,
+                "metadata": {
+                    "validation_type": "PRE-LLM FACT CHECK",
+                    "companies_in_database": 14,
+                    "known_executives_checked": True,
+                    "is_valid": job_data.get("pre_llm_validation", {}).get("is_valid", True),
+                    "confidence_score": job_data.get("pre_llm_validation", {}).get("confidence_score", 1.0),
+                    "issues_found": job_data.get("pre_llm_validation", {}).get("issues_found", 0),
+                    "issues": job_data.get("pre_llm_validation", {}).get("issues", []),
+                    "corrected_values": job_data.get("pre_llm_validation", {}).get("corrected_values", {}),
+                    "stakeholders_filtered": job_data.get("pre_llm_validation", {}).get("stakeholders_filtered", 0),
+                    "stakeholders_remaining": job_data.get("pre_llm_validation", {}).get("stakeholders_remaining", 0),
+                }
+            },
+            {
+                "id": "step-4",
+                "name": "LLM Council Validation",
+                "description": "Running 20 specialist LLMs + 1 aggregator for comprehensive validation",
+                "status": "completed" if status == "completed" else "in_progress",
+                "start_time": (base_time + timedelta(seconds=4, milliseconds=500)).isoformat() + "Z",
+                "end_time": (base_time + timedelta(seconds=10)).isoformat() + "Z" if status == "completed" else None,
+                "duration": 5500 if status == "completed" else None,
+                "metadata": {
+                    "model": "gpt-4o-mini",
+                    "specialists_count": 20,
+                    "aggregator_model": "gpt-4o-mini",
+                    "validated_fields": validated_data if validated_data else {}
+                }
+            },
+            {
+                "id": "step-5",
+                "name": "Store Results",
+                "description": "Saving validated data to Supabase",
+                "status": "completed" if status == "completed" else "pending",
+                "start_time": (base_time + timedelta(seconds=7)).isoformat() + "Z" if status == "completed" else None,
+                "end_time": (base_time + timedelta(seconds=8)).isoformat() + "Z" if status == "completed" else None,
+                "duration": 1000 if status == "completed" else None,
+                "metadata": {"tables": ["raw_data", "finalize_data"]}
+            },
+            {
+                "id": "step-6",
+                "name": "Generate Slideshow",
+                "description": "Creating presentation with Gamma API",
+                "status": "completed" if status == "completed" else "pending",
+                "start_time": (base_time + timedelta(seconds=9)).isoformat() + "Z" if status == "completed" else None,
+                "end_time": (base_time + timedelta(seconds=12)).isoformat() + "Z" if status == "completed" else None,
+                "duration": 3000 if status == "completed" else None,
+                "metadata": {"slideshow_url": result.get("slideshow_url", "N/A")}
+            },
+        ],
+        "api_responses": (_real_api_calls if _real_api_calls else [
+            {
+                "id": "api-0",
+                "api_name": "ZoomInfo Company Enrichment (PRIMARY SOURCE)",
+                "url": "https://api.zoominfo.com/gtm/data/v1/companies/enrich",
+                "method": "POST",
+                "status_code": 200,
+                "status_text": "OK",
+                "headers": {"content-type": "application/vnd.api+json", "x-ratelimit-remaining": "23"},
+                "request_body": {"data": {"type": "CompanyEnrich", "attributes": {"companyWebsite": domain}}},
+                "response_body": {
+                    "data": [{
+                        "companyName": zoominfo_extracted["company_name"],
+                        "domain": zoominfo_extracted["domain"],
+                        "employeeCount": zoominfo_extracted["employee_count"],
+                        "revenue": zoominfo_extracted["revenue"],
+                        "industry": zoominfo_extracted["industry"],
+                        "city": zoominfo_extracted["city"],
+                        "state": zoominfo_extracted["state"],
+                        "yearFounded": zoominfo_extracted["year_founded"],
+                        "ceoName": zoominfo_extracted["ceo"],
+                    }]
+                },
+                "timestamp": (base_time + timedelta(seconds=1)).isoformat() + "Z",
+                "duration": 1400,
+                "is_sensitive": True,
+                "masked_fields": ["authorization"]
+            },
+            {
+                "id": "api-0b",
+                "api_name": "ZoomInfo Intent Enrichment",
+                "url": "https://api.zoominfo.com/gtm/data/v1/intent/enrich",
+                "method": "POST",
+                "status_code": 200,
+                "status_text": "OK",
+                "headers": {"content-type": "application/vnd.api+json"},
+                "request_body": {"data": {"type": "IntentEnrich", "attributes": {"companyWebsite": domain}}},
+                "response_body": {
+                    "data": zi_intent if zi_intent else [
+                        {"topic": "Cloud Migration", "score": 85, "audienceStrength": "high", "lastSeen": "2025-01-15"},
+                        {"topic": "Data Security", "score": 72, "audienceStrength": "medium", "lastSeen": "2025-01-12"},
+                        {"topic": "AI/ML Platform", "score": 68, "audienceStrength": "medium", "lastSeen": "2025-01-10"},
+                    ]
+                },
+                "timestamp": (base_time + timedelta(seconds=1, milliseconds=500)).isoformat() + "Z",
+                "duration": 900,
+                "is_sensitive": True,
+                "masked_fields": ["authorization"]
+            },
+            {
+                "id": "api-0c",
+                "api_name": "ZoomInfo Scoops Search",
+                "url": "https://api.zoominfo.com/gtm/data/v1/scoops/search",
+                "method": "POST",
+                "status_code": 200,
+                "status_text": "OK",
+                "headers": {"content-type": "application/vnd.api+json"},
+                "request_body": {"data": {"type": "ScoopSearch", "attributes": {"companyWebsite": domain}}},
+                "response_body": {
+                    "data": zi_scoops if zi_scoops else [
+                        {"scoopType": "executive_hire", "title": f"New CTO Appointed at {company_name}", "date": "2025-01-08"},
+                        {"scoopType": "expansion", "title": "Office Expansion Planned", "date": "2025-01-05"},
+                    ]
+                },
+                "timestamp": (base_time + timedelta(seconds=1, milliseconds=800)).isoformat() + "Z",
+                "duration": 600,
+                "is_sensitive": True,
+                "masked_fields": ["authorization"]
+            },
+            {
+                "id": "api-0d",
+                "api_name": "ZoomInfo Contact Search",
+                "url": "https://api.zoominfo.com/gtm/data/v1/contacts/search",
+                "method": "POST",
+                "status_code": 200,
+                "status_text": "OK",
+                "headers": {"content-type": "application/vnd.api+json"},
+                "request_body": {"data": {"type": "ContactSearch", "attributes": {"companyWebsite": domain, "managementLevel": ["C-Level", "VP-Level", "Director-Level", "Manager-Level"], "jobTitle": ["Chief Executive Officer", "CEO", "Chief Technology Officer", "CTO", "Chief Information Officer", "CIO", "Chief Financial Officer", "CFO", "Chief Operating Officer", "COO", "...38 more titles"], "rpp": 25}}},
+                "response_body": {
+                    "data": zi_contacts[:5] if zi_contacts else [
+                        {"firstName": zoominfo_extracted["ceo"].split()[0] if zoominfo_extracted["ceo"] != "N/A" and " " in str(zoominfo_extracted["ceo"]) else "N/A",
+                         "lastName": zoominfo_extracted["ceo"].split()[-1] if zoominfo_extracted["ceo"] != "N/A" and " " in str(zoominfo_extracted["ceo"]) else "N/A",
+                         "jobTitle": "CEO"},
+                    ]
+                },
+                "timestamp": (base_time + timedelta(seconds=2)).isoformat() + "Z",
+                "duration": 800,
+                "is_sensitive": True,
+                "masked_fields": ["authorization", "email", "phone"]
+            },
+            {
+                "id": "api-0e",
+                "api_name": "ZoomInfo Contact Enrich",
+                "url": "https://api.zoominfo.com/gtm/data/v1/contacts/enrich",
+                "method": "POST",
+                "status_code": 200 if zi_contacts else 204,
+                "status_text": "OK" if zi_contacts else "No Content",
+                "headers": {"content-type": "application/vnd.api+json"},
+                "request_body": {"data": {"type": "ContactEnrich", "attributes": {"personId": [c.get("person_id") for c in zi_contacts[:5] if c.get("person_id")] or ["(person_ids come from contact search results)"]}}},
+                "response_body": {
+                    "data": [
+                        {
+                            "personId": c.get("person_id", "N/A"),
+                            "firstName": c.get("name", "").split()[0] if c.get("name") and " " in c.get("name", "") else "N/A",
+                            "lastName": c.get("name", "").split()[-1] if c.get("name") and " " in c.get("name", "") else "N/A",
+                            "jobTitle": c.get("title", "N/A"),
+                            "directPhone": c.get("direct_phone", "N/A"),
+                            "mobilePhone": c.get("mobile_phone", "N/A"),
+                            "companyPhone": c.get("company_phone", "N/A"),
+                            "contactAccuracyScore": c.get("contact_accuracy_score", 0),
+                            "department": c.get("department", "N/A"),
+                            "managementLevel": c.get("management_level", "N/A"),
+                        }
+                        for c in (zi_contacts[:5] if zi_contacts else [])
+                    ] if zi_contacts else [{"note": "No contacts enriched"}]
+                },
+                "timestamp": (base_time + timedelta(seconds=2, milliseconds=500)).isoformat() + "Z",
+                "duration": 650,
+                "is_sensitive": True,
+                "masked_fields": ["authorization", "directPhone", "mobilePhone"]
+            },
+            {
+                "id": "api-1",
+                "api_name": "Apollo.io Organization Search",
+                "url": "https://api.apollo.io/v1/organizations/search",
+                "method": "POST",
+                "status_code": 200 if apollo_org else 401,
+                "status_text": "OK" if apollo_org else "Unauthorized",
+                "headers": {"content-type": "application/json"},
+                "request_body": {"q_organization_name": company_name, "page": 1, "per_page": 1},
+                "response_body": apollo_data if apollo_data else {"error": "No data returned"},
+                "timestamp": (base_time + timedelta(seconds=2)).isoformat() + "Z",
+                "duration": 450,
+                "is_sensitive": True,
+                "masked_fields": ["api_key"]
+            },
+            {
+                "id": "api-2",
+                "api_name": "PeopleDataLabs Company Enrich",
+                "url": "https://api.peopledatalabs.com/v5/company/enrich",
+                "method": "GET",
+                "status_code": pdl_data.get("status", 200) if pdl_data else 404,
+                "status_text": "OK" if pdl_data else "Not Found",
+                "headers": {"content-type": "application/json"},
+                "request_body": {"website": domain},
+                "response_body": pdl_data if pdl_data else {"error": "No data returned"},
+                "timestamp": (base_time + timedelta(seconds=2)).isoformat() + "Z",
+                "duration": 380,
+                "is_sensitive": True,
+                "masked_fields": ["api_key"]
+            },
+            {
+                "id": "api-2b",
+                "api_name": "Hunter.io Domain Search",
+                "url": "https://api.hunter.io/v2/domain-search",
+                "method": "GET",
+                "status_code": 200 if hunter_data else 404,
+                "status_text": "OK" if hunter_data else "Not Found",
+                "headers": {"content-type": "application/json"},
+                "request_body": {"domain": domain, "limit": 20},
+                "response_body": hunter_data if hunter_data else {"error": "No data returned or API not configured"},
+                "timestamp": (base_time + timedelta(seconds=3)).isoformat() + "Z",
+                "duration": 320,
+                "is_sensitive": True,
+                "masked_fields": ["api_key"]
+            },
+            {
+                "id": "api-2c",
+                "api_name": "GNews API - Recent Company News",
+                "url": "https://gnews.io/api/v4/search",
+                "method": "GET",
+                "status_code": 200 if news_data and news_data.get("success") else (503 if news_data and news_data.get("error") else 404),
+                "status_text": news_data.get("error", "No news API configured") if news_data and not news_data.get("success") else ("OK" if news_data and news_data.get("success") else "Not attempted"),
+                "headers": {"content-type": "application/json"},
+                "request_body": {"q": company_name, "lang": "en", "max": 10, "sortby": "publishedAt"},
+                "response_body": {
+                    "success": news_data.get("success", False) if news_data else False,
+                    "error": news_data.get("error") if news_data and not news_data.get("success") else None,
+                    "articles_count": news_data.get("articles_count", 0) if news_data else 0,
+                    "date_range": news_data.get("date_range", "Last 90 days") if news_data else "N/A",
+                    "categories": {
+                        "executive_changes": len(news_data.get("categories", {}).get("executive_changes", [])) if news_data else 0,
+                        "funding": len(news_data.get("categories", {}).get("funding", [])) if news_data else 0,
+                        "partnerships": len(news_data.get("categories", {}).get("partnerships", [])) if news_data else 0,
+                        "expansions": len(news_data.get("categories", {}).get("expansions", [])) if news_data else 0
+                    },
+                    "summaries": news_data.get("summaries", {}) if news_data else {},
+                    "raw_articles": news_data.get("raw_articles", [])[:5] if news_data else []
+                },
+                "timestamp": (base_time + timedelta(seconds=3, milliseconds=500)).isoformat() + "Z",
+                "duration": 280,
+                "is_sensitive": True,
+                "masked_fields": ["token", "api_key"]
+            },
+            {
+                "id": "api-3",
+                "api_name": "OpenAI - LLM Council (20 Specialists)",
+                "url": "https://api.openai.com/v1/chat/completions",
+                "method": "POST",
+                "status_code": 200 if validated_data else 500,
+                "status_text": "OK" if validated_data else "Error",
+                "headers": {"content-type": "application/json"},
+                "request_body": {
+                    "model": "gpt-4o-mini",
+                    "specialists": [
+                        "Industry Classifier", "Employee Analyst", "Revenue Analyst",
+                        "Geographic Specialist", "Company Historian", "Tech Stack Expert",
+                        "Market Analyst", "Product Analyst", "Competitor Analyst",
+                        "Leadership Analyst", "Social Media Analyst", "Legal Analyst",
+                        "Growth Analyst", "Brand Analyst", "Partnership Analyst",
+                        "Customer Analyst", "Pricing Analyst", "Culture Analyst",
+                        "Innovation Analyst", "Risk Analyst"
+                    ],
+                    "parallel_calls": 20,
+                    "company": company_name
+                },
+                "response_body": {
+                    "specialists_completed": job_data.get("council_metadata", {}).get("specialists_run", 20),
+                    "specialists_total": 20,
+                    "aggregator_output": validated_data
+                },
+                "timestamp": (base_time + timedelta(seconds=5)).isoformat() + "Z",
+                "duration": 4000,
+                "is_sensitive": True,
+                "masked_fields": ["api_key", "authorization"]
+            },
+            {
+                "id": "api-4",
+                "api_name": "OpenAI - Chief Aggregator",
+                "url": "https://api.openai.com/v1/chat/completions",
+                "method": "POST",
+                "status_code": 200 if validated_data else 500,
+                "status_text": "OK" if validated_data else "Error",
+                "headers": {"content-type": "application/json"},
+                "request_body": {
+                    "model": "gpt-4o-mini",
+                    "role": "Chief Data Aggregator",
+                    "task": "Synthesize 20 specialist analyses into concise, fact-driven profile"
+                },
+                "response_body": {
+                    "validated_data": validated_data,
+                    "confidence_score": validated_data.get("confidence_score", 0.85) if validated_data else 0,
+                    "fields_validated": list(validated_data.keys()) if validated_data else []
+                },
+                "timestamp": (base_time + timedelta(seconds=9)).isoformat() + "Z",
+                "duration": 2000,
+                "is_sensitive": True,
+                "masked_fields": ["api_key", "authorization"]
+            },
+            {
+                "id": "api-5",
+                "api_name": "Gamma Slideshow Generation",
+                "url": "https://public-api.gamma.app/v1.0/generations",
+                "method": "POST",
+                "status_code": 200 if slideshow_data and slideshow_data.get("success") else (503 if slideshow_data else 404),
+                "status_text": "OK" if slideshow_data and slideshow_data.get("success") else ("Error" if slideshow_data else "Not Configured"),
+                "headers": {"content-type": "application/json"},
+                "request_body": {
+                    "company": company_name,
+                    "template": "HP RAD Intelligence",
+                    "slides": ["Executive Snapshot", "Buying Signals", "Opportunity Themes", "Stakeholder Map", "Sales Program"],
+                },
+                "response_body": {
+                    "success": slideshow_data.get("success", False) if slideshow_data else False,
+                    "slideshow_url": slideshow_data.get("slideshow_url") if slideshow_data else None,
+                    "slideshow_id": slideshow_data.get("slideshow_id") if slideshow_data else None,
+                    "error": slideshow_data.get("error") if slideshow_data and not slideshow_data.get("success") else None,
+                },
+                "timestamp": (base_time + timedelta(seconds=11)).isoformat() + "Z",
+                "duration": 3000 if slideshow_data and slideshow_data.get("success") else 100,
+                "is_sensitive": True,
+                "masked_fields": ["api_key"]
+            },
+        ]),
+        "llm_thought_processes": _generate_council_thought_processes(
+            job_data, company_name, base_time, apollo_extracted, pdl_extracted, validated_data
+        ),
+        "process_flow": {
+            "nodes": [
+                {"id": "start", "label": "Request Received", "type": "start", "status": "completed"},
+                {"id": "zoominfo", "label": "ZoomInfo API (PRIMARY)", "type": "api", "status": "completed", "details": "[PRIORITY] Company enrichment, buyer intent, scoops, contacts"},
+                {"id": "apollo", "label": "Apollo.io API", "type": "api", "status": "completed"},
+                {"id": "pdl", "label": "PeopleDataLabs API", "type": "api", "status": "completed"},
+                {"id": "merge", "label": "ZoomInfo Priority Merge", "type": "process", "status": "completed", "details": "Merged data with ZoomInfo as primary source"},
+                {"id": "council", "label": "LLM Council (20 Specialists)", "type": "llm", "status": "completed" if status == "completed" else "in_progress"},
+                {"id": "aggregator", "label": "Chief Aggregator", "type": "llm", "status": "completed" if status == "completed" else "in_progress"},
+                {"id": "store", "label": "Store to Supabase", "type": "process", "status": "completed" if status == "completed" else "pending"},
+                {"id": "gamma", "label": "Gamma Slideshow", "type": "api", "status": "completed" if status == "completed" else "pending"},
+                {"id": "end", "label": "Complete", "type": "end", "status": "completed" if status == "completed" else "pending"},
+            ],
+            "edges": [
+                {"id": "e1", "source": "start", "target": "zoominfo", "label": "Primary Source"},
+                {"id": "e2", "source": "start", "target": "apollo"},
+                {"id": "e3", "source": "start", "target": "pdl"},
+                {"id": "e4", "source": "zoominfo", "target": "merge"},
+                {"id": "e5", "source": "apollo", "target": "merge"},
+                {"id": "e6", "source": "pdl", "target": "merge"},
+                {"id": "e7", "source": "merge", "target": "council", "label": "Merged Data"},
+                {"id": "e8", "source": "council", "target": "aggregator", "label": "20 Analyses"},
+                {"id": "e9", "source": "aggregator", "target": "store", "label": "Validated Data"},
+                {"id": "e10", "source": "store", "target": "gamma", "label": "Generate"},
+                {"id": "e11", "source": "gamma", "target": "end", "label": "Complete"},
+            ],
+        },
+        "created_at": created_at,
+        "completed_at": (base_time + timedelta(seconds=12)).isoformat() + "Z" if status == "completed" else None,
+    }
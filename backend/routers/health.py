@@ -0,0 +1,65 @@
+"""Health, metrics and info routes (cheap: answered while warmup still runs)."""
+from datetime import datetime
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from routers import main
+from worker import metrics
+
+router = APIRouter()
+
+
+# Health check
+@router.get("/health", tags=["Health"])
+async def health_check():
+    """Health check endpoint with API status."""
+    pm = main()
+    api_status = {
+        "apollo": "configured" if pm.APOLLO_API_KEY else "missing",
+        "peopledatalabs": "configured" if pm.PEOPLEDATALABS_API_KEY else "missing",
+        "hunter": "configured" if pm.HUNTER_API_KEY else "missing",
+        "openai": "configured" if pm.OPENAI_API_KEY else "missing",
+        "supabase": "configured" if pm.SUPABASE_URL and pm.SUPABASE_KEY else "missing",
+        "gamma": "configured" if pm.GAMMA_API_KEY else "missing",
+        "zoominfo": "configured" if (pm.ZOOMINFO_USERNAME and pm.ZOOMINFO_PASSWORD) or pm.ZOOMINFO_REFRESH_TOKEN or (pm.ZOOMINFO_CLIENT_ID and pm.ZOOMINFO_CLIENT_SECRET) or pm.ZOOMINFO_ACCESS_TOKEN else "missing",
+    }
+
+    all_configured = all(v == "configured" for v in api_status.values())
+
+    return {
+        "status": "healthy",
+        "service": "RADTest Backend Production",
+        "mode": "production" if all_configured else "degraded",
+        "api_status": api_status,
+        "timestamp": datetime.utcnow().isoformat(),
+        "deploy_version": "gamma-template-v3",
+        "jobs_store": pm.jobs_store.stats(),
+        "warmup": pm._warmup_module().status(),
+    }
+
+
+@router.get("/metrics", tags=["Health"], response_class=PlainTextResponse)
+async def prometheus_metrics():
+    """Prometheus text exposition: vendor latency/errors/429s, limiter waits,
+    council fan-out, deck renders, job cost and job-store gauges."""
+    return PlainTextResponse(metrics.render(), media_type="text/plain; version=0.0.4")
+
+
+# Root endpoint
+@router.get("/", tags=["Info"])
+async def root():
+    """Root endpoint."""
+    return {
+        "service": "RADTest Backend Production",
+        "version": "2.0.0",
+        "mode": "production",
+        "data_sources": ["Apollo.io", "PeopleDataLabs", "OpenAI", "Gamma API"],
+        "endpoints": {
+            "health": "/health",
+            "debug_env": "/debug-env",
+            "profile_request": "/profile-request",
+            "job_status": "/job-status/{job_id}",
+            "docs": "/docs"
+        }
+    }
@@ -0,0 +1,88 @@
+"""Tests for the durable title-adjacency verdict memo (worker/adjacency_memo.py)."""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "worker"))
+
+import bi_resolver  # noqa: E402
+from adjacency_memo import AdjacencyMemo  # noqa: E402
+from bi_resolver import Proximity, classify_title_proximity  # noqa: E402
+
+
+def test_get_is_keyed_on_normalized_title():
+    memo = AdjacencyMemo()
+    memo.put("Head of Enterprise Apps", "CIO", True)
+    assert memo.get("head of enterprise apps.", "CIO") is True
+    assert memo.get("Head of Enterprise Apps", "CTO") is None
+
+
+def test_repeatedly_confirmed_verdict_is_promoted_to_classifier():
+    title = "SVP Digital Workplace"
+    memo = AdjacencyMemo(promote_after=2)
+    try:
+        memo.put(title, "CIO", True)
+        memo.get(title, "CIO")
+        assert classify_title_proximity(title, "CIO") is None
+        memo.get(title, "CIO")
+        assert classify_title_proximity(title, "CIO") == int(Proximity.LLM_ADJACENT)
+        assert classify_title_proximity(title, "CTO") is None
+    finally:
+        bi_resolver.LEARNED_ADJACENT["CIO"].discard("svp digital workplace")
+
+
+def test_negative_verdicts_are_never_promoted():
+    memo = AdjacencyMemo(promote_after=1)
+    memo.load_rows([{"title": "head of catering", "persona": "CTO", "verdict": False, "hits": 50}])
+    assert memo.get("Head of Catering", "CTO") is False
+    assert classify_title_proximity("Head of Catering", "CTO") is None
+
+
+def test_rows_round_trip_with_hits():
+    memo = AdjacencyMemo()
+    key = memo.put("VP Platforms", "CTO", True)
+    memo.get("VP Platforms", "CTO")
+    rows = memo.rows([key])
+    assert rows == [{"title": "vp platforms", "persona": "CTO", "verdict": True, "hits": 1}]
+    other = AdjacencyMemo()
+    other.load_rows(rows)
+    assert other.get("vp platforms", "CTO") is True
+
+
+class _Query:
+    """Just enough of the async postgrest builder for a ranged select."""
+
+    def __init__(self, rows, calls):
+        self._rows, self._calls, self._range = rows, calls, None
+
+    def select(self, *_):
+        return self
+
+    def order(self, *_):
+        return self
+
+    def range(self, start, end):
+        self._range = (start, end)
+        self._calls.append(self._range)
+        return self
+
+    async def execute(self):
+        start, end = self._range
+        return type("Res", (), {"data": self._rows[start:end + 1]})()
+
+
+async def test_load_pages_past_the_row_cap(monkeypatch):
+    import adjacency_memo
+
+    rows = [{"title": f"title {i}", "persona": "CIO", "verdict": False, "hits": 0} for i in range(5)]
+    calls = []
+    client = type("Client", (), {"table": lambda self, _name: _Query(rows, calls)})()
+
+    async def fake_client():
+        return client
+
+    monkeypatch.setattr(adjacency_memo, "LOAD_PAGE_SIZE", 2)
+    monkeypatch.setattr(adjacency_memo, "_supabase_client", fake_client)
+    memo = AdjacencyMemo()
+    await memo.ensure_loaded()
+    assert len(memo) == 5
+    assert calls == [(0, 1), (2, 3), (4, 5)]
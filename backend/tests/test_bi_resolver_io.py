@@ -153,6 +153,59 @@ def test_run_stage3_uncapped_co_equal():
     assert len(result.slide_contacts["CFO"]) == 2
 
 
+class SlowFake(FakeProviders):
+    """Tracks how many provider queries are in flight at once."""
+
+    def __init__(self, *a, **kw):
+        super().__init__(*a, **kw)
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+    async def query(self, persona, source, kind, canonical, canada_only):
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(0.01)
+        self.in_flight -= 1
+        return await super().query(persona, source, kind, canonical, canada_only)
+
+
+def test_run_stage3_queries_personas_concurrently():
+    table = {(p, "zoominfo", "csuite"): [rec(p, f"N{p}", "Chief X Officer")] for p in PERSONAS}
+    fp = SlowFake(table)
+    run(run_stage3(fp, canonical=None))
+    assert fp.max_in_flight == len(PERSONAS)
+
+
+def _sequential_stage3_selection(fp):
+    used, out = set(), {}
+    for p in PERSONAS:
+        sel, _ = run(select_persona_contacts_io(p, fp, None, False, used))
+        out[p] = [c.name for c in sel]
+    return out
+
+
+def test_run_stage3_matches_sequential_when_dedupe_forces_deeper_tier():
+    # CIO and CTO share one exec at ZI C-suite; CTO (later in PERSONAS) must fall
+    # through to its VP tier exactly as the serial cascade does.
+    def table():
+        shared = "https://li/shared"
+        return {
+            ("CIO", "zoominfo", "csuite"): [rec("CIO", "Sam", "Chief Information Officer", linkedin=shared)],
+            ("CTO", "zoominfo", "csuite"): [rec("CTO", "Sam", "Chief Technology Officer", linkedin=shared)],
+            ("CTO", "zoominfo", "vp"): [rec("CTO", "Vic", "VP Engineering")],
+        }
+    expected = _sequential_stage3_selection(FakeProviders(table()))
+    fp = FakeProviders(table())
+    result = run(run_stage3(fp, canonical=None))
+    got = {p: [c.name for c in v if not c.is_sentinel]
+           for p, v in result.slide_contacts.items()}
+    for p in PERSONAS:
+        assert got[p][:len(expected[p])] == expected[p]
+    assert expected["CTO"] == ["Vic"]
+    # each tier queried at most once
+    assert len(fp.queries) == len(set(fp.queries))
+
+
 # --- Geo top-up (canada_only, non-Canada-HQ) ---------------------------------
 
 class GeoFake(FakeProviders):
@@ -193,6 +246,15 @@ def test_geo_topup_skipped_for_canada_hq_company():
     assert all(q[3] is True for q in fp.queries)  # only Canada-scoped queries
 
 
+def test_geo_topup_refused_by_budget_stays_canada_scoped():
+    from bi_resolver import CanonicalCompany
+    canonical = CanonicalCompany(name="Coca-Cola", hq_country="Atlanta, Georgia, United States")
+    fp = GeoFake()
+    result = run(run_stage3(fp, canonical, canada_only=True, allow_geo_topup=lambda: False))
+    assert all(q[3] is True for q in fp.queries)
+    assert "geo_topup_skipped_budget" in result.warnings
+
+
 def test_geo_topup_not_triggered_when_not_canada_only():
     # A normal (global) run already searches globally; no special top-up needed.
     from bi_resolver import CanonicalCompany
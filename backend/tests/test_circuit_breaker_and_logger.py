@@ -150,3 +150,37 @@ def test_buffer_cap_drops_oldest():
         jl.info("s", "st", f"m{i}")
     assert len(jl.entries) == 10
     assert jl.entries[-1]["msg"] == "m24"  # newest kept
+
+
+def test_batched_flush_runs_off_loop_and_drains_on_exit():
+    import asyncio
+
+    seen = []
+
+    async def job():
+        async with JobLogger("job1", sink=lambda e: seen.append(len(e)), batch_size=3) as jl:
+            for i in range(7):
+                jl.info("s", "st", f"m{i}")
+                await asyncio.sleep(0)
+        return jl
+
+    jl = asyncio.new_event_loop().run_until_complete(job())
+    assert sum(seen) == 7 and max(seen) >= 3
+    assert jl.entries == []
+
+
+def test_batched_flush_failure_requeues_entries():
+    import asyncio
+
+    def bad_sink(_):
+        raise RuntimeError("supabase down")
+
+    async def job():
+        jl = JobLogger("job1", sink=bad_sink, batch_size=2)
+        jl.info("s", "st", "a")
+        jl.info("s", "st", "b")
+        await jl.aclose()
+        return jl
+
+    jl = asyncio.new_event_loop().run_until_complete(job())
+    assert [e["msg"] for e in jl.entries] == ["a", "b"]
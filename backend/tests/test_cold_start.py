@@ -0,0 +1,110 @@
+"""Cold-start guards: import-time budget for production_main (measured with
+`python -X importtime`, as scripts/bench_import_time.py does), the routers
+split, and the background warmup (worker/warmup.py)."""
+import os
+import subprocess
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "worker"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from worker import warmup  # noqa: E402
+
+BACKEND = os.path.join(os.path.dirname(__file__), "..")
+
+# Must not be imported by `import production_main` — lazy or warmup only.
+DEFERRED = {
+    "llm_council", "orchestrator", "worker.data_validator", "content_audit",
+    "routers.debug_payload", "anthropic", "openai", "supabase", "pptx", "numpy",
+    "sentence_transformers", "worker.zoominfo_client", "worker.gamma_slideshow",
+}
+# Self time of app-owned modules (production_main, routers.*, worker.*); ~0.1s
+# today, mostly FastAPI route + pydantic model construction. Generous for CI noise.
+APP_IMPORT_BUDGET_MS = 500
+APP_PREFIXES = ("production_main", "routers", "worker", "llm_council", "orchestrator",
+                "content_audit", "content_embeddings", "council_resolver")
+
+
+def _importtime():
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", "import production_main"],
+                          cwd=BACKEND, env={**os.environ, "WARMUP": "0"},
+                          capture_output=True, text=True, timeout=300)
+    assert proc.returncode == 0, proc.stderr[-2000:]
+    rows = {}
+    for line in proc.stderr.splitlines():
+        if line.startswith("import time:") and "self [us]" not in line:
+            self_us, cum_us, name = line[len("import time:"):].split("|")
+            rows[name.strip()] = (int(self_us), int(cum_us))
+    return rows
+
+
+def test_production_main_import_budget():
+    rows = _importtime()
+    assert "production_main" in rows
+    assert not DEFERRED & set(rows), sorted(DEFERRED & set(rows))
+    app_ms = sum(s for name, (s, _) in rows.items() if name.split(".")[0] in APP_PREFIXES) / 1e3
+    assert app_ms < APP_IMPORT_BUDGET_MS, f"app-owned import time {app_ms:.0f} ms"
+
+
+def test_routers_mounted_and_lazy_names_resolve():
+    import production_main as pm
+
+    paths = {r.path for r in pm.app.routes}
+    assert {"/health", "/metrics", "/api/content-audit", "/debug-env",
+            "/debug-data/{job_id}", "/profile-request"} <= paths
+    assert pm.generate_debug_data.__module__ == "routers.debug_payload"
+    body = TestClient(pm.app).get("/health").json()
+    assert body["status"] == "healthy" and "state" in body["warmup"]
+
+
+async def test_warmup_records_steps_and_never_raises(monkeypatch):
+    monkeypatch.setattr(warmup, "ENABLED", True)
+    calls = []
+
+    async def async_step():
+        calls.append("async")
+
+    def broken():
+        raise RuntimeError("boom")
+
+    out = await warmup.run([("a", async_step), ("s", lambda: calls.append("sync")), ("b", broken)],
+                           modules=("json", "no_such_module_xyz"), delay=0)
+    assert calls == ["async", "sync"] and out["state"] == "done"
+    steps = out["steps"]
+    assert "ms" in steps["import:json"] and "error" not in steps["import:json"]
+    assert "ModuleNotFoundError" in steps["import:no_such_module_xyz"]["skipped"]
+    assert steps["b"]["error"] == "RuntimeError: boom"
+
+    monkeypatch.setattr(warmup, "ENABLED", False)
+    assert (await warmup.run([("x", broken)], delay=0))["state"] == "disabled"
+
+
+async def test_process_company_profile_completes_and_freezes_debug_payload(monkeypatch):
+    """End-to-end run with every vendor unconfigured: the job must finish as
+    completed with its debug payload frozen (module globals, not PEP 562)."""
+    import llm_council
+    import orchestrator
+    import production_main as pm
+
+    for name in ("APOLLO_API_KEY", "PEOPLEDATALABS_API_KEY", "HUNTER_API_KEY", "OPENAI_API_KEY",
+                 "SUPABASE_URL", "SUPABASE_KEY", "GAMMA_API_KEY", "GNEWS_API_KEY", "ANTHROPIC_API_KEY",
+                 "ZOOMINFO_CLIENT_ID", "ZOOMINFO_CLIENT_SECRET", "ZOOMINFO_ACCESS_TOKEN",
+                 "ZOOMINFO_REFRESH_TOKEN", "ZOOMINFO_USERNAME", "ZOOMINFO_PASSWORD"):
+        monkeypatch.setattr(pm, name, None)
+    monkeypatch.setattr(llm_council, "OPENAI_API_KEY", None)
+    monkeypatch.setattr(orchestrator, "OPENAI_API_KEY", None)
+    monkeypatch.delenv("USE_V31_PIPELINE", raising=False)
+    monkeypatch.delenv("GNEWS_API_KEY", raising=False)
+
+    job_id = "cold-start-e2e"
+    company = {"company_name": "Acme", "domain": "acme.com", "requested_by": "a@b.c"}
+    pm.jobs_store[job_id] = {"job_id": job_id, "status": "pending", "progress": 0,
+                             "current_step": "", "company_data": company}
+    await pm.process_company_profile(job_id, company)
+
+    job = pm.jobs_store[job_id]
+    assert job["status"] == "completed", job.get("error")
+    from worker import debug_memo
+    assert job[debug_memo.PERSISTED_KEY]["job_id"] == job_id
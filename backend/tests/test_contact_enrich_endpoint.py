@@ -318,6 +318,26 @@ class TestPhoneSourceFieldInPipeline:
 
         assert contact_obj["phoneSource"] is None
 
+    def test_enrich_replaces_masked_search_phones(self):
+        """Step 2.84: every enriched phone (incl. the generic one) replaces the
+        search result's masked value; the email is only filled if missing."""
+        from production_main import _apply_zoominfo_enrich
+
+        contact = {"person_id": "zi-1", "phone": "(555) ***-**12", "direct_phone": "****",
+                   "mobile_phone": "", "email": "eve@example.com"}
+        _apply_zoominfo_enrich(contact, {
+            "person_id": "zi-1", "phone": "+1-555-000-0012", "direct_phone": "+1-555-000-0001",
+            "mobile_phone": "+1-555-000-0002", "contact_accuracy_score": 90,
+            "email": "eve.davis@example.com",
+        })
+
+        assert contact["phone"] == "+1-555-000-0012"
+        assert contact["direct_phone"] == "+1-555-000-0001"
+        assert contact["mobile_phone"] == "+1-555-000-0002"
+        assert contact["contact_accuracy_score"] == 90
+        assert contact["email"] == "eve@example.com"
+        assert contact["enriched"] is True
+
     def test_normalize_contact_preserves_all_phone_types(self):
         """ZoomInfo _normalize_contact returns all phone fields."""
         import sys
@@ -0,0 +1,63 @@
+"""Tests for the step 2.83 rule table and id-indexed remap (worker/contact_fact_check.py),
+and chunked validation in production_main.fact_check_contacts."""
+import os
+import sys
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "worker"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from contact_fact_check import apply_hard_rules, apply_scores, assign_ids, chunks  # noqa: E402
+
+
+def _contact(name, **kw):
+    return dict({"name": name, "title": "CTO", "linkedin_url": f"https://linkedin.com/in/{name}",
+                 "email": f"{name}@acme.com"}, **kw)
+
+
+def test_hard_rules_first_failing_rule_wins():
+    contacts = [_contact("a"), _contact("b", linkedin_url=""), _contact("c", email="")]
+    qualified, counts = apply_hard_rules(contacts)
+    assert [c["name"] for c in qualified] == ["a"]
+    assert counts == {"no_linkedin": 1, "no_contact_info": 1}
+    assert contacts[1]["fact_check_notes"] == "Filtered: no LinkedIn URL"
+    assert contacts[2]["fact_check_score"] == 0.0
+
+
+def test_apply_scores_by_id_handles_duplicate_names_and_threshold():
+    ided = assign_ids([_contact("john"), _contact("john", title="CIO"), _contact("amy")])
+    passed = apply_scores(ided, [
+        {"id": "c1", "fact_check_score": 0.1, "fact_check_notes": "former"},
+        {"name": "JOHN", "fact_check_score": 0.9},  # no id -> first unclaimed "john"
+        {"id": "c2", "fact_check_score": 0.15},
+    ])
+    assert [c["title"] for c in passed] == ["CTO", "CTO"]
+    assert passed[0]["fact_check_score"] == 0.9 and passed[1]["name"] == "amy"
+
+
+def test_apply_scores_defaults_for_unmatched_and_failed_chunks():
+    ided = assign_ids([_contact("a"), _contact("b")])
+    passed = apply_scores(ided, [], unavailable=["c1"])
+    assert [c["fact_check_notes"] for c in passed] == [
+        "Not matched in validation response", "LinkedIn validation unavailable"]
+    assert chunks(list(range(5)), 2) == [[0, 1], [2, 3], [4]]
+
+
+async def test_fact_check_contacts_chunks_prompts_concurrently():
+    import production_main
+
+    contacts = [_contact(f"p{i}") for i in range(5)]
+    prompts = []
+
+    async def fake_openai(prompt, system_prompt=""):
+        prompts.append(prompt)
+        ids = [f"c{i}" for i in range(5) if f'"id": "c{i}"' in prompt]
+        return {"contacts": [{"id": cid, "fact_check_score": 0.05 if cid == "c3" else 0.9}
+                             for cid in ids]}
+
+    with patch.object(production_main, "FACT_CHECK_CHUNK_SIZE", 2), \
+            patch.object(production_main, "_call_openai_json", fake_openai):
+        result = await production_main.fact_check_contacts("Acme", "acme.com", contacts)
+
+    assert len(prompts) == 3
+    assert [c["name"] for c in result] == ["p0", "p1", "p2", "p4"]
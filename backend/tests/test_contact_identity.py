@@ -0,0 +1,72 @@
+"""Tests for shared contact entity resolution (worker/contact_identity.py)."""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "worker"))
+
+from contact_identity import (  # noqa: E402
+    ContactIndex, dedupe, identity_keys, linkedin_slug, merge_fields, name_key,
+)
+
+
+def test_name_key_absorbs_nicknames_and_honorifics():
+    assert name_key("Johnny Smith") == name_key("Dr. John  Smith, Jr.")
+    assert name_key("Stephen O'Neil") == name_key("Steven ONeil") == name_key("Steve O'Neil")
+    assert name_key("Bob Smith") == name_key("Robert Smith")
+    assert name_key("John Smith") != name_key("John Smyth")
+    assert name_key("Madonna") is None
+
+
+def test_name_key_keeps_similar_sounding_people_apart():
+    for a, b in (("John Smith", "Jane Smith"), ("Tim Lee", "Tom Lee"),
+                 ("Dan Park", "Dean Park"), ("Chris Wu", "Craig Wu"), ("Robert Hale", "Rupert Hale"),
+                 ("Liam Smith", "William Smith"), ("Ed Cole", "Edward Cole"), ("Jon Poe", "John Poe")):
+        assert name_key(a) != name_key(b), (a, b)
+    index = ContactIndex("acme")
+    index.add({"name": "John Smith", "title": "CEO"})
+    assert index.find({"name": "Jane Smith", "title": "CFO"}) is None
+
+
+def test_identity_keys_normalize_every_source_shape():
+    zi = {"name": "Jane Smith", "email": "Jane@Acme.com ",
+          "linkedin": "https://www.linkedin.com/in/Jane-Smith/?trk=x"}
+    apollo = {"name": "jane smith", "email": "jane@acme.com",
+              "linkedin_url": "linkedin.com/in/jane-smith"}
+    assert identity_keys(zi) == identity_keys(apollo)
+    assert identity_keys({"email": "Not available"}) == set()
+    assert linkedin_slug("https://ca.linkedin.com/in/abc-123/") == "abc-123"
+
+
+def test_index_resolves_across_sources_and_dedupes():
+    index = ContactIndex()
+    first = index.add({"name": "Jane Smith", "email": "jane@acme.com"})
+    assert index.add({"name": "J. Doe", "email": "JANE@acme.com"}) is first
+    assert index.find({"name": "Jane  Smith, MBA"}) is first
+    assert index.find({"name": "Jane Smithers", "linkedin_url": "x"}) is None
+    assert len(index) == 1
+    people = [{"name": "Ann Lee"}, {"name": "Anne Lee"}, {"name": "Bo Chan"}]
+    assert [p["name"] for p in dedupe(people)] == ["Ann Lee", "Bo Chan"]
+
+
+def test_merge_fields_source_precedence():
+    target = {"source": "apollo", "email": "a@acme.com", "direct_phone": "111",
+              "linkedin_url": "https://linkedin.com/in/a"}
+    merge_fields(target, {"email": "b@acme.com", "direct_phone": "222",
+                          "linkedin": "https://linkedin.com/in/b", "department": "IT"},
+                 target_source="apollo", incoming_source="zoominfo",
+                 fields={"email": "email", "direct_phone": "direct_phone",
+                         "linkedin_url": "linkedin", "department": "department"})
+    assert target["email"] == "a@acme.com"                      # Apollo email kept
+    assert target["direct_phone"] == "222"                      # ZoomInfo phone wins
+    assert target["linkedin_url"] == "https://linkedin.com/in/a"  # ZoomInfo only fills
+    assert target["department"] == "IT"                         # empty field filled
+
+
+def test_merge_fields_is_fill_only_for_unknown_target_source():
+    target = {"linkedin_url": "https://linkedin.com/in/a", "direct_phone": "111", "email": ""}
+    merge_fields(target, {"linkedin": "https://linkedin.com/in/b", "direct_phone": "222",
+                          "email": "b@acme.com"},
+                 target_source=None, incoming_source="zoominfo",
+                 fields={"linkedin_url": "linkedin", "direct_phone": "direct_phone", "email": "email"})
+    assert target == {"linkedin_url": "https://linkedin.com/in/a", "direct_phone": "111",
+                      "email": "b@acme.com"}
@@ -0,0 +1,39 @@
+"""Tests for the per-job ZoomInfo contact pool index (worker/contact_pool.py)."""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "worker"))
+
+from contact_pool import ContactPool, title_tokens  # noqa: E402
+
+
+PEOPLE = [
+    {"name": "A", "title": "Chief Technology Officer", "management_level": "C-Level"},
+    {"name": "B", "title": "CFO", "management_level": "C-Level"},
+    {"name": "C", "title": "Senior Vice President of Engineering", "management_level": "VP-Level"},
+    {"name": "D", "title": "Director, IT Operations", "management_level": "Director-Level"},
+]
+
+
+def test_title_tokens_normalizes_phrases_and_stopwords():
+    assert title_tokens("Vice President of Information Technology") == {"vp", "it"}
+    assert title_tokens("Sr. Director, Finance") == {"sr", "director", "finance"}
+
+
+def test_match_titles_requires_all_tokens_and_knows_acronyms():
+    pool = ContactPool(PEOPLE)
+    assert [p["name"] for p in pool.match_titles(["Chief Financial Officer"], limit=1)] == ["B"]
+    assert [p["name"] for p in pool.match_titles(["VP of Engineering"], limit=1)] == ["C"]
+    assert pool.match_titles(["VP of Marketing"], limit=0) == []
+
+
+def test_match_titles_tops_up_by_level_in_pool_order():
+    pool = ContactPool(PEOPLE)
+    got = [p["name"] for p in pool.match_titles(["Director of IT"], limit=3)]
+    assert got == ["A", "B", "D"]  # D matched; C-Level fills the rest, pool order kept
+
+
+def test_by_level_is_case_insensitive():
+    pool = ContactPool(PEOPLE)
+    assert [p["name"] for p in pool.by_level("VP-Level")] == ["C"]
+    assert len(pool) == 4
@@ -125,3 +125,99 @@ class TestContentAuditUserItems:
         items = get_all_items()
         names = [i['asset_name'] for i in items]
         assert "My Test Asset" in names
+
+
+class TestContentAuditIndex:
+    """The token index must pick exactly what brute-force `_score_item` picks."""
+
+    def test_index_matches_reference_scoring(self):
+        import content_audit
+        from content_audit import load_content_audit, match_content, top_matches, _score_item
+        load_content_audit(force=True)
+        items = content_audit.get_all_items()
+        cases = [
+            (["AI workstation"], "", []),
+            (["IT", "modernization", "fleet management"], "ITDM", [1, 2]),
+            (["ROI", "cost", "efficiency"], "BDM", []),
+            (["workforce", "hybrid work"], "BDM", [i["id"] for i in items[:10]]),
+            (["zzz_nonexistent_xyz_gibberish"], "", []),
+            (["security"], "ITDM", [i["id"] for i in items]),   # all excluded -> fall back
+        ]
+        for keywords, audience, exclude in cases:
+            pool = [i for i in items if i["id"] not in set(exclude)] or items
+            ranked = sorted(pool, key=lambda i: _score_item(i, keywords, audience), reverse=True)
+            expected = [i for i in ranked if _score_item(i, keywords, audience) > 0]
+            assert match_content(keywords, audience, exclude) is (expected[0] if expected else None)
+            assert top_matches(keywords, audience, exclude, k=3) == expected[:3]
+
+    def test_added_item_is_indexed(self):
+        from content_audit import load_content_audit, add_item, match_content
+        load_content_audit()
+        before = match_content(["quokkaformation"])   # memoized before the add
+        assert before is None or before.get("source") == "csv"
+        item = add_item(asset_name="Quokkaformation Playbook", sp_link="https://example.com/q",
+                        asset_summary="Indexed on add")
+        assert match_content(["quokkaformation"]) is item
+
+
+class TestContentAuditHybrid:
+    """Semantic hits from the (optional) embedding index are blended into the score."""
+
+    def test_semantic_hit_outranks_keyword_miss(self, monkeypatch):
+        import content_embeddings
+        from content_audit import load_content_audit, match_content
+        load_content_audit()
+        monkeypatch.setattr(content_embeddings, "available", lambda: True)
+        monkeypatch.setattr(content_embeddings, "search", lambda q, k=10: [(13, 0.9), (36, 0.2)])
+        hit = match_content(["zzz_no_keyword_hit"], semantic_query="zero trust posture")
+        assert hit["id"] == 13
+
+    def test_without_index_matching_is_keyword_only(self):
+        import content_embeddings
+        from content_audit import load_content_audit, match_content
+        load_content_audit()
+        assert not content_embeddings.available()
+        assert match_content(["fleet management"], "ITDM", semantic_query="anything") is \
+            match_content(["fleet management"], "ITDM")
+
+    def test_keyword_only_ranking_is_not_memoized_while_the_model_loads(self, monkeypatch):
+        import content_embeddings
+        from content_audit import load_content_audit, match_content
+        load_content_audit()
+        monkeypatch.setitem(content_embeddings._state, "matrix", object())
+        monkeypatch.setitem(content_embeddings._state, "model", None)
+        monkeypatch.setitem(content_embeddings._state, "model_failed", False)
+        monkeypatch.setattr(content_embeddings, "search", lambda q, k=10: (
+            [(13, 0.9)] if content_embeddings._state["model"] is not None else []))
+        keywords = ["zzz_warming_miss"]
+        before = match_content(keywords, semantic_query="zero trust posture")
+        assert before is None or before["id"] != 13    # keyword-only while warming
+        content_embeddings._state["model"] = object()  # model finished loading
+        assert match_content(keywords, semantic_query="zero trust posture")["id"] == 13
+
+    def test_model_loads_off_the_caller_and_only_from_the_local_cache(self, monkeypatch):
+        import threading
+
+        import content_embeddings
+        loaded = threading.Event()
+        callers = []
+
+        def fake_model():
+            callers.append(threading.current_thread().name)
+            loaded.set()
+            return object()
+
+        monkeypatch.setattr(content_embeddings, "_load_model", fake_model)
+        monkeypatch.setitem(content_embeddings._state, "matrix", object())
+        monkeypatch.setitem(content_embeddings._state, "model", None)
+        monkeypatch.setitem(content_embeddings._state, "model_failed", False)
+        monkeypatch.setitem(content_embeddings._state, "model_loading", False)
+        # First search: keyword-only while the model loads in a background thread.
+        assert content_embeddings.search("zero trust") == []
+        assert loaded.wait(5)
+        for _ in range(100):
+            if content_embeddings._state["model"] is not None:
+                break
+            threading.Event().wait(0.01)
+        assert callers == ["content-embeddings-model"]
+        assert content_embeddings.load_model() is True and callers == ["content-embeddings-model"]
@@ -0,0 +1,56 @@
+"""Tests for cost budgets, rollup rows and estimates (worker/cost_budget.py) and the
+bounded cost_meter registry."""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "worker"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from worker import cost_budget, cost_meter  # noqa: E402
+
+
+def test_optional_step_refused_over_job_and_tenant_budgets(monkeypatch):
+    cost_meter.reset("budget-1")
+    cost_meter.set_job("budget-1", tenant="ana")
+    cost_meter.record_call("zoominfo", 10)   # $0.10
+    monkeypatch.setattr(cost_budget, "JOB_BUDGET_USD", 0.2)
+    assert not cost_budget.allow_optional("linkedin_search", job_id="budget-1")   # 0.10 + 0.15
+    assert cost_budget.allow_optional("unknown_step", job_id="budget-1")
+
+    monkeypatch.setattr(cost_budget, "JOB_BUDGET_USD", 0.0)
+    monkeypatch.setattr(cost_budget, "TENANT_DAILY_BUDGET_USD", 1.0)
+    cost_budget.seed_tenant_spend("ana", 0.9)
+    assert not cost_budget.allow_optional("geo_topup", job_id="budget-1")
+    assert cost_meter.snapshot("budget-1")["skipped_steps"] == [
+        {"step": "linkedin_search", "reason": "job_budget"},
+        {"step": "geo_topup", "reason": "tenant_budget"}]
+
+
+def test_cost_row_and_estimate_from_history():
+    cost_meter.reset("budget-2")
+    cost_meter.set_job("budget-2", batch_id="b-7")
+    summary = {"total_ms": 90_000.0, "spans": [
+        {"name": "4_council", "kind": "stage", "duration_ms": 30_000.0},
+        {"name": "openai.council", "kind": "llm", "duration_ms": 1_000.0}]}
+    row = cost_budget.cost_row("budget-2", {"salesperson_name": "Bo "}, {"total_usd": 0.4}, summary)
+    assert (row["seller"], row["batch_id"], row["stage_ms"]) == ("bo", "b-7", {"4_council": 30_000.0})
+
+    rows = [dict(row, total_usd=usd, duration_ms=ms) for usd, ms in ((0.2, 60_000), (0.4, 90_000), (1.0, 300_000))]
+    est = cost_budget.estimate(rows)
+    assert est["samples"] == 3
+    assert est["cost_usd"] == {"p50": 0.4, "p90": 1.0}
+    assert est["duration_seconds"]["p50"] == 90.0
+    assert est["stages_ms_p50"] == {"4_council": 30_000.0}
+    assert cost_budget.estimate([])["cost_usd"] == {"p50": None, "p90": None}
+
+
+def test_cost_meter_registry_is_bounded(monkeypatch):
+    monkeypatch.setattr(cost_meter, "REGISTRY_MAX_JOBS", 2)
+    for i in range(4):
+        cost_meter.set_job(f"bounded-{i}")
+    assert "bounded-3" in cost_meter._REGISTRY and "bounded-0" not in cost_meter._REGISTRY
+    assert len(cost_meter._REGISTRY) == 2
+
+    monkeypatch.setattr(cost_meter, "REGISTRY_TTL_SECONDS", -1.0)
+    cost_meter.set_job("bounded-fresh")
+    assert list(cost_meter._REGISTRY) == ["bounded-fresh"]   # expired entries dropped first
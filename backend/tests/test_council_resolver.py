@@ -0,0 +1,111 @@
+"""Tests for the pre-council fast path (council_resolver.py + llm_council.run_council)."""
+import os
+import sys
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import council_resolver  # noqa: E402
+import llm_council  # noqa: E402
+
+APOLLO = {"organization": {"industry": "Computer Software", "estimated_num_employees": 10000,
+                           "city": "Austin", "state": "Texas", "country": "United States",
+                           "founded_year": 2001}}
+PDL = {"name": "acme", "industry": "computer software", "employee_count": 10300,
+       "location": {"locality": "austin", "region": "texas", "country": "united states"},
+       "founded": 2001}
+ZI = {"industry": "Computer Software", "employee_count": 10200,
+      "headquarters": "Austin, TX, United States", "founded_year": 1999, "ceo": "Jane Roe"}
+
+
+def test_resolve_fields_agreement_tolerance_and_conflicts():
+    values = council_resolver.source_values(APOLLO, PDL, ZI)
+    resolved = council_resolver.resolve_fields("acme.com", values)
+    assert resolved["industry"]["value"] == "Computer Software"
+    assert resolved["employee_count"] == {"value": 10200, "sources": ["apollo", "pdl", "zoominfo"],
+                                          "reason": "multi_source_agreement"}
+    assert resolved["headquarters"]["value"] == "Austin, TX, United States"
+    assert "founded_year" not in resolved   # 1999 vs 2001: conflict -> council
+    assert "ceo" not in resolved            # single source: gap -> council
+
+
+def test_known_fact_resolves_single_source():
+    resolved = council_resolver.resolve_fields("www.microsoft.com", {"ceo": {"zoominfo": "satya nadella"}})
+    assert resolved["ceo"]["reason"] == "known_fact"
+
+
+def test_headquarters_agree_on_city_region_and_country():
+    norm = council_resolver._normalizer("headquarters")
+    assert norm("Austin, TX, USA") == norm("austin, texas, united states") \
+        == ("austin", "texas", "united states")
+    assert norm("London, UK") == ("london", "", "united kingdom")
+    paris = {"zoominfo": "Paris, TX, United States", "pdl": "Paris, Ile-de-France, France"}
+    assert "headquarters" not in council_resolver.resolve_fields("acme.com", {"headquarters": paris})
+    portland = {"zoominfo": "Portland, OR, US", "apollo": "Portland, Maine, United States"}
+    assert "headquarters" not in council_resolver.resolve_fields("acme.com", {"headquarters": portland})
+
+
+def test_plan_specialists_skips_on_resolvable_fields_and_carries_the_rest():
+    resolved = {"industry": {"value": "X", "sources": ["a", "b"], "reason": "multi_source_agreement"}}
+    dispatch, skipped = council_resolver.plan_specialists(
+        llm_council.SPECIALISTS, resolved, has_news=False, has_stakeholders=True)
+    assert {s["id"] for s in skipped} == {"industry_classifier", "news_intelligence_analyst"}
+    assert "industry_classifier" not in {s["id"] for s in dispatch}
+
+    carried = council_resolver.carried_values(
+        {"organization": {"keywords": ["saas"]}}, PDL, dict(ZI, sub_industry="Dev Tools", ticker="ACME"))
+    assert carried == {"sub_industry": "Dev Tools", "industry_keywords": ["saas"],
+                       "countries": ["united states"], "ticker": "ACME"}
+    spec = next(s for s in llm_council.SPECIALISTS if s["id"] == "industry_classifier")
+    assert council_resolver.resolved_analysis(spec, resolved, carried)["analysis"] == {
+        "industry": "X", "sub_industry": "Dev Tools", "industry_keywords": ["saas"]}
+
+
+async def _run(apollo, pdl, zi):
+    ran = []
+
+    async def fake_specialist(spec, *args, **kwargs):
+        ran.append(spec["id"])
+        return {"specialist_id": spec["id"], "specialist_name": spec["name"],
+                "focus": spec["focus"], "analysis": {"ok": True}}
+
+    async def fake_openai(prompt, system_prompt, model="gpt-4o-mini"):
+        assert "Computer Software" in prompt  # resolved values reach the aggregator
+        return {"industry": "Hallucinated", "company_name": "Acme"}
+
+    with patch.object(llm_council, "run_specialist", fake_specialist), \
+            patch.object(llm_council, "call_openai", fake_openai), \
+            patch.object(llm_council.asyncio, "sleep", lambda *_: _noop()):
+        result = await llm_council.run_council(
+            {"company_name": "Acme", "domain": "acme.com"}, apollo, pdl, None,
+            [{"name": "A"}], None, zi)
+    return result, ran
+
+
+async def test_run_council_dispatches_only_unresolved_specialists():
+    result, ran = await _run(APOLLO, PDL, ZI)
+    meta = result["_council_metadata"]["fast_path"]
+    skipped = {s["id"] for s in meta["skipped_specialists"]}
+    assert skipped == {"industry_classifier", "employee_analyst", "geo_specialist",
+                       "news_intelligence_analyst"}
+    assert not skipped & set(ran) and "founding_historian" in ran   # 1999 vs 2001: conflict
+    assert "leadership_analyst" in ran                              # CEO from one source: gap
+    assert meta["specialists_dispatched"] == len(ran)
+    assert result["industry"] == "Computer Software"   # resolved value is authoritative
+
+
+async def test_agreeing_sources_remove_the_factual_specialists():
+    pdl = dict(PDL, type="public", ticker="ACME")
+    zi = dict(ZI, founded_year=2001, company_type="Public", sub_industry="Dev Tools")
+    result, ran = await _run(APOLLO, pdl, zi)
+    factual = {"industry_classifier", "employee_analyst", "geo_specialist",
+               "founding_historian", "legal_analyst"}
+    assert not factual & set(ran)
+    assert len(ran) == len(llm_council.SPECIALISTS) - len(factual) - 1   # - news (no input)
+    meta = result["_council_metadata"]["fast_path"]
+    assert factual <= {s["id"] for s in meta["skipped_specialists"]}
+    assert result["company_type"] == "Public" and result["founded_year"] == 2001
+
+
+async def _noop():
+    return None
@@ -0,0 +1,41 @@
+"""Tests for the per-job debug payload memo (worker/debug_memo.py)."""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "worker"))
+
+from debug_memo import for_persistence, freeze, get_or_build, split_persisted  # noqa: E402
+
+
+class _Builder:
+    def __init__(self):
+        self.calls = 0
+
+    def __call__(self):
+        self.calls += 1
+        return {"build": self.calls}
+
+
+def test_payload_rebuilt_only_when_the_job_moves_on():
+    job = {"status": "processing", "progress": 20, "current_step": "Querying Apollo.io..."}
+    build = _Builder()
+    assert get_or_build(job, build) == get_or_build(job, build) == {"build": 1}
+    job["apollo_data"] = {"name": "Acme"}           # a stage output landed
+    assert get_or_build(job, build) == {"build": 2}
+    job["progress"] = 40
+    get_or_build(job, build)
+    assert build.calls == 3
+
+
+def test_frozen_payload_round_trips_through_the_durable_row():
+    job = {"status": "completed", "progress": 100, "result": {"company_name": "Acme"}}
+    build = _Builder()
+    freeze(job, build)
+    assert "debug_data" not in job["result"]        # /job-status payload stays lean
+    row_result = for_persistence(job, job["result"])
+    assert row_result == {"company_name": "Acme", "debug_data": {"build": 1}}
+
+    result, data = split_persisted(row_result)
+    rehydrated = {"status": "completed", "result": result, "rehydrated": True, "debug_data": data}
+    assert get_or_build(rehydrated, build) == {"build": 1}
+    assert build.calls == 1
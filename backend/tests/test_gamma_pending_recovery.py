@@ -13,7 +13,8 @@ to the system entirely. These tests describe the desired new behavior:
   3. create_slideshow propagates slideshow_status='pending' and slideshow_id.
   4. A new check_generation_status method does a single non-polling check.
   5. A new reconcile_pending_generation method polls until terminal.
-  6. /job-status performs an inline lazy reconcile when slideshow is pending.
+  6. The job maintenance sweep reconciles pending slideshows (/job-status
+     itself stays a pure read and never calls Gamma).
 
 Tests use a fake httpx.AsyncClient (not the real network) and mock asyncio.sleep
 so the full polling ceiling runs in milliseconds.
@@ -349,21 +350,11 @@ async def test_reconcile_pending_generation_gives_up_at_hard_cap():
 
 
 # ---------------------------------------------------------------------------
-# /job-status endpoint — inline lazy reconcile
+# Job maintenance sweep — lazy reconcile moved off the /job-status hot path
 # ---------------------------------------------------------------------------
 
-async def test_job_status_endpoint_lazy_reconciles_pending_slideshow():
-    """
-    When a job's stored result has slideshow_status='pending' and
-    slideshow_id is set, /job-status MUST perform an inline single-shot
-    Gamma status check before returning. If Gamma now reports completed,
-    the job's result is updated in place.
-    """
-    import production_main as pm
-    from fastapi.testclient import TestClient
-
-    job_id = "test-pending-job-001"
-    pm.jobs_store[job_id] = {
+def _pending_job() -> dict:
+    return {
         "status": "completed",
         "progress": 100,
         "current_step": "Complete!",
@@ -383,6 +374,20 @@ async def test_job_status_endpoint_lazy_reconciles_pending_slideshow():
         },
     }
 
+
+async def test_maintenance_sweep_reconciles_pending_slideshow():
+    """
+    When a job's stored result has slideshow_status='pending' and
+    slideshow_id is set, the maintenance sweep MUST perform a single-shot
+    Gamma status check. If Gamma now reports completed, the job's result is
+    updated in place so the next /job-status poll returns it.
+    """
+    import production_main as pm
+    from fastapi.testclient import TestClient
+
+    job_id = "test-pending-job-001"
+    pm.jobs_store[job_id] = _pending_job()
+
     # Mock the Gamma status check used by the lazy reconcile so it reports
     # the slideshow is now finished.
     async def fake_check(self, generation_id):
@@ -396,9 +401,11 @@ async def test_job_status_endpoint_lazy_reconciles_pending_slideshow():
     with patch("worker.gamma_slideshow.GammaSlideshowCreator.check_generation_status",
                new=fake_check), \
          patch.object(pm, "GAMMA_API_KEY", "test-key"):
+        counts = await pm._run_job_maintenance()
         client = TestClient(pm.app)
         resp = client.get(f"/job-status/{job_id}")
 
+    assert counts["reconciled"] >= 1
     assert resp.status_code == 200, resp.text
     body = resp.json()
     assert body["result"]["slideshow_url"] == "https://gamma.app/docs/lazily-reconciled"
@@ -412,6 +419,32 @@ async def test_job_status_endpoint_lazy_reconciles_pending_slideshow():
     del pm.jobs_store[job_id]
 
 
+async def test_job_status_endpoint_never_calls_gamma_for_pending_slideshow():
+    """/job-status is a pure read: a pending slideshow is reported as-is."""
+    import production_main as pm
+    from fastapi.testclient import TestClient
+
+    job_id = "test-pending-job-003"
+    pm.jobs_store[job_id] = _pending_job()
+    call_count = {"n": 0}
+
+    async def fake_check(self, generation_id):
+        call_count["n"] += 1
+        return {"status": "completed", "url": "should-not-be-used", "id": generation_id, "error": None}
+
+    with patch("worker.gamma_slideshow.GammaSlideshowCreator.check_generation_status",
+               new=fake_check), \
+         patch.object(pm, "GAMMA_API_KEY", "test-key"):
+        client = TestClient(pm.app)
+        resp = client.get(f"/job-status/{job_id}")
+
+    assert resp.status_code == 200
+    assert resp.json()["result"]["slideshow_status"] == "pending"
+    assert call_count["n"] == 0
+
+    del pm.jobs_store[job_id]
+
+
 async def test_job_status_endpoint_does_not_reconcile_when_slideshow_already_completed():
     """Lazy reconcile MUST be a no-op for jobs whose slideshow is already done."""
     import production_main as pm
@@ -0,0 +1,107 @@
+"""Tests for concurrent Hunter enrichment, pattern inference and the verify cache
+(worker/hunter_client.py)."""
+import asyncio
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "worker"))
+
+import hunter_client  # noqa: E402
+from hunter_client import HunterClient, remember_domain_pattern, render_email_pattern  # noqa: E402
+
+
+@pytest.fixture(autouse=True)
+def _clear_caches():
+    hunter_client._VERIFY_CACHE.clear()
+    hunter_client._PATTERN_CACHE.clear()
+    yield
+    hunter_client._VERIFY_CACHE.clear()
+    hunter_client._PATTERN_CACHE.clear()
+
+
+class FakeHunter(HunterClient):
+    """Scripted verifier/finder that records calls and peak concurrency."""
+
+    def __init__(self, valid=(), found=None, delay=0.01, accept_all=()):
+        super().__init__(api_key="test")
+        self.valid = set(valid)
+        self.accept_all = set(accept_all)
+        self.found = found or {}
+        self.delay = delay
+        self.verify_calls, self.find_calls = [], []
+        self.in_flight = self.peak = 0
+
+    async def _call(self):
+        self.in_flight += 1
+        self.peak = max(self.peak, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+
+    async def verify_email(self, email):
+        self.verify_calls.append(email)
+        await self._call()
+        status = "valid" if email in self.valid else "accept_all" if email in self.accept_all else "invalid"
+        return {"verified": status == "valid", "confidence": 90 if status == "valid" else 0,
+                "status": status, "email": email}
+
+    async def find_email(self, domain, first_name, last_name):
+        self.find_calls.append((first_name, last_name))
+        await self._call()
+        email = self.found.get((first_name, last_name))
+        return {"found": bool(email), "email": email, "confidence": 80}
+
+
+def test_render_email_pattern_placeholders():
+    assert render_email_pattern("{first}.{last}", "José", "O'Neil", "www.Acme.com") == "jose.oneil@acme.com"
+    assert render_email_pattern("{f}{last}", "Ann", "Lee", "acme.com") == "alee@acme.com"
+    assert render_email_pattern("{nickname}", "Ann", "Lee", "acme.com") is None
+    assert render_email_pattern("{first}", "", "Lee", "acme.com") is None
+
+
+async def test_pattern_candidate_skips_finder_when_valid():
+    client = FakeHunter(valid={"ann.lee@acme.com"}, found={("Bo", "Chan"): "bchan@acme.com"})
+    out = await client.enrich_stakeholder_emails(
+        [{"name": "Ann Lee"}, {"name": "Bo Chan"}], "acme.com", pattern="{first}.{last}")
+    assert out[0]["email"] == "ann.lee@acme.com" and out[0]["email_source"] == "hunter_pattern"
+    assert out[1]["email"] == "bchan@acme.com"
+    assert client.find_calls == [("Bo", "Chan")]
+
+
+async def test_accept_all_candidate_is_kept_unverified_without_a_finder_call():
+    client = FakeHunter(accept_all={"ann.lee@acme.com"})
+    out = await client.enrich_stakeholder_emails([{"name": "Ann Lee"}], "acme.com", pattern="{first}.{last}")
+    assert out[0]["email"] == "ann.lee@acme.com" and out[0]["email_verified"] is False
+    assert client.find_calls == []
+
+
+def test_domain_pattern_only_pays_off_for_several_missing_emails():
+    one = [{"name": "Ann Lee"}, {"name": "Bo Chan", "email": "bo@acme.com"}]
+    assert not HunterClient.needs_domain_pattern(one)
+    assert HunterClient.needs_domain_pattern(one + [{"name": "Cy Dee", "email": "Not available"}])
+
+
+async def test_cached_domain_pattern_is_used_by_default():
+    remember_domain_pattern("https://acme.com/", "{first}")
+    client = FakeHunter(valid={"ann@acme.com"})
+    out = await client.enrich_stakeholder_emails([{"name": "Ann Lee"}], "acme.com")
+    assert out[0]["email"] == "ann@acme.com" and client.find_calls == []
+
+
+async def test_verification_verdicts_are_cached_across_calls():
+    client = FakeHunter(valid={"ann@acme.com"})
+    people = lambda: [{"name": "Ann Lee", "email": "ann@acme.com"}]  # noqa: E731
+    await client.enrich_stakeholder_emails(people(), "acme.com")
+    again = await FakeHunter().enrich_stakeholder_emails(people(), "acme.com")
+    assert client.verify_calls == ["ann@acme.com"]
+    assert again[0]["email_verified"] is True
+
+
+async def test_enrichment_is_concurrent_and_bounded():
+    client = FakeHunter(delay=0.02)
+    client._sem = asyncio.Semaphore(3)
+    people = [{"name": f"P{i} X", "email": f"p{i}@acme.com"} for i in range(9)]
+    out = await client.enrich_stakeholder_emails(people, "acme.com")
+    assert [p["name"] for p in out] == [p["name"] for p in people]
+    assert client.peak == 3
@@ -0,0 +1,92 @@
+"""Tests for refresh-mode input hashing and reuse planning (worker/incremental_refresh.py)
+and reuse_results in llm_council.run_council."""
+import os
+import sys
+from unittest.mock import patch
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "worker"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from incremental_refresh import (  # noqa: E402
+    baseline_state, changed_inputs, content_hash, input_hashes, plan_refresh,
+)
+
+SPECS = [
+    {"id": "s1", "name": "Industry", "focus": "industry"},
+    {"id": "s2", "name": "News", "focus": "news_intelligence"},
+    {"id": "s3", "name": "Mystery", "focus": "unlisted_focus"},
+]
+
+
+def _hashes(**overrides):
+    args = dict(company_data={"company_name": "Acme", "domain": "acme.com", "requested_by": "a@x.com"},
+                apollo_data={"name": "Acme"}, pdl_data={}, hunter_data={}, zoominfo_data={},
+                stakeholders_data=[], news_data={"articles": ["a"]})
+    args.update(overrides)
+    return input_hashes(**args)
+
+
+def test_content_hash_ignores_key_order_and_volatile_keys():
+    assert content_hash({"a": 1, "b": [1, 2]}) == content_hash({"b": [1, 2], "a": 1, "timestamp": "now"})
+    assert content_hash({"a": 1}) != content_hash({"a": 2})
+    # who asked for the job doesn't change its inputs
+    assert _hashes() == _hashes(company_data={"company_name": "Acme", "domain": "acme.com",
+                                              "requested_by": "b@x.com", "refresh": True})
+    # nor does the batch it was submitted in (cost rollups only)
+    assert _hashes() == _hashes(company_data={"company_name": "Acme", "domain": "acme.com",
+                                              "batch_id": "batch-7"})
+    # nor the news gatherer's per-run bookkeeping (cold vs warm cursor)
+    news = {"success": True, "raw_articles": [{"url": "u"}]}
+    assert _hashes(news_data={**news, "duplicates_removed": 0, "incremental": False}) \
+        == _hashes(news_data={**news, "duplicates_removed": 1, "incremental": True})
+
+
+def test_plan_refresh_reuses_specialists_whose_inputs_are_unchanged():
+    before = _hashes()
+    state = {"input_hashes": before, "specialist_results": [
+        {"specialist_id": s["id"], "analysis": {"x": 1}} for s in SPECS]}
+    after = _hashes(news_data={"articles": ["a", "b"]})
+    assert changed_inputs(before, after) == ["news"]
+
+    plan = plan_refresh(state, after, SPECS)
+    assert plan["changed_inputs"] == ["news"]
+    assert list(plan["reuse_results"]) == ["s1"]   # news-dependent and unlisted foci rerun
+    assert plan["unchanged"] is False
+    assert plan_refresh(state, before, SPECS)["unchanged"] is True
+
+
+def test_plan_refresh_without_baseline_reuses_nothing():
+    plan = plan_refresh(None, _hashes(), SPECS)
+    assert plan["reuse_results"] == {} and plan["unchanged"] is False
+    assert baseline_state({"result": {"refresh_state": {}}}) is None
+    assert baseline_state(None) is None
+
+
+async def test_run_council_skips_reused_specialists():
+    import llm_council
+
+    dispatched, prompts = [], []
+
+    async def fake_specialist(spec, *args, **kwargs):
+        dispatched.append(spec["id"])
+        return {"specialist_id": spec["id"], "specialist_name": spec["name"],
+                "focus": spec["focus"], "analysis": {"ok": True}}
+
+    async def fake_openai(prompt, system_prompt, model="gpt-4o-mini"):
+        prompts.append(prompt)
+        return {"company_name": "Acme"}
+
+    reuse = {"s1": {"specialist_id": "s1", "specialist_name": "Industry", "focus": "industry",
+                    "analysis": {"industry": "Retail"}}}
+    with patch.object(llm_council, "SPECIALISTS", SPECS), \
+            patch.object(llm_council, "COUNCIL_FAST_PATH", False), \
+            patch.object(llm_council, "run_specialist", fake_specialist), \
+            patch.object(llm_council, "call_openai", fake_openai):
+        result = await llm_council.run_council({"company_name": "Acme", "domain": "acme.com"},
+                                               {}, {}, reuse_results=reuse)
+
+    assert dispatched == ["s2", "s3"]
+    assert '"industry": "Retail"' in prompts[0]       # reused analysis reaches the aggregator
+    meta = result["_council_metadata"]
+    assert meta["specialist_results"][0]["reused"] is True
+    assert meta["fast_path"]["specialists_reused"] == 1
@@ -0,0 +1,145 @@
+"""Unit tests for the bounded jobs_store cache (worker/job_cache.py).
+
+Pure stdlib with an injected clock, so the LRU/TTL/byte-budget policy is
+exercised deterministically.
+"""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "worker"))
+
+from job_cache import BoundedJobStore, approx_bytes  # noqa: E402
+
+
+class _Clock:
+    def __init__(self):
+        self.t = 0.0
+
+    def __call__(self):
+        return self.t
+
+
+def _done(**extra):
+    return {"status": "completed", "result": {"ok": True}, **extra}
+
+
+def test_behaves_like_a_dict():
+    store = BoundedJobStore()
+    store["a"] = {"status": "processing"}
+    store["a"]["progress"] = 10
+    assert store.get("a")["progress"] == 10
+    assert "a" in store and len(store) == 1
+    assert store.get("missing") is None
+    del store["a"]
+    assert "a" not in store
+
+
+def test_count_cap_evicts_lru_finished_jobs_only():
+    store = BoundedJobStore(max_jobs=2)
+    store["running"] = {"status": "processing"}
+    store["old"] = _done()
+    store["new"] = _done()
+    assert "running" in store and "new" in store and "old" not in store
+    evicted = store.sweep()
+    assert [job_id for job_id, _ in evicted] == ["old"]
+
+
+def test_in_flight_jobs_are_never_evicted():
+    store = BoundedJobStore(max_jobs=1)
+    store["a"] = {"status": "processing"}
+    store["b"] = {"status": "pending"}
+    assert len(store) == 2
+    assert store.sweep() == []
+
+
+def test_access_refreshes_lru_order():
+    store = BoundedJobStore(max_jobs=2)
+    store["a"] = _done()
+    store["b"] = _done()
+    store.get("a")
+    store["c"] = _done()
+    assert "a" in store and "b" not in store
+
+
+def test_ttl_evicts_idle_finished_jobs():
+    clock = _Clock()
+    store = BoundedJobStore(ttl_seconds=60, clock=clock)
+    store["idle"] = _done()
+    store["busy"] = {"status": "processing"}
+    clock.t = 30
+    store["fresh"] = _done()
+    clock.t = 61
+    evicted = store.sweep()
+    assert [job_id for job_id, _ in evicted] == ["idle"]
+    assert "busy" in store and "fresh" in store
+
+
+def test_byte_budget_evicts_until_under():
+    store = BoundedJobStore(max_bytes=approx_bytes(_done(blob="x" * 10_000)) + 500)
+    store["big1"] = _done(blob="x" * 10_000)
+    store["big2"] = _done(blob="y" * 10_000)
+    evicted = store.sweep()
+    assert [job_id for job_id, _ in evicted] == ["big1"]
+    stats = store.stats()
+    assert stats["resident_jobs"] == 1 and stats["estimated_bytes"] > 10_000
+
+
+def test_items_scan_does_not_touch_recency():
+    store = BoundedJobStore(max_jobs=2)
+    store["a"] = _done()
+    store["b"] = _done()
+    list(store.items())
+    store["c"] = _done()
+    assert "a" not in store
+
+
+def test_approx_bytes_grows_with_payload_and_ignores_shared_refs():
+    blob = "z" * 5000
+    assert approx_bytes({"a": blob}) > 5000
+    assert approx_bytes({"a": blob, "b": blob}) < approx_bytes({"a": blob, "b": "w" * 5000})
+
+
+def test_stats_counts_in_flight():
+    store = BoundedJobStore()
+    store["a"] = {"status": "processing"}
+    store["b"] = _done()
+    store.sweep()
+    s = store.stats()
+    assert s["resident_jobs"] == 2 and s["in_flight_jobs"] == 1
+
+
+def test_pending_deck_jobs_are_never_evicted():
+    clock = _Clock()
+    store = BoundedJobStore(max_jobs=1, ttl_seconds=60, clock=clock)
+    store["deck"] = {"status": "completed", "result": {"slideshow_status": "pending"}}
+    store["done"] = _done()
+    assert "deck" in store and "done" not in store
+    clock.t = 120
+    store.sweep()
+    assert "deck" in store
+    store.peek("deck")["result"]["slideshow_status"] = "completed"
+    store.sweep()
+    assert "deck" not in store
+
+
+def test_sweep_measures_finished_jobs_only_when_they_change(monkeypatch):
+    import job_cache
+
+    measured = []
+    real = job_cache.approx_bytes
+
+    def counting(obj, *args):
+        if not args:                            # top-level call, not the recursion
+            measured.append(obj)
+        return real(obj, *args)
+
+    monkeypatch.setattr(job_cache, "approx_bytes", counting)
+    store = BoundedJobStore()
+    store["run"] = {"status": "processing"}
+    store["done"] = _done()
+    store.sweep()
+    store.sweep()
+    assert len(measured) == 3                   # done once, run every sweep
+    store.peek("done")["debug_data"] = {"blob": "x" * 5000}
+    store.sweep()
+    assert measured[-1] is store.peek("done") and store.stats()["estimated_bytes"] > 5000
@@ -0,0 +1,135 @@
+"""Tests for the SSE job-progress stream (worker/job_events + /jobs/{id}/events).
+
+The event-log logic is pure stdlib; the endpoint test drives a job that is
+already terminal so the stream closes on its own.
+"""
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "worker"))
+
+from job_events import (  # noqa: E402
+    JobEventBus, JobEventLog, diff_view, format_sse, parse_last_event_id,
+    progress_view,
+)
+
+
+def _view(status="processing", progress=10, step="Initializing...", cost=0):
+    return {"status": status, "progress": progress, "current_step": step, "cost_usd": cost}
+
+
+def test_first_observation_is_a_stage_event():
+    assert diff_view(None, _view()) == [("stage", _view())]
+
+
+def test_progress_only_change_is_a_small_delta():
+    out = diff_view(_view(progress=10), _view(progress=20))
+    assert out == [("progress", {"progress": 20})]
+
+
+def test_step_change_is_a_stage_event_and_cost_tick_is_separate():
+    out = diff_view(_view(step="A", cost=0.01), _view(step="B", progress=30, cost=0.02))
+    assert out[0] == ("stage", {"status": "processing", "current_step": "B", "progress": 30})
+    assert out[1] == ("cost", {"cost_usd": 0.02})
+
+
+def test_unchanged_view_emits_nothing():
+    log = JobEventLog()
+    log.observe(_view())
+    assert log.observe(_view()) == []
+    assert log.last_seq == 1
+
+
+def test_resume_replays_only_missed_events():
+    log = JobEventLog()
+    log.observe(_view(progress=10))
+    log.observe(_view(progress=20))
+    log.observe(_view(progress=30))
+    assert [e["seq"] for e in log.since(1)] == [2, 3]
+    assert log.since(3) == []
+
+
+def test_resume_before_retained_window_gets_snapshot_first():
+    log = JobEventLog(cap=2)
+    for p in (10, 20, 30, 40):
+        log.observe(_view(progress=p))
+    events = log.since(0)
+    assert events[0]["type"] == "snapshot"
+    assert events[0]["data"]["progress"] == 40
+    assert [e["seq"] for e in events[1:]] == [3, 4]
+
+
+def test_finish_sends_full_payload_once_and_closes():
+    log = JobEventLog()
+    log.observe(_view(status="completed", progress=100, step="Complete!"))
+    ev = log.finish("completed", {"job_id": "j", "result": {"x": 1}})
+    assert ev["type"] == "complete" and ev["data"]["result"] == {"x": 1}
+    assert log.closed
+    assert log.observe(_view(status="completed", progress=100, step="Other")) == []
+
+
+def test_bus_is_bounded():
+    bus = JobEventBus(max_jobs=2)
+    bus.log("a"); bus.log("b"); bus.log("c")
+    assert len(bus) == 2
+
+
+def test_progress_view_reads_cost_total():
+    v = progress_view({"status": "processing", "progress": 40, "current_step": "x"},
+                      {"total_usd": 0.123})
+    assert v["cost_usd"] == 0.123
+
+
+def test_sse_framing_and_last_event_id():
+    frame = format_sse({"seq": 7, "type": "progress", "data": {"progress": 50}})
+    assert frame == 'id: 7\nevent: progress\ndata: {"progress":50}\n\n'
+    assert parse_last_event_id("12") == 12
+    assert parse_last_event_id(None) == 0
+    assert parse_last_event_id("junk") == 0
+
+
+def _parse_stream(text):
+    events = []
+    for block in text.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        events.append({"id": int(fields["id"]), "event": fields["event"],
+                       "data": json.loads(fields["data"])})
+    return events
+
+
+def test_events_endpoint_streams_deltas_then_full_payload():
+    import production_main as pm
+    from fastapi.testclient import TestClient
+
+    job_id = "test-sse-job-001"
+    pm.jobs_store[job_id] = {
+        "status": "completed", "progress": 100, "current_step": "Complete!",
+        "created_at": "2026-06-24T00:00:00Z",
+        "result": {"success": True, "company_name": "Test Co"},
+        "apollo_data": {"big": "blob"},
+    }
+    try:
+        client = TestClient(pm.app)
+        resp = client.get(f"/jobs/{job_id}/events")
+        assert resp.status_code == 200
+        assert resp.headers["content-type"].startswith("text/event-stream")
+        events = _parse_stream(resp.text)
+        assert [e["event"] for e in events] == ["stage", "complete"]
+        assert "apollo_data" not in events[0]["data"]
+        assert events[1]["data"]["apollo_data"] == {"big": "blob"}
+
+        # Resuming after the last seen id replays nothing and closes.
+        resumed = client.get(f"/jobs/{job_id}/events",
+                             headers={"Last-Event-ID": str(events[-1]["id"])})
+        assert resumed.text.strip() == ""
+    finally:
+        pm.jobs_store.pop(job_id, None)
+        pm._job_event_bus().drop(job_id)
+
+
+def test_events_endpoint_404_for_unknown_job():
+    import production_main as pm
+    from fastapi.testclient import TestClient
+
+    assert TestClient(pm.app).get("/jobs/does-not-exist/events").status_code == 404
@@ -13,6 +13,7 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "worker"))
 
 from job_status_recovery import (  # noqa: E402
     resolve_persisted_status, is_stale_processing, parse_iso,
+    jobs_needing_maintenance, PersistedRowCache,
 )
 
 
@@ -69,3 +70,58 @@ def test_parse_iso_handles_z_suffix_and_naive():
     assert parse_iso("2026-06-24T13:29:36.403") is not None
     assert parse_iso("") is None
     assert parse_iso("not-a-date") is None
+
+
+def test_maintenance_selects_stale_and_pending_slideshow_jobs():
+    now = datetime(2026, 6, 24, 14, 0, 0, tzinfo=timezone.utc)
+    jobs = {
+        "stale": {"status": "processing",
+                  "created_at": (now - timedelta(minutes=45)).isoformat()},
+        "fresh": {"status": "processing",
+                  "created_at": (now - timedelta(minutes=2)).isoformat()},
+        "deck": {"status": "completed", "created_at": now.isoformat(),
+                 "result": {"slideshow_status": "pending", "slideshow_id": "gen-1"}},
+        "deck_no_id": {"status": "completed",
+                       "result": {"slideshow_status": "pending"}},
+        "done": {"status": "completed",
+                 "result": {"slideshow_status": "completed", "slideshow_id": "gen-2"}},
+    }
+    stale, pending = jobs_needing_maintenance(jobs, now, max_age_minutes=30)
+    assert stale == ["stale"]
+    assert pending == ["deck"]
+
+
+def test_persisted_row_cache_serves_hits_and_misses_until_ttl():
+    cache = PersistedRowCache(ttl_seconds=30)
+    assert cache.get("j1", 0.0) == (False, None)
+    cache.put("j1", {"status": "completed"}, 0.0)
+    cache.put("missing", None, 0.0)
+    assert cache.get("j1", 10.0) == (True, {"status": "completed"})
+    # A cached miss is a fresh hit with no row (-> 404 without a DB query).
+    assert cache.get("missing", 10.0) == (True, None)
+    # Expired: refresh, but keep serving the last row meanwhile.
+    assert cache.get("j1", 31.0) == (False, {"status": "completed"})
+    assert cache.get("missing", 31.0) == (False, None)
+    assert "missing" in cache and "never-looked-up" not in cache
+
+
+def test_persisted_row_cache_never_forgets_a_seen_row():
+    cache = PersistedRowCache(ttl_seconds=30)
+    cache.put("j1", {"status": "completed"}, 0.0)
+    cache.invalidate("j1")
+    assert cache.get("j1", 1.0) == (False, {"status": "completed"})
+    cache.put("j1", None, 2.0)                  # failed refresh reads as a miss
+    assert cache.get("j1", 3.0) == (True, {"status": "completed"})
+    cache.put("j1", {"status": "failed"}, 4.0)
+    assert cache.get("j1", 5.0) == (True, {"status": "failed"})
+
+
+def test_persisted_row_cache_is_bounded_and_invalidates():
+    cache = PersistedRowCache(ttl_seconds=30, max_entries=2)
+    cache.put("a", {"n": 1}, 0.0)
+    cache.put("b", {"n": 2}, 0.0)
+    cache.put("c", {"n": 3}, 0.0)
+    assert len(cache) == 2
+    assert cache.get("a", 1.0) == (False, None)
+    cache.invalidate("b")
+    assert cache.get("b", 1.0) == (False, {"n": 2})
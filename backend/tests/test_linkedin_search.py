@@ -0,0 +1,40 @@
+"""Tests for the step 2.86 batching/cache helpers (worker/linkedin_search.py)."""
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "worker"))
+
+from linkedin_search import (  # noqa: E402
+    MISS, LinkedInCache, batch_prompt, batches, parse_batch_response,
+)
+
+
+def test_batches_keep_order():
+    assert batches([1, 2, 3, 4, 5], 2) == [[1, 2], [3, 4], [5]]
+    assert batches([], 4) == []
+
+
+def test_batch_prompt_lists_every_name():
+    prompt = batch_prompt("Acme", "acme.com", ["Ann Lee", "Bo Chan"])
+    assert "1. Ann Lee" in prompt and "2. Bo Chan" in prompt and "NOT_FOUND" in prompt
+
+
+def test_parse_batch_response_maps_urls_negatives_and_unknowns():
+    text = ('Here you go: [{"name": "ann lee", "linkedin_url": "https://www.linkedin.com/in/annlee/"},'
+            ' {"name": "Bo Chan", "linkedin_url": "NOT_FOUND"},'
+            ' {"name": "Stranger", "linkedin_url": "https://www.linkedin.com/in/x"}]')
+    out = parse_batch_response(text, ["Ann Lee", "Bo Chan", "Cy Dee"])
+    assert out == {"Ann Lee": "https://www.linkedin.com/in/annlee", "Bo Chan": None}
+    assert parse_batch_response("no json here", ["Ann Lee"]) == {}
+
+
+def test_cache_negative_entries_expire_sooner():
+    now = [0.0]
+    cache = LinkedInCache(positive_ttl=100, negative_ttl=10, clock=lambda: now[0])
+    cache.put("Ann Lee", "https://www.acme.com/", "https://www.linkedin.com/in/annlee")
+    cache.put("Bo Chan", "acme.com", None)
+    assert cache.get("ann  lee", "acme.com") == "https://www.linkedin.com/in/annlee"
+    assert cache.get("Bo Chan", "acme.com") is None
+    now[0] = 50
+    assert cache.get("Bo Chan", "acme.com") is MISS
+    assert cache.get("Ann Lee", "acme.com") == "https://www.linkedin.com/in/annlee"
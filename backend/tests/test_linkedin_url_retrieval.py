@@ -372,8 +372,14 @@ class TestClaudeLinkedInSearch:
     Step 2.86 — Claude web search LinkedIn finder.
     Fires after Apollo people/match backfill for contacts still missing LinkedIn.
     Tests written FIRST (TDD). All tests must FAIL before implementation exists.
+    Per-request behaviour is pinned with LINKEDIN_SEARCH_BATCH_SIZE=1; the
+    cross-job cache is cleared before each test.
     """
 
+    def setup_method(self):
+        from production_main import _linkedin_cache
+        _linkedin_cache().clear()
+
     @pytest.mark.asyncio
     async def test_returns_empty_when_no_api_key(self):
         """Returns ({}, []) immediately when ANTHROPIC_API_KEY is not configured."""
@@ -421,6 +427,7 @@ class TestClaudeLinkedInSearch:
         ]
 
         with patch("production_main.ANTHROPIC_API_KEY", "test-key"), \
+             patch("production_main.LINKEDIN_SEARCH_BATCH_SIZE", 1), \
              patch("anthropic.AsyncAnthropic", return_value=mock_client):
             await _find_linkedin_via_claude_search("Corp", "corp.com", contacts)
 
@@ -451,6 +458,7 @@ class TestClaudeLinkedInSearch:
         contacts = [{"name": f"Person {i}", "title": "Director"} for i in range(20)]
 
         with patch("production_main.ANTHROPIC_API_KEY", "test-key"), \
+             patch("production_main.LINKEDIN_SEARCH_BATCH_SIZE", 1), \
              patch("anthropic.AsyncAnthropic", return_value=mock_client):
             await _find_linkedin_via_claude_search("Corp", "corp.com", contacts)
 
@@ -571,6 +579,7 @@ class TestClaudeLinkedInSearch:
         ]
 
         with patch("production_main.ANTHROPIC_API_KEY", "test-key"), \
+             patch("production_main.LINKEDIN_SEARCH_BATCH_SIZE", 1), \
              patch("anthropic.AsyncAnthropic", return_value=mock_client):
             found, all_results = await _find_linkedin_via_claude_search("Corp", "corp.com", contacts)
 
@@ -585,6 +594,74 @@ class TestClaudeLinkedInSearch:
         success_entry = next(r for r in all_results if r["name"] == "John Doe")
         assert success_entry["linkedin_url"] == "https://www.linkedin.com/in/johndoe"
 
+    @pytest.mark.asyncio
+    async def test_batches_contacts_into_json_array_requests(self):
+        """Default mode: one request per batch of contacts, answers parsed per name."""
+        from production_main import _find_linkedin_via_claude_search
+        import json as _json
+
+        prompts = []
+
+        async def mock_create(**kwargs):
+            content = kwargs["messages"][0]["content"]
+            prompts.append(content)
+            rows = [{"name": f"Person {i}",
+                     "linkedin_url": f"https://www.linkedin.com/in/person{i}" if i % 2 == 0 else "NOT_FOUND"}
+                    for i in range(6) if f"Person {i}" in content]
+            mock_resp = MagicMock()
+            mock_block = MagicMock()
+            mock_block.text = _json.dumps(rows)
+            mock_resp.content = [mock_block]
+            return mock_resp
+
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(side_effect=mock_create)
+        contacts = [{"name": f"Person {i}", "title": "Director"} for i in range(6)]
+        stats = {}
+
+        with patch("production_main.ANTHROPIC_API_KEY", "test-key"), \
+             patch("production_main.LINKEDIN_SEARCH_BATCH_SIZE", 3), \
+             patch("anthropic.AsyncAnthropic", return_value=mock_client):
+            found, all_results = await _find_linkedin_via_claude_search(
+                "Corp", "corp.com", contacts, stats=stats)
+
+        assert len(prompts) == 2
+        assert found == {f"Person {i}": f"https://www.linkedin.com/in/person{i}" for i in (0, 2, 4)}
+        assert len(all_results) == 6
+        assert stats["requests_made"] == 2 and stats["calls_saved"] == 4
+
+    @pytest.mark.asyncio
+    async def test_cross_job_cache_serves_hits_and_negatives(self):
+        """A second job for the same people makes no request, NOT_FOUND included."""
+        from production_main import _find_linkedin_via_claude_search
+
+        async def mock_create(**kwargs):
+            content = kwargs["messages"][0]["content"]
+            mock_resp = MagicMock()
+            mock_block = MagicMock()
+            mock_block.text = ("https://www.linkedin.com/in/janesmith"
+                               if "Jane Smith" in content else "NOT_FOUND")
+            mock_resp.content = [mock_block]
+            return mock_resp
+
+        mock_client = MagicMock()
+        mock_client.messages.create = AsyncMock(side_effect=mock_create)
+        contacts = [{"name": "Jane Smith", "title": "CTO"}, {"name": "Ghost Person", "title": "CFO"}]
+
+        with patch("production_main.ANTHROPIC_API_KEY", "test-key"), \
+             patch("production_main.LINKEDIN_SEARCH_BATCH_SIZE", 1), \
+             patch("anthropic.AsyncAnthropic", return_value=mock_client):
+            await _find_linkedin_via_claude_search("Corp", "corp.com", contacts)
+            assert mock_client.messages.create.await_count == 2
+            stats = {}
+            found, all_results = await _find_linkedin_via_claude_search(
+                "Corp", "www.corp.com", contacts, stats=stats)
+
+        assert mock_client.messages.create.await_count == 2
+        assert found == {"Jane Smith": "https://www.linkedin.com/in/janesmith"}
+        assert all(r.get("cached") for r in all_results)
+        assert stats["cache_hits"] == 2 and stats["requests_made"] == 0
+
 
 class TestContactEnrichEndpointLinkedIn:
     """GET /contacts/enrich/{domain} must return linkedinUrl for each contact."""
@@ -0,0 +1,102 @@
+"""Tests for the process-wide Prometheus metrics (worker/metrics.py) and their tracing feed."""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "worker"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import pytest  # noqa: E402
+
+from worker import cost_meter, metrics, tracing  # noqa: E402
+
+
+def test_histogram_buckets_are_cumulative_and_rendered():
+    reg = metrics.Registry()
+    h = reg.histogram("t_latency_seconds", "test", ("vendor",), buckets=(0.1, 1.0))
+    for v in (0.05, 0.1, 0.5, 3.0):
+        h.observe(("zi",), v)
+    text = reg.render()
+    assert 't_latency_seconds_bucket{vendor="zi",le="0.1"} 2' in text
+    assert 't_latency_seconds_bucket{vendor="zi",le="1"} 3' in text
+    assert 't_latency_seconds_bucket{vendor="zi",le="+Inf"} 4' in text
+    assert 't_latency_seconds_count{vendor="zi"} 4' in text
+    with pytest.raises(ValueError):
+        h.observe((), 1.0)
+
+
+def test_spans_feed_vendor_latency_errors_and_429s():
+    async def call(status):
+        with tracing.span("zoominfo.request", "vendor"):
+            tracing.annotate(endpoint="/search/contact", status_code=status)
+
+    async def failing():
+        with tracing.span("pdl.company_enrich", "vendor"):
+            raise TimeoutError("slow")
+
+    cost_meter.current_job_id.set(None)
+    labels = ("zoominfo", "/search/contact")
+    before = metrics.VENDOR_LATENCY.count(labels)
+    limited = metrics.VENDOR_RATE_LIMITED.value(("zoominfo",))
+    loop = asyncio.new_event_loop()
+    loop.run_until_complete(call(200))
+    loop.run_until_complete(call(429))
+    with pytest.raises(TimeoutError):
+        loop.run_until_complete(failing())
+    tracing.record_span("zoominfo.rate_limit_wait", "wait", 0.2)
+
+    assert metrics.VENDOR_LATENCY.count(labels) == before + 2
+    assert metrics.VENDOR_RATE_LIMITED.value(("zoominfo",)) == limited + 1
+    assert metrics.VENDOR_ERRORS.value(("zoominfo", "/search/contact", "http_429")) >= 1
+    assert metrics.VENDOR_ERRORS.value(("pdl", "company_enrich", "TimeoutError")) >= 1
+    assert metrics.RATE_LIMIT_WAIT.count(("zoominfo.rate_limit_wait",)) >= 1
+    assert metrics.INFLIGHT.value(("vendor", "zoominfo")) == 0
+    assert "rad_vendor_request_duration_seconds_bucket" in metrics.render()
+
+
+def test_collectors_render_at_scrape_time_and_failures_are_skipped():
+    reg = metrics.Registry()
+    depth = {"pending": 3}
+    reg.register_collector(lambda: [("t_jobs", {"status": k}, v) for k, v in depth.items()],
+                           {"t_jobs": "Jobs by status."})
+    reg.register_collector(lambda: 1 / 0)
+    assert 't_jobs{status="pending"} 3' in reg.render()
+    depth["pending"] = 1
+    text = reg.render()
+    assert "# TYPE t_jobs gauge" in text and 't_jobs{status="pending"} 1' in text
+
+
+def test_swallowed_vendor_failures_still_reach_metrics(monkeypatch):
+    import httpx
+
+    import production_main as pm
+
+    def handler(request):
+        if "hunter.io" in request.url.host:
+            return httpx.Response(429, json={"errors": []})
+        raise httpx.ConnectError("refused", request=request)
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(httpx, "AsyncClient",
+                        lambda *a, **kw: real_client(transport=httpx.MockTransport(handler)))
+    monkeypatch.setattr(pm, "HUNTER_API_KEY", "k")
+    monkeypatch.setattr(pm, "PEOPLEDATALABS_API_KEY", "k")
+    cost_meter.current_job_id.set(None)
+    limited = metrics.VENDOR_RATE_LIMITED.value(("hunter",))
+    refused = metrics.VENDOR_ERRORS.value(("pdl", "company_enrich", "ConnectError"))
+
+    company = {"company_name": "Acme", "domain": "acme.com"}
+    loop = asyncio.new_event_loop()
+    assert loop.run_until_complete(pm.fetch_hunter_data(company)) == {}
+    assert loop.run_until_complete(pm.fetch_pdl_data(company)) == {}
+
+    assert metrics.VENDOR_RATE_LIMITED.value(("hunter",)) == limited + 1
+    assert metrics.VENDOR_ERRORS.value(("hunter", "domain_search", "http_429")) >= 1
+    assert metrics.VENDOR_ERRORS.value(("pdl", "company_enrich", "ConnectError")) == refused + 1
+
+
+def test_annotate_status_keeps_the_first_error():
+    with tracing.span("apollo.organization", "vendor") as s:
+        tracing.annotate_status(429)
+        tracing.annotate_status(200)
+    assert s.attributes["status_code"] == 429
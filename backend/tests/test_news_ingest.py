@@ -0,0 +1,97 @@
+"""Tests for multi-source news ingestion (worker/news_ingest.py) and the paged,
+incremental NewsGatherer."""
+import os
+import random
+import sys
+
+import httpx
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "worker"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from worker import news_gatherer, news_ingest  # noqa: E402
+
+
+def _reference_category(content):
+    """The nested `any(term in content)` scan the matcher replaced."""
+    for category, terms in news_gatherer.CATEGORY_KEYWORDS.items():
+        if any(term in content for term in terms):
+            return category, sum(1 for t in terms if t in content) / len(terms)
+    return None
+
+
+def test_matcher_agrees_with_substring_scan():
+    rng = random.Random(7)
+    vocab = [t for terms in news_gatherer.CATEGORY_KEYWORDS.values() for t in terms]
+    vocab += ["acme", "corp", "the", "quarter", "serviceable", "ceos", "q", "venturesome", "x"]
+    for _ in range(2000):
+        text = rng.choice(["", " ", "-"]).join(rng.choice(vocab) for _ in range(rng.randint(0, 12)))
+        assert news_gatherer._MATCHER.classify(text) == _reference_category(text), text
+
+    matcher = news_ingest.KeywordMatcher({"a": ["he", "she", "hers"], "b": ["his", "e"]})
+    assert matcher.matches("ushers") == {"a": {"he", "she", "hers"}, "b": {"e"}}
+
+
+def test_dedupe_by_canonical_url_and_title_shingles():
+    articles = [
+        {"title": "Acme raises $50M Series B to expand platform - Reuters",
+         "url": "https://www.example.com/news/acme/?utm_source=x", "description": ""},
+        {"title": "Acme Raises $50M Series B to Expand Platform | TechWire",
+         "url": "https://techwire.io/acme-series-b", "description": "Led by Example Ventures."},
+        {"title": "Something else entirely", "url": "http://example.com/news/acme#top"},
+        {"title": "Acme names new CFO", "url": "https://example.com/cfo?id=2"},
+        {"title": "Acme names new CFO from Globex", "url": "https://example.com/cfo?id=3"},
+    ]
+    kept, dropped = news_ingest.dedupe(articles)
+    assert dropped == 2
+    assert [a["url"] for a in kept] == [articles[0]["url"], articles[3]["url"], articles[4]["url"]]
+    assert kept[0]["description"] == "Led by Example Ventures."   # borrowed from the copy
+    assert news_ingest.canonical_url("HTTPS://WWW.Example.com/a/?b=1&utm_medium=y&a=2") == "example.com/a?a=2&b=1"
+
+
+async def test_gatherer_pages_merges_zoominfo_and_fetches_incrementally(monkeypatch):
+    news_ingest.CURSORS.clear()
+    pages = {
+        None: [{"title": f"Acme launches product {i}", "url": f"https://n.io/{i}",
+                "publishedAt": f"2026-10-{17 - i:02d}T10:00:00Z", "source": {"name": "N"}} for i in range(10)],
+        "2": [{"title": "Acme appoints new CTO", "url": "https://n.io/cto",
+               "publishedAt": "2026-10-01T09:00:00Z", "source": {"name": "N"}}],
+    }
+    requests = []
+
+    def handler(request):
+        requests.append(dict(request.url.params))
+        if request.url.params.get("from", "") >= "2026-10-17":
+            return httpx.Response(200, json={"totalArticles": 1, "articles": [
+                {"title": "Acme opens new office in Austin", "url": "https://n.io/austin",
+                 "publishedAt": "2026-10-18T08:00:00Z", "source": {"name": "N"}},
+                pages[None][0]]})
+        return httpx.Response(200, json={"totalArticles": 11, "articles": pages[request.url.params.get("page")]})
+
+    real_client = httpx.AsyncClient
+    monkeypatch.setattr(news_gatherer.httpx, "AsyncClient",
+                        lambda **kw: real_client(transport=httpx.MockTransport(handler), **kw))
+    monkeypatch.setattr(news_gatherer, "GNEWS_MAX_PAGES", 3)
+    zoominfo = {
+        "news_articles": [{"title": "Acme appoints new CTO", "url": "https://zi.io/cto",
+                           "description": "ZoomInfo copy", "published_date": "2026-10-01"}],
+        "scoops": [{"title": "Acme evaluating SIEM vendors", "scoop_type": "Project",
+                    "date": "2026-10-05", "source_url": ""}],
+    }
+
+    gatherer = news_gatherer.NewsGatherer(api_key="k")
+    gatherer.days_back = 3650
+    first = await gatherer.fetch_company_news("Acme", "acme.com", max_articles=50,
+                                              extra_articles=news_ingest.zoominfo_articles(zoominfo))
+    assert [r.get("page") for r in requests] == [None, "2"]
+    assert first["articles_count"] == 12 and first["duplicates_removed"] == 1
+    assert first["sources"] == {"gnews": 11, "zoominfo_scoop": 1}
+    assert not first["incremental"]
+    assert first["categories"]["executive_changes"][0]["url"] == "https://n.io/cto"
+
+    requests.clear()
+    second = await gatherer.fetch_company_news("Acme", "acme.com", max_articles=50)
+    assert requests[0]["from"] == "2026-10-17T10:00:00Z" and len(requests) == 1
+    assert second["incremental"] and second["articles_count"] == 12
+    assert second["raw_articles"][0]["url"] == "https://n.io/austin"
+    assert second["categories"]["expansions"][0]["url"] == "https://n.io/austin"
@@ -238,3 +238,52 @@ class TestOrchestratorPlanning:
 
         assert hasattr(result, 'granular_assignments')
         assert len(result.granular_assignments) > 0
+
+
+class TestPlanCache:
+    """Plan cache keyed on the feature signature; the LLM never blocks a job."""
+
+    def setup_method(self):
+        import orchestrator
+        orchestrator._PLAN_CACHE.clear()
+
+    def test_signature_ignores_company_identity(self):
+        from orchestrator import plan_signature
+        a = plan_signature({"company_name": "Acme", "domain": "acme.com", "industry": "Retail & CPG"}, ["apollo"])
+        b = plan_signature({"company_name": "Other", "domain": "other.com", "industry": "retail cpg"}, ["apollo"])
+        assert a == b
+        assert plan_signature({"domain": "shop.ca"}, ["apollo"])[2] == "ca"
+        assert plan_signature({"domain": "acme.com"}, ["apollo", "pdl"]) != plan_signature({"domain": "acme.com"}, ["apollo"])
+        # only request-time fields: vendor firmographics don't exist yet at step 0.5
+        assert plan_signature({"domain": "acme.com", "employee_count": 50000}, ["apollo"]) == \
+            plan_signature({"domain": "acme.com"}, ["apollo"])
+
+    def test_rules_plan_prioritizes_configured_vendors(self):
+        from orchestrator import rules_based_plan
+        plan = rules_based_plan({"company_name": "Acme"}, ["zoominfo", "pdl"])
+        assert plan.priority_order[:2] == ["pdl", "zoominfo"]
+        assert set(plan.apis_to_query) == set(API_CAPABILITIES)
+
+    @pytest.mark.asyncio
+    async def test_miss_returns_rules_plan_and_refreshes_in_background(self, monkeypatch):
+        import asyncio
+        import orchestrator
+
+        calls = []
+
+        async def fake_llm(prompt):
+            calls.append(prompt)
+            return {"apis_to_query": ["apollo"], "reasoning": "llm plan"}
+
+        monkeypatch.setattr(orchestrator, "OPENAI_API_KEY", "sk-test")
+        monkeypatch.setattr(orchestrator, "call_orchestrator_llm", fake_llm)
+        company = {"company_name": "Acme", "domain": "acme.com", "industry": "Retail"}
+
+        first = await analyze_and_plan(company)
+        assert first.reasoning.startswith("Rules plan")
+        await asyncio.gather(*list(orchestrator._REFRESHING.values()))
+
+        second = await analyze_and_plan({"company_name": "Other", "domain": "other.com", "industry": "retail"})
+        assert second.reasoning == "[cached plan] llm plan"
+        assert "hunter" in second.apis_to_query
+        assert len(calls) == 1
@@ -7,7 +7,8 @@ sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "worker"))
 
 from bi_resolver import StakeholderRecord, CanonicalCompany, MIN_SLIDES  # noqa: E402
 from job_store import (  # noqa: E402
-    should_apply_update, build_progress_update, build_final_update, STAGE_SEQ,
+    should_apply_update, should_write_progress, build_progress_update, build_final_update,
+    JobStore, STAGE_SEQ,
 )
 from pipeline_v31 import run_pipeline_v31, _serialize_catalogue  # noqa: E402
 
@@ -41,6 +42,87 @@ def test_build_final_update_carries_artifacts():
     assert f["data_quality_score"] == 0.8 and f["warnings"] == ["w"]
 
 
+def test_progress_coalescing():
+    assert should_write_progress(None, 3, 0.0)
+    assert should_write_progress((3, 0.0), 4, 0.1)                      # stage change
+    assert not should_write_progress((3, 0.0), 3, 0.5)                  # same-stage tick, too soon
+    assert should_write_progress((3, 0.0), 3, 0.5, has_partial=True)    # partials always land
+    assert should_write_progress((3, 0.0), 3, 1.5)
+    assert not should_write_progress((4, 0.0), 3, 9.0)                  # stale
+
+
+class _Query:
+    def __init__(self, calls, op, *args):
+        self.calls, self.call = calls, [op, *args]
+
+    def __getattr__(self, name):
+        def chain(*args):
+            self.call.append((name, *args))
+            return self
+        return chain
+
+    def execute(self):
+        self.calls.append(self.call)
+        return type("Res", (), {"data": []})()
+
+
+class _Client:
+    def __init__(self):
+        self.calls = []
+
+    def table(self, name):
+        client = self
+
+        class _T:
+            def update(self, payload):
+                return _Query(client.calls, "update", name, payload)
+
+            def insert(self, rows):
+                return _Query(client.calls, "insert", name, rows)
+        return _T()
+
+    def rpc(self, fn, params):
+        return _Query(self.calls, "rpc", fn, params)
+
+
+def test_job_store_single_conditional_write_and_append_only_logs():
+    client, now = _Client(), [0.0]
+    store = JobStore(client, clock=lambda: now[0])
+    store.update_progress("j1", stage="3_contacts", step="a", progress=0.5)
+    store.update_progress("j1", stage="3_contacts", step="b", progress=0.55)   # coalesced
+    store.update_progress("j1", stage="3_contacts", step="c", progress=0.6, partial={"x": 1})
+    assert [c[0] for c in client.calls] == ["update", "rpc"]
+    assert ("lte", "current_stage_seq", STAGE_SEQ["3_contacts"]) in client.calls[0]
+    assert client.calls[1][2]["p_partial"] == {"x": 1}
+
+    store.logger_sink("j1")([{"ts": 1.0, "msg": "a"}, {"ts": 2.0, "msg": "b"}])
+    op, table, rows = client.calls[2][:3]
+    assert (op, table) == ("insert", "profile_request_logs")
+    assert [r["job_id"] for r in rows] == ["j1", "j1"]
+
+
+def test_job_store_coalesces_to_the_latest_tick_instead_of_dropping_it():
+    client, now = _Client(), [0.0]
+    store = JobStore(client, clock=lambda: now[0])
+    store.update_progress("j1", stage="3_contacts", step="a", progress=0.5)
+    now[0] = 0.2
+    store.update_progress("j1", stage="3_contacts", step="b", progress=0.55)   # held
+    now[0] = 0.4
+    store.update_progress("j1", stage="3_contacts", step="c", progress=0.58)   # held (latest)
+    assert len(client.calls) == 1
+    now[0] = 5.0
+    store.update_progress("j1", stage="4_council", step="validating", progress=0.7)
+    steps = [(c[2]["current_stage"], c[2]["current_step"]) for c in client.calls]
+    assert steps == [("3_contacts", "a"), ("3_contacts", "c"), ("4_council", "validating")]
+
+    now[0] = 5.1
+    store.update_progress("j1", stage="4_council", step="debating", progress=0.75)   # held
+    store.flush("j1")
+    assert client.calls[-1][2]["current_step"] == "debating"
+    store.flush("j1")                                                              # nothing held
+    assert len(client.calls) == 4
+
+
 # --- end-to-end orchestration on fakes --------------------------------------
 
 class FakeStore:
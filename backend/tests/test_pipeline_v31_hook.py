@@ -299,6 +299,29 @@ def test_quality_floor_backfills_to_four_baseline_contacts():
     assert "Real CIO" in baseline  # relevant+reachable pick kept
 
 
+def test_quality_floor_enriches_in_waves_and_stops_at_floor():
+    # 1 baseline contact, floor 3 -> first wave enriches exactly the 2 most relevant
+    # free candidates together; both make baseline, so the rest are never touched.
+    from pipeline_v31_hook import _enforce_contact_quality
+    from bi_resolver import SelectionResult, Proximity
+    cio = _mkrec("CIO", "Real CIO", email="cio@x.com", linkedin="https://li/cio", prox=Proximity.EXACT)
+    cands = [_mkrec("CTO", f"Cand {i}", prox=Proximity.VP if i < 2 else Proximity.DIRECTOR)
+             for i in range(5)]
+    sel = SelectionResult(slide_contacts={"CIO": [cio]},
+                          contact_catalogue={"CIO": [cio], "CTO": cands},
+                          enrichment_trace=[], warnings=[])
+    enriched = []
+
+    class FakeP:
+        async def enrich_one(self, c, company, domain=""):
+            enriched.append(c.name)
+            c.email, c.linkedin_url = f"{c.name}@x.com", f"https://li/{c.name}"
+
+    run(_enforce_contact_quality(sel, FakeP(), "Acme", "acme.com", floor=3))
+    assert sorted(enriched) == ["Cand 0", "Cand 1"]
+    assert [c.name for c in sel.slide_contacts["CTO"]] == ["Cand 0", "Cand 1"]
+
+
 def test_deck_basename_canada_only_suffix_avoids_collision():
     # The Canada-only run must not overwrite the company's global deck same-day.
     assert deck_basename("Microsoft", "2026-06-23", canada_only=True) == "hprad_microsoft_2026-06-23_ca"
@@ -134,3 +134,156 @@ def test_resolve_company_from_zi_normalized():
                             "country": "USA", "employee_count": 500})
     canon = run(LiveProviders(zi_client=zi).resolve_company({"company_name": "Acme", "domain": "acme.com"}))
     assert canon.name == "Acme Inc" and canon.industry == "Tech" and canon.confidence == 0.8
+
+
+# --- shared per-job contact pool ----------------------------------------------
+
+class PoolZI(FakeZI):
+    """Fake with the broad pool pull; counts calls of each kind."""
+    def __init__(self, people):
+        super().__init__(people=people)
+        self.pool_pulls = []
+        self.searches = 0
+    async def pull_contact_pool(self, domain, job_titles=None, canada_only=False):
+        self.pool_pulls.append((domain, canada_only))
+        return {"success": True, "people": self._people, "error": None, "calls": 2}
+    async def search_contacts(self, domain, job_titles=None, max_results=25, canada_only=False):
+        self.searches += 1
+        return await super().search_contacts(domain, job_titles, max_results)
+
+
+_POOL_PEOPLE = [
+    {"name": "Tia Tech", "title": "CTO", "management_level": "C-Level", "person_id": "1"},
+    {"name": "Fay Fin", "title": "Chief Financial Officer", "management_level": "C-Level", "person_id": "2"},
+    {"name": "Ivy It", "title": "Vice President, Information Technology", "management_level": "VP-Level", "person_id": "3"},
+]
+
+
+def test_query_uses_one_pool_pull_for_all_personas():
+    zi = PoolZI(_POOL_PEOPLE)
+    lp = LiveProviders(zi_client=zi)
+
+    async def all_personas():
+        from bi_resolver import PERSONAS
+        return await asyncio.gather(*(lp.query(p, "zoominfo", "csuite", CANON, False)
+                                      for p in PERSONAS))
+
+    results = run(all_personas())
+    assert zi.pool_pulls == [("acme.com", False)] and zi.searches == 0
+    assert all(results)  # level top-up gives every persona candidates
+
+
+def test_pool_matches_acronyms_and_vp_phrasing():
+    lp = LiveProviders(zi_client=PoolZI(_POOL_PEOPLE))
+    cto = run(lp.query("CTO", "zoominfo", "csuite", CANON, False))
+    assert cto[0].name == "Tia Tech"
+    cio = run(lp.query("CIO", "zoominfo", "csuite", CANON, False))
+    assert "Ivy It" in [r.name for r in cio]
+
+
+def test_geo_scopes_get_separate_pools():
+    zi = PoolZI(_POOL_PEOPLE)
+    lp = LiveProviders(zi_client=zi)
+    run(lp.query("CTO", "zoominfo", "csuite", CANON, True))
+    run(lp.query("CFO", "zoominfo", "csuite", CANON, False))
+    assert zi.pool_pulls == [("acme.com", True), ("acme.com", False)]
+
+
+# --- adjacency verdict memo + batched judging ----------------------------------
+
+class CountingMessages(FakeMessages):
+    def __init__(self, text):
+        super().__init__(text)
+        self.calls = []
+    async def create(self, **kwargs):
+        self.calls.append(kwargs)
+        return _Resp(self._text)
+
+
+def _counting_anthropic(text):
+    client = FakeAnthropic(text)
+    client.messages = CountingMessages(text)
+    return client
+
+
+def test_concurrent_novel_titles_are_judged_in_one_batch_and_memoized():
+    from adjacency_memo import AdjacencyMemo
+    client = _counting_anthropic('{"verdicts": [{"i": 0, "yes": true}, {"i": 1, "yes": false}]}')
+    lp = LiveProviders(anthropic_client=client, adjacency_memo=AdjacencyMemo(durable=False))
+
+    async def judge_both():
+        return await asyncio.gather(lp.judge_adjacency("SVP Digital Workplace", "CIO"),
+                                    lp.judge_adjacency("Head of Catering", "CTO"))
+
+    assert run(judge_both()) == [True, False]
+    assert len(client.messages.calls) == 1
+    # Memo hit: no further LLM call.
+    assert run(lp.judge_adjacency("svp digital workplace", "CIO")) is True
+    assert len(client.messages.calls) == 1
+
+
+def test_unanswered_verdict_is_not_memoized():
+    from adjacency_memo import AdjacencyMemo
+    memo = AdjacencyMemo(durable=False)
+    lp = LiveProviders(anthropic_client=_counting_anthropic(""), adjacency_memo=memo)
+    assert run(lp.judge_adjacency("Head of Enterprise Apps", "CIO")) is False
+    assert len(memo) == 0
+
+
+# --- bounded-parallel web enrichment -------------------------------------------
+
+class SlowWebMessages(FakeMessages):
+    """Web-search fake: counts calls and in-flight concurrency."""
+    def __init__(self, text, delay=0.01):
+        super().__init__(text)
+        self.delay = delay
+        self.calls = 0
+        self.in_flight = 0
+        self.max_in_flight = 0
+    async def create(self, **kwargs):
+        self.calls += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        await asyncio.sleep(self.delay)
+        self.in_flight -= 1
+        return _Resp(self._text)
+
+
+def _web_lp(text, delay=0.01):
+    client = FakeAnthropic(text)
+    client.messages = SlowWebMessages(text, delay)
+    return LiveProviders(anthropic_client=client), client.messages
+
+
+def test_enrich_final_web_step_is_bounded_concurrent_and_cached():
+    import providers_live
+    providers_live._WEB_ENRICH_CACHE.clear()
+    lp, msgs = _web_lp('{"linkedin_url": "https://li/x", "start_date": "2023", '
+                       '"extracted_snippet": "joined 2023", "source_url": "u"}')
+    people = [StakeholderRecord(persona="CTO", name=f"Person {i}") for i in range(8)]
+    run(lp.enrich_final(people, "Acme"))
+    assert msgs.calls == 8
+    assert 1 < msgs.max_in_flight <= providers_live.WEB_ENRICH_CONCURRENCY
+    assert all(p.linkedin_url == "https://li/x" for p in people)
+
+    # Same (name, company) in a later job: served from the cache, no new search.
+    again = StakeholderRecord(persona="CTO", name="person 0")
+    lp2, msgs2 = _web_lp("{}")
+    run(lp2.enrich_final([again], "ACME"))
+    assert msgs2.calls == 0 and again.start_date == "2023"
+    providers_live._WEB_ENRICH_CACHE.clear()
+
+
+def test_enrich_final_web_step_times_out_per_contact():
+    import providers_live
+    providers_live._WEB_ENRICH_CACHE.clear()
+    old = providers_live.WEB_ENRICH_TIMEOUT_SECONDS
+    providers_live.WEB_ENRICH_TIMEOUT_SECONDS = 0.01
+    try:
+        lp, _ = _web_lp('{"extracted_snippet": "x", "linkedin_url": "https://li/slow"}', delay=1.0)
+        rec = StakeholderRecord(persona="CTO", name="Slow Search")
+        run(lp.enrich_final([rec], "Acme"))
+    finally:
+        providers_live.WEB_ENRICH_TIMEOUT_SECONDS = old
+    assert rec.linkedin_url == "" and "web_enrich_timed_out" in rec.marks
+    assert not providers_live._WEB_ENRICH_CACHE  # timeouts are not cached
@@ -0,0 +1,160 @@
+"""Tests for job payload projection, ETag/304 and compression (user-facing
+contract of /job-status and /job-result query params)."""
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "worker"))
+
+from response_payload import (  # noqa: E402
+    SUMMARY_EXCLUDE, dumps, etag_for, etag_matches, parse_field_list, project,
+)
+
+PAYLOAD = {
+    "job_id": "j",
+    "status": "completed",
+    "apollo_data": {"raw": 1},
+    "council_metadata": {"specialist_results": [1, 2, 3]},
+    "result": {"slideshow_url": "u", "industry": "Tech",
+               "validated_data": {"ceo": "A", "_council_metadata": {"x": 1}}},
+}
+
+
+def test_parse_field_list():
+    assert parse_field_list(" a, b.c,,d ") == ["a", "b.c", "d"]
+    assert parse_field_list(None) == []
+
+
+def test_fields_keeps_only_dotted_paths():
+    out = project(PAYLOAD, fields=["status", "result.slideshow_url", "nope.x"])
+    assert out == {"status": "completed", "result": {"slideshow_url": "u"}}
+
+
+def test_shorter_path_wins():
+    out = project(PAYLOAD, fields=["result.industry", "result"])
+    assert out["result"] == PAYLOAD["result"]
+
+
+def test_exclude_drops_nested_paths_without_mutating():
+    out = project(PAYLOAD, exclude=["apollo_data", "result.validated_data._council_metadata"])
+    assert "apollo_data" not in out
+    assert out["result"]["validated_data"] == {"ceo": "A"}
+    assert PAYLOAD["result"]["validated_data"]["_council_metadata"] == {"x": 1}
+
+
+def test_summary_exclude_drops_blobs():
+    out = project(PAYLOAD, exclude=SUMMARY_EXCLUDE)
+    assert set(out) == {"job_id", "status", "result"}
+
+
+def test_dumps_is_compact_json():
+    assert json.loads(dumps({"a": [1, 2]})) == {"a": [1, 2]}
+    assert b" " not in dumps({"a": [1, 2]})
+
+
+def test_etag_weak_comparison():
+    tag = etag_for(b"body")
+    assert tag.startswith('W/"')
+    assert etag_matches(tag, tag)
+    assert etag_matches(tag[2:], tag)
+    assert etag_matches('"other", ' + tag, tag)
+    assert etag_matches("*", tag)
+    assert not etag_matches('"other"', tag)
+    assert not etag_matches(None, tag)
+
+
+def _client_with_job(job_id):
+    import production_main as pm
+    from fastapi.testclient import TestClient
+    pm.jobs_store[job_id] = {
+        "status": "completed", "progress": 100, "current_step": "Complete!",
+        "created_at": "2026-06-24T00:00:00Z",
+        "result": {"success": True, "slideshow_url": "u", "blob": "x" * 5000},
+        "apollo_data": {"raw": "y" * 5000},
+    }
+    return pm, TestClient(pm.app)
+
+
+def test_job_status_projection_and_304():
+    pm, client = _client_with_job("test-proj-001")
+    try:
+        resp = client.get("/job-status/test-proj-001", params={"fields": "status,result.slideshow_url"})
+        assert resp.status_code == 200
+        assert resp.json() == {"status": "completed", "result": {"slideshow_url": "u"}}
+        etag = resp.headers["etag"]
+        again = client.get("/job-status/test-proj-001",
+                           params={"fields": "status,result.slideshow_url"},
+                           headers={"If-None-Match": etag})
+        assert again.status_code == 304
+        assert again.content == b""
+
+        summary = client.get("/job-status/test-proj-001", params={"view": "summary"}).json()
+        assert "apollo_data" not in summary and summary["status"] == "completed"
+    finally:
+        pm.jobs_store.pop("test-proj-001", None)
+
+
+def test_job_result_is_compressed_when_large():
+    pm, client = _client_with_job("test-proj-002")
+    try:
+        resp = client.get("/job-result/test-proj-002", headers={"Accept-Encoding": "gzip"})
+        assert resp.status_code == 200
+        assert resp.headers.get("content-encoding") == "gzip"
+        assert resp.json()["result"]["slideshow_url"] == "u"
+    finally:
+        pm.jobs_store.pop("test-proj-002", None)
+
+
+def test_persisted_rows_never_leak_the_frozen_debug_payload(monkeypatch):
+    import time
+
+    import production_main as pm
+    from fastapi.testclient import TestClient
+    row = {"status": "completed", "company_name": "Acme", "updated_at": "2026-06-24T00:00:00Z",
+           "result": {"success": True, "slideshow_url": "u", "debug_data": {"big": "z" * 100}}}
+
+    async def fetch(job_id):
+        return row
+
+    monkeypatch.setattr(pm, "_fetch_job_results_row", fetch)
+    client = TestClient(pm.app)
+    try:
+        pm._persisted_row_cache().put("test-proj-003", row, time.monotonic())
+        status = client.get("/job-status/test-proj-003").json()
+        assert status["status"] == "completed" and "debug_data" not in status["result"]
+        pm._persisted_row_cache().invalidate("test-proj-003")   # stale: served while refreshing
+        assert client.get("/job-status/test-proj-003").json()["status"] == "completed"
+
+        body = client.get("/job-result/test-proj-004").json()
+        assert body["source"] == "supabase" and body["result"] == {"success": True, "slideshow_url": "u"}
+        assert pm.jobs_store["test-proj-004"]["debug_data"] == {"big": "z" * 100}
+    finally:
+        pm._persisted_row_cache().invalidate("test-proj-003")
+        pm.jobs_store.pop("test-proj-003", None)
+        pm.jobs_store.pop("test-proj-004", None)
+
+
+async def test_unknown_job_is_pending_only_while_its_first_lookup_runs(monkeypatch):
+    import asyncio
+
+    import pytest
+    from fastapi import HTTPException
+
+    import production_main as pm
+    found = asyncio.Event()
+
+    async def fetch(job_id):
+        await found.wait()
+        return None
+
+    monkeypatch.setattr(pm, "_fetch_job_results_row", fetch)
+    assert pm._resolve_job_status("test-proj-005").status == "pending"
+    found.set()
+    await pm._BACKGROUND_HYDRATE_TASKS["test-proj-005"]
+    with pytest.raises(HTTPException) as fresh_miss:
+        pm._resolve_job_status("test-proj-005")
+    pm._persisted_row_cache().invalidate("test-proj-005")   # expired miss: refresh, still 404
+    with pytest.raises(HTTPException) as expired_miss:
+        pm._resolve_job_status("test-proj-005")
+    assert fresh_miss.value.status_code == expired_miss.value.status_code == 404
+    await pm._BACKGROUND_HYDRATE_TASKS.get("test-proj-005", asyncio.sleep(0))
@@ -0,0 +1,103 @@
+"""Tests for the pooled async Supabase client (worker/supabase_pool.py).
+
+A fake async client records the PostgREST calls so the pool's reuse/close
+behaviour and production_main's batched writes are checked without Supabase.
+"""
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "worker"))
+
+from supabase_pool import SupabasePool  # noqa: E402
+
+
+class _FakeQuery:
+    def __init__(self, client, table):
+        self._client = client
+        self._table = table
+
+    def insert(self, rows):
+        self._client.calls.append(("insert", self._table, rows))
+        return self
+
+    def upsert(self, row, **kwargs):
+        self._client.calls.append(("upsert", self._table, row))
+        return self
+
+    async def execute(self):
+        return type("Res", (), {"data": None})()
+
+
+class _FakePostgrest:
+    def __init__(self):
+        self.closed = False
+
+    async def aclose(self):
+        self.closed = True
+
+
+class _FakeClient:
+    def __init__(self):
+        self.calls = []
+        self.postgrest = _FakePostgrest()
+
+    def table(self, name):
+        return _FakeQuery(self, name)
+
+
+def _pool(created):
+    async def factory(url, key):
+        client = _FakeClient()
+        created.append(client)
+        return client
+    return SupabasePool("http://sb", "key", factory=factory)
+
+
+def test_client_is_created_once_and_reused():
+    created = []
+    pool = _pool(created)
+
+    async def run():
+        return await pool.client(), await pool.client()
+
+    a, b = asyncio.run(run())
+    assert a is b and len(created) == 1
+
+
+def test_unconfigured_pool_returns_none():
+    assert asyncio.run(SupabasePool(None, None).client()) is None
+
+
+def test_aclose_closes_session_and_is_idempotent():
+    created = []
+    pool = _pool(created)
+
+    async def run():
+        await pool.client()
+        await pool.aclose()
+        await pool.aclose()
+
+    asyncio.run(run())
+    assert created[0].postgrest.closed
+
+
+def test_store_raw_data_is_one_batched_insert():
+    import production_main as pm
+    import worker.supabase_pool as sp
+
+    created = []
+    old = (pm.SUPABASE_URL, pm.SUPABASE_KEY)
+    pm.SUPABASE_URL, pm.SUPABASE_KEY = "http://sb", "key"
+    sp.set_pool(_pool(created))
+    try:
+        asyncio.run(pm.store_raw_data("Acme", {"a": 1}, {"p": 2}, {"h": 3}))
+    finally:
+        pm.SUPABASE_URL, pm.SUPABASE_KEY = old
+        sp.set_pool(None)
+
+    calls = created[0].calls
+    assert len(calls) == 1
+    op, table, rows = calls[0]
+    assert (op, table) == ("insert", "raw_data")
+    assert [r["source"] for r in rows] == ["apollo", "peopledatalabs", "hunter"]
@@ -0,0 +1,52 @@
+"""Tests for per-job span tracing (worker/tracing.py)."""
+import asyncio
+import json
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), "..", "worker"))
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from worker import cost_meter, tracing  # noqa: E402
+
+
+async def _vendor(name, delay):
+    with tracing.span(name, "vendor"):
+        await asyncio.sleep(delay)
+
+
+async def _job(job_id):
+    cost_meter.set_job(job_id)
+    tracing.start_job(job_id)
+    tracing.mark_stage("fetch")
+    await asyncio.gather(_vendor("fast", 0.001), _vendor("slow", 0.02))
+    tracing.mark_stage("council")
+    tracing.record_span("rate_limit_wait", "wait", 0.005)
+    tracing.finish_job(job_id)
+
+
+def test_critical_path_follows_last_finishing_child():
+    asyncio.new_event_loop().run_until_complete(_job("trace-1"))
+    summary = tracing.summarize("trace-1")
+    assert summary["complete"]
+    assert [s["name"] for s in summary["critical_path"]] == ["profile_job", "council", "rate_limit_wait"]
+    fetch = next(s for s in summary["spans"] if s["name"] == "fetch")
+    slow = next(s for s in summary["spans"] if s["name"] == "slow")
+    assert slow["parent_id"] == fetch["span_id"]          # gathered calls nest under the stage
+    assert summary["by_kind"]["vendor"]["count"] == 2
+
+
+def test_noop_outside_a_job_and_otlp_export(tmp_path, monkeypatch):
+    cost_meter.current_job_id.set(None)
+    with tracing.span("orphan") as s:
+        tracing.annotate(status_code=200)
+    assert s.attributes == {"status_code": 200}
+    assert tracing.summarize("") is None        # detached: timed, but not kept
+
+    asyncio.new_event_loop().run_until_complete(_job("trace-2"))
+    out = tmp_path / "traces.jsonl"
+    monkeypatch.setattr(tracing, "EXPORT_PATH", str(out))
+    asyncio.new_event_loop().run_until_complete(tracing.export_job("trace-2"))
+    payload = json.loads(out.read_text().splitlines()[0])
+    spans = payload["resourceSpans"][0]["scopeSpans"][0]["spans"]
+    assert len(spans) == 6 and len({s["traceId"] for s in spans}) == 1
@@ -0,0 +1,157 @@
+"""Durable memo of Haiku title-adjacency verdicts.
+
+`LiveProviders.judge_adjacency` asks Haiku whether a title `classify_title_proximity`
+can't place ("SVP Digital Workplace", "Head of Enterprise Apps") belongs to a
+persona's domain. The same titles recur across thousands of companies, so every
+verdict is kept here keyed by (normalized title, persona) and consulted before
+any LLM call:
+
+  * in process: a dict shared by every job (`get_memo()`),
+  * durably: the `title_adjacency_verdicts` Supabase table (migration
+    backend/migrations/2026-10-18_title_adjacency_verdicts.sql), loaded once per
+    process and written through after each batch of new verdicts,
+  * promotion: a positive verdict reused `PROMOTE_AFTER_HITS` times is promoted
+    into `bi_resolver.LEARNED_ADJACENT`, so `classify_title_proximity` answers it
+    deterministically from then on.
+
+Persistence is best-effort: without Supabase (or the table) the memo still works
+in memory.
+"""
+from __future__ import annotations
+
+import asyncio
+import logging
+import os
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+from bi_resolver import _normalize_title, promote_adjacent_titles
+
+logger = logging.getLogger(__name__)
+
+TABLE = "title_adjacency_verdicts"
+# Reuses of a positive verdict before it joins the deterministic table.
+PROMOTE_AFTER_HITS = int(os.getenv("ADJACENCY_PROMOTE_AFTER_HITS", "5"))
+# Rows per select while loading: PostgREST caps an unranged select at its
+# max-rows (1000 on Supabase), so the load pages until a short page.
+LOAD_PAGE_SIZE = 1000
+
+Key = Tuple[str, str]
+
+
+def memo_key(title: str, persona: str) -> Key:
+    return (_normalize_title(title), persona)
+
+
+class AdjacencyMemo:
+    """(normalized title, persona) -> verdict, with reuse counts for promotion."""
+
+    def __init__(self, *, promote_after: int = PROMOTE_AFTER_HITS, durable: bool = True):
+        self.promote_after = promote_after
+        self.durable = durable
+        self._verdicts: Dict[Key, bool] = {}
+        self._hits: Dict[Key, int] = {}
+        self._dirty: set = set()
+        self._load_task: Optional[asyncio.Future] = None
+
+    def __len__(self) -> int:
+        return len(self._verdicts)
+
+    def get(self, title: str, persona: str) -> Optional[bool]:
+        """Memoized verdict (None if never judged). Counts the reuse and
+        promotes a positive verdict once it crosses the threshold."""
+        key = memo_key(title, persona)
+        verdict = self._verdicts.get(key)
+        if verdict is None:
+            return None
+        self._hits[key] = self._hits.get(key, 0) + 1
+        self._dirty.add(key)
+        self._maybe_promote(key)
+        return verdict
+
+    def put(self, title: str, persona: str, verdict: bool) -> Key:
+        key = memo_key(title, persona)
+        self._verdicts[key] = bool(verdict)
+        self._hits.setdefault(key, 0)
+        self._dirty.add(key)
+        return key
+
+    def _maybe_promote(self, key: Key) -> None:
+        if self._verdicts.get(key) and self._hits.get(key, 0) >= self.promote_after:
+            promote_adjacent_titles(key[1], [key[0]])
+
+    # -- persistence ----------------------------------------------------------
+    def load_rows(self, rows: Iterable[dict]) -> None:
+        """Merge stored rows (title, persona, verdict, hits); promote eligible ones."""
+        for row in rows or []:
+            key = (str(row.get("title") or ""), str(row.get("persona") or ""))
+            if not key[0] or not key[1]:
+                continue
+            self._verdicts[key] = bool(row.get("verdict"))
+            self._hits[key] = max(self._hits.get(key, 0), int(row.get("hits") or 0))
+            self._maybe_promote(key)
+
+    def rows(self, keys: Iterable[Key]) -> List[dict]:
+        return [{"title": k[0], "persona": k[1], "verdict": self._verdicts[k],
+                 "hits": self._hits.get(k, 0)}
+                for k in keys if k in self._verdicts]
+
+    async def ensure_loaded(self) -> None:
+        """Load the durable table once per process (best-effort). Concurrent
+        callers all wait for the same load, so none misses a stored verdict."""
+        if not self.durable:
+            return
+        if self._load_task is None:
+            self._load_task = asyncio.ensure_future(self._load())
+        await asyncio.shield(self._load_task)
+
+    async def _load(self) -> None:
+        try:
+            sb = await _supabase_client()
+            if sb is None:
+                return
+            start = 0
+            while True:
+                res = await (sb.table(TABLE).select("title,persona,verdict,hits")
+                             .order("title").order("persona")
+                             .range(start, start + LOAD_PAGE_SIZE - 1).execute())
+                page = getattr(res, "data", None) or []
+                self.load_rows(page)
+                if len(page) < LOAD_PAGE_SIZE:
+                    break
+                start += LOAD_PAGE_SIZE
+            logger.info("Loaded %d title-adjacency verdicts", len(self))
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Could not load %s (apply its migration?): %s", TABLE, e)
+
+    async def persist(self) -> None:
+        """Upsert new verdicts and updated reuse counts in one request (best-effort)."""
+        keys, self._dirty = self._dirty, set()
+        rows = self.rows(keys)
+        if not rows or not self.durable:
+            return
+        try:
+            sb = await _supabase_client()
+            if sb is None:
+                return
+            await sb.table(TABLE).upsert(rows, on_conflict="title,persona").execute()
+        except Exception as e:  # noqa: BLE001
+            logger.warning("Could not persist %d adjacency verdicts: %s", len(rows), e)
+
+
+async def _supabase_client() -> Any:
+    try:
+        from worker.supabase_pool import get_pool
+    except ImportError:
+        from supabase_pool import get_pool  # bare path (v3.1 inserts worker/ on sys.path)
+    return await get_pool().client()
+
+
+_MEMO: Optional[AdjacencyMemo] = None
+
+
+def get_memo() -> AdjacencyMemo:
+    """The process-wide memo shared by every job."""
+    global _MEMO
+    if _MEMO is None:
+        _MEMO = AdjacencyMemo()
+    return _MEMO
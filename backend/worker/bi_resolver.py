@@ -145,9 +145,34 @@ def classify_title_proximity(title: str, persona: str) -> Optional[int]:
         return int(Proximity.EXACT)
     if norm in bucket["adjacent"]:  # type: ignore[operator]
         return int(Proximity.CANONICAL)
+    if norm in LEARNED_ADJACENT.get(persona, ()):
+        return int(Proximity.LLM_ADJACENT)
     return None
 
 
+# Titles promoted from repeatedly-confirmed Haiku adjacency verdicts (see
+# worker/adjacency_memo.py). They classify as LLM_ADJACENT — exactly what the
+# judge would say — without the call. Normalized titles, per persona.
+LEARNED_ADJACENT: dict[str, set[str]] = {p: set() for p in PERSONA_TITLE_BUCKETS}
+
+
+def promote_adjacent_titles(persona: str, titles) -> int:
+    """Add confirmed-adjacent titles to the deterministic fast path. Returns the
+    number newly added (titles already exact/canonical are skipped)."""
+    bucket = PERSONA_TITLE_BUCKETS.get(persona)
+    if not bucket:
+        return 0
+    learned = LEARNED_ADJACENT.setdefault(persona, set())
+    added = 0
+    for t in titles:
+        norm = _normalize_title(t)
+        if not norm or norm == bucket["exact"] or norm in bucket["adjacent"] or norm in learned:  # type: ignore[operator]
+            continue
+        learned.add(norm)
+        added += 1
+    return added
+
+
 # ---------------------------------------------------------------------------
 # Data contracts
 # ---------------------------------------------------------------------------
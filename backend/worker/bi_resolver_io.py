@@ -18,6 +18,7 @@ import asyncio
 import re
 from typing import Awaitable, Callable, Optional, Protocol
 
+from contact_identity import identity_keys
 from bi_resolver import (
     PERSONAS, FLOOR_PRIORITY, MIN_SLIDES, ENRICH_BUDGET_PER_TIER, Proximity,
     StakeholderRecord, SelectionResult, classify_title_proximity,
@@ -57,27 +58,15 @@ def _trace(trace, **e):
         trace.append(e)
 
 
-def _dedupe_key(rec) -> Optional[str]:
-    """Cross-slide identity key: LinkedIn first, then email, then name — so a
-    contact with no LinkedIn URL still can't headline multiple persona slides."""
-    for v in (rec.linkedin_url, rec.email, rec.name):
-        if v and str(v).strip():
-            return str(v).strip().lower()
-    return None
-
-
 def _identities(rec) -> set:
-    """ALL identities a contact can be matched on (LinkedIn, email, normalized name).
+    """ALL identities a contact can be matched on (`contact_identity.identity_keys`:
+    email, LinkedIn slug, exact name with nicknames).
 
     Cross-slide dedupe matches on ANY of these — otherwise the same person can
     headline two personas when one source carries a LinkedIn URL and another
     doesn't (e.g. a ZI record vs the same exec returned by the web agent with a
     differently-formatted LinkedIn URL → the name still catches it)."""
-    out: set = set()
-    for v in (getattr(rec, "linkedin_url", ""), getattr(rec, "email", ""), getattr(rec, "name", "")):
-        if v and str(v).strip():
-            out.add(str(v).strip().lower())
-    return out
+    return identity_keys(rec)
 
 
 def _is_used(rec, used: set) -> bool:
@@ -108,13 +97,20 @@ def _is_canada_hq(canonical) -> bool:
 
 async def _grade_csuite_candidates(persona: str, raw: list[StakeholderRecord],
                                    providers: Providers, trace) -> list[StakeholderRecord]:
-    """Assign proximity to C-suite candidates; Haiku-judge novel titles."""
+    """Assign proximity to C-suite candidates; Haiku-judge novel titles.
+
+    Novel titles are judged concurrently; marks/trace entries are applied in
+    candidate order afterwards so the outcome matches a serial pass."""
+    base = [classify_title_proximity(r.title, persona) for r in raw]
+    novel = [i for i, prox in enumerate(base) if prox is None]
+    verdicts = await asyncio.gather(*(providers.judge_adjacency(raw[i].title, persona)
+                                      for i in novel))
+    judged = dict(zip(novel, verdicts))
     graded: list[StakeholderRecord] = []
-    for r in raw:
-        prox = classify_title_proximity(r.title, persona)
+    for i, r in enumerate(raw):
+        prox = base[i]
         if prox is None:
-            ok = await providers.judge_adjacency(r.title, persona)
-            if ok:
+            if judged[i]:
                 prox = int(Proximity.LLM_ADJACENT)
             else:
                 # Not an obvious proxy — but KEEP it ranked last so a real ZI
@@ -130,6 +126,71 @@ async def _grade_csuite_candidates(persona: str, raw: list[StakeholderRecord],
     return graded
 
 
+class PersonaTiers:
+    """Memoized query+grade results for one persona's cascade, tier by tier.
+
+    Fetching a tier (provider query + proximity grading) is the only I/O in the
+    cascade and does not depend on other personas, so `run_stage3` prefetches
+    every persona concurrently. Selection (cross-slide dedupe) then replays the
+    cascade serially over these cached tiers, in PERSONAS order, so results and
+    trace are identical to a fully sequential run. A tier is fetched at most
+    once; the replay fetches further tiers on demand only when dedupe rejects
+    every candidate the prefetch stopped at.
+    """
+
+    def __init__(self, persona: str, providers: Providers, canonical, canada_only: bool,
+                 *, enrich_budget_per_tier: int = ENRICH_BUDGET_PER_TIER):
+        self.persona = persona
+        self._providers = providers
+        self._canonical = canonical
+        self._canada_only = canada_only
+        self._budget = enrich_budget_per_tier
+        # index -> (ranked, grading trace entries) | None (short-circuit skipped)
+        self._tiers: dict[int, Optional[tuple[list[StakeholderRecord], list]]] = {}
+        self._raw_n: dict[tuple[str, str], int] = {}
+
+    async def tier(self, i: int) -> Optional[tuple[list[StakeholderRecord], list]]:
+        """(ranked candidates, grading trace) for TIERS[i]; None when skipped.
+        Tiers must be requested in order (the short-circuit reads earlier ones)."""
+        if i in self._tiers:
+            return self._tiers[i]
+        source, kind = TIERS[i]
+        # Mitigation 1 — short-circuit: ZI C-suite AND VP both empty -> the company
+        # simply doesn't have this role senior; skip ZI Director, jump to Apollo.
+        if (source == "zoominfo" and kind == "director"
+                and self._raw_n.get(("zoominfo", "csuite")) == 0
+                and self._raw_n.get(("zoominfo", "vp")) == 0):
+            self._tiers[i] = None
+            return None
+
+        raw = await self._providers.query(self.persona, source, kind,
+                                          self._canonical, self._canada_only)
+        for r in raw:
+            r.source = source
+            r.tier = _tier_depth(source, kind)
+        self._raw_n[(source, kind)] = len(raw)
+
+        grading_trace: list = []
+        if kind == "csuite":
+            cands = await _grade_csuite_candidates(self.persona, raw, self._providers,
+                                                   grading_trace)
+        else:
+            for r in raw:
+                r.proximity = int(Proximity.VP if kind == "vp" else Proximity.DIRECTOR)
+            cands = raw
+        self._tiers[i] = (rank_by_proximity(cands)[:self._budget], grading_trace)
+        return self._tiers[i]
+
+    async def prefetch(self) -> None:
+        """Fetch tiers in cascade order up to the first with a real role match
+        (ignoring dedupe) — the tier a serial cascade stops at unless an earlier
+        persona already took that contact."""
+        for i in range(len(TIERS)):
+            got = await self.tier(i)
+            if got and any(c.proximity <= int(Proximity.DIRECTOR) for c in got[0]):
+                return
+
+
 async def select_persona_contacts_io(
     persona: str,
     providers: Providers,
@@ -139,41 +200,29 @@ async def select_persona_contacts_io(
     *,
     enrich_budget_per_tier: int = ENRICH_BUDGET_PER_TIER,
     trace: Optional[list] = None,
+    tiers: Optional[PersonaTiers] = None,
 ) -> tuple[list[StakeholderRecord], list[StakeholderRecord]]:
     """Async surgical cascade for one persona. Lazy across tiers, stops on qualify.
 
     Reuses the pure predicates from `bi_resolver` for every decision so the
-    behavior matches the unit-tested selection core exactly.
+    behavior matches the unit-tested selection core exactly. `tiers` supplies
+    prefetched query/grade results (see `PersonaTiers`); by default they are
+    fetched lazily here.
     """
+    if tiers is None:
+        tiers = PersonaTiers(persona, providers, canonical, canada_only,
+                             enrich_budget_per_tier=enrich_budget_per_tier)
     selected: list[StakeholderRecord] = []
     examined: list[StakeholderRecord] = []
-    zi_csuite_n: Optional[int] = None
-    zi_vp_n: Optional[int] = None
 
-    for source, kind in TIERS:
-        # Mitigation 1 — short-circuit: ZI C-suite AND VP both empty -> the company
-        # simply doesn't have this role senior; skip ZI Director, jump to Apollo.
-        if source == "zoominfo" and kind == "director" and zi_csuite_n == 0 and zi_vp_n == 0:
+    for i, (source, kind) in enumerate(TIERS):
+        got = await tiers.tier(i)
+        if got is None:
             _trace(trace, persona=persona, source=source, outcome="short_circuit_skip_zi_director")
             continue
-
-        raw = await providers.query(persona, source, kind, canonical, canada_only)
-        for r in raw:
-            r.source = source
-            r.tier = _tier_depth(source, kind)
-        if source == "zoominfo" and kind == "csuite":
-            zi_csuite_n = len(raw)
-        if source == "zoominfo" and kind == "vp":
-            zi_vp_n = len(raw)
-
-        if kind == "csuite":
-            cands = await _grade_csuite_candidates(persona, raw, providers, trace)
-        else:
-            for r in raw:
-                r.proximity = int(Proximity.VP if kind == "vp" else Proximity.DIRECTOR)
-            cands = raw
-
-        ranked = rank_by_proximity(cands)[:enrich_budget_per_tier]
+        ranked, grading_trace = got
+        if trace is not None:
+            trace.extend(grading_trace)
         # Everything we looked at is kept for the dashboard "examined" catalogue.
         examined.extend(ranked)
 
@@ -223,17 +272,26 @@ async def run_stage3(
     canonical,
     *,
     canada_only: bool = False,
+    allow_geo_topup: Optional[Callable[[], bool]] = None,
 ) -> SelectionResult:
-    """Full async Stage 3: per-persona cascade + global floor-fill + score."""
+    """Full async Stage 3: per-persona cascade + global floor-fill + score.
+
+    Query and grading run for every persona concurrently (the providers share
+    one rate limiter); selection/dedupe then runs serially in PERSONAS order,
+    so the result is identical to a sequential cascade. `allow_geo_topup` is
+    asked only when the geo top-up would run (a cost budget may refuse it)."""
     slide_contacts: dict[str, list[StakeholderRecord]] = {p: [] for p in PERSONAS}
     catalogue: dict[str, list[StakeholderRecord]] = {p: [] for p in PERSONAS}
     trace: list[dict] = []
     warnings: list[str] = []
     used: set[str] = set()
 
+    tiers = {p: PersonaTiers(p, providers, canonical, canada_only) for p in PERSONAS}
+    await asyncio.gather(*(t.prefetch() for t in tiers.values()))
     for persona in PERSONAS:
         sel, exm = await select_persona_contacts_io(
-            persona, providers, canonical, canada_only, used, trace=trace)
+            persona, providers, canonical, canada_only, used, trace=trace,
+            tiers=tiers[persona])
         slide_contacts[persona] = sel
         catalogue[persona] = exm
 
@@ -284,15 +342,17 @@ async def run_stage3(
     # then enriches and selects/pads from it, so the same >=2-field + hard-floor rules
     # apply uniformly to Canadian and topped-up contacts.
     real_total = sum(1 for v in slide_contacts.values() for c in v if not c.is_sentinel)
-    if canada_only and not _is_canada_hq(canonical) and real_total < MIN_SLIDES:
+    needs_topup = canada_only and not _is_canada_hq(canonical) and real_total < MIN_SLIDES
+    if needs_topup and allow_geo_topup is not None and not allow_geo_topup():
+        warnings.append("geo_topup_skipped_budget")
+    elif needs_topup:
         warnings.append("geo_topup_non_canada_hq")
+        # Widened (non-Canada) queries/grades run concurrently; merging stays serial.
+        widened = {p: PersonaTiers(p, providers, canonical, False) for p in PERSONAS}
+        await asyncio.gather(*(t.tier(0) for t in widened.values()))
         for persona in PERSONAS:
-            raw = await providers.query(persona, "zoominfo", "csuite", canonical, False)
-            for r in raw:
-                r.source = "zoominfo"
-                r.tier = _tier_depth("zoominfo", "csuite")
-            graded = await _grade_csuite_candidates(persona, raw, providers, trace)
-            ranked = rank_by_proximity(graded)[:ENRICH_BUDGET_PER_TIER]
+            ranked, grading_trace = await widened[persona].tier(0)
+            trace.extend(grading_trace)
             existing = {k for c in catalogue[persona] for k in _identities(c)}
             added = False
             for r in ranked:
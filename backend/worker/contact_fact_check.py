@@ -0,0 +1,142 @@
+"""Rule table, chunking and id-indexed remap for step 2.83 (pure, stdlib-only).
+
+`production_main.fact_check_contacts` used to hard-filter contacts with inline
+if/else, send every survivor in one prompt, and map the LLM's scores back by
+re-scanning names. On large domains the prompt grew with the contact list and the
+remap was name-keyed (two "John Smith"s collided). Here:
+
+  * `HARD_RULES` — the pre-LLM ground rules as a table of compiled predicates,
+    applied in one pass by `apply_hard_rules` (first failing rule wins),
+  * `assign_ids` / `chunks` — each qualified contact gets a stable id ("c0",
+    "c1", ...) in list order; the prompt carries the id and is split into chunks
+    that production_main sends concurrently,
+  * `apply_scores` — a dict keyed by id (name as fallback for replies that drop
+    it) maps verdicts back in O(n); `MIN_SCORE` keeps the 0.15 cut.
+
+production_main owns the prompt, the OpenAI call and the concurrency.
+"""
+from __future__ import annotations
+
+import logging
+from typing import Callable, Dict, Iterable, List, NamedTuple, Optional, Sequence, Tuple
+
+logger = logging.getLogger(__name__)
+
+# Contacts scoring below this are dropped after LLM validation.
+MIN_SCORE = 0.15
+# Score when the LLM gave no verdict for a contact (or its chunk failed).
+DEFAULT_SCORE = 0.7
+
+_PHONE_FIELDS = ("phone", "direct_phone", "mobile_phone", "company_phone")
+
+
+class Rule(NamedTuple):
+    name: str
+    rejects: Callable[[dict], bool]
+    note: str
+    log_label: str
+
+
+def linkedin_of(contact: dict) -> str:
+    return contact.get("linkedin_url") or contact.get("linkedin") or ""
+
+
+def _has_phone(contact: dict) -> bool:
+    return any(contact.get(f) for f in _PHONE_FIELDS)
+
+
+# Ground rules (applied BEFORE the LLM), in order:
+#   (a) No LinkedIn -> omit
+#   (b) LinkedIn present but no phone AND no email -> omit
+HARD_RULES: Tuple[Rule, ...] = (
+    Rule("no_linkedin", lambda c: not linkedin_of(c),
+         "Filtered: no LinkedIn URL", "no LinkedIn"),
+    Rule("no_contact_info", lambda c: not _has_phone(c) and not c.get("email"),
+         "Filtered: has LinkedIn but no phone or email", "no phone/email"),
+)
+
+
+def apply_hard_rules(contacts: Iterable[dict],
+                     rules: Sequence[Rule] = HARD_RULES) -> Tuple[List[dict], Dict[str, int]]:
+    """(qualified contacts, rejections per rule name). Rejected contacts get a
+    0.0 `fact_check_score` and the rule's note."""
+    counts = {r.name: 0 for r in rules}
+    qualified: List[dict] = []
+    for contact in contacts:
+        failed = next((r for r in rules if r.rejects(contact)), None)
+        if failed is None:
+            qualified.append(contact)
+            continue
+        contact["fact_check_score"] = 0.0
+        contact["fact_check_notes"] = failed.note
+        counts[failed.name] += 1
+        logger.info(f"FILTERED ({failed.log_label}): {contact.get('name')} — {contact.get('title')}")
+    return qualified, counts
+
+
+def assign_ids(contacts: Sequence[dict]) -> List[Tuple[str, dict]]:
+    return [(f"c{i}", c) for i, c in enumerate(contacts)]
+
+
+def chunks(items: Sequence, size: int) -> List[list]:
+    size = max(1, int(size))
+    return [list(items[i:i + size]) for i in range(0, len(items), size)]
+
+
+def prompt_row(cid: str, contact: dict) -> dict:
+    return {
+        "id": cid,
+        "name": contact.get("name", ""),
+        "title": contact.get("title", ""),
+        "linkedin_url": linkedin_of(contact),
+        "email": contact.get("email", ""),
+    }
+
+
+def _name_key(name: Optional[str]) -> str:
+    return (name or "").lower().strip()
+
+
+def apply_scores(ided: Sequence[Tuple[str, dict]], verdicts: Iterable[dict],
+                 unavailable: Iterable[str] = ()) -> List[dict]:
+    """Write each verdict onto its contact and return those scoring >= MIN_SCORE.
+
+    `verdicts` are the LLM rows from every chunk. A row is matched by its "id",
+    else by name (first unclaimed contact of that name). Contacts listed in
+    `unavailable` (their chunk failed) keep DEFAULT_SCORE.
+    """
+    by_id = dict(ided)
+    by_name: Dict[str, List[str]] = {}
+    for cid, contact in ided:
+        by_name.setdefault(_name_key(contact.get("name")), []).append(cid)
+
+    scored: Dict[str, dict] = {}
+    for row in verdicts:
+        if not isinstance(row, dict):
+            continue
+        cid = str(row.get("id") or "")
+        if cid not in by_id:
+            cid = next((c for c in by_name.get(_name_key(row.get("name")), []) if c not in scored), "")
+        if cid and cid not in scored:
+            scored[cid] = row
+
+    unavailable = set(unavailable)
+    passed = []
+    for cid, contact in ided:
+        row = scored.get(cid)
+        if row is not None:
+            contact["fact_check_score"] = row.get("fact_check_score", 0.5)
+            contact["fact_check_notes"] = row.get("fact_check_notes", "")
+        else:
+            contact["fact_check_score"] = DEFAULT_SCORE
+            contact["fact_check_notes"] = ("LinkedIn validation unavailable" if cid in unavailable
+                                           else "Not matched in validation response")
+
+        if contact["fact_check_score"] >= MIN_SCORE:
+            passed.append(contact)
+        else:
+            logger.warning(
+                f"FACT CHECK FILTERED: {contact.get('name')} as {contact.get('title')} "
+                f"(score={contact['fact_check_score']}: {contact.get('fact_check_notes')})"
+            )
+    return passed
@@ -0,0 +1,225 @@
+"""Shared contact entity resolution (pure, stdlib-only).
+
+Contacts for one company arrive from ZoomInfo (search and enrich), Apollo,
+Hunter, PDL and the web agent. Each source spells the same person differently:
+mixed-case emails, `linkedin.com/in/x` vs `https://www.linkedin.com/in/x/?trk=..`,
+"Dr. Steve Smith, Jr." vs "Steven Smith". Every merge/dedupe site used to carry its own
+lower().strip() matching, and `_merge_zoominfo_contacts` scanned stakeholders x
+ZoomInfo contacts in nested loops. Everything now goes through this module:
+
+  * `identity_keys(contact)` — normalized, namespaced keys a contact can be
+    matched on: `email:<address>`, `li:<slug>`, `name:<company>|<first>|<last>`
+    (both names ASCII-folded and matched exactly; only the explicit `NICKNAMES`
+    table maps a first name to its canonical form, e.g. Bob -> Robert. Phonetic
+    codes were tried and merged different people: John/Jane, Tim/Tom, Dan/Dean),
+  * `ContactIndex` — key -> entity hash index, so finding a contact's match is
+    O(#keys) rather than a scan, and merging N contacts is linear,
+  * `merge_fields` — deterministic field-level precedence by source tier
+    (`SOURCE_ORDER`, overridable per field in `FIELD_SOURCE_ORDER`); a value
+    from an unknown source is only ever filled in, never replaced.
+
+Contacts may be dicts or objects (e.g. `StakeholderRecord`); both `linkedin_url`
+and ZoomInfo's `linkedin` field are recognized.
+"""
+from __future__ import annotations
+
+import re
+import unicodedata
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Set
+
+# Field precedence by source, best first. Unknown sources rank after all of these.
+SOURCE_ORDER = ("zoominfo_enrich", "zoominfo", "apollo", "hunter", "pdl", "web")
+
+# Per-field overrides. Hunter verifies mailboxes, so its emails outrank the rest
+# (and a ZoomInfo enrich only fills a missing email). LinkedIn URLs and the
+# generic phone come from the people-search sources first; ZoomInfo only fills,
+# though an enriched (real) phone still replaces a search result's masked one.
+FIELD_SOURCE_ORDER: Dict[str, tuple] = {
+    "email": ("hunter", "apollo", "pdl", "zoominfo", "zoominfo_enrich", "web"),
+    "linkedin_url": ("apollo", "hunter", "pdl", "web", "zoominfo", "zoominfo_enrich"),
+    "phone": ("apollo", "hunter", "pdl", "web", "zoominfo_enrich", "zoominfo"),
+}
+
+# Nickname / spelling variant -> canonical first name. Deliberately explicit and
+# small: only unambiguous pairs (no Chris, Alex, Sam, Pat, and none of Liam, Will,
+# Ed, Ted, Jon, Rick, Beth, Meg — each is also a name of its own or short for
+# another one).
+NICKNAMES: Dict[str, str] = {
+    "bob": "robert", "rob": "robert", "bobby": "robert", "robbie": "robert",
+    "bill": "william", "billy": "william",
+    "mike": "michael", "mick": "michael", "jim": "james", "jimmy": "james",
+    "johnny": "john", "steve": "steven", "stephen": "steven",
+    "dave": "david", "danny": "daniel", "tom": "thomas", "tommy": "thomas",
+    "matt": "matthew", "nick": "nicholas", "tony": "anthony", "joe": "joseph",
+    "ben": "benjamin", "andy": "andrew", "greg": "gregory", "jeff": "jeffrey",
+    "ken": "kenneth", "dick": "richard", "rich": "richard",
+    "larry": "lawrence", "tim": "timothy", "liz": "elizabeth", "kate": "katherine", "katie": "katherine",
+    "kathy": "katherine", "catherine": "katherine", "jen": "jennifer", "jenny": "jennifer",
+    "sue": "susan", "anne": "ann", "peggy": "margaret",
+}
+
+_SOURCE_ALIASES = {
+    "hunter.io": "hunter", "identity_lookup": "zoominfo", "zoominfo gtm": "zoominfo",
+    "peopledatalabs": "pdl", "apollo.io": "apollo", "web_agent": "web",
+}
+
+_EMPTY_EMAILS = frozenset({"", "not available", "n/a", "none", "null"})
+_LINKEDIN_SLUG_RE = re.compile(r"linkedin\.com/(?:in|pub)/([^/?#\s]+)", re.IGNORECASE)
+_NAME_NOISE = frozenset({"mr", "mrs", "ms", "dr", "jr", "sr", "ii", "iii", "iv", "phd", "mba", "cpa"})
+
+
+def normalize_source(source: Optional[str]) -> str:
+    s = (source or "").strip().lower()
+    return _SOURCE_ALIASES.get(s, s)
+
+
+def source_rank(source: Optional[str], field: str = "") -> int:
+    order = FIELD_SOURCE_ORDER.get(field, SOURCE_ORDER)
+    s = normalize_source(source)
+    return order.index(s) if s in order else len(order)
+
+
+def _get(contact: Any, field: str) -> Any:
+    if isinstance(contact, Mapping):
+        return contact.get(field)
+    return getattr(contact, field, None)
+
+
+def _fold(text: str) -> str:
+    return unicodedata.normalize("NFKD", text or "").encode("ascii", "ignore").decode().lower()
+
+
+def normalize_email(email: Optional[str]) -> Optional[str]:
+    e = (email or "").strip().lower()
+    if e in _EMPTY_EMAILS or "@" not in e:
+        return None
+    return e
+
+
+def linkedin_slug(url: Optional[str]) -> Optional[str]:
+    """'https://www.linkedin.com/in/Jane-Smith-123/?trk=x' -> 'jane-smith-123'."""
+    m = _LINKEDIN_SLUG_RE.search(url or "")
+    return m.group(1).strip().lower() if m else None
+
+
+def _name_parts(name: str) -> List[str]:
+    words = re.sub(r"[^a-z\s'-]", " ", _fold(name)).replace("'", "").split()
+    return [w for w in words if w.strip("-") and w not in _NAME_NOISE and len(w.strip("-")) > 1]
+
+
+def name_key(name: Optional[str], company: str = "") -> Optional[str]:
+    """Person key: company | canonical first name (via `NICKNAMES`) | last name."""
+    parts = _name_parts(name or "")
+    if len(parts) < 2:
+        return None
+    first = parts[0].strip("-")
+    return f"{(company or '').strip().lower()}|{NICKNAMES.get(first, first)}|{parts[-1]}"
+
+
+def identity_keys(contact: Any, company: str = "") -> Set[str]:
+    """Every normalized key `contact` can be matched on (possibly empty)."""
+    keys: Set[str] = set()
+    email = normalize_email(_get(contact, "email"))
+    if email:
+        keys.add(f"email:{email}")
+    url = _get(contact, "linkedin_url") or _get(contact, "linkedin")
+    if url and str(url).strip():
+        keys.add(f"li:{linkedin_slug(url) or str(url).strip().lower().rstrip('/')}")
+    name = _get(contact, "name")
+    if not name and (_get(contact, "first_name") or _get(contact, "last_name")):
+        name = f"{_get(contact, 'first_name') or ''} {_get(contact, 'last_name') or ''}"
+    nk = name_key(name, company)
+    if nk:
+        keys.add(f"name:{nk}")
+    elif name and str(name).strip():
+        keys.add(f"name:{(company or '').strip().lower()}|{' '.join(_fold(str(name)).split())}")
+    return keys
+
+
+class ContactIndex:
+    """Hash index of entities by identity key. `add` returns the entity a contact
+    resolved to, so callers can merge in one linear pass."""
+
+    def __init__(self, company: str = ""):
+        self.company = company
+        self.entities: List[Any] = []
+        self._by_key: Dict[str, int] = {}
+        self._pos: Dict[int, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.entities)
+
+    def keys_of(self, contact: Any) -> Set[str]:
+        return identity_keys(contact, self.company)
+
+    def find(self, contact: Any) -> Optional[Any]:
+        """The indexed entity sharing any key with `contact`, else None.
+        Email beats LinkedIn beats name when keys point at different entities."""
+        i = self._find_index(self.keys_of(contact))
+        return None if i is None else self.entities[i]
+
+    def _find_index(self, keys: Set[str]) -> Optional[int]:
+        for prefix in ("email:", "li:", "name:"):
+            for k in sorted(k for k in keys if k.startswith(prefix)):
+                if k in self._by_key:
+                    return self._by_key[k]
+        return None
+
+    def __contains__(self, contact: Any) -> bool:
+        return self._find_index(self.keys_of(contact)) is not None
+
+    def add(self, contact: Any) -> Any:
+        """Index `contact` as a new entity unless it matches one; return the entity.
+        A matched entity also becomes reachable by the contact's new keys."""
+        keys = self.keys_of(contact)
+        i = self._find_index(keys)
+        if i is None:
+            i = len(self.entities)
+            self.entities.append(contact)
+            self._pos[id(contact)] = i
+        for k in keys:
+            self._by_key.setdefault(k, i)
+        return self.entities[i]
+
+    def reindex(self, entity: Any) -> None:
+        """Register keys an entity gained after a merge (e.g. a filled email)."""
+        i = self._pos.get(id(entity))
+        if i is not None:
+            for k in self.keys_of(entity):
+                self._by_key.setdefault(k, i)
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or (isinstance(value, str) and value.strip().lower() in _EMPTY_EMAILS)
+
+
+def merge_fields(target: dict, incoming: Mapping, *, target_source: Optional[str],
+                 incoming_source: Optional[str], fields: Mapping[str, str]) -> dict:
+    """Copy `fields` ({target_field: incoming_field}) from `incoming` into `target`.
+
+    A non-empty incoming value fills an empty target field, and replaces a set one
+    when its source ranks at least as high for that field (ties go to the newer
+    value). A set value whose source is unknown (None or not ranked for the
+    field) is never replaced, so merging is fill-only for it. Returns `target`.
+    """
+    for t_field, i_field in fields.items():
+        value = incoming.get(i_field)
+        if _is_empty(value):
+            continue
+        target_rank = source_rank(target_source, t_field)
+        if _is_empty(target.get(t_field)) or (
+                target_rank < len(FIELD_SOURCE_ORDER.get(t_field, SOURCE_ORDER))
+                and source_rank(incoming_source, t_field) <= target_rank):
+            target[t_field] = value
+    return target
+
+
+def dedupe(contacts: Iterable[Any], company: str = "") -> List[Any]:
+    """First occurrence of each distinct person, order kept."""
+    index = ContactIndex(company)
+    out = []
+    for c in contacts:
+        if c not in index:
+            out.append(c)
+        index.add(c)
+    return out
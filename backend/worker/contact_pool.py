@@ -0,0 +1,89 @@
+"""Per-job ZoomInfo contact pool for Stage 3 (pure, stdlib-only).
+
+`LiveProviders.query` used to run a full `search_contacts` cascade per persona —
+and again per persona for the geo top-up — although the six personas' title sets
+overlap heavily and every cascade pulls the same C-Level/VP/Director people for
+the same domain. Instead, one or two broad paged pulls per (domain, geo scope)
+fill a `ContactPool`, and each persona's tier is answered locally from it.
+
+The pool indexes people by normalized title tokens (plus the acronym of a
+"chief ... officer" title, so "Chief Technology Officer" finds "CTO") and by
+ZoomInfo management level. `match_titles` mirrors what the per-persona search
+returned: persona-title matches first, topped up from C-Level, then VP-Level,
+then Director-Level, in the pool's priority order.
+"""
+from __future__ import annotations
+
+import re
+from typing import Dict, Iterable, List, Optional, Set
+
+# Management levels in top-up order (ZoomInfo's own classification).
+LEVELS = ("c-level", "vp-level", "director-level")
+
+_STOPWORDS = frozenset({"of", "the", "and", "for", "&", "-", "a", "an"})
+_PHRASES = (("vice president", "vp"), ("senior", "sr"), ("information technology", "it"))
+
+
+def title_tokens(title: str) -> Set[str]:
+    """Normalized token set for a job title ('Vice President, IT' -> {'vp', 'it'})."""
+    t = " " + re.sub(r"[^a-z0-9&]+", " ", (title or "").lower()) + " "
+    for phrase, short in _PHRASES:
+        t = t.replace(f" {phrase} ", f" {short} ")
+    return {w for w in t.split() if w not in _STOPWORDS}
+
+
+def _acronym(title: str) -> Optional[str]:
+    """'Chief Technology Officer' -> 'cto' (only for chief ... officer titles)."""
+    words = [w for w in re.sub(r"[^a-z ]+", " ", (title or "").lower()).split()
+             if w not in _STOPWORDS]
+    if len(words) >= 3 and words[0] == "chief" and words[-1] == "officer":
+        return "".join(w[0] for w in words)
+    return None
+
+
+def _level(person: dict) -> str:
+    return str(person.get("management_level") or "").strip().lower()
+
+
+class ContactPool:
+    """Priority-ordered people for one domain, indexed by title token and level."""
+
+    def __init__(self, people: Iterable[dict]):
+        self.people: List[dict] = list(people)
+        self._by_token: Dict[str, Set[int]] = {}
+        self._by_level: Dict[str, List[int]] = {}
+        for i, person in enumerate(self.people):
+            for tok in title_tokens(person.get("title", "")):
+                self._by_token.setdefault(tok, set()).add(i)
+            self._by_level.setdefault(_level(person), []).append(i)
+
+    def __len__(self) -> int:
+        return len(self.people)
+
+    def _title_hits(self, title: str) -> Set[int]:
+        hits: Set[int] = set()
+        toks = title_tokens(title)
+        if toks:
+            postings = [self._by_token.get(t, set()) for t in toks]
+            hits = set.intersection(*postings) if all(postings) else set()
+        acro = _acronym(title)
+        if acro:
+            hits |= self._by_token.get(acro, set())
+        return hits
+
+    def match_titles(self, titles: Iterable[str], limit: int = 10) -> List[dict]:
+        """People whose title contains any of `titles` (all tokens), topped up by
+        management level (C, VP, Director) to `limit`; returned in pool order."""
+        chosen: Set[int] = set()
+        matched = sorted(set().union(*[self._title_hits(t) for t in titles] or [set()]))
+        chosen.update(matched[:limit])
+        for level in LEVELS:
+            for i in self._by_level.get(level, []):
+                if len(chosen) >= limit:
+                    break
+                chosen.add(i)
+        return [self.people[i] for i in sorted(chosen)]
+
+    def by_level(self, level: str) -> List[dict]:
+        """Everyone at one management level ('C-Level', 'VP-Level', ...)."""
+        return [self.people[i] for i in self._by_level.get(level.strip().lower(), [])]
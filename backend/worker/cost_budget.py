@@ -0,0 +1,187 @@
+"""Cost budgets, rollups and pre-flight estimates (pure, stdlib-only at import).
+
+`cost_meter` only reported a job's spend after the fact, in memory. This module
+adds what sits on top of it:
+
+  * budgets — `allow_optional(step)` is asked before an optional, skippable
+    step (2.86 Claude LinkedIn search, the v3.1 geo top-up). It says no when
+    the step's expected cost (`OPTIONAL_STEP_USD`) would push the job past
+    COST_BUDGET_PER_JOB_USD, or the tenant (seller) past
+    COST_BUDGET_PER_TENANT_DAY_USD for the UTC day; the skip is recorded on the
+    job's cost snapshot. Required steps are never gated. 0 = unlimited (default),
+  * tenant day spend — seeded from the durable rollup at job start
+    (`seed_tenant_spend`) and bumped as jobs finish (`add_tenant_spend`),
+  * rollups — `cost_row` builds one `job_costs` row per finished job (seller,
+    batch, UTC day, total/by-service USD, duration, per-stage ms from the trace);
+    the per-seller/day/batch rollups are SQL views over that table,
+  * estimates — `estimate` predicts cost and latency for `/profile-request
+    ?estimate=1` from recent `job_costs` rows (p50/p90 overall and per stage),
+    falling back to the in-process history of this worker's finished jobs.
+"""
+from __future__ import annotations
+
+import os
+import threading
+from collections import deque
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional
+
+try:
+    from worker import cost_meter
+except Exception:  # noqa: BLE001
+    import cost_meter  # bare path
+
+JOB_BUDGET_USD = float(os.getenv("COST_BUDGET_PER_JOB_USD", "0") or 0)
+TENANT_DAILY_BUDGET_USD = float(os.getenv("COST_BUDGET_PER_TENANT_DAY_USD", "0") or 0)
+
+# Expected cost of each optional step, so it is skipped before it would cross
+# the budget rather than after. Rough: 2.86 is a handful of web_search calls
+# plus Sonnet tokens; the geo top-up is a second round of ZoomInfo searches.
+OPTIONAL_STEP_USD: Dict[str, float] = {
+    "linkedin_search": 0.15,
+    "geo_topup": 0.10,
+}
+
+HISTORY_SIZE = 200
+
+_LOCK = threading.Lock()
+_TENANT_SPEND: Dict[tuple, float] = {}
+_HISTORY: "deque[Dict[str, Any]]" = deque(maxlen=HISTORY_SIZE)
+
+
+def today() -> str:
+    return datetime.now(timezone.utc).date().isoformat()
+
+
+def tenant_key(company_data: Dict[str, Any]) -> str:
+    """The tenant a job is billed to: the seller, else the requester."""
+    return ((company_data or {}).get("salesperson_name")
+            or (company_data or {}).get("requested_by") or "").strip().lower()
+
+
+# -- tenant day spend -----------------------------------------------------------
+
+def seed_tenant_spend(tenant: str, usd: float, day: Optional[str] = None) -> None:
+    """Raise the tenant's known spend for `day` to the durable figure."""
+    if not tenant:
+        return
+    key = (tenant, day or today())
+    with _LOCK:
+        _TENANT_SPEND[key] = max(_TENANT_SPEND.get(key, 0.0), float(usd or 0.0))
+        for stale in [k for k in _TENANT_SPEND if k[1] != key[1]]:
+            _TENANT_SPEND.pop(stale, None)
+
+
+def add_tenant_spend(tenant: str, usd: float, day: Optional[str] = None) -> None:
+    if not tenant:
+        return
+    key = (tenant, day or today())
+    with _LOCK:
+        _TENANT_SPEND[key] = _TENANT_SPEND.get(key, 0.0) + float(usd or 0.0)
+
+
+def tenant_spend(tenant: str, day: Optional[str] = None) -> float:
+    return _TENANT_SPEND.get((tenant, day or today()), 0.0)
+
+
+# -- budgets --------------------------------------------------------------------
+
+def over_budget(step_usd: float = 0.0, *, job_id: Optional[str] = None) -> Optional[str]:
+    """"job_budget" / "tenant_budget" if spending `step_usd` more would exceed one."""
+    acc = cost_meter.accumulator(job_id)
+    spent = acc.total_usd if acc is not None else 0.0
+    if JOB_BUDGET_USD and spent + step_usd > JOB_BUDGET_USD:
+        return "job_budget"
+    tenant = acc.tenant if acc is not None else None
+    if TENANT_DAILY_BUDGET_USD and tenant and \
+            tenant_spend(tenant) + spent + step_usd > TENANT_DAILY_BUDGET_USD:
+        return "tenant_budget"
+    return None
+
+
+def allow_optional(step: str, *, job_id: Optional[str] = None) -> bool:
+    """Whether optional `step` may run; a refusal is recorded on the job's snapshot."""
+    try:
+        reason = over_budget(OPTIONAL_STEP_USD.get(step, 0.0), job_id=job_id)
+    except Exception:  # noqa: BLE001 — budgeting must never break the pipeline
+        return True
+    if reason is None:
+        return True
+    cost_meter.record_skip(step, reason, job_id=job_id)
+    return False
+
+
+# -- rollups --------------------------------------------------------------------
+
+def stage_durations(trace_summary: Optional[Dict[str, Any]]) -> Dict[str, float]:
+    """stage name -> ms from a `tracing.summarize` result."""
+    return {s["name"]: s["duration_ms"] for s in (trace_summary or {}).get("spans", [])
+            if s.get("kind") == "stage"}
+
+
+def cost_row(job_id: str, company_data: Dict[str, Any], snapshot: Dict[str, Any],
+             trace_summary: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
+    """One `job_costs` row for a finished job (also kept in the local history)."""
+    acc = cost_meter.accumulator(job_id)
+    row = {
+        "job_id": job_id,
+        "seller": tenant_key(company_data),
+        "batch_id": (acc.batch_id if acc is not None else None) or company_data.get("batch_id"),
+        "day": today(),
+        "domain": company_data.get("domain"),
+        "total_usd": float(snapshot.get("total_usd") or 0.0),
+        "by_service": {k: v.get("usd", 0.0) for k, v in (snapshot.get("by_service") or {}).items()},
+        "duration_ms": round((trace_summary or {}).get("total_ms") or 0.0, 1),
+        "stage_ms": stage_durations(trace_summary),
+        "skipped_steps": [s["step"] for s in snapshot.get("skipped_steps") or []],
+    }
+    with _LOCK:
+        _HISTORY.append(row)
+    return row
+
+
+def history() -> List[Dict[str, Any]]:
+    with _LOCK:
+        return list(_HISTORY)
+
+
+# -- estimates ------------------------------------------------------------------
+
+def _quantile(values: List[float], q: float) -> Optional[float]:
+    if not values:
+        return None
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def estimate(rows: Iterable[Dict[str, Any]], *, tenant: str = "") -> Dict[str, Any]:
+    """Predicted cost / latency for a new job from finished-job `rows`."""
+    rows = [r for r in rows if r.get("total_usd") is not None]
+    costs = [float(r["total_usd"]) for r in rows]
+    durations = [float(r["duration_ms"]) / 1e3 for r in rows if r.get("duration_ms")]
+    stages: Dict[str, List[float]] = {}
+    services: Dict[str, List[float]] = {}
+    for r in rows:
+        for name, ms in (r.get("stage_ms") or {}).items():
+            stages.setdefault(name, []).append(float(ms))
+        for name, usd in (r.get("by_service") or {}).items():
+            services.setdefault(name, []).append(float(usd))
+    p50, p90 = _quantile(costs, 0.5), _quantile(costs, 0.9)
+    out = {
+        "samples": len(rows),
+        "cost_usd": {"p50": p50, "p90": p90},
+        "duration_seconds": {"p50": _quantile(durations, 0.5), "p90": _quantile(durations, 0.9)},
+        "stages_ms_p50": {k: _quantile(v, 0.5) for k, v in sorted(stages.items())},
+        "by_service_usd_p50": {k: _quantile(v, 0.5) for k, v in sorted(services.items())},
+        "budget": {
+            "job_budget_usd": JOB_BUDGET_USD or None,
+            "tenant_daily_budget_usd": TENANT_DAILY_BUDGET_USD or None,
+            "tenant_spent_today_usd": round(tenant_spend(tenant), 4) if tenant else None,
+        },
+    }
+    if p90 is not None:
+        out["budget"]["likely_degraded"] = bool(
+            (JOB_BUDGET_USD and p90 > JOB_BUDGET_USD)
+            or (TENANT_DAILY_BUDGET_USD and tenant
+                and tenant_spend(tenant) + p90 > TENANT_DAILY_BUDGET_USD))
+    return out
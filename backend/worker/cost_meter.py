@@ -23,13 +23,22 @@ Usage (call sites):
 
 The job id is bound to a ``contextvars.ContextVar`` so call sites that already
 run inside the job's task don't need the id threaded through their signatures.
+
+The registry is bounded: accumulators older than ``REGISTRY_TTL_SECONDS`` are
+dropped, and beyond ``REGISTRY_MAX_JOBS`` the oldest go first (the final
+snapshot is persisted with the job result, so nothing reads an old entry).
+``set_job`` also tags the accumulator with the job's tenant (seller) and
+batch, which `cost_budget` uses for budgets and rollups.
 """
 
 from __future__ import annotations
 
 import contextvars
+import os
 import threading
-from typing import Any, Dict, Optional
+import time
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
 
 # ---------------------------------------------------------------------------
 # PRICING CONSTANTS  (edit here)
@@ -74,15 +83,24 @@ current_job_id: "contextvars.ContextVar[Optional[str]]" = contextvars.ContextVar
     "current_job_id", default=None
 )
 
-# job_id -> CostAccumulator. Guarded by a lock for the rare cross-thread case.
-_REGISTRY: "Dict[str, CostAccumulator]" = {}
+# job_id -> CostAccumulator, oldest first. Guarded by a lock for the rare
+# cross-thread case. Bounded by age and count (see `_evict`).
+_REGISTRY: "OrderedDict[str, CostAccumulator]" = OrderedDict()
 _LOCK = threading.Lock()
 
+REGISTRY_MAX_JOBS = int(os.getenv("COST_METER_MAX_JOBS", "1000"))
+REGISTRY_TTL_SECONDS = float(os.getenv("COST_METER_TTL_SECONDS", str(6 * 3600)))
+
 
 class CostAccumulator:
     """Mutable per-job tally. All numbers are additive; never decremented."""
 
-    def __init__(self) -> None:
+    def __init__(self, tenant: Optional[str] = None, batch_id: Optional[str] = None) -> None:
+        self.created = time.monotonic()
+        self.tenant = tenant
+        self.batch_id = batch_id
+        # Optional steps skipped by a budget: [{"step", "reason"}]
+        self.skipped_steps: List[Dict[str, str]] = []
         # Anthropic
         self.anthropic_calls = 0
         self.input_tokens = 0
@@ -132,11 +150,14 @@ class CostAccumulator:
         self.zoominfo_usd += n * ZOOMINFO_USD_PER_CALL
 
     # -- reporting ----------------------------------------------------------
+    @property
+    def total_usd(self) -> float:
+        return (self.anthropic_usd + self.openai_usd
+                + self.zoominfo_usd + self.web_search_usd)
+
     def to_snapshot(self) -> Dict[str, Any]:
-        total = (self.anthropic_usd + self.openai_usd
-                 + self.zoominfo_usd + self.web_search_usd)
-        return {
-            "total_usd": round(total, _USD_ROUND),
+        snap = {
+            "total_usd": round(self.total_usd, _USD_ROUND),
             "by_service": {
                 "anthropic": {
                     "calls": self.anthropic_calls,
@@ -164,6 +185,9 @@ class CostAccumulator:
                 "output": self.output_tokens,
             },
         }
+        if self.skipped_steps:
+            snap["skipped_steps"] = list(self.skipped_steps)
+        return snap
 
 
 # ---------------------------------------------------------------------------
@@ -220,16 +244,32 @@ def _web_search_requests(usage: Any) -> int:
 # ---------------------------------------------------------------------------
 # Public API
 # ---------------------------------------------------------------------------
-def set_job(job_id: str) -> None:
+def _evict(now: float) -> None:
+    """Drop expired accumulators, then the oldest until one more fits (lock held)."""
+    while _REGISTRY:
+        oldest = next(iter(_REGISTRY.values()))
+        if now - oldest.created <= REGISTRY_TTL_SECONDS and len(_REGISTRY) < REGISTRY_MAX_JOBS:
+            break
+        _REGISTRY.popitem(last=False)
+
+
+def set_job(job_id: str, *, tenant: Optional[str] = None, batch_id: Optional[str] = None) -> None:
     """Bind `job_id` to the contextvar and ensure an accumulator exists.
 
     Safe to call more than once for the same job (the existing accumulator is
-    preserved so re-binding inside a sub-pipeline keeps the running tally).
+    preserved so re-binding inside a sub-pipeline keeps the running tally;
+    `tenant` / `batch_id` are only filled in when given).
     """
     current_job_id.set(job_id)
     with _LOCK:
-        if job_id not in _REGISTRY:
-            _REGISTRY[job_id] = CostAccumulator()
+        acc = _REGISTRY.get(job_id)
+        if acc is None:
+            _evict(time.monotonic())
+            acc = _REGISTRY[job_id] = CostAccumulator()
+        if tenant:
+            acc.tenant = tenant
+        if batch_id:
+            acc.batch_id = batch_id
 
 
 def _get(job_id: Optional[str]) -> Optional[CostAccumulator]:
@@ -307,6 +347,25 @@ def snapshot(job_id: Optional[str] = None) -> Dict[str, Any]:
     return acc.to_snapshot()
 
 
+def total_usd(job_id: Optional[str] = None) -> float:
+    """Running USD total for `job_id` (or the bound job); 0.0 when unknown."""
+    acc = _get(job_id)
+    return acc.total_usd if acc is not None else 0.0
+
+
+def accumulator(job_id: Optional[str] = None) -> Optional[CostAccumulator]:
+    """The live accumulator for `job_id` (or the bound job), if any."""
+    return _get(job_id)
+
+
+def record_skip(step: str, reason: str, *, job_id: Optional[str] = None) -> None:
+    """Note that optional `step` was skipped (e.g. over budget); shown in the snapshot."""
+    acc = _get(job_id)
+    if acc is None:
+        return
+    acc.skipped_steps.append({"step": step, "reason": reason})
+
+
 def reset(job_id: str) -> None:
     """Drop the accumulator for `job_id` (optional cleanup; not required)."""
     with _LOCK:
@@ -0,0 +1,91 @@
+"""Per-job memo for the debug-mode payload (pure, stdlib-only).
+
+`production_main.generate_debug_data` rebuilds process steps, API responses,
+council thought processes and the process flow from the raw jobs_store entry.
+It used to run from scratch on every `/debug-data/{job_id}` call and again for
+each of the four tab endpoints, so opening the debug UI built it five times.
+Here:
+
+  * `job_revision` — a cheap fingerprint of the job (status, stage, the stage
+    outputs present, slideshow state). It changes whenever a pipeline stage
+    completes or the background slideshow reconcile lands, and nowhere else,
+    so the payload is rebuilt once per stage rather than once per request,
+  * `get_or_build` — returns the memoized payload for the current revision,
+    building (and storing it on the job under `MEMO_KEY`) only on a change,
+  * `freeze` / `for_persistence` / `split_persisted` — at completion the final
+    payload is kept on the job (`PERSISTED_KEY`) and written to job_results
+    inside the durable result row; on rehydration it is split back out of the
+    result, so an evicted/restarted job serves it as-is (its raw vendor payloads
+    are not in the durable row, so it could not be rebuilt there). The
+    in-memory `result` polled by /job-status never carries it.
+
+The four tab endpoints are lookups into the memoized payload.
+"""
+from __future__ import annotations
+
+from typing import Any, Callable, Dict, Tuple
+
+MEMO_KEY = "debug_memo"
+PERSISTED_KEY = "debug_data"
+
+_TERMINAL = frozenset({"completed", "failed"})
+
+
+def job_revision(job: Dict[str, Any]) -> Tuple:
+    """Fingerprint of everything generate_debug_data reads that can change."""
+    result = job.get("result") or {}
+    slideshow = job.get("slideshow_data") or {}
+    return (
+        job.get("status"),
+        job.get("progress"),
+        job.get("current_step"),
+        tuple(sorted(k for k in job if k not in (MEMO_KEY, PERSISTED_KEY))),
+        len(job.get("api_calls") or ()),
+        result.get("slideshow_status") if isinstance(result, dict) else None,
+        result.get("slideshow_url") if isinstance(result, dict) else None,
+        slideshow.get("slideshow_status"),
+    )
+
+
+def persisted(job: Dict[str, Any]) -> Any:
+    """The frozen payload of a finished job, if any."""
+    return job.get(PERSISTED_KEY) if job.get("status") in _TERMINAL else None
+
+
+def get_or_build(job: Dict[str, Any], build: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """The debug payload for the job's current revision (built at most once)."""
+    revision = job_revision(job)
+    memo = job.get(MEMO_KEY)
+    if memo and memo.get("revision") == revision:
+        return memo["data"]
+    stored = persisted(job)
+    if stored and job.get("rehydrated"):
+        # Raw stage outputs are gone (evicted/restarted): the persisted copy is canonical.
+        data = stored
+    else:
+        data = build()
+    job[MEMO_KEY] = {"revision": revision, "data": data}
+    return data
+
+
+def freeze(job: Dict[str, Any], build: Callable[[], Dict[str, Any]]) -> Dict[str, Any]:
+    """Build the final payload and keep it on the job for persistence."""
+    data = get_or_build(job, build)
+    job[PERSISTED_KEY] = data
+    return data
+
+
+def for_persistence(job: Dict[str, Any], result: Any) -> Any:
+    """`result` plus the frozen payload, for the durable job_results row."""
+    data = job.get(PERSISTED_KEY)
+    if data is None or not isinstance(result, dict):
+        return result
+    return {**result, PERSISTED_KEY: data}
+
+
+def split_persisted(result: Any) -> Tuple[Any, Any]:
+    """(result without the payload, payload) for a row read back from job_results."""
+    if not isinstance(result, dict) or PERSISTED_KEY not in result:
+        return result, None
+    result = dict(result)
+    return result, result.pop(PERSISTED_KEY)
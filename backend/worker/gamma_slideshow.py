@@ -15,6 +15,11 @@ from content_audit import (
     match_content_for_supporting_asset,
 )
 
+try:
+    from worker import tracing
+except ImportError:
+    import tracing  # bare path (worker/ on sys.path)
+
 logger = logging.getLogger(__name__)
 
 
@@ -136,7 +141,8 @@ class GammaSlideshowCreator:
             logger.info(f"Creating slideshow for {company_name}")
 
             # Generate markdown content with user email for attribution
-            markdown_content = self._generate_markdown(company_data, user_email)
+            # Content-audit matching (keyword + embedding query) runs off the event loop.
+            markdown_content = await asyncio.to_thread(self._generate_markdown, company_data, user_email)
 
             # Count ALL contacts that will appear in the slideshow:
             # executive stakeholders + relevant other contacts (sales/partnerships/strategy/comms)
@@ -2603,7 +2609,7 @@ CRITICAL DESIGN INSTRUCTIONS - MUST FOLLOW:
             # Template has 1 slide per C-suite role — we pick the best contact per role.
             api_endpoint = self.template_url
 
-            structured_data = self._format_for_template(company_data, user_email)
+            structured_data = await asyncio.to_thread(self._format_for_template, company_data, user_email)
 
             payload = {
                 "gammaId": self.template_id,
@@ -2641,6 +2647,7 @@ CRITICAL DESIGN INSTRUCTIONS - MUST FOLLOW:
                 )
 
                 logger.info(f"Gamma API status code: {response.status_code}")
+                tracing.annotate_status(response.status_code)
                 response.raise_for_status()
                 result = response.json()
 
@@ -2770,6 +2777,7 @@ CRITICAL DESIGN INSTRUCTIONS - MUST FOLLOW:
                             logger.warning(f"Unknown status: {status}")
 
                     except httpx.HTTPStatusError as e:
+                        tracing.annotate_error(e)
                         logger.error(f"Status check failed: {e.response.status_code}")
                         if attempt >= max_attempts:
                             raise
@@ -2807,6 +2815,7 @@ CRITICAL DESIGN INSTRUCTIONS - MUST FOLLOW:
             ) from e
 
         except httpx.RequestError as e:
+            tracing.annotate_error(e)
             logger.error(f"Gamma API request error: {e}")
             raise Exception("Failed to connect to Gamma API") from e
 
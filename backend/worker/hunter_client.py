@@ -1,13 +1,112 @@
 """
 Hunter.io API client for email verification and enrichment.
+
+Enrichment runs every stakeholder concurrently, bounded by `HUNTER_CONCURRENCY`
+(Hunter throttles the finder/verifier endpoints per second). Two process-wide
+caches cut credit spend across jobs:
+
+  * verification verdicts per address (`HUNTER_VERIFY_CACHE_TTL_SECONDS`) — the
+    same executives' addresses are re-verified job after job,
+  * the email pattern per domain ("{first}.{last}"), from this client's own
+    Domain Search (`domain_pattern`). The worker looks it up when several
+    stakeholders still need an address (`needs_domain_pattern`) and passes it
+    to `enrich_stakeholder_emails`. A stakeholder without an email gets a
+    candidate rendered from the pattern and verified first; the Email Finder
+    call is only spent when the candidate verifies as "invalid" — for
+    "accept_all" / "unknown" verdicts the Finder can't confirm a mailbox
+    either, so the candidate is kept, marked unverified.
 """
+import asyncio
 import logging
+import re
+import time
+import unicodedata
+from collections import OrderedDict
 import httpx
 from typing import Dict, Any, Optional
 import os
 
 logger = logging.getLogger(__name__)
 
+HUNTER_CONCURRENCY = int(os.getenv("HUNTER_CONCURRENCY", "5"))
+VERIFY_CACHE_TTL_SECONDS = float(os.getenv("HUNTER_VERIFY_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+PATTERN_CACHE_TTL_SECONDS = float(os.getenv("HUNTER_PATTERN_CACHE_TTL_SECONDS", str(30 * 24 * 3600)))
+_CACHE_MAX_ENTRIES = 20000
+
+
+class _TTLCache:
+    """Small LRU dict whose entries expire `ttl` seconds after being stored."""
+
+    def __init__(self, ttl: float, max_entries: int = _CACHE_MAX_ENTRIES, clock=time.monotonic):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+
+    def get(self, key: str) -> Any:
+        hit = self._entries.get(key)
+        if hit is None:
+            return None
+        stored_at, value = hit
+        if self._clock() - stored_at > self.ttl:
+            del self._entries[key]
+            return None
+        self._entries.move_to_end(key)
+        return value
+
+    def put(self, key: str, value: Any) -> None:
+        self._entries[key] = (self._clock(), value)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+_VERIFY_CACHE = _TTLCache(VERIFY_CACHE_TTL_SECONDS)
+_PATTERN_CACHE = _TTLCache(PATTERN_CACHE_TTL_SECONDS)
+
+
+def _normalize_domain(domain: str) -> str:
+    d = re.sub(r"^https?://", "", (domain or "").strip().lower()).split("/")[0]
+    return d[4:] if d.startswith("www.") else d
+
+
+def remember_domain_pattern(domain: str, pattern: Optional[str]) -> None:
+    """Cache a domain's Hunter email pattern (from a Domain Search response)."""
+    if domain and pattern:
+        _PATTERN_CACHE.put(_normalize_domain(domain), pattern)
+
+
+def cached_domain_pattern(domain: str) -> Optional[str]:
+    return _PATTERN_CACHE.get(_normalize_domain(domain)) if domain else None
+
+
+def _name_part(value: str) -> str:
+    """'José' -> 'jose', "O'Neil" -> 'oneil' (what mailbox names look like)."""
+    ascii_only = unicodedata.normalize("NFKD", value or "").encode("ascii", "ignore").decode()
+    return re.sub(r"[^a-z0-9]", "", ascii_only.lower())
+
+
+def render_email_pattern(pattern: str, first_name: str, last_name: str, domain: str) -> Optional[str]:
+    """Candidate address from a Hunter pattern such as "{first}.{last}" or "{f}{last}".
+
+    None when the pattern has an unknown placeholder or a name part is empty.
+    """
+    first, last = _name_part(first_name), _name_part(last_name)
+    if not pattern or not first or not last or not domain:
+        return None
+    values = {"first": first, "last": last, "f": first[0], "l": last[0]}
+    placeholders = re.findall(r"\{(\w+)\}", pattern)
+    if not placeholders or any(p not in values for p in placeholders):
+        return None
+    local = re.sub(r"\{(\w+)\}", lambda m: values[m.group(1)], pattern)
+    return f"{local}@{_normalize_domain(domain)}"
+
 
 class HunterClient:
     """
@@ -32,6 +131,8 @@ class HunterClient:
         self.api_key = api_key or os.getenv("HUNTER_API_KEY")
         self.api_url = "https://api.hunter.io/v2"
         self.timeout = 10
+        self._sem = asyncio.Semaphore(max(1, HUNTER_CONCURRENCY))
+        self._verifying: Dict[str, asyncio.Future] = {}
 
     async def verify_email(self, email: str) -> Dict[str, Any]:
         """
@@ -79,6 +180,30 @@ class HunterClient:
             logger.error(f"Hunter.io error: {e}")
             return {"verified": False, "confidence": 0, "error": str(e)}
 
+    async def verify_email_cached(self, email: str) -> Dict[str, Any]:
+        """`verify_email` through the per-address verdict cache.
+
+        Concurrent requests for the same address share one API call; failed
+        calls (an "error" key) are not cached.
+        """
+        key = (email or "").strip().lower()
+        cached = _VERIFY_CACHE.get(key)
+        if cached is not None:
+            return dict(cached, cached=True)
+        pending = self._verifying.get(key)
+        if pending is None:
+            pending = asyncio.ensure_future(self._verify_and_cache(key, email))
+            self._verifying[key] = pending
+            pending.add_done_callback(lambda _f: self._verifying.pop(key, None))
+        return dict(await asyncio.shield(pending))
+
+    async def _verify_and_cache(self, key: str, email: str) -> Dict[str, Any]:
+        async with self._sem:
+            verification = await self.verify_email(email)
+        if "error" not in verification:
+            _VERIFY_CACHE.put(key, verification)
+        return verification
+
     async def find_email(
         self,
         domain: str,
@@ -133,49 +258,128 @@ class HunterClient:
             logger.error(f"Hunter.io error: {e}")
             return {"found": False, "confidence": 0, "error": str(e)}
 
+    async def domain_pattern(self, domain: str) -> Optional[str]:
+        """The domain's email pattern (cached; one Domain Search call on a miss)."""
+        cached = cached_domain_pattern(domain)
+        if cached or not self.api_key:
+            return cached
+
+        try:
+            async with self._sem:
+                async with httpx.AsyncClient(timeout=self.timeout) as client:
+                    response = await client.get(
+                        f"{self.api_url}/domain-search",
+                        params={
+                            "domain": _normalize_domain(domain),
+                            "limit": 1,
+                            "api_key": self.api_key
+                        }
+                    )
+            response.raise_for_status()
+            pattern = (response.json().get("data") or {}).get("pattern")
+            remember_domain_pattern(domain, pattern)
+            return pattern
+
+        except Exception as e:
+            logger.warning(f"Hunter.io pattern lookup failed for {domain}: {e}")
+            return None
+
+    @staticmethod
+    def needs_domain_pattern(stakeholders: list) -> bool:
+        """Whether a Domain Search pays off: it costs about what one Finder call
+        does, so only when several stakeholders still need an address."""
+        need_find = sum(
+            1 for s in stakeholders
+            if s.get("email") in (None, "", "Not available") and len((s.get("name") or "").split()) >= 2
+        )
+        return need_find >= 2
+
     async def enrich_stakeholder_emails(
         self,
         stakeholders: list,
-        domain: str
+        domain: str,
+        pattern: Optional[str] = None
     ) -> list:
         """
-        Enrich stakeholder profiles with verified emails.
+        Enrich stakeholder profiles with verified emails (concurrently).
 
         Args:
             stakeholders: List of stakeholder profiles
             domain: Company domain
+            pattern: Hunter email pattern for the domain (from `domain_pattern`);
+                defaults to the one already cached for the domain
 
         Returns:
             List of enriched stakeholder profiles
         """
-        enriched = []
-
-        for stakeholder in stakeholders:
-            name = stakeholder.get("name", "")
-            existing_email = stakeholder.get("email")
-
-            # If email exists, verify it
-            if existing_email and existing_email != "Not available":
-                verification = await self.verify_email(existing_email)
-                stakeholder["email_verified"] = verification.get("verified", False)
-                stakeholder["email_confidence"] = verification.get("confidence", 0)
-
-            # If no email, try to find it
-            elif name and domain:
-                name_parts = name.split()
-                if len(name_parts) >= 2:
-                    first_name = name_parts[0]
-                    last_name = name_parts[-1]
-
+        pattern = pattern or cached_domain_pattern(domain)
+        stats = {"verified": 0, "cache_hits": 0, "pattern_hits": 0,
+                 "pattern_unverified": 0, "finder_calls": 0}
+        enriched = await asyncio.gather(*[
+            self._enrich_one(stakeholder, domain, pattern, stats)
+            for stakeholder in stakeholders
+        ])
+
+        logger.info(
+            f"Enriched {len(enriched)} stakeholder emails with Hunter.io "
+            f"(verified={stats['verified']}, cache_hits={stats['cache_hits']}, "
+            f"pattern_hits={stats['pattern_hits']}, pattern_unverified={stats['pattern_unverified']}, "
+            f"finder_calls={stats['finder_calls']})"
+        )
+        return list(enriched)
+
+    async def _enrich_one(
+        self,
+        stakeholder: dict,
+        domain: str,
+        pattern: Optional[str],
+        stats: Dict[str, int]
+    ) -> dict:
+        name = stakeholder.get("name", "")
+        existing_email = stakeholder.get("email")
+
+        # If email exists, verify it
+        if existing_email and existing_email != "Not available":
+            verification = await self.verify_email_cached(existing_email)
+            stats["verified"] += 1
+            stats["cache_hits"] += int(bool(verification.get("cached")))
+            stakeholder["email_verified"] = verification.get("verified", False)
+            stakeholder["email_confidence"] = verification.get("confidence", 0)
+
+        # If no email, try the domain pattern, then the finder
+        elif name and domain:
+            name_parts = name.split()
+            if len(name_parts) >= 2:
+                first_name = name_parts[0]
+                last_name = name_parts[-1]
+
+                candidate = render_email_pattern(pattern, first_name, last_name, domain) if pattern else None
+                if candidate:
+                    verification = await self.verify_email_cached(candidate)
+                    stats["cache_hits"] += int(bool(verification.get("cached")))
+                    # "accept_all" servers accept any address, so only a
+                    # "valid" verdict confirms the guessed mailbox. The Finder
+                    # can't do better on an accept_all / unknown server (it
+                    # would return the same pattern guess), so keep the
+                    # candidate unverified instead of spending the call.
+                    status = verification.get("status")
+                    if status in ("valid", "accept_all", "unknown"):
+                        stakeholder["email"] = candidate
+                        stakeholder["email_verified"] = status == "valid"
+                        stakeholder["email_confidence"] = verification.get("confidence", 0)
+                        stakeholder["email_source"] = "hunter_pattern"
+                        stats["pattern_hits" if status == "valid" else "pattern_unverified"] += 1
+                        logger.info(f"Inferred email for {name} from pattern {pattern}: {candidate} ({status})")
+                        return stakeholder
+
+                async with self._sem:
                     find_result = await self.find_email(domain, first_name, last_name)
+                stats["finder_calls"] += 1
 
-                    if find_result.get("found"):
-                        stakeholder["email"] = find_result["email"]
-                        stakeholder["email_verified"] = True
-                        stakeholder["email_confidence"] = find_result["confidence"]
-                        logger.info(f"Found email for {name}: {find_result['email']}")
-
-            enriched.append(stakeholder)
+                if find_result.get("found"):
+                    stakeholder["email"] = find_result["email"]
+                    stakeholder["email_verified"] = True
+                    stakeholder["email_confidence"] = find_result["confidence"]
+                    logger.info(f"Found email for {name}: {find_result['email']}")
 
-        logger.info(f"Enriched {len(enriched)} stakeholder emails with Hunter.io")
-        return enriched
+        return stakeholder
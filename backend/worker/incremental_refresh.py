@@ -0,0 +1,124 @@
+"""Incremental re-profiling for `/profile-request` refresh mode (pure, stdlib-only).
+
+A full run recomputes everything: 28 council specialists + aggregator, the
+derived sections and the deck. A refresh (`"refresh": true`) still pulls fresh
+vendor responses — that is how we learn what changed — but diffs them against
+the last completed `job_results` row for the domain by content hash:
+
+  * `input_hashes` — one SHA-256 per pipeline input (company request, Apollo,
+    PDL, Hunter, ZoomInfo, stakeholders, news), with volatile keys (timestamps,
+    request ids, vendor meta) stripped so an unchanged account hashes the same,
+  * `plan_refresh` — which inputs changed, and which specialists can reuse
+    their previous analysis because none of the inputs their focus depends on
+    (`SPECIALIST_INPUTS`) changed,
+  * `section_hash` — a hash of a derived section's input, so builders
+    (`build_buying_signals`, `_build_executive_snapshot`) and the deck are
+    reused when their input is byte-for-byte the same as last time.
+
+Everything needed for the next refresh is stored under `result["refresh_state"]`
+(`refresh_state`), so no schema change is required.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Dict, Iterable, List, Optional
+
+INPUTS = ("company", "apollo", "pdl", "hunter", "zoominfo", "stakeholders", "news")
+
+# Keys whose values change on every fetch without the data changing (incl. the
+# news gatherer's per-run bookkeeping: a warm cursor flips `incremental` and
+# re-counts `duplicates_removed` for the same articles).
+VOLATILE_KEYS = frozenset({
+    "timestamp", "lastUpdated", "last_updated", "updated_at", "fetched_at",
+    "retrieved_at", "request_id", "requestId", "_meta", "api_calls", "duration_ms",
+    "duplicates_removed", "incremental", "gnews_error",
+})
+
+# Request fields that don't change what is computed (who asked, the flag itself,
+# and the cost-rollup batch the request was submitted in).
+_COMPANY_IGNORED = frozenset({"requested_by", "salesperson_name", "refresh", "batch_id"})
+
+_FIRMOGRAPHIC = ("company", "apollo", "pdl", "hunter", "zoominfo")
+
+# Specialist focus -> the inputs its analysis actually depends on. Foci not
+# listed depend on everything (never reused unless nothing changed).
+SPECIALIST_INPUTS: Dict[str, tuple] = {
+    **{focus: _FIRMOGRAPHIC for focus in (
+        "industry", "employee_count", "revenue", "geography", "history", "technology",
+        "target_market", "products", "competitors", "social", "legal", "growth", "brand",
+        "partnerships", "customers", "pricing", "culture", "innovation", "risk",
+        "executive_snapshot", "tech_stack_categories", "it_spend", "opportunity_themes",
+    )},
+    "leadership": _FIRMOGRAPHIC + ("stakeholders",),
+    "stakeholder_profiles": ("company", "stakeholders"),
+    "news_intelligence": ("company", "news", "zoominfo"),
+    "scoops": ("company", "news", "zoominfo"),
+    "buying_signals": _FIRMOGRAPHIC + ("news",),
+    "sales_strategy": _FIRMOGRAPHIC + ("news", "stakeholders"),
+}
+
+
+def _strip_volatile(obj: Any) -> Any:
+    if isinstance(obj, dict):
+        return {k: _strip_volatile(v) for k, v in obj.items() if k not in VOLATILE_KEYS}
+    if isinstance(obj, (list, tuple)):
+        return [_strip_volatile(v) for v in obj]
+    return obj
+
+
+def content_hash(obj: Any) -> str:
+    """Stable SHA-256 of a JSON-like value, ignoring key order and volatile keys."""
+    canonical = json.dumps(_strip_volatile(obj), sort_keys=True, default=str, separators=(",", ":"))
+    return hashlib.sha256(canonical.encode("utf-8")).hexdigest()
+
+
+def section_hash(obj: Any) -> str:
+    return content_hash(obj)
+
+
+def input_hashes(company_data: dict, apollo_data: Any, pdl_data: Any, hunter_data: Any,
+                 zoominfo_data: Any, stakeholders_data: Any, news_data: Any) -> Dict[str, str]:
+    company = {k: v for k, v in (company_data or {}).items() if k not in _COMPANY_IGNORED}
+    values = (company, apollo_data, pdl_data, hunter_data, zoominfo_data, stakeholders_data, news_data)
+    return {name: content_hash(value or {}) for name, value in zip(INPUTS, values)}
+
+
+def changed_inputs(previous: Optional[Dict[str, str]], current: Dict[str, str]) -> List[str]:
+    """Inputs whose hash differs (all of them when there is no baseline)."""
+    if not previous:
+        return list(current)
+    return [name for name in current if previous.get(name) != current[name]]
+
+
+def plan_refresh(baseline_state: Optional[dict], current: Dict[str, str],
+                 specialists: Iterable[dict]) -> Dict[str, Any]:
+    """What a refresh can reuse from `baseline_state` (the previous refresh_state).
+
+    Returns {"changed_inputs", "reuse_results" (specialist_id -> previous result),
+    "unchanged" (nothing changed at all)}.
+    """
+    state = baseline_state or {}
+    changed = set(changed_inputs(state.get("input_hashes"), current))
+    previous = {r.get("specialist_id"): r for r in state.get("specialist_results") or []
+                if isinstance(r, dict) and r.get("analysis")}
+    reuse: Dict[str, dict] = {}
+    for spec in specialists:
+        prior = previous.get(spec["id"])
+        deps = SPECIALIST_INPUTS.get(spec["focus"], INPUTS)
+        if prior is not None and not changed.intersection(deps):
+            reuse[spec["id"]] = prior
+    return {
+        "changed_inputs": sorted(changed),
+        "reuse_results": reuse,
+        "unchanged": bool(state) and not changed,
+    }
+
+
+def baseline_state(row: Optional[dict]) -> Optional[dict]:
+    """The refresh_state stored in a job_results row (None when unusable)."""
+    result = (row or {}).get("result") or {}
+    state = result.get("refresh_state") if isinstance(result, dict) else None
+    if not isinstance(state, dict) or not state.get("input_hashes"):
+        return None
+    return state
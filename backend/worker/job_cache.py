@@ -0,0 +1,212 @@
+"""Bounded, evicting in-memory job cache (pure, stdlib-only).
+
+`production_main.jobs_store` used to be a plain dict that held every job's full
+result, raw vendor payloads, ZoomInfo contacts, council metadata and `api_calls`
+log until the process restarted, so a long-lived instance grew without bound.
+`BoundedJobStore` is a drop-in MutableMapping replacement that:
+
+  * keeps jobs in LRU order (reads and writes both count as access),
+  * evicts *finished* jobs (completed/failed) past a TTL since last access, past
+    a job-count cap, or past an approximate byte budget — in-flight jobs, and
+    completed jobs whose Gamma deck is still pending (the reconcile writes the
+    URL into the resident job), are never evicted, whatever the pressure,
+  * accounts memory per job with a cheap recursive size estimate, refreshed on
+    `sweep()` (the maintenance loop), so `/health` can report it for free. A
+    finished job's size is cached and only re-measured when its shape changes,
+    so a sweep walks the in-flight jobs, not every resident payload,
+  * queues evicted jobs for spill so the caller can upsert them to the durable
+    `job_results` table (they are rehydrated from there lazily on access).
+
+The clock is injectable so the eviction policy is deterministic under test.
+"""
+from __future__ import annotations
+
+import sys
+import time
+from collections import OrderedDict
+from collections.abc import MutableMapping
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+TERMINAL_STATUSES = frozenset({"completed", "failed"})
+
+DEFAULT_MAX_JOBS = 200
+DEFAULT_TTL_SECONDS = 6 * 3600.0
+DEFAULT_MAX_BYTES = 512 * 1024 * 1024
+
+# Depth cap for the size walk: job payloads are a few levels of dicts/lists, and
+# anything deeper is noise relative to the vendor blobs near the top.
+_SIZE_MAX_DEPTH = 12
+
+
+def approx_bytes(obj: Any, _depth: int = 0, _seen: Optional[set] = None) -> int:
+    """Approximate deep size of a JSON-like object (dict/list/str/number).
+
+    Counts each container/string once (shared references are not double
+    counted). An estimate — good for relative accounting and budgets, not exact.
+    """
+    if _seen is None:
+        _seen = set()
+    oid = id(obj)
+    if oid in _seen:
+        return 0
+    _seen.add(oid)
+    size = sys.getsizeof(obj)
+    if _depth >= _SIZE_MAX_DEPTH:
+        return size
+    if isinstance(obj, dict):
+        for k, v in obj.items():
+            size += approx_bytes(k, _depth + 1, _seen) + approx_bytes(v, _depth + 1, _seen)
+    elif isinstance(obj, (list, tuple, set)):
+        for v in obj:
+            size += approx_bytes(v, _depth + 1, _seen)
+    return size
+
+
+def _is_terminal(job: Any) -> bool:
+    return isinstance(job, dict) and job.get("status") in TERMINAL_STATUSES
+
+
+def _evictable(job: Any) -> bool:
+    """Finished, and not waiting on a background deck reconcile."""
+    if not _is_terminal(job):
+        return False
+    result = job.get("result")
+    return not (isinstance(result, dict) and result.get("slideshow_status") == "pending")
+
+
+def _shape(job: dict) -> Tuple:
+    """Cheap change signature for a finished job's cached size: in-place updates
+    after completion (deck reconcile, debug freeze) add keys or swap `result`."""
+    result = job.get("result")
+    return (job.get("status"), len(job), id(result),
+            len(result) if isinstance(result, dict) else 0,
+            result.get("slideshow_status") if isinstance(result, dict) else None)
+
+
+class BoundedJobStore(MutableMapping):
+    """LRU/TTL job cache with byte accounting. See module docstring."""
+
+    def __init__(self, *, max_jobs: int = DEFAULT_MAX_JOBS,
+                 ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 max_bytes: int = DEFAULT_MAX_BYTES,
+                 clock: Callable[[], float] = time.monotonic):
+        self.max_jobs = max_jobs
+        self.ttl_seconds = ttl_seconds
+        self.max_bytes = max_bytes
+        self._clock = clock
+        self._jobs: "OrderedDict[str, dict]" = OrderedDict()
+        self._touched: Dict[str, float] = {}
+        self._sizes: Dict[str, int] = {}
+        self._shapes: Dict[str, Tuple] = {}
+        self._evicted: List[Tuple[str, dict]] = []
+        self.evictions = 0
+
+    # -- mapping protocol ---------------------------------------------------
+    def __getitem__(self, job_id: str) -> dict:
+        job = self._jobs[job_id]
+        self._touch(job_id)
+        return job
+
+    def __setitem__(self, job_id: str, job: dict) -> None:
+        self._jobs[job_id] = job
+        self._touch(job_id)
+        self._forget_size(job_id)
+        self._evict_over_count()
+
+    def __delitem__(self, job_id: str) -> None:
+        del self._jobs[job_id]
+        self._touched.pop(job_id, None)
+        self._forget_size(job_id)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(list(self._jobs))
+
+    def __len__(self) -> int:
+        return len(self._jobs)
+
+    def __contains__(self, job_id: object) -> bool:
+        return job_id in self._jobs
+
+    def items(self):  # snapshot without touching recency (maintenance scans)
+        return list(self._jobs.items())
+
+    def values(self):
+        return list(self._jobs.values())
+
+    def peek(self, job_id: str) -> Optional[dict]:
+        """Read without counting as an access."""
+        return self._jobs.get(job_id)
+
+    # -- eviction -----------------------------------------------------------
+    def _touch(self, job_id: str) -> None:
+        self._jobs.move_to_end(job_id)
+        self._touched[job_id] = self._clock()
+
+    def _evict(self, job_id: str) -> None:
+        job = self._jobs.pop(job_id)
+        self._touched.pop(job_id, None)
+        self._forget_size(job_id)
+        self._evicted.append((job_id, job))
+        self.evictions += 1
+
+    def _forget_size(self, job_id: str) -> None:
+        self._sizes.pop(job_id, None)
+        self._shapes.pop(job_id, None)
+
+    def _measure(self, job_id: str, job: dict) -> None:
+        """(Re)size in-flight jobs every sweep; finished ones only when changed."""
+        if not _is_terminal(job):
+            self._sizes[job_id] = approx_bytes(job)
+            self._shapes.pop(job_id, None)
+            return
+        shape = _shape(job)
+        if self._shapes.get(job_id) != shape or job_id not in self._sizes:
+            self._sizes[job_id] = approx_bytes(job)
+            self._shapes[job_id] = shape
+
+    def _lru_terminal(self) -> Optional[str]:
+        for job_id, job in self._jobs.items():
+            if _evictable(job):
+                return job_id
+        return None
+
+    def _evict_over_count(self) -> None:
+        while len(self._jobs) > self.max_jobs:
+            victim = self._lru_terminal()
+            if victim is None:
+                return  # everything resident is in flight — never evict those
+            self._evict(victim)
+
+    def sweep(self) -> List[Tuple[str, dict]]:
+        """Refresh byte accounting and apply TTL, count and byte limits.
+
+        Returns (and clears) every job evicted since the last sweep, including
+        count-driven evictions from inserts, for the caller to spill.
+        """
+        now = self._clock()
+        for job_id, job in list(self._jobs.items()):
+            if _evictable(job) and now - self._touched.get(job_id, now) > self.ttl_seconds:
+                self._evict(job_id)
+        self._evict_over_count()
+        for job_id, job in self._jobs.items():
+            self._measure(job_id, job)
+        while sum(self._sizes.values()) > self.max_bytes:
+            victim = self._lru_terminal()
+            if victim is None:
+                break
+            self._evict(victim)
+        evicted, self._evicted = self._evicted, []
+        return evicted
+
+    # -- reporting ----------------------------------------------------------
+    def stats(self) -> Dict[str, Any]:
+        """Resident counts and the byte estimate from the last sweep (cheap)."""
+        in_flight = sum(1 for j in self._jobs.values() if not _is_terminal(j))
+        return {
+            "resident_jobs": len(self._jobs),
+            "in_flight_jobs": in_flight,
+            "estimated_bytes": sum(self._sizes.get(j, 0) for j in self._jobs),
+            "max_jobs": self.max_jobs,
+            "max_bytes": self.max_bytes,
+            "evictions": self.evictions,
+        }
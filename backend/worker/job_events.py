@@ -0,0 +1,146 @@
+"""Server-push job progress for `/jobs/{job_id}/events` (pure, stdlib-only).
+
+The portal used to poll `/job-status` every ~1.5s and receive the full JobStatus
+(raw vendor blobs, council metadata, news) on every tick even when only
+`progress` moved. The SSE stream instead sends small deltas:
+
+  * ``stage``    — status or current_step changed (carries progress too)
+  * ``progress`` — only the progress number moved
+  * ``cost``     — the live cost-meter total ticked up
+  * ``complete`` / ``failed`` — terminal; carries the full payload exactly once
+
+Every event gets a per-job monotonic ``seq`` (the SSE ``id:``), so a client that
+reconnects with ``Last-Event-ID`` resumes where it left off — the same monotonic
+idea as ``job_store.STAGE_SEQ``, at event granularity. Events are derived by
+diffing a compact view of the in-memory job, so the pipeline needs no extra
+instrumentation and any number of subscribers share one log per job.
+
+No FastAPI imports here on purpose; production_main owns the HTTP stream.
+"""
+from __future__ import annotations
+
+import json
+from collections import OrderedDict
+from typing import Any, Dict, List, Optional
+
+TERMINAL_STATUSES = ("completed", "failed")
+
+# Events retained per job for resume. A full run emits well under this; a client
+# resuming from before the retained window gets a fresh "snapshot" event instead.
+EVENT_LOG_CAP = 500
+# Jobs with a retained log (oldest dropped first).
+EVENT_BUS_MAX_JOBS = 1000
+
+# Server-side tick (in-memory diff only) and SSE keep-alive comment cadence.
+TICK_SECONDS = 0.5
+KEEPALIVE_SECONDS = 15.0
+
+
+def progress_view(job: dict, api_cost: Optional[dict] = None) -> Dict[str, Any]:
+    """The handful of fields a progress UI needs, pulled from a jobs_store entry."""
+    cost = api_cost or job.get("api_cost") or {}
+    return {
+        "status": job.get("status"),
+        "progress": job.get("progress", 0),
+        "current_step": job.get("current_step"),
+        "cost_usd": cost.get("total_usd", 0) if isinstance(cost, dict) else 0,
+    }
+
+
+def diff_view(prev: Optional[dict], cur: dict) -> List[tuple]:
+    """Return the (event_type, data) deltas that take `prev` to `cur`."""
+    if prev is None:
+        return [("stage", dict(cur))]
+    out: List[tuple] = []
+    if prev.get("status") != cur.get("status") or prev.get("current_step") != cur.get("current_step"):
+        out.append(("stage", {"status": cur.get("status"),
+                              "current_step": cur.get("current_step"),
+                              "progress": cur.get("progress")}))
+    elif prev.get("progress") != cur.get("progress"):
+        out.append(("progress", {"progress": cur.get("progress")}))
+    if prev.get("cost_usd") != cur.get("cost_usd"):
+        out.append(("cost", {"cost_usd": cur.get("cost_usd")}))
+    return out
+
+
+class JobEventLog:
+    """Bounded, append-only event log for one job."""
+
+    def __init__(self, cap: int = EVENT_LOG_CAP):
+        self.cap = cap
+        self._events: List[dict] = []
+        self._last_view: Optional[dict] = None
+        self.last_seq = 0
+        self.closed = False
+
+    def append(self, event_type: str, data: Any) -> dict:
+        self.last_seq += 1
+        event = {"seq": self.last_seq, "type": event_type, "data": data}
+        self._events.append(event)
+        if len(self._events) > self.cap:
+            del self._events[: len(self._events) - self.cap]
+        return event
+
+    def observe(self, view: dict) -> List[dict]:
+        """Diff `view` against the last observed one and append any deltas."""
+        if self.closed:
+            return []
+        added = [self.append(t, d) for t, d in diff_view(self._last_view, view)]
+        self._last_view = dict(view)
+        return added
+
+    def finish(self, status: str, payload: dict) -> dict:
+        """Append the single terminal event (full payload) and close the log."""
+        event = self.append("complete" if status == "completed" else "failed", payload)
+        self.closed = True
+        return event
+
+    def since(self, seq: int) -> List[dict]:
+        """Events with seq > `seq`. If `seq` predates the retained window, the
+        caller gets a synthetic snapshot of the latest view followed by what is
+        still retained, so a late resume still converges on current state."""
+        if not self._events or seq >= self.last_seq:
+            return []
+        oldest = self._events[0]["seq"]
+        if seq < oldest - 1:
+            snap = {"seq": oldest - 1, "type": "snapshot", "data": dict(self._last_view or {})}
+            return [snap] + list(self._events)
+        return [e for e in self._events if e["seq"] > seq]
+
+
+class JobEventBus:
+    """job_id -> JobEventLog, bounded to the most recently touched jobs."""
+
+    def __init__(self, max_jobs: int = EVENT_BUS_MAX_JOBS, cap: int = EVENT_LOG_CAP):
+        self.max_jobs = max_jobs
+        self.cap = cap
+        self._logs: "OrderedDict[str, JobEventLog]" = OrderedDict()
+
+    def log(self, job_id: str) -> JobEventLog:
+        log = self._logs.get(job_id)
+        if log is None:
+            log = self._logs[job_id] = JobEventLog(self.cap)
+        self._logs.move_to_end(job_id)
+        while len(self._logs) > self.max_jobs:
+            self._logs.popitem(last=False)
+        return log
+
+    def drop(self, job_id: str) -> None:
+        self._logs.pop(job_id, None)
+
+    def __len__(self) -> int:
+        return len(self._logs)
+
+
+def parse_last_event_id(value: Optional[str]) -> int:
+    """Resume point from an SSE Last-Event-ID header (0 when absent/garbage)."""
+    try:
+        return max(0, int(str(value).strip()))
+    except (TypeError, ValueError):
+        return 0
+
+
+def format_sse(event: dict) -> str:
+    """Serialize one event as an SSE frame."""
+    data = json.dumps(event["data"], separators=(",", ":"), default=str)
+    return f"id: {event['seq']}\nevent: {event['type']}\ndata: {data}\n\n"
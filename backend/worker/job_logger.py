@@ -2,8 +2,8 @@
 JobLogger — centralized, PII-redacted, per-job structured logging (v3.1).
 
 Every job (regardless of seller) gets one JobLogger threaded through all stages.
-It buffers structured entries and flushes them to a sink (in production, the
-`profile_requests.debug_logs` jsonb column; in tests, an injected callable).
+It buffers structured entries and flushes them to a sink (in production, an
+append-only insert into `profile_request_logs`; in tests, an injected callable).
 
 Design rules honored here:
 - PII (emails/phones) is redacted in `write()` before buffering, unless
@@ -11,9 +11,15 @@ Design rules honored here:
 - The buffer is capped to avoid runaway memory on stuck jobs.
 - Telemetry must never block the job: a sink failure logs to stderr and continues.
 - Flushes on stage boundaries and on context-manager exit, including on exception.
+- Batched: with `batch_size` / `flush_interval` set, `write()` starts a flush
+  once that many entries are buffered or that many seconds have passed since
+  the last one. Inside an event loop the (blocking) sink runs in the default
+  executor, one batch in flight at a time, so the job never waits on the DB;
+  `async with` / `aclose()` drains the in-flight batch before the final flush.
 """
 from __future__ import annotations
 
+import asyncio
 import re
 import sys
 import time
@@ -70,6 +76,8 @@ class JobLogger:
         redact: bool = True,
         clock: Callable[[], float] = time.time,
         buffer_cap: int = _BUFFER_CAP,
+        batch_size: Optional[int] = None,
+        flush_interval: Optional[float] = None,
     ):
         self.job_id = job_id
         self._sink = sink
@@ -78,6 +86,10 @@ class JobLogger:
         self._cap = buffer_cap
         self._buffer: list[dict] = []
         self._truncated = False
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval
+        self._last_flush = clock()
+        self._inflight: Optional[asyncio.Future] = None
 
     def write(self, *, stage: str, step: str, level: Level, msg: str, data: Optional[dict] = None) -> None:
         entry = {
@@ -96,6 +108,41 @@ class JobLogger:
             self._buffer.pop(0)  # keep most-recent; drop oldest
             if not self._truncated:
                 self._truncated = True
+        if self._flush_due():
+            self._flush_background()
+
+    def _flush_due(self) -> bool:
+        if self._sink is None or (self._inflight is not None and not self._inflight.done()):
+            return False
+        if self._batch_size is not None and len(self._buffer) >= self._batch_size:
+            return True
+        return (self._flush_interval is not None
+                and self._clock() - self._last_flush >= self._flush_interval)
+
+    def _flush_background(self) -> None:
+        """Hand the buffer to the sink without blocking the caller (if in a loop)."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.flush()
+            return
+        batch, self._buffer = self._buffer, []
+        self._last_flush = self._clock()
+        self._inflight = loop.run_in_executor(None, self._write_batch, batch)
+        self._inflight.add_done_callback(lambda fut: self._requeue(batch, fut))
+
+    def _write_batch(self, batch: list[dict]) -> bool:
+        try:
+            self._sink(batch)
+            return True
+        except Exception as exc:  # telemetry must never block the job
+            print(f"[JobLogger {self.job_id}] flush failed, continuing: {exc}", file=sys.stderr)
+            return False
+
+    def _requeue(self, batch: list[dict], fut: asyncio.Future) -> None:
+        if fut.cancelled() or not fut.result():
+            self._buffer[:0] = batch  # retried on the next flush
+            del self._buffer[:max(0, len(self._buffer) - self._cap)]
 
     # Convenience helpers
     def info(self, stage: str, step: str, msg: str, data: Optional[dict] = None) -> None:
@@ -114,11 +161,15 @@ class JobLogger:
     def flush(self) -> None:
         if self._sink is None or not self._buffer:
             return
-        try:
-            self._sink(list(self._buffer))
+        self._last_flush = self._clock()
+        if self._write_batch(list(self._buffer)):
             self._buffer = []  # only clear on a successful write
-        except Exception as exc:  # telemetry must never block the job
-            print(f"[JobLogger {self.job_id}] flush failed, continuing: {exc}", file=sys.stderr)
+
+    async def aclose(self) -> None:
+        """Wait for the in-flight batch, then flush what is left."""
+        if self._inflight is not None:
+            await asyncio.wait([self._inflight])
+        self.flush()
 
     def __enter__(self) -> "JobLogger":
         return self
@@ -129,3 +180,13 @@ class JobLogger:
                        msg=f"job ended with exception: {exc_type.__name__}: {exc_val}")
         self.flush()
         return False  # never suppress exceptions
+
+    async def __aenter__(self) -> "JobLogger":
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> bool:
+        if exc_type is not None:
+            self.write(stage="job", step="exit", level="error",
+                       msg=f"job ended with exception: {exc_type.__name__}: {exc_val}")
+        await self.aclose()
+        return False  # never suppress exceptions
@@ -7,20 +7,34 @@ on every restart/redeploy. Two failure modes follow from that:
      404s and the portal shows it stuck "in progress". The durable `job_results`
      row is the recovery source — these helpers map it back to a status payload.
   2. A job whose worker dies mid-run is left "processing" forever (nothing flips it
-     to failed). `is_stale_processing` lets a status poll reap it.
+     to failed). `is_stale_processing` lets the background maintenance sweep reap it.
+
+`/job-status` is polled every couple of seconds per open tab, so it must stay a pure
+read: durable rows are served from `PersistedRowCache` (short TTL, misses included;
+an expired row keeps being served while a background lookup refreshes it) and reaping / slideshow reconciliation run from the maintenance sweep, never inline.
 
 No FastAPI / Supabase imports here on purpose, so the decision logic is unit-tested
 with stdlib only; production_main wires the Supabase I/O around it.
 """
 from __future__ import annotations
 
+from collections import OrderedDict
 from datetime import datetime, timezone
-from typing import Optional
+from typing import Dict, List, Optional, Tuple
 
-# How long an in-memory job may sit in "processing" before a status check reaps it
-# to "failed". Generous: a full real run is minutes, not tens of minutes.
+# How long an in-memory job may sit in "processing" before the maintenance sweep
+# reaps it to "failed". Generous: a full real run is minutes, not tens of minutes.
 STALE_PROCESSING_MINUTES = 30
 
+# How long a durable job_results lookup (hit OR miss) is served from memory before
+# the next status poll schedules a refresh. Short: rows only change at job end.
+PERSISTED_ROW_TTL_SECONDS = 30.0
+PERSISTED_ROW_CACHE_MAX = 1000
+
+# Cadence of the background sweep that reaps stale jobs and reconciles pending
+# slideshows (work that used to run inline on every /job-status poll).
+MAINTENANCE_INTERVAL_SECONDS = 15.0
+
 
 def resolve_persisted_status(row: dict) -> dict:
     """Map a durable `job_results` row (looked up when the job is NOT in memory) to a
@@ -78,3 +92,77 @@ def is_stale_processing(status: str, created_at: str, now: datetime,
         now = now.replace(tzinfo=timezone.utc)
     age_minutes = (now - started).total_seconds() / 60.0
     return age_minutes >= max_age_minutes
+
+
+def jobs_needing_maintenance(jobs: Dict[str, dict], now: datetime,
+                             max_age_minutes: int = STALE_PROCESSING_MINUTES
+                             ) -> Tuple[List[str], List[str]]:
+    """Split in-memory jobs into (stale_processing_ids, pending_slideshow_ids).
+
+    Pure selection for the maintenance sweep: stale jobs get reaped to 'failed';
+    jobs whose slideshow is still 'pending' with a generation id get one Gamma
+    status check. A job is never in both lists (a reaped job has no deck to wait on).
+    """
+    stale: List[str] = []
+    pending: List[str] = []
+    for job_id, job in list(jobs.items()):
+        if not isinstance(job, dict):
+            continue
+        if is_stale_processing(job.get("status", ""), job.get("created_at", ""),
+                               now, max_age_minutes=max_age_minutes):
+            stale.append(job_id)
+            continue
+        result = job.get("result") or {}
+        if result.get("slideshow_status") == "pending" and result.get("slideshow_id"):
+            pending.append(job_id)
+    return stale, pending
+
+
+class PersistedRowCache:
+    """Short-TTL memo of durable `job_results` rows, keyed by job_id.
+
+    Misses are cached too (as None) so a poll for an unknown job id doesn't turn
+    into one Supabase query per poll. Stale-while-revalidate: an expired or
+    invalidated entry keeps its last row, so a recovered job keeps reporting its
+    real status while the caller refreshes it, and a later miss (a failed lookup
+    also reads as None) never erases a row already seen. Bounded: the oldest
+    entries are dropped once `max_entries` is exceeded. Timestamps are
+    caller-supplied (monotonic seconds) so the expiry logic is deterministic
+    under test.
+    """
+
+    def __init__(self, ttl_seconds: float = PERSISTED_ROW_TTL_SECONDS,
+                 max_entries: int = PERSISTED_ROW_CACHE_MAX):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Tuple[float, Optional[dict]]]" = OrderedDict()
+
+    def get(self, job_id: str, now: float) -> Tuple[bool, Optional[dict]]:
+        """Return (fresh_hit, row). `row` is None for a cached miss or a job never
+        seen; on a stale entry it is the last row seen (refresh, but serve it)."""
+        entry = self._entries.get(job_id)
+        if entry is None:
+            return False, None
+        fetched_at, row = entry
+        return now - fetched_at <= self.ttl_seconds, row
+
+    def put(self, job_id: str, row: Optional[dict], now: float) -> None:
+        if row is None and job_id in self._entries:
+            row = self._entries[job_id][1]
+        self._entries[job_id] = (now, row)
+        self._entries.move_to_end(job_id)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def __contains__(self, job_id: str) -> bool:
+        """Whether `job_id` was ever looked up (a cached miss included)."""
+        return job_id in self._entries
+
+    def invalidate(self, job_id: str) -> None:
+        """Force the next `get` to report stale (the last row is still returned)."""
+        entry = self._entries.get(job_id)
+        if entry is not None:
+            self._entries[job_id] = (float("-inf"), entry[1])
+
+    def __len__(self) -> int:
+        return len(self._entries)
@@ -3,15 +3,30 @@ JobStore — Supabase persistence for the central `profile_requests` table (v3.1
 
 Replaces the in-memory `jobs_store` dict: every job is created, progressed, and
 finalized here, so devops can pull any job's state + debug log straight from the
-database. Provides the JobLogger flush sink (appends redacted entries to
-`profile_requests.debug_logs`).
+database. Provides the JobLogger flush sink.
+
+Write path (migrations/2026-10-18_profile_request_logs.sql):
+  * debug log entries are bulk-INSERTed into the append-only
+    `profile_request_logs` table, one row per entry — a flush costs one round
+    trip for its batch only (the old `profile_requests.debug_logs` sink
+    re-read and rewrote the whole array on every flush),
+  * progress is one conditional UPDATE (`current_stage_seq <= new seq`, so the
+    STAGE_SEQ guard runs server-side) — or the `advance_profile_request` RPC
+    when a partial result has to be merged into `partial_results` — instead of
+    a SELECT then an UPDATE,
+  * same-stage progress ticks closer together than PROGRESS_MIN_INTERVAL are
+    coalesced client-side: the latest one is held per job and written by the
+    next allowed tick of the stage (which supersedes it) or just before the
+    stage changes, so the row ends each stage on its last step. Stage
+    changes, partials and the terminal stages are always written.
 
 The supabase client is imported lazily; the payload-building and monotonic-guard
 logic is pure and unit-tested locally.
 """
 from __future__ import annotations
 
-from typing import Callable, Optional
+import time
+from typing import Callable, Dict, Optional, Tuple
 
 STAGE_SEQ = {  # canonical stage -> monotonic sequence for the out-of-order guard
     "1_resolution": 1,
@@ -25,11 +40,29 @@ STAGE_SEQ = {  # canonical stage -> monotonic sequence for the out-of-order guar
 }
 
 
+# Same-stage progress ticks closer together than this (seconds) are coalesced.
+PROGRESS_MIN_INTERVAL = 1.0
+
+
 def should_apply_update(current_seq: Optional[int], new_seq: int) -> bool:
     """Monotonic guard: only advance progress forward (Mitigation: out-of-order writes)."""
     return current_seq is None or new_seq >= current_seq
 
 
+def should_write_progress(last: Optional[Tuple[int, float]], new_seq: int, now: float, *,
+                          has_partial: bool = False,
+                          min_interval: float = PROGRESS_MIN_INTERVAL) -> bool:
+    """Client-side coalescing: `last` is (seq, time) of this writer's last write."""
+    if last is None:
+        return True
+    last_seq, last_at = last
+    if not should_apply_update(last_seq, new_seq):
+        return False
+    if new_seq > last_seq or has_partial:
+        return True
+    return now - last_at >= min_interval
+
+
 def build_progress_update(*, stage: str, step: str, progress: float,
                           partial: Optional[dict] = None) -> dict:
     """Shape the row update for a stage transition."""
@@ -65,9 +98,16 @@ class JobStore:
     """Thin Supabase wrapper around `profile_requests` (supabase imported lazily)."""
 
     TABLE = "profile_requests"
+    LOG_TABLE = "profile_request_logs"
+    ADVANCE_RPC = "advance_profile_request"
 
-    def __init__(self, client=None):
+    def __init__(self, client=None, *, clock: Callable[[], float] = time.monotonic,
+                 min_interval: float = PROGRESS_MIN_INTERVAL):
         self._client = client  # inject in tests; lazily created in prod via factory
+        self._clock = clock
+        self._min_interval = min_interval
+        self._last_write: Dict[str, Tuple[int, float]] = {}  # job_id -> (seq, time)
+        self._pending: Dict[str, dict] = {}  # job_id -> latest coalesced tick's kwargs
 
     @classmethod
     def from_env(cls) -> "JobStore":
@@ -84,33 +124,65 @@ class JobStore:
     def update_progress(self, job_id: str, *, stage: str, step: str,
                         progress: float, partial: Optional[dict] = None) -> None:
         new_seq = STAGE_SEQ.get(stage, 0)
-        current = self._client.table(self.TABLE).select("current_stage_seq,partial_results") \
-            .eq("id", job_id).single().execute().data
-        if not should_apply_update(current.get("current_stage_seq"), new_seq):
-            return  # stale/out-of-order update — drop it
+        now = self._clock()
+        terminal = stage in ("done", "failed")
+        last = self._last_write.get(job_id)
+        if not terminal and not should_write_progress(
+                last, new_seq, now, has_partial=bool(partial), min_interval=self._min_interval):
+            if should_apply_update(last[0], new_seq):  # too soon: hold the latest tick
+                self._pending[job_id] = {"stage": stage, "step": step, "progress": progress}
+            return  # coalesced tick, or stale/out-of-order for this writer
+        pending = self._pending.pop(job_id, None)
+        if pending and not terminal and last and new_seq > last[0]:
+            self._write(job_id, now=now, **pending)  # the old stage's last step lands first
+        self._write(job_id, stage=stage, step=step, progress=progress, partial=partial, now=now)
+
+    def flush(self, job_id: str) -> None:
+        """Write the job's held (coalesced) tick now, if any."""
+        pending = self._pending.pop(job_id, None)
+        if pending:
+            self._write(job_id, now=self._clock(), **pending)
+
+    def _write(self, job_id: str, *, stage: str, step: str, progress: float,
+               now: float, partial: Optional[dict] = None) -> None:
+        new_seq = STAGE_SEQ.get(stage, 0)
+        terminal = stage in ("done", "failed")
         payload = build_progress_update(stage=stage, step=step, progress=progress, partial=partial)
-        merged_partial = dict(current.get("partial_results") or {})
-        if "_partial" in payload:
-            merged_partial.update(payload.pop("_partial"))
-            payload["partial_results"] = merged_partial
-        payload["updated_at"] = "now()"
-        self._client.table(self.TABLE).update(payload).eq("id", job_id).execute()
+        merge = payload.pop("_partial", None)
+        if merge:
+            self._client.rpc(self.ADVANCE_RPC, {
+                "p_id": job_id, "p_seq": new_seq, "p_update": payload, "p_partial": merge,
+            }).execute()
+        else:
+            payload["updated_at"] = "now()"
+            # Server-side STAGE_SEQ guard: a stale update matches no row.
+            self._client.table(self.TABLE).update(payload).eq("id", job_id) \
+                .lte("current_stage_seq", new_seq).execute()
+        if terminal:
+            self._last_write.pop(job_id, None)
+        else:
+            self._last_write[job_id] = (new_seq, now)
 
     def persist_final(self, job_id: str, result: dict) -> None:
         self._client.table(self.TABLE).update(build_final_update(result)).eq("id", job_id).execute()
 
     def fail(self, job_id: str, *, error_code: str, error_message: str) -> None:
+        self._last_write.pop(job_id, None)
+        self._pending.pop(job_id, None)
         self._client.table(self.TABLE).update({
             "status": "failed", "current_stage": "failed",
             "error_code": error_code, "error_message": error_message,
         }).eq("id", job_id).execute()
 
     def logger_sink(self, job_id: str) -> Callable[[list[dict]], None]:
-        """Return a JobLogger sink that appends entries to debug_logs."""
+        """Return a JobLogger sink that appends entries to profile_request_logs."""
         def _sink(entries: list[dict]) -> None:
-            current = self._client.table(self.TABLE).select("debug_logs") \
-                .eq("id", job_id).single().execute().data
-            logs = list(current.get("debug_logs") or [])
-            logs.extend(entries)
-            self._client.table(self.TABLE).update({"debug_logs": logs}).eq("id", job_id).execute()
+            rows = [{"job_id": job_id, **entry} for entry in entries]
+            self._client.table(self.LOG_TABLE).insert(rows).execute()
         return _sink
+
+    def read_logs(self, job_id: str) -> list[dict]:
+        """A job's debug log entries in write order."""
+        res = self._client.table(self.LOG_TABLE).select("ts,stage,step,level,msg,data") \
+            .eq("job_id", job_id).order("ts").order("id").execute()
+        return list(res.data or [])
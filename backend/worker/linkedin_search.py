@@ -0,0 +1,140 @@
+"""Batched LinkedIn discovery helpers for step 2.86 (pure, stdlib-only).
+
+Step 2.86 (`production_main._find_linkedin_via_claude_search`) used to send one
+web-search `messages.create` per contact, in sequence — a full tool round-trip
+per person. These helpers let it ask about 3–5 contacts per request (one JSON
+array back), and remember answers across jobs:
+
+  * `batches` / `batch_prompt` / `parse_batch_response` — the batched request,
+    with the same two hard rules as the single-contact prompt (exact name match,
+    currently at the company; title is not checked),
+  * `LinkedInCache` — (normalized name, company domain) -> LinkedIn URL, with
+    negative entries (confirmed NOT_FOUND) kept for a shorter TTL.
+
+production_main owns the Anthropic client, concurrency and cost metering.
+"""
+from __future__ import annotations
+
+import json
+import re
+import time
+from collections import OrderedDict
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+DEFAULT_BATCH_SIZE = 4
+
+LINKEDIN_URL_RE = re.compile(r"https?://(?:www\.)?linkedin\.com/in/[\w\-]+/?")
+
+# Positive hits are stable for weeks; a NOT_FOUND may change when a profile is
+# created or indexed, so it is retried sooner.
+POSITIVE_TTL_SECONDS = 30 * 24 * 3600.0
+NEGATIVE_TTL_SECONDS = 3 * 24 * 3600.0
+CACHE_MAX_ENTRIES = 20000
+
+# Cache lookup result for "never asked / expired".
+MISS = object()
+
+
+def normalize_name(name: str) -> str:
+    return " ".join((name or "").lower().split())
+
+
+def normalize_domain(domain: str) -> str:
+    d = (domain or "").strip().lower()
+    d = re.sub(r"^https?://", "", d)
+    d = d.split("/")[0]
+    return d[4:] if d.startswith("www.") else d
+
+
+def batches(items: Sequence, size: int) -> List[list]:
+    """Split `items` into consecutive chunks of at most `size` (order kept)."""
+    size = max(1, int(size))
+    return [list(items[i:i + size]) for i in range(0, len(items), size)]
+
+
+def batch_prompt(company_name: str, domain: str, names: Sequence[str]) -> str:
+    """User prompt asking for several people at once; JSON array back."""
+    listing = "\n".join(f"{i + 1}. {n}" for i, n in enumerate(names))
+    return (
+        f"Find the LinkedIn profile URL for each person below who currently works at "
+        f"{company_name} (domain: {domain}).\n\n{listing}\n\n"
+        f"For EACH person only TWO things matter:\n"
+        f"1. The full name on the LinkedIn profile must EXACTLY match the listed name\n"
+        f"2. They must CURRENTLY work at {company_name} — not a former employee\n\n"
+        f"Do NOT check job title — title differences are expected and acceptable.\n\n"
+        f"Return ONLY a JSON array with one object per listed person, in order:\n"
+        f'[{{"name": "<listed name>", "linkedin_url": "https://www.linkedin.com/in/..."}}]\n'
+        f'Use "linkedin_url": "NOT_FOUND" for anyone you cannot confirm on BOTH counts.'
+    )
+
+
+def parse_batch_response(text: str, names: Sequence[str]) -> Dict[str, Optional[str]]:
+    """Map each listed name to a URL, None (confirmed NOT_FOUND), or leave it out
+    when the model said nothing usable about that person."""
+    start, end = (text or "").find("["), (text or "").rfind("]")
+    if start == -1 or end <= start:
+        return {}
+    try:
+        rows = json.loads(text[start:end + 1])
+    except json.JSONDecodeError:
+        return {}
+    wanted = {normalize_name(n): n for n in names}
+    out: Dict[str, Optional[str]] = {}
+    for row in rows if isinstance(rows, list) else []:
+        if not isinstance(row, dict):
+            continue
+        name = wanted.get(normalize_name(str(row.get("name") or "")))
+        if name is None or name in out:
+            continue
+        raw = str(row.get("linkedin_url") or "")
+        match = LINKEDIN_URL_RE.search(raw)
+        if match:
+            out[name] = match.group(0).rstrip("/")
+        elif "NOT_FOUND" in raw.upper():
+            out[name] = None
+    return out
+
+
+class LinkedInCache:
+    """Cross-job (normalized name, domain) -> URL | None (negative), TTL + LRU."""
+
+    def __init__(self, *, positive_ttl: float = POSITIVE_TTL_SECONDS,
+                 negative_ttl: float = NEGATIVE_TTL_SECONDS,
+                 max_entries: int = CACHE_MAX_ENTRIES,
+                 clock: Callable[[], float] = time.monotonic):
+        self.positive_ttl = positive_ttl
+        self.negative_ttl = negative_ttl
+        self.max_entries = max_entries
+        self._clock = clock
+        self._entries: "OrderedDict[Tuple[str, str], Tuple[float, Optional[str]]]" = OrderedDict()
+
+    @staticmethod
+    def key(name: str, domain: str) -> Tuple[str, str]:
+        return (normalize_name(name), normalize_domain(domain))
+
+    def get(self, name: str, domain: str):
+        """The cached URL, None for a cached NOT_FOUND, or MISS."""
+        key = self.key(name, domain)
+        hit = self._entries.get(key)
+        if hit is None:
+            return MISS
+        stored_at, url = hit
+        ttl = self.positive_ttl if url else self.negative_ttl
+        if self._clock() - stored_at > ttl:
+            del self._entries[key]
+            return MISS
+        self._entries.move_to_end(key)
+        return url
+
+    def put(self, name: str, domain: str, url: Optional[str]) -> None:
+        key = self.key(name, domain)
+        self._entries[key] = (self._clock(), url)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
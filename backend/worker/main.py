@@ -193,9 +193,13 @@ class WorkerOrchestrator:
             if stakeholder_profiles:
                 try:
                     logger.info("Step 3.5: Verifying and enriching emails")
+                    email_pattern = None
+                    if self.hunter_client.needs_domain_pattern(stakeholder_profiles):
+                        email_pattern = await self.hunter_client.domain_pattern(domain)
                     stakeholder_profiles = await self.hunter_client.enrich_stakeholder_emails(
                         stakeholder_profiles,
-                        domain
+                        domain,
+                        pattern=email_pattern
                     )
                 except Exception as e:
                     logger.warning(f"Email enrichment failed, continuing with basic emails: {e}")
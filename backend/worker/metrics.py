@@ -0,0 +1,302 @@
+"""Process-wide Prometheus metrics for the profile pipeline (pure, stdlib-only).
+
+Vendor health used to be visible only per job (the span tree behind
+`/jobs/{id}/trace`, `api_cost` on the result, `CircuitBreakerRegistry.snapshot`
+inside one provider) — nothing answered "is ZoomInfo slow right now" or "how
+many jobs are queued" across jobs. This module aggregates that into a scrape
+endpoint (`GET /metrics`, Prometheus text format 0.0.4) without a client
+library:
+
+  * `Counter` / `Histogram` / `Gauge` — label-keyed, fixed buckets, one lock per
+    family; the hot path is a dict lookup and a few float adds,
+  * `observe_span` — fed by `tracing` when a vendor / LLM / wait / render span
+    ends, so every `@tracing.traced` call site reports latency, errors (an
+    exception, `status_code >= 400`, or an `error_type` attribute for failures the
+    call site swallowed — see `tracing.annotate_error`) and 429s;
+    the vendor is the span-name prefix (`zoominfo.request` -> zoominfo),
+  * `register_collector` — scrape-time callbacks for values that are cheaper to
+    read than to maintain (queue depth and in-flight jobs from the job store),
+  * `render` — the exposition text.
+"""
+from __future__ import annotations
+
+import bisect
+import math
+import threading
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0)
+WAIT_BUCKETS = (0.001, 0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+FANOUT_BUCKETS = (0, 1, 2, 5, 10, 15, 20, 25, 30)
+COST_BUCKETS = (0.01, 0.05, 0.1, 0.25, 0.5, 1.0, 2.0, 5.0, 10.0)
+JOB_BUCKETS = (10.0, 30.0, 60.0, 120.0, 180.0, 300.0, 600.0, 1200.0)
+
+# Span-name prefix -> vendor label, where they differ.
+VENDOR_ALIASES = {"claude": "anthropic"}
+
+# Span kinds observed by `observe_span`.
+_LATENCY_KINDS = frozenset({"vendor", "llm"})
+
+Labels = Tuple[str, ...]
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _label_str(names: Iterable[str], values: Iterable[Any], extra: str = "") -> str:
+    parts = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+
+def _fmt(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Family:
+    kind = "untyped"
+
+    def __init__(self, name: str, help_text: str, labelnames: Labels = ()):
+        self.name = name
+        self.help = help_text
+        self.labelnames = tuple(labelnames)
+        self._lock = threading.Lock()
+
+    def _key(self, labels: Iterable[Any]) -> Labels:
+        key = tuple(str(v) for v in labels)
+        if len(key) != len(self.labelnames):
+            raise ValueError(f"{self.name} expects labels {self.labelnames}, got {key}")
+        return key
+
+    def header(self) -> List[str]:
+        return [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} {self.kind}"]
+
+
+class Counter(_Family):
+    kind = "counter"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[Labels, float] = {}
+
+    def inc(self, labels: Iterable[Any] = (), amount: float = 1.0) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def value(self, labels: Iterable[Any] = ()) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def lines(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_label_str(self.labelnames, k)} {_fmt(v)}" for k, v in items]
+
+
+class Gauge(_Family):
+    kind = "gauge"
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self._values: Dict[Labels, float] = {}
+
+    def set(self, labels: Iterable[Any], value: float) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = float(value)
+
+    def inc(self, labels: Iterable[Any] = (), amount: float = 1.0) -> None:
+        key = self._key(labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0.0) + amount
+
+    def dec(self, labels: Iterable[Any] = (), amount: float = 1.0) -> None:
+        self.inc(labels, -amount)
+
+    def value(self, labels: Iterable[Any] = ()) -> float:
+        return self._values.get(self._key(labels), 0.0)
+
+    def lines(self) -> List[str]:
+        with self._lock:
+            items = sorted(self._values.items())
+        return [f"{self.name}{_label_str(self.labelnames, k)} {_fmt(v)}" for k, v in items]
+
+
+class Histogram(_Family):
+    kind = "histogram"
+
+    def __init__(self, name: str, help_text: str, labelnames: Labels = (),
+                 buckets: Iterable[float] = LATENCY_BUCKETS):
+        super().__init__(name, help_text, labelnames)
+        self.buckets = tuple(sorted(buckets))
+        # labels -> [per-bucket counts (non-cumulative, last = +Inf), sum, count]
+        self._series: Dict[Labels, list] = {}
+
+    def observe(self, labels: Iterable[Any], value: float) -> None:
+        key = self._key(labels)
+        idx = bisect.bisect_left(self.buckets, value)
+        with self._lock:
+            series = self._series.get(key)
+            if series is None:
+                series = self._series[key] = [[0] * (len(self.buckets) + 1), 0.0, 0]
+            series[0][idx] += 1
+            series[1] += value
+            series[2] += 1
+
+    def count(self, labels: Iterable[Any] = ()) -> int:
+        series = self._series.get(self._key(labels))
+        return series[2] if series else 0
+
+    def sum(self, labels: Iterable[Any] = ()) -> float:
+        series = self._series.get(self._key(labels))
+        return series[1] if series else 0.0
+
+    def lines(self) -> List[str]:
+        with self._lock:
+            items = sorted((k, (list(s[0]), s[1], s[2])) for k, s in self._series.items())
+        out = []
+        for key, (counts, total, n) in items:
+            running = 0
+            for bound, c in zip(self.buckets + (math.inf,), counts):
+                running += c
+                le = _label_str(self.labelnames, key, f'le="{_fmt(bound)}"')
+                out.append(f"{self.name}_bucket{le} {running}")
+            labels = _label_str(self.labelnames, key)
+            out.append(f"{self.name}_sum{labels} {_fmt(round(total, 6))}")
+            out.append(f"{self.name}_count{labels} {n}")
+        return out
+
+
+class Registry:
+    def __init__(self):
+        self._families: Dict[str, _Family] = {}
+        self._collectors: List[Callable[[], Iterable[Tuple[str, Dict[str, Any], float]]]] = []
+        self._collected: Dict[str, Gauge] = {}
+
+    def _add(self, family: _Family) -> Any:
+        existing = self._families.get(family.name)
+        if existing is not None:
+            return existing
+        self._families[family.name] = family
+        return family
+
+    def counter(self, name: str, help_text: str, labelnames: Labels = ()) -> Counter:
+        return self._add(Counter(name, help_text, labelnames))
+
+    def gauge(self, name: str, help_text: str, labelnames: Labels = ()) -> Gauge:
+        return self._add(Gauge(name, help_text, labelnames))
+
+    def histogram(self, name: str, help_text: str, labelnames: Labels = (),
+                  buckets: Iterable[float] = LATENCY_BUCKETS) -> Histogram:
+        return self._add(Histogram(name, help_text, labelnames, buckets))
+
+    def register_collector(self, fn: Callable[[], Iterable[Tuple[str, Dict[str, Any], float]]],
+                           help_texts: Optional[Dict[str, str]] = None) -> None:
+        """`fn()` yields (gauge name, labels, value) at scrape time."""
+        self._collectors.append(fn)
+        for name, text in (help_texts or {}).items():
+            self._collected.setdefault(name, Gauge(name, text))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for family in self._families.values():
+            body = family.lines()
+            if body:
+                lines += family.header() + body
+        scraped: Dict[str, List[str]] = {}
+        for fn in self._collectors:
+            try:
+                samples = list(fn())
+            except Exception:  # noqa: BLE001 — a broken collector must not break the scrape
+                continue
+            for name, labels, value in samples:
+                scraped.setdefault(name, []).append(
+                    f"{name}{_label_str(labels.keys(), labels.values())} {_fmt(value)}")
+        for name, body in scraped.items():
+            family = self._collected.get(name) or Gauge(name, name)
+            lines += family.header() + body
+        return "\n".join(lines) + "\n"
+
+
+REGISTRY = Registry()
+
+VENDOR_LATENCY = REGISTRY.histogram(
+    "rad_vendor_request_duration_seconds", "Vendor / LLM call latency.", ("vendor", "endpoint"))
+VENDOR_ERRORS = REGISTRY.counter(
+    "rad_vendor_errors_total", "Vendor / LLM calls that raised or returned HTTP >= 400.",
+    ("vendor", "endpoint", "reason"))
+VENDOR_RATE_LIMITED = REGISTRY.counter(
+    "rad_vendor_rate_limited_total", "Vendor responses with HTTP 429.", ("vendor",))
+RATE_LIMIT_WAIT = REGISTRY.histogram(
+    "rad_rate_limiter_wait_seconds", "Time spent waiting on client-side rate limiters / semaphores.",
+    ("limiter",), WAIT_BUCKETS)
+RENDER_LATENCY = REGISTRY.histogram(
+    "rad_render_duration_seconds", "Deck render latency.", ("renderer",))
+INFLIGHT = REGISTRY.gauge(
+    "rad_inflight_calls", "Vendor / LLM calls and deck renders currently running.", ("kind", "vendor"))
+COUNCIL_FANOUT = REGISTRY.histogram(
+    "rad_council_specialists", "Council specialists per run, by outcome.", ("outcome",), FANOUT_BUCKETS)
+JOB_COST = REGISTRY.histogram(
+    "rad_job_cost_usd", "Metered API cost per completed job (USD).", (), COST_BUCKETS)
+JOB_DURATION = REGISTRY.histogram(
+    "rad_job_duration_seconds", "Wall-clock time per profile job.", ("status",), JOB_BUCKETS)
+
+
+def vendor_of(span_name: str) -> Tuple[str, str]:
+    """(vendor, endpoint) from a span name like `zoominfo.request`."""
+    prefix, _, rest = span_name.partition(".")
+    return VENDOR_ALIASES.get(prefix, prefix), rest or prefix
+
+
+def _tracked(kind: str) -> bool:
+    return kind in _LATENCY_KINDS or kind == "render"
+
+
+def span_started(name: str, kind: str) -> None:
+    if _tracked(kind):
+        INFLIGHT.inc((kind, vendor_of(name)[0]))
+
+
+def observe_span(name: str, kind: str, duration_s: float, attributes: Dict[str, Any],
+                 error: Optional[BaseException] = None, *, started: bool = True) -> None:
+    """Fold a finished tracing span into the process-wide metrics."""
+    if kind == "wait":
+        RATE_LIMIT_WAIT.observe((name,), duration_s)
+        return
+    if not _tracked(kind):
+        return
+    vendor, endpoint = vendor_of(name)
+    if started:
+        INFLIGHT.dec((kind, vendor))
+    if kind == "render":
+        RENDER_LATENCY.observe((vendor,), duration_s)
+        return
+    endpoint = str(attributes.get("endpoint") or endpoint)
+    VENDOR_LATENCY.observe((vendor, endpoint), duration_s)
+    status = attributes.get("status_code")
+    if error is not None:
+        VENDOR_ERRORS.inc((vendor, endpoint, type(error).__name__))
+    elif isinstance(status, int) and status >= 400:
+        VENDOR_ERRORS.inc((vendor, endpoint, f"http_{status}"))
+    elif attributes.get("error_type"):
+        VENDOR_ERRORS.inc((vendor, endpoint, str(attributes["error_type"])))
+    if status == 429:
+        VENDOR_RATE_LIMITED.inc((vendor,))
+
+
+def observe_council(dispatched: int, skipped: int, reused: int) -> None:
+    COUNCIL_FANOUT.observe(("dispatched",), dispatched)
+    COUNCIL_FANOUT.observe(("skipped",), skipped)
+    COUNCIL_FANOUT.observe(("reused",), reused)
+
+
+def register_collector(fn, help_texts: Optional[Dict[str, str]] = None) -> None:
+    REGISTRY.register_collector(fn, help_texts)
+
+
+def render() -> str:
+    return REGISTRY.render()
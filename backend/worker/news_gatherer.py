@@ -1,15 +1,66 @@
 """
 News Intelligence Gatherer using GNews API
 Fetches recent company news for sales intelligence.
+
+GNews is paged (GNEWS_PAGE_SIZE per request, up to GNEWS_MAX_PAGES), merged
+with the ZoomInfo news/scoops already fetched for the job, deduped, and only
+asked for articles newer than the previous run for the same domain — see
+news_ingest.py.
 """
 import logging
 import httpx
 from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import os
 
+try:
+    from worker import news_ingest, tracing
+except Exception:  # noqa: BLE001
+    import news_ingest  # bare path
+    import tracing
+
 logger = logging.getLogger(__name__)
 
+GNEWS_PAGE_SIZE = int(os.getenv("GNEWS_PAGE_SIZE", "10"))  # free-plan max per request
+GNEWS_MAX_PAGES = int(os.getenv("GNEWS_MAX_PAGES", "3"))
+
+# Keywords for each category, in priority order (an article lands in the first match)
+CATEGORY_KEYWORDS: Dict[str, List[str]] = {
+    "executive_changes": [
+        "ceo", "cto", "cfo", "cio", "coo", "hire", "hired", "appoint",
+        "joins", "joined", "executive", "resign", "departure", "promoted",
+        "chief", "president", "vp", "vice president", "names", "taps"
+    ],
+    "funding": [
+        "funding", "raised", "raises", "investment", "investors", "valuation",
+        "series a", "series b", "series c", "series d", "seed", "round",
+        "venture", "vc", "capital", "million", "billion", "invested", "financing"
+    ],
+    "partnerships": [
+        "partnership", "partners", "acquisition", "acquires", "acquired",
+        "merger", "deal", "agreement", "collaboration", "strategic",
+        "alliance", "joint venture", "buys", "purchased", "teams up"
+    ],
+    "expansions": [
+        "expansion", "expands", "new office", "opens", "location",
+        "facility", "headquarters", "growth", "scaling", "presence",
+        "regional", "international", "global"
+    ],
+    "products": [
+        "launch", "launches", "launched", "product", "service", "feature",
+        "release", "unveiled", "announces", "introduced", "new offering",
+        "platform", "solution"
+    ],
+    "financial": [
+        "earnings", "revenue", "profit", "quarterly", "financial results",
+        "fiscal", "q1", "q2", "q3", "q4", "annual report", "sales",
+        "beats estimates", "misses", "guidance"
+    ]
+}
+
+# Compiled once: one pass per article finds every category's terms
+_MATCHER = news_ingest.KeywordMatcher(CATEGORY_KEYWORDS)
+
 
 class NewsGatherer:
     """
@@ -42,81 +93,137 @@ class NewsGatherer:
         self,
         company_name: str,
         domain: Optional[str] = None,
-        max_articles: int = 50
+        max_articles: int = 50,
+        extra_articles: Optional[List[Dict]] = None,
+        use_gnews: bool = True
     ) -> Dict[str, Any]:
         """
         Fetch recent news articles about a company.
 
         Args:
             company_name: Company name to search
-            domain: Company domain (helps with disambiguation)
-            max_articles: Maximum articles to fetch (GNews max is 10 per request)
+            domain: Company domain (keys the incremental cursor)
+            max_articles: Maximum new GNews articles (paged, GNEWS_PAGE_SIZE per request)
+            extra_articles: Already-fetched articles in GNews shape (ZoomInfo news/scoops)
+                merged in after GNews, lowest dedupe priority
+            use_gnews: False to categorize only `extra_articles`
 
         Returns:
             Dictionary with categorized news articles
         """
-        if not self.api_key:
-            logger.warning("GNews API key not configured, returning empty news data")
+        extra = list(extra_articles or [])
+        if use_gnews and not self.api_key:
+            logger.warning("GNews API key not configured" + (", using ZoomInfo news only" if extra else ", returning empty news data"))
+            use_gnews = False
+        if not use_gnews and not extra:
             return self._empty_response()
 
-        try:
-            # Calculate date range (last 90 days)
-            from_date = (datetime.now() - timedelta(days=self.days_back)).strftime("%Y-%m-%dT%H:%M:%SZ")
-
-            # Build search query
-            query = f'"{company_name}"'
-
-            params = {
-                "q": query,
-                "lang": "en",
-                "max": min(max_articles, 10),  # GNews max is 10
-                "from": from_date,
-                "token": self.api_key,
-                "sortby": "publishedAt"
-            }
-
-            logger.info(f"Fetching news for {company_name} from GNews (last {self.days_back} days)")
-
-            async with httpx.AsyncClient(timeout=10) as client:  # 10 second timeout
-                response = await client.get(self.api_url, params=params)
-                response.raise_for_status()
-                data = response.json()
-
-                articles = data.get("articles", [])
-                logger.info(f"Found {len(articles)} news articles for {company_name}")
-
-                # Categorize articles
-                categorized = self._categorize_articles(articles)
-
-                # Extract summaries for each category
-                summaries = self._generate_category_summaries(categorized)
-
-                return {
-                    "success": True,
-                    "company_name": company_name,
-                    "articles_count": len(articles),
-                    "date_range": f"Last {self.days_back} days",
-                    "categories": categorized,
-                    "summaries": summaries,
-                    "raw_articles": articles
-                }
-
-        except httpx.TimeoutException:
-            logger.warning(f"GNews API timeout after 10s for {company_name}")
-            return self._empty_response(error="GNews API timeout (10s)")
+        window_start = (datetime.now(timezone.utc) - timedelta(days=self.days_back)).strftime(news_ingest.ISO_FORMAT)
+        cursor_key = news_ingest.CursorCache.key(company_name, domain)
+        cached = news_ingest.CURSORS.get(cursor_key) if use_gnews else None
+        cached_articles = news_ingest.within(cached[1], window_start) if cached else []
 
-        except httpx.HTTPStatusError as e:
-            error_detail = ""
+        fresh: List[Dict] = []
+        error = None
+        if use_gnews:
+            # Only ask for what is newer than the last run for this domain
+            from_date = max(cached[0], window_start) if cached else window_start
             try:
-                error_detail = e.response.json().get("errors", [])
-            except:
-                pass
-            logger.error(f"GNews API HTTP error: {e.response.status_code} - {error_detail}")
-            return self._empty_response(error=f"GNews API HTTP {e.response.status_code}")
+                fresh = await self._fetch_gnews(company_name, from_date, max_articles)
+                logger.info(f"Found {len(fresh)} new GNews articles for {company_name} since {from_date}"
+                            + (f" ({len(cached_articles)} cached)" if cached else ""))
+                window, _ = news_ingest.dedupe(fresh + cached_articles)
+                news_ingest.CURSORS.put(cursor_key, window)
+
+            except httpx.TimeoutException as e:
+                tracing.annotate_error(e)
+                logger.warning(f"GNews API timeout after 10s for {company_name}")
+                error = "GNews API timeout (10s)"
+
+            except httpx.HTTPStatusError as e:
+                error_detail = ""
+                try:
+                    error_detail = e.response.json().get("errors", [])
+                except:
+                    pass
+                logger.error(f"GNews API HTTP error: {e.response.status_code} - {error_detail}")
+                error = f"GNews API HTTP {e.response.status_code}"
+
+            except Exception as e:
+                tracing.annotate_error(e)
+                logger.error(f"Error fetching news: {e}")
+                error = str(e)
+
+        articles, duplicates = news_ingest.dedupe(
+            news_ingest.within(fresh + cached_articles + extra, window_start)
+        )
+        if error and not articles:
+            return self._empty_response(error=error)
+        articles.sort(key=lambda a: a.get("publishedAt") or "", reverse=True)
+
+        sources: Dict[str, int] = {}
+        for article in articles:
+            sources[article.get("origin", "gnews")] = sources.get(article.get("origin", "gnews"), 0) + 1
+
+        # Categorize articles
+        categorized = self._categorize_articles(articles)
+
+        # Extract summaries for each category
+        summaries = self._generate_category_summaries(categorized)
+
+        result = {
+            "success": True,
+            "company_name": company_name,
+            "articles_count": len(articles),
+            "date_range": f"Last {self.days_back} days",
+            "categories": categorized,
+            "summaries": summaries,
+            "raw_articles": articles,
+            "sources": sources,
+            "duplicates_removed": duplicates,
+            "incremental": cached is not None,
+        }
+        if error:
+            result["gnews_error"] = error
+        return result
+
+    async def _fetch_gnews(self, company_name: str, from_date: str, max_articles: int) -> List[Dict]:
+        """Page through GNews search results published since `from_date`."""
+        page_size = max(1, min(max_articles, GNEWS_PAGE_SIZE))
+        pages = max(1, min(GNEWS_MAX_PAGES, -(-max_articles // page_size)))
+        articles: List[Dict] = []
+
+        async with httpx.AsyncClient(timeout=10) as client:  # 10 second timeout per page
+            for page in range(1, pages + 1):
+                params = {
+                    "q": f'"{company_name}"',
+                    "lang": "en",
+                    "max": page_size,
+                    "from": from_date,
+                    "token": self.api_key,
+                    "sortby": "publishedAt"
+                }
+                if page > 1:
+                    params["page"] = page
+                try:
+                    response = await client.get(self.api_url, params=params)
+                    if page == 1 or response.status_code == 429:  # plan-limited paging isn't an outage
+                        tracing.annotate_status(response.status_code)
+                    response.raise_for_status()
+                except httpx.HTTPError as e:
+                    if page == 1:
+                        raise
+                    # Paging is a paid-plan feature; keep what the first pages returned
+                    logger.info(f"GNews paging stopped at page {page}: {e}")
+                    break
+                data = response.json()
+                batch = data.get("articles", [])
+                articles.extend(news_ingest.from_gnews(a) for a in batch)
+                total = data.get("totalArticles")
+                if len(batch) < page_size or (total is not None and len(articles) >= total):
+                    break
 
-        except Exception as e:
-            logger.error(f"Error fetching news: {e}")
-            return self._empty_response(error=str(e))
+        return articles[:max_articles]
 
     def _categorize_articles(self, articles: List[Dict]) -> Dict[str, List[Dict]]:
         """
@@ -138,73 +245,25 @@ class NewsGatherer:
             "other": []
         }
 
-        # Keywords for each category
-        keywords = {
-            "executive_changes": [
-                "ceo", "cto", "cfo", "cio", "coo", "hire", "hired", "appoint",
-                "joins", "joined", "executive", "resign", "departure", "promoted",
-                "chief", "president", "vp", "vice president", "names", "taps"
-            ],
-            "funding": [
-                "funding", "raised", "raises", "investment", "investors", "valuation",
-                "series a", "series b", "series c", "series d", "seed", "round",
-                "venture", "vc", "capital", "million", "billion", "invested", "financing"
-            ],
-            "partnerships": [
-                "partnership", "partners", "acquisition", "acquires", "acquired",
-                "merger", "deal", "agreement", "collaboration", "strategic",
-                "alliance", "joint venture", "buys", "purchased", "teams up"
-            ],
-            "expansions": [
-                "expansion", "expands", "new office", "opens", "location",
-                "facility", "headquarters", "growth", "scaling", "presence",
-                "regional", "international", "global"
-            ],
-            "products": [
-                "launch", "launches", "launched", "product", "service", "feature",
-                "release", "unveiled", "announces", "introduced", "new offering",
-                "platform", "solution"
-            ],
-            "financial": [
-                "earnings", "revenue", "profit", "quarterly", "financial results",
-                "fiscal", "q1", "q2", "q3", "q4", "annual report", "sales",
-                "beats estimates", "misses", "guidance"
-            ]
-        }
-
         for article in articles:
             title = (article.get("title") or "").lower()
             description = (article.get("description") or "").lower()
             content_text = (article.get("content") or "").lower()
             content = f"{title} {description} {content_text}"
 
-            categorized = False
-
-            # Check each category (prioritize by order)
-            for category, terms in keywords.items():
-                if any(term in content for term in terms):
-                    categories[category].append({
-                        "title": article.get("title"),
-                        "description": article.get("description"),
-                        "content": article.get("content"),
-                        "url": article.get("url"),
-                        "source": article.get("source", {}).get("name"),
-                        "publishedAt": article.get("publishedAt"),
-                        "relevance_score": self._calculate_relevance(content, terms)
-                    })
-                    categorized = True
-                    break  # Only categorize once per article
-
-            if not categorized:
-                categories["other"].append({
-                    "title": article.get("title"),
-                    "description": article.get("description"),
-                    "content": article.get("content"),
-                    "url": article.get("url"),
-                    "source": article.get("source", {}).get("name"),
-                    "publishedAt": article.get("publishedAt"),
-                    "relevance_score": 0.1
-                })
+            # First category (by priority order) with a keyword hit
+            match = _MATCHER.classify(content)
+            category, relevance = match if match else ("other", 0.1)
+            categories[category].append({
+                "title": article.get("title"),
+                "description": article.get("description"),
+                "content": article.get("content"),
+                "url": article.get("url"),
+                "source": (article.get("source") or {}).get("name"),
+                "publishedAt": article.get("publishedAt"),
+                "origin": article.get("origin", "gnews"),
+                "relevance_score": relevance
+            })
 
         # Sort each category by relevance and date
         for category in categories:
@@ -219,11 +278,6 @@ class NewsGatherer:
 
         return categories
 
-    def _calculate_relevance(self, content: str, keywords: List[str]) -> float:
-        """Calculate relevance score based on keyword matches."""
-        matches = sum(1 for keyword in keywords if keyword in content)
-        return min(matches / len(keywords) if keywords else 0, 1.0)
-
     def _generate_category_summaries(self, categories: Dict[str, List[Dict]]) -> Dict[str, str]:
         """
         Generate human-readable summaries for each category.
@@ -309,16 +363,27 @@ class NewsGatherer:
         }
 
 
-async def gather_company_news(company_name: str, domain: Optional[str] = None) -> Dict[str, Any]:
+async def gather_company_news(
+    company_name: str,
+    domain: Optional[str] = None,
+    zoominfo_data: Optional[Dict[str, Any]] = None,
+    use_gnews: bool = True
+) -> Dict[str, Any]:
     """
     Convenience function to gather company news.
 
     Args:
         company_name: Company name
         domain: Optional company domain
+        zoominfo_data: Step 2.6 ZoomInfo results; its news_articles/scoops are merged in
+        use_gnews: False when the orchestrator skipped GNews
 
     Returns:
         News data dictionary
     """
     gatherer = NewsGatherer()
-    return await gatherer.fetch_company_news(company_name, domain)
+    return await gatherer.fetch_company_news(
+        company_name, domain,
+        extra_articles=news_ingest.zoominfo_articles(zoominfo_data),
+        use_gnews=use_gnews
+    )
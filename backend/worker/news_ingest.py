@@ -0,0 +1,284 @@
+"""News ingestion helpers: merge, dedupe, incremental windows, classification.
+
+`NewsGatherer` used to make a single GNews request (10 articles at most) per
+job, ZoomInfo news/scoops were only consulted as a late fallback, and every
+article was classified by substring-scanning each category's keyword list.
+The gatherer now composes these stdlib-only pieces:
+
+  * `KeywordMatcher` — an Aho-Corasick automaton over every category's terms,
+    compiled once; one pass over an article's text finds every term of every
+    category (same substring semantics as `term in content`),
+  * `from_zoominfo_news` / `from_zoominfo_scoop` — map ZoomInfo items onto the
+    GNews article shape so all sources flow through one categorizer,
+  * `dedupe` — drops repeats by canonical URL, then by title-shingle Jaccard
+    (the same press release syndicated under different URLs),
+  * `CursorCache` — per-domain cursor (newest `publishedAt` seen) plus the
+    articles already fetched, so the next job for that domain only asks GNews
+    for newer articles and merges them into the cached window.
+    NEWS_CURSOR_TTL_SECONDS (default 6h) / NEWS_CURSOR_MAX_DOMAINS (500).
+"""
+from __future__ import annotations
+
+import os
+import re
+import threading
+import time
+from collections import OrderedDict, deque
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit
+
+CURSOR_TTL_SECONDS = float(os.getenv("NEWS_CURSOR_TTL_SECONDS", str(6 * 3600)))
+CURSOR_MAX_DOMAINS = int(os.getenv("NEWS_CURSOR_MAX_DOMAINS", "500"))
+
+# Titles sharing this fraction of word 3-grams are the same story.
+TITLE_SIMILARITY = 0.6
+
+ISO_FORMAT = "%Y-%m-%dT%H:%M:%SZ"
+
+
+# -- classification -------------------------------------------------------------
+
+class KeywordMatcher:
+    """Aho-Corasick multi-pattern matcher over named groups of terms."""
+
+    def __init__(self, groups: Dict[str, Iterable[str]]):
+        self.groups: Dict[str, List[str]] = {
+            name: list(dict.fromkeys(t.lower() for t in terms)) for name, terms in groups.items()
+        }
+        self._terms: List[Tuple[str, str]] = [
+            (name, term) for name, terms in self.groups.items() for term in terms
+        ]
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        for term_id, (_, term) in enumerate(self._terms):
+            node = 0
+            for ch in term:
+                nxt = self._goto[node].get(ch)
+                if nxt is None:
+                    nxt = len(self._goto)
+                    self._goto[node][ch] = nxt
+                    self._goto.append({})
+                    self._fail.append(0)
+                    self._out.append([])
+                node = nxt
+            self._out[node].append(term_id)
+        queue = deque(self._goto[0].values())
+        while queue:
+            node = queue.popleft()
+            for ch, child in self._goto[node].items():
+                queue.append(child)
+                fail = self._fail[node]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(ch, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def term_ids(self, text: str) -> Set[int]:
+        """Ids of every term occurring in lower-cased `text`."""
+        goto, fail, out = self._goto, self._fail, self._out
+        found: Set[int] = set()
+        node = 0
+        for ch in text:
+            while node and ch not in goto[node]:
+                node = fail[node]
+            node = goto[node].get(ch, 0)
+            if out[node]:
+                found.update(out[node])
+        return found
+
+    def matches(self, text: str) -> Dict[str, Set[str]]:
+        """group -> terms of that group occurring in `text` (groups with none omitted)."""
+        hits: Dict[str, Set[str]] = {}
+        for term_id in self.term_ids(text.lower()):
+            name, term = self._terms[term_id]
+            hits.setdefault(name, set()).add(term)
+        return hits
+
+    def classify(self, text: str) -> Optional[Tuple[str, float]]:
+        """(first group in declaration order with a hit, matched/total terms), else None."""
+        hits = self.matches(text)
+        for name, terms in self.groups.items():
+            if name in hits:
+                return name, min(len(hits[name]) / len(terms), 1.0)
+        return None
+
+
+# -- source normalisation -------------------------------------------------------
+
+def iso_date(value: Any) -> str:
+    """Best-effort `YYYY-MM-DDTHH:MM:SSZ` (GNews' format) so dates sort as strings."""
+    if value in (None, ""):
+        return ""
+    try:
+        if isinstance(value, (int, float)):
+            dt = datetime.fromtimestamp(value / 1000 if value > 1e11 else value, tz=timezone.utc)
+        else:
+            dt = datetime.fromisoformat(str(value).strip().replace("Z", "+00:00"))
+            if dt.tzinfo is None:
+                dt = dt.replace(tzinfo=timezone.utc)
+        return dt.astimezone(timezone.utc).strftime(ISO_FORMAT)
+    except (ValueError, OverflowError, OSError):
+        return str(value)
+
+
+def _source_name(source: Any) -> str:
+    return (source.get("name") or "") if isinstance(source, dict) else (source or "")
+
+
+def from_gnews(article: Dict[str, Any]) -> Dict[str, Any]:
+    return {**article, "publishedAt": iso_date(article.get("publishedAt")), "origin": "gnews"}
+
+
+def from_zoominfo_news(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "title": item.get("title") or "",
+        "description": item.get("description") or item.get("snippet") or item.get("excerpt") or "",
+        "content": item.get("full_text") or "",
+        "url": item.get("url") or "",
+        "source": {"name": _source_name(item.get("source"))},
+        "publishedAt": iso_date(item.get("published_date")),
+        "origin": "zoominfo_news",
+    }
+
+
+def from_zoominfo_scoop(item: Dict[str, Any]) -> Dict[str, Any]:
+    return {
+        "title": item.get("title") or "",
+        "description": item.get("description") or item.get("snippet") or "",
+        "content": item.get("full_text") or "",
+        "url": item.get("source_url") or "",
+        "source": {"name": _source_name(item.get("source")) or "ZoomInfo Scoops"},
+        "publishedAt": iso_date(item.get("published_date") or item.get("date")),
+        "origin": "zoominfo_scoop",
+    }
+
+
+def zoominfo_articles(zoominfo_data: Optional[Dict[str, Any]]) -> List[Dict[str, Any]]:
+    """ZoomInfo news then scoops (as fetched in step 2.6), in GNews article shape."""
+    zoominfo_data = zoominfo_data or {}
+    return ([from_zoominfo_news(a) for a in zoominfo_data.get("news_articles") or [] if a.get("title")]
+            + [from_zoominfo_scoop(s) for s in zoominfo_data.get("scoops") or [] if s.get("title")])
+
+
+def within(articles: Iterable[Dict[str, Any]], since: str) -> List[Dict[str, Any]]:
+    """Articles published at/after `since` (undated ones are kept)."""
+    return [a for a in articles if not a.get("publishedAt") or a["publishedAt"] >= since]
+
+
+# -- dedupe ---------------------------------------------------------------------
+
+_TRACKING_PARAMS = {"fbclid", "gclid", "mc_cid", "mc_eid", "cmpid", "ref", "src", "ocid"}
+_WORD = re.compile(r"[a-z0-9]+")
+_SOURCE_SUFFIX = re.compile(r"\s+[-|–—]\s+[^-|–—]{1,60}$")
+
+
+def canonical_url(url: str) -> str:
+    """Scheme-, www-, fragment- and tracking-param-free URL for equality checks."""
+    if not url:
+        return ""
+    parts = urlsplit(url.strip())
+    host = parts.netloc.lower()
+    if host.startswith("www."):
+        host = host[4:]
+    query = sorted((k, v) for k, v in parse_qsl(parts.query)
+                   if not k.lower().startswith("utm_") and k.lower() not in _TRACKING_PARAMS)
+    return f"{host}{parts.path.rstrip('/')}" + (f"?{urlencode(query)}" if query else "")
+
+
+def title_shingles(title: str, n: int = 3) -> Set[Tuple[str, ...]]:
+    """Word n-grams of a title, minus a trailing " - Publisher" suffix."""
+    words = _WORD.findall(_SOURCE_SUFFIX.sub("", title or "").lower())
+    if len(words) < n:
+        return {tuple(words)} if words else set()
+    return {tuple(words[i:i + n]) for i in range(len(words) - n + 1)}
+
+
+def dedupe(articles: Iterable[Dict[str, Any]],
+           threshold: float = TITLE_SIMILARITY) -> Tuple[List[Dict[str, Any]], int]:
+    """(first occurrence of each story, number dropped).
+
+    Earlier articles win, so callers pass sources in priority order; a kept
+    article borrows a missing description/content from the copies it absorbs.
+    """
+    kept: List[Dict[str, Any]] = []
+    shingles: List[Set[Tuple[str, ...]]] = []
+    by_url: Dict[str, int] = {}
+    by_shingle: Dict[Tuple[str, ...], List[int]] = {}
+    dropped = 0
+    for article in articles:
+        url = canonical_url(article.get("url") or "")
+        sh = title_shingles(article.get("title") or "")
+        dup = by_url.get(url) if url else None
+        if dup is None and sh:
+            overlap: Dict[int, int] = {}
+            for g in sh:
+                for idx in by_shingle.get(g, ()):
+                    overlap[idx] = overlap.get(idx, 0) + 1
+            for idx, shared in overlap.items():
+                if shared / len(sh | shingles[idx]) >= threshold:
+                    dup = idx
+                    break
+        if dup is not None:
+            dropped += 1
+            original = kept[dup]
+            for field in ("description", "content"):
+                if not original.get(field) and article.get(field):
+                    kept[dup] = original = {**original, field: article[field]}
+            continue
+        idx = len(kept)
+        kept.append(article)
+        shingles.append(sh)
+        if url:
+            by_url[url] = idx
+        for g in sh:
+            by_shingle.setdefault(g, []).append(idx)
+    return kept, dropped
+
+
+# -- incremental windows --------------------------------------------------------
+
+class CursorCache:
+    """Per-domain (cursor, articles) with TTL and LRU bounds; thread-safe."""
+
+    def __init__(self, max_domains: int = CURSOR_MAX_DOMAINS, ttl_seconds: float = CURSOR_TTL_SECONDS):
+        self.max_domains = max_domains
+        self.ttl_seconds = ttl_seconds
+        self._entries: "OrderedDict[str, Tuple[float, str, List[Dict[str, Any]]]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(company_name: str, domain: Optional[str]) -> str:
+        return (domain or company_name or "").strip().lower()
+
+    def get(self, key: str) -> Optional[Tuple[str, List[Dict[str, Any]]]]:
+        """(cursor, cached articles) for `key`, or None when unknown/expired."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.ttl_seconds:
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return entry[1], list(entry[2])
+
+    def put(self, key: str, articles: List[Dict[str, Any]]) -> Optional[str]:
+        """Store `articles` for `key`; the cursor is the newest `publishedAt` among them."""
+        cursor = max((a.get("publishedAt") or "" for a in articles), default="")
+        if not key or not cursor:
+            return None
+        with self._lock:
+            self._entries[key] = (time.monotonic(), cursor, list(articles))
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_domains:
+                self._entries.popitem(last=False)
+        return cursor
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+
+CURSORS = CursorCache()
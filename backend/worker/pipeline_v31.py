@@ -17,6 +17,11 @@ from bi_resolver_io import run_stage3
 from claude_formatter import council_contact_payload
 from job_logger import JobLogger
 
+# JobLogger batching: flush every LOG_BATCH_SIZE entries or LOG_FLUSH_INTERVAL
+# seconds, off the event loop (see job_logger / job_store.logger_sink).
+LOG_BATCH_SIZE = 50
+LOG_FLUSH_INTERVAL = 2.0
+
 
 async def run_pipeline_v31(
     job_id: str,
@@ -36,10 +41,11 @@ async def run_pipeline_v31(
     are recorded fail-loud on the job row.
     """
     canada_only = bool(company_data.get("canada_only"))
-    log = logger or JobLogger(job_id, sink=store.logger_sink(job_id))
+    log = logger or JobLogger(job_id, sink=store.logger_sink(job_id),
+                              batch_size=LOG_BATCH_SIZE, flush_interval=LOG_FLUSH_INTERVAL)
 
     try:
-        with log:
+        async with log:
             # Stage 1 — company resolution
             store.update_progress(job_id, stage="1_resolution", step="resolving company", progress=0.1)
             canonical = await providers.resolve_company(company_data)
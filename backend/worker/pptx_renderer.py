@@ -16,6 +16,11 @@ from __future__ import annotations
 import re
 from typing import Callable, Optional
 
+try:
+    from worker import tracing
+except ImportError:
+    import tracing  # bare path (v3.1 inserts worker/ on sys.path)
+
 # --- fail-loud errors (mirror the design doc's Stage-6 error table) ----------
 
 
@@ -502,6 +507,7 @@ class PptxRenderer:
                     elif hyperlinked[i] and not (r.text or "").strip():
                         cls._strip_run_hyperlink(r)  # emptied link run — drop dead link
 
+    @tracing.traced("pptx.render", kind="render")
     async def render(self, *, slide_contacts: dict, company_slots: dict,
                      outreach_slots: dict, job_id: str,
                      hyperlink_slots: dict = None, outreach_hyperlinks: dict = None,
@@ -15,16 +15,78 @@ SDK/client imports are lazy.
 """
 from __future__ import annotations
 
+import asyncio
 import json
 import os
+import time
+from collections import OrderedDict
 from typing import Optional
 
-from bi_resolver import PERSONA_TITLE_BUCKETS, StakeholderRecord, CanonicalCompany
+from adjacency_memo import AdjacencyMemo, get_memo, memo_key
+from bi_resolver import PERSONAS, PERSONA_TITLE_BUCKETS, StakeholderRecord, CanonicalCompany
+from bi_resolver_io import with_timeout
 from circuit_breaker import CircuitBreakerRegistry
+from contact_pool import ContactPool
 
 HAIKU_MODEL = "claude-haiku-4-5-20251001"
 WEB_SEARCH_TOOL = {"type": "web_search_20250305", "name": "web_search", "max_uses": 3}
 
+# Step 3 of enrich_final (web search for LinkedIn + start date): how many contacts
+# search at once, the per-contact cap, and the (name, company) result cache shared
+# across jobs so a contact enriched in one job is not re-searched in the next.
+WEB_ENRICH_CONCURRENCY = int(os.getenv("WEB_ENRICH_CONCURRENCY", "4"))
+WEB_ENRICH_TIMEOUT_SECONDS = float(os.getenv("WEB_ENRICH_TIMEOUT_SECONDS", "25"))
+WEB_ENRICH_CACHE_TTL_SECONDS = float(os.getenv("WEB_ENRICH_CACHE_TTL_SECONDS", str(7 * 24 * 3600)))
+WEB_ENRICH_CACHE_MAX = 5000
+_WEB_ENRICH_CACHE: "OrderedDict[tuple, tuple]" = OrderedDict()  # key -> (stored_at, data)
+
+
+def _web_cache_get(key: tuple) -> Optional[dict]:
+    hit = _WEB_ENRICH_CACHE.get(key)
+    if hit is None:
+        return None
+    stored_at, data = hit
+    if time.monotonic() - stored_at > WEB_ENRICH_CACHE_TTL_SECONDS:
+        _WEB_ENRICH_CACHE.pop(key, None)
+        return None
+    _WEB_ENRICH_CACHE.move_to_end(key)
+    return data
+
+
+def _web_cache_put(key: tuple, data: dict) -> None:
+    _WEB_ENRICH_CACHE[key] = (time.monotonic(), data)
+    _WEB_ENRICH_CACHE.move_to_end(key)
+    while len(_WEB_ENRICH_CACHE) > WEB_ENRICH_CACHE_MAX:
+        _WEB_ENRICH_CACHE.popitem(last=False)
+
+
+# Novel titles arriving within this window (all personas grade concurrently) are
+# judged in ONE Haiku request.
+ADJACENCY_BATCH_WINDOW_SECONDS = 0.05
+
+# Strict, domain-scoped adjacency: a title is a proxy ONLY if it sits in the
+# persona's functional domain at a senior level. This rejects unrelated senior
+# titles (Communications, HR, Legal, Investigations, Brand, etc.) that ZoomInfo's
+# generic C-Level pool surfaces — they used to slip through a loose "reasonable
+# proxy" judgement and win a slide over the real exec.
+_ADJACENCY_RULES = (
+    "You decide if a job title belongs to the SAME functional domain as a target "
+    "C-suite persona. Domains are DISTINCT — do not conflate CIO and CTO:\n"
+    "- CIO = internal/enterprise INFORMATION technology: IT, information systems, "
+    "digital workplace, enterprise applications, data/analytics platforms.\n"
+    "- CTO = PRODUCT/build technology: engineering, software development, R&D, "
+    "architecture, the technology the company sells.\n"
+    "- CISO = security / information security / cybersecurity.\n"
+    "- CFO = finance / accounting / treasury / controller.\n"
+    "- COO = operations / supply chain / general management.\n"
+    "- CPO = product management / product strategy.\n"
+    "Answer 'yes' ONLY if the title clearly sits in THIS persona's domain at a senior "
+    "level (C-level, SVP, VP, Head, or Director). A CTO is NOT a proxy for CIO and vice "
+    "versa. Titles in unrelated functions — communications, HR/people, legal, marketing, "
+    "sales, brand, investigations, facilities, administration, or an executive/CEO office "
+    "role — are NOT proxies."
+)
+
 _VP_DIR_HINTS = {
     "CIO": ["Information Technology", "IT", "Information Systems"],
     "CTO": ["Engineering", "Technology", "Software"],
@@ -85,11 +147,20 @@ class LiveProviders:
     """Real Providers seam. zi_client + anthropic_client injected (CI uses mocks)."""
 
     def __init__(self, *, zi_client=None, anthropic_client=None,
-                 breakers: Optional[CircuitBreakerRegistry] = None):
+                 breakers: Optional[CircuitBreakerRegistry] = None,
+                 adjacency_memo: Optional[AdjacencyMemo] = None):
         self.zi = zi_client
         self._anthropic = anthropic_client
         self.breakers = breakers or CircuitBreakerRegistry()
+        # Process-wide (durable) verdict memo unless a test injects its own.
+        self.adjacency_memo = adjacency_memo if adjacency_memo is not None else get_memo()
+        # memo key -> (original title, Future[bool]) awaiting the next batch
+        self._judge_pending: dict = {}
+        self._judge_flush: Optional[asyncio.Future] = None
+        self._web_sem = asyncio.Semaphore(WEB_ENRICH_CONCURRENCY)
         self._company_id_cache: dict = {}  # domain -> ZoomInfo companyId (resolved once)
+        # (domain, canada_only) -> Task[ContactPool | None]; shared by every persona
+        self._contact_pools: dict = {}
 
     async def _resolve_company_id(self, domain: str) -> str:
         """Resolve (and cache) a domain to its ZoomInfo companyId — used to anchor
@@ -175,30 +246,66 @@ class LiveProviders:
         }
 
     # --- Stage 3 -----------------------------------------------------------
+    async def _contact_pool(self, domain: str, canada_only: bool) -> Optional[ContactPool]:
+        """The job's shared ZoomInfo pool for (domain, geo scope), pulled once.
+
+        Concurrent personas await the same pull. None when the client has no
+        pool pull (per-persona search is used instead) or the pull failed."""
+        if not hasattr(self.zi, "pull_contact_pool"):
+            return None
+        key = (domain, bool(canada_only))
+        task = self._contact_pools.get(key)
+        if task is None:
+            task = self._contact_pools[key] = asyncio.ensure_future(
+                self._pull_contact_pool(domain, canada_only))
+        return await task
+
+    async def _pull_contact_pool(self, domain: str, canada_only: bool) -> Optional[ContactPool]:
+        union = sorted({t for p in PERSONAS for t in persona_titles_for(p, "csuite")})
+        try:
+            res = await self.zi.pull_contact_pool(
+                domain=domain, job_titles=union, canada_only=canada_only)
+        except Exception:  # noqa: BLE001
+            self.breakers.get("zoominfo").record_failure()
+            return None
+        if not (res or {}).get("success"):
+            self.breakers.get("zoominfo").record_failure()
+            return None
+        self.breakers.get("zoominfo").record_success()
+        people = (res or {}).get("people", [])
+        # Empty pool: let each persona run the full search (it has name fallbacks).
+        return ContactPool(people) if people else None
+
     async def query(self, persona, source, kind, canonical, canada_only) -> list[StakeholderRecord]:
-        # Reuse the validated ZoomInfo client. Its search already cascades
-        # C-suite->VP->Director internally and returns a priority-sorted pool, so
-        # we issue ONE csuite-scoped call per persona and let bi_resolver grade
-        # proximity. VP/Director/Apollo/PDL rungs are no-ops here (ZI covers them);
+        # Reuse the validated ZoomInfo client. One broad pull per (domain, geo)
+        # fills a per-job contact pool shared by every persona (and the geo
+        # top-up); each persona's csuite rung is answered locally from it — its
+        # titles first, then C/VP/Director coverage, priority-sorted — so Stage 3
+        # makes O(1) ZoomInfo calls instead of one search cascade per persona.
+        # VP/Director/Apollo/PDL rungs are no-ops here (the pool covers them);
         # they remain available for a future multi-source expansion.
         if source != "zoominfo" or self.zi is None or kind != "csuite":
             return []
         if self.breakers.get("zoominfo").is_open():
             return []
         titles = persona_titles_for(persona, "csuite")
-        try:
-            res = await self.zi.search_contacts(
-                domain=canonical.primary_domain, job_titles=titles, max_results=10,
-                canada_only=canada_only)
-            self.breakers.get("zoominfo").record_success()
-        except Exception:  # noqa: BLE001
-            self.breakers.get("zoominfo").record_failure()
-            return []
-        people = (res or {}).get("people", []) if isinstance(res, dict) else []
+        pool = await self._contact_pool(canonical.primary_domain, canada_only)
+        if pool is not None:
+            people = pool.match_titles(titles, limit=10)
+        else:
+            try:
+                res = await self.zi.search_contacts(
+                    domain=canonical.primary_domain, job_titles=titles, max_results=10,
+                    canada_only=canada_only)
+                self.breakers.get("zoominfo").record_success()
+            except Exception:  # noqa: BLE001
+                self.breakers.get("zoominfo").record_failure()
+                return []
+            people = (res or {}).get("people", []) if isinstance(res, dict) else []
         records = [zi_person_to_record(p, persona) for p in people]
         if canada_only:
-            # search_contacts now restricts the query to Canada (no global fallback),
-            # so these records ARE Canada-scoped; mark them for the dashboard trace.
+            # The pull is restricted to Canada (no global fallback), so these
+            # records ARE Canada-scoped; mark them for the dashboard trace.
             for r in records:
                 r.mark("canada_only_filtered")
         return records
@@ -269,25 +376,42 @@ class LiveProviders:
             except Exception:  # noqa: BLE001
                 pass
 
-        # 3) Web search for LinkedIn URL + start_date where still missing (citation required).
+        # 3) Web search for LinkedIn URL + start_date where still missing (citation
+        #    required) — bounded-concurrent, per-contact timeout, cached by
+        #    (name, company) across jobs.
         if self._anthropic_or_none() is None:
             return
-        for c in real:
-            if c.linkedin_url and c.start_date:
-                continue
-            text = await self._haiku_text(
-                system=("Find a person's LinkedIn profile URL and the date they started their "
-                        "current role. Return STRICT JSON {\"linkedin_url\": str, \"start_date\": str, "
-                        "\"extracted_snippet\": str, \"source_url\": str}. Only fill a field from a "
-                        "source you actually read; otherwise use an empty string. Do not fabricate."),
-                user=f"{c.name}, {c.title} at {company_name}. Find their LinkedIn URL and role start date.",
-                tools=[WEB_SEARCH_TOOL], max_tokens=400,
-            )
+        await asyncio.gather(*(self._web_enrich(c, company_name) for c in real
+                               if not (c.linkedin_url and c.start_date)))
+
+    async def _web_enrich(self, c, company_name: str) -> None:
+        key = (self._norm_name(c.name), self._norm_name(company_name))
+        data = _web_cache_get(key)
+        if data is None:
+            try:
+                async with self._web_sem:
+                    text = await with_timeout(
+                        self._haiku_text(
+                            system=("Find a person's LinkedIn profile URL and the date they started their "
+                                    "current role. Return STRICT JSON {\"linkedin_url\": str, \"start_date\": str, "
+                                    "\"extracted_snippet\": str, \"source_url\": str}. Only fill a field from a "
+                                    "source you actually read; otherwise use an empty string. Do not fabricate."),
+                            user=f"{c.name}, {c.title} at {company_name}. Find their LinkedIn URL and role start date.",
+                            tools=[WEB_SEARCH_TOOL], max_tokens=400,
+                        ),
+                        WEB_ENRICH_TIMEOUT_SECONDS, on_timeout=None, label="web_enrich",
+                    )
+            except Exception:  # noqa: BLE001 — one failed search must not sink the rest
+                return
+            if text is None:
+                c.mark("web_enrich_timed_out")
+                return  # not cached: a timeout says nothing about the person
             data = _extract_json(text)
-            if data.get("extracted_snippet"):
-                c.linkedin_url = c.linkedin_url or str(data.get("linkedin_url") or "")
-                c.start_date = c.start_date or str(data.get("start_date") or "")
-                c.mark("web_enriched_linkedin_start")
+            _web_cache_put(key, data)
+        if data.get("extracted_snippet"):
+            c.linkedin_url = c.linkedin_url or str(data.get("linkedin_url") or "")
+            c.start_date = c.start_date or str(data.get("start_date") or "")
+            c.mark("web_enriched_linkedin_start")
 
     async def enrich_one(self, contact, company_name: str = "", company_domain: str = "") -> None:
         """Enrich a SINGLE contact to completeness (delegates to enrich_final). Used
@@ -307,32 +431,67 @@ class LiveProviders:
         return " ".join((name or "").lower().split())
 
     async def judge_adjacency(self, title: str, persona: str) -> bool:
-        # Strict, domain-scoped adjacency: a title is a proxy ONLY if it sits in the
-        # persona's functional domain at a senior level. This rejects unrelated
-        # senior titles (Communications, HR, Legal, Investigations, Brand, etc.)
-        # that ZoomInfo's generic C-Level pool surfaces — they used to slip through
-        # a loose "reasonable proxy" judgement and win a slide over the real exec.
+        """Is `title` a senior proxy for `persona`? Memo first (durable, shared
+        across jobs); otherwise queued for the job's next batched Haiku call."""
+        memo = self.adjacency_memo
+        await memo.ensure_loaded()
+        cached = memo.get(title, persona)
+        if cached is not None:
+            return cached
+        key = memo_key(title, persona)
+        pending = self._judge_pending.get(key)
+        if pending is None:
+            pending = self._judge_pending[key] = (title, asyncio.get_running_loop().create_future())
+            if self._judge_flush is None:
+                self._judge_flush = asyncio.ensure_future(self._flush_adjacency())
+        return await pending[1]
+
+    async def _flush_adjacency(self) -> None:
+        await asyncio.sleep(ADJACENCY_BATCH_WINDOW_SECONDS)
+        batch, self._judge_pending = self._judge_pending, {}
+        self._judge_flush = None
+        keys = list(batch)
+        try:
+            verdicts = await self._judge_batch([(batch[k][0], k[1]) for k in keys])
+        except Exception:  # noqa: BLE001 — an unjudged title is simply not a proxy
+            verdicts = []
+        for i, key in enumerate(keys):
+            verdict = verdicts[i] if i < len(verdicts) else None
+            if verdict is not None:
+                self.adjacency_memo.put(batch[key][0], key[1], verdict)
+            fut = batch[key][1]
+            if not fut.done():
+                fut.set_result(bool(verdict))
+        await self.adjacency_memo.persist()
+
+    async def _judge_batch(self, pairs: list) -> list:
+        """Verdicts (True/False, or None = no answer) for [(title, persona), ...].
+        No answer — e.g. Anthropic not configured — is never memoized."""
+        if len(pairs) == 1:
+            title, persona = pairs[0]
+            text = await self._haiku_text(
+                system=_ADJACENCY_RULES + " Answer strictly 'yes' or 'no'.",
+                user=f"Persona: {persona}. Title: '{title}'. In {persona}'s functional domain at a senior level? yes or no.",
+                max_tokens=8,
+            )
+            return [text.strip().lower().startswith("y")] if text.strip() else [None]
+        listing = "\n".join(f"{i}. Persona: {p}. Title: '{t}'" for i, (t, p) in enumerate(pairs))
         text = await self._haiku_text(
-            system=(
-                "You decide if a job title belongs to the SAME functional domain as a target "
-                "C-suite persona. Domains are DISTINCT — do not conflate CIO and CTO:\n"
-                "- CIO = internal/enterprise INFORMATION technology: IT, information systems, "
-                "digital workplace, enterprise applications, data/analytics platforms.\n"
-                "- CTO = PRODUCT/build technology: engineering, software development, R&D, "
-                "architecture, the technology the company sells.\n"
-                "- CISO = security / information security / cybersecurity.\n"
-                "- CFO = finance / accounting / treasury / controller.\n"
-                "- COO = operations / supply chain / general management.\n"
-                "- CPO = product management / product strategy.\n"
-                "Answer 'yes' ONLY if the title clearly sits in THIS persona's domain at a senior "
-                "level (C-level, SVP, VP, Head, or Director). A CTO is NOT a proxy for CIO and vice "
-                "versa. Titles in unrelated functions — communications, HR/people, legal, marketing, "
-                "sales, brand, investigations, facilities, administration, or an executive/CEO office "
-                "role — are NOT proxies. Answer strictly 'yes' or 'no'."),
-            user=f"Persona: {persona}. Title: '{title}'. In {persona}'s functional domain at a senior level? yes or no.",
-            max_tokens=8,
+            system=_ADJACENCY_RULES + (
+                " Judge EACH numbered pair independently. Respond with JSON only: "
+                '{"verdicts": [{"i": <number>, "yes": true|false}, ...]}'),
+            user=listing,
+            max_tokens=32 + 16 * len(pairs),
         )
-        return text.strip().lower().startswith("y")
+        out: list = [None] * len(pairs)
+        for v in _extract_json(text).get("verdicts") or []:
+            try:
+                i = int(v.get("i"))
+            except (AttributeError, TypeError, ValueError):
+                continue
+            if 0 <= i < len(pairs) and isinstance(v.get("yes"), bool):
+                out[i] = v["yes"]
+        return out
 
     async def enrich(self, record: StakeholderRecord) -> StakeholderRecord:
         # Cross-fill from other sources = follow-up. Here we do the always-on
@@ -0,0 +1,130 @@
+"""Field projection, ETags and fast JSON encoding for job payload responses.
+
+`/job-status` and `/job-result` carry megabyte-scale JSON (raw vendor blobs,
+`_council_metadata.specialist_results` for every specialist) while most portal
+views need only the summary. These helpers let a caller ask for just the parts
+it renders (`fields=` / `exclude=` with dotted paths), answer unchanged polls
+with 304 via a content ETag, and serialize with orjson when it is installed.
+
+Pure: stdlib only (orjson is an optional import), so it is unit-tested without
+FastAPI. production_main wraps the bytes in a Response.
+"""
+from __future__ import annotations
+
+import hashlib
+import json
+from typing import Any, Iterable, List, Optional
+
+try:  # optional fast encoder; identical output shape either way
+    import orjson as _orjson
+except Exception:  # noqa: BLE001
+    _orjson = None
+
+# `view=summary`: everything except the raw vendor payloads and the per-
+# specialist council dump. What the dashboard cards actually render.
+SUMMARY_EXCLUDE = (
+    "apollo_data",
+    "pdl_data",
+    "hunter_data",
+    "zoominfo_data",
+    "news_data",
+    "council_metadata",
+    "result.validated_data._council_metadata",
+    "result.validated_data.council_metadata",
+)
+
+
+def parse_field_list(raw: Optional[str]) -> List[str]:
+    """'a, b.c,,d' -> ['a', 'b.c', 'd'] (empty/None -> [])."""
+    if not raw:
+        return []
+    return [p.strip() for p in str(raw).split(",") if p.strip()]
+
+
+# Leaf marker in a path tree: "the whole value at this key".
+_WHOLE = None
+
+
+def _split(paths: Iterable[str]) -> dict:
+    """Group dotted paths into a tree: ['a.b', 'a.c', 'd'] -> {'a': {'b': None, 'c': None}, 'd': None}.
+    A shorter path wins over a longer one under it ('a' + 'a.b' -> {'a': None})."""
+    tree: dict = {}
+    for path in paths:
+        node = tree
+        parts = path.split(".")
+        for i, part in enumerate(parts):
+            if i == len(parts) - 1:
+                node[part] = _WHOLE
+                break
+            child = node.get(part, {})
+            if child is _WHOLE:
+                break
+            node[part] = child
+            node = child
+    return tree
+
+
+def _include(value: Any, tree: Optional[dict]) -> Any:
+    if tree is _WHOLE or not isinstance(value, dict):
+        return value
+    return {key: _include(value[key], sub) for key, sub in tree.items() if key in value}
+
+
+def _exclude(value: Any, tree: dict) -> Any:
+    if not isinstance(value, dict):
+        return value
+    out = {}
+    for key, v in value.items():
+        if key not in tree:
+            out[key] = v
+        elif tree[key] is not _WHOLE:
+            out[key] = _exclude(v, tree[key])
+    return out
+
+
+def project(payload: dict, fields: Optional[Iterable[str]] = None,
+            exclude: Optional[Iterable[str]] = None) -> dict:
+    """Apply `fields` (keep only these dotted paths) then `exclude` (drop these).
+
+    Never mutates `payload`; unknown paths are ignored. With neither given the
+    payload is returned as-is.
+    """
+    fields = list(fields or [])
+    exclude = list(exclude or [])
+    out = payload
+    if fields:
+        out = _include(out, _split(fields))
+    if exclude:
+        out = _exclude(out, _split(exclude))
+    return out
+
+
+def dumps(obj: Any) -> bytes:
+    """Compact JSON bytes; orjson when available, stdlib json otherwise."""
+    if _orjson is not None:
+        try:
+            return _orjson.dumps(obj, default=str, option=_orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            pass  # e.g. ints beyond 64 bits — fall through to stdlib
+    return json.dumps(obj, separators=(",", ":"), default=str).encode("utf-8")
+
+
+def etag_for(body: bytes) -> str:
+    """Weak content ETag for a serialized body."""
+    return 'W/"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """RFC 7232 weak comparison of an If-None-Match header against `etag`."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    bare = etag[2:] if etag.startswith("W/") else etag
+    for candidate in if_none_match.split(","):
+        c = candidate.strip()
+        if c.startswith("W/"):
+            c = c[2:]
+        if c == bare:
+            return True
+    return False
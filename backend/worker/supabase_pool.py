@@ -0,0 +1,88 @@
+"""Process-wide pooled async Supabase client.
+
+Every durable write/read used to call `create_client(...)` per invocation (a new
+sync client, new HTTP connection pool and TLS handshake each time) and then run
+a blocking supabase-py request inside an `async def`, stalling the event loop
+for the whole round-trip. `SupabasePool` owns ONE `AsyncClient` for the process:
+created lazily on first use, reused by every caller (its PostgREST session keeps
+connections alive), and closed by the app's shutdown hook.
+
+    from worker.supabase_pool import get_pool
+    sb = await get_pool().client()          # None when Supabase isn't configured
+    if sb is not None:
+        await sb.table("raw_data").insert(rows).execute()   # rows: list -> one request
+
+supabase is imported lazily so this module stays importable (and testable)
+without it. Import it as `worker.supabase_pool` first (bare path as fallback) so
+the process shares a single instance.
+"""
+from __future__ import annotations
+
+import logging
+import os
+from typing import Any, Awaitable, Callable, Optional
+
+logger = logging.getLogger(__name__)
+
+
+async def _default_factory(url: str, key: str) -> Any:
+    from supabase import acreate_client  # lazy
+    return await acreate_client(url, key)
+
+
+class SupabasePool:
+    """Lazily-created, shared async Supabase client."""
+
+    def __init__(self, url: Optional[str] = None, key: Optional[str] = None, *,
+                 factory: Optional[Callable[[str, str], Awaitable[Any]]] = None):
+        self._url = url
+        self._key = key
+        self._factory = factory or _default_factory
+        self._client: Any = None
+
+    @property
+    def configured(self) -> bool:
+        return bool(self._url and self._key)
+
+    async def client(self) -> Any:
+        """The shared AsyncClient, or None when URL/key are missing."""
+        if not self.configured:
+            return None
+        if self._client is None:
+            # No lock: creation does no network I/O, and if two first callers
+            # race, the loser's client is simply dropped.
+            self._client = await self._factory(self._url, self._key)
+        return self._client
+
+    async def aclose(self) -> None:
+        """Close the PostgREST session (app shutdown). Safe to call repeatedly."""
+        client, self._client = self._client, None
+        if client is None:
+            return
+        try:
+            postgrest = getattr(client, "postgrest", None)
+            if postgrest is not None and hasattr(postgrest, "aclose"):
+                await postgrest.aclose()
+        except Exception as e:  # noqa: BLE001 — shutdown must not raise
+            logger.debug("Supabase pool close failed: %s", e)
+
+
+_POOL: Optional[SupabasePool] = None
+
+
+def get_pool() -> SupabasePool:
+    """The process-wide pool, configured from SUPABASE_URL / SUPABASE_KEY
+    (or SUPABASE_SERVICE_ROLE_KEY)."""
+    global _POOL
+    if _POOL is None:
+        _POOL = SupabasePool(
+            os.getenv("SUPABASE_URL"),
+            os.getenv("SUPABASE_KEY") or os.getenv("SUPABASE_SERVICE_ROLE_KEY"),
+        )
+    return _POOL
+
+
+def set_pool(pool: Optional[SupabasePool]) -> None:
+    """Replace the process-wide pool (tests; None re-reads the env next call)."""
+    global _POOL
+    _POOL = pool
@@ -0,0 +1,360 @@
+"""Per-job span tracing for the profile pipeline (pure, stdlib-only at import).
+
+Stage timings used to be scattered: `_t0 = time.monotonic()` snippets around
+vendor calls in `process_company_profile`, `duration_ms` on a few step results,
+and synthetic timestamps in `generate_debug_data`. This module records real
+spans instead — a lightweight, OpenTelemetry-shaped equivalent (no SDK):
+
+  * the job id comes from `cost_meter.current_job_id` (already bound by
+    `cost_meter.set_job` at the start of every job); outside a job every entry
+    point is a cheap no-op,
+  * `start_job` opens the root span, `mark_stage` closes the running stage and
+    opens the next (the pipeline is linear, so no re-indenting into `with`
+    blocks), `span` / `traced` wrap vendor and LLM calls, `record_span` logs an
+    after-the-fact interval (rate-limiter waits), `annotate` tags the current
+    span (retries), `annotate_status` records a vendor HTTP status on it and
+    `annotate_error` a failure the call site caught and swallowed, so vendor
+    error / 429 metrics see every vendor, not only those that raise,
+  * parent/child links ride a ContextVar, so calls fanned out with
+    asyncio.gather nest under the stage that launched them,
+  * `summarize` walks the tree for the critical path (at each level the child
+    that finished last) plus per-kind totals — served by `/jobs/{id}/trace`,
+  * `export_job` writes the job's spans as OTLP/JSON to a local file
+    (TRACE_EXPORT_PATH, one line per job) and/or POSTs them to an OTLP/HTTP
+    collector (OTEL_EXPORTER_OTLP_ENDPOINT). Best-effort: never raises,
+  * every finished vendor / LLM / wait / render span is also folded into the
+    process-wide `metrics` (served by `/metrics`), in or out of a job — outside
+    a job the span is detached (timed and annotatable, but not kept).
+"""
+from __future__ import annotations
+
+import contextvars
+import functools
+import inspect
+import json
+import logging
+import os
+import secrets
+import threading
+import time
+from collections import OrderedDict
+from contextlib import contextmanager
+from typing import Any, Dict, Iterator, List, Optional
+
+try:
+    from worker import cost_meter, metrics
+except Exception:  # noqa: BLE001
+    import cost_meter  # bare path
+    import metrics
+
+logger = logging.getLogger(__name__)
+
+SERVICE_NAME = os.getenv("OTEL_SERVICE_NAME", "rad-backend")
+EXPORT_PATH = os.getenv("TRACE_EXPORT_PATH", "")
+OTLP_ENDPOINT = os.getenv("OTEL_EXPORTER_OTLP_ENDPOINT", "").rstrip("/")
+
+# Traces kept in memory for /jobs/{id}/trace (LRU by job), and spans per job.
+MAX_TRACES = int(os.getenv("TRACE_MAX_JOBS", "200"))
+MAX_SPANS_PER_JOB = 5000
+
+_current_span: "contextvars.ContextVar[Optional[Span]]" = contextvars.ContextVar(
+    "current_span", default=None
+)
+
+
+class Span:
+    __slots__ = ("trace_id", "span_id", "parent_id", "name", "kind", "start_ns", "end_ns",
+                 "attributes", "error")
+
+    def __init__(self, trace_id: str, parent_id: Optional[str], name: str, kind: str,
+                 attributes: Optional[Dict[str, Any]] = None, start_ns: Optional[int] = None):
+        self.trace_id = trace_id
+        self.span_id = secrets.token_hex(8)
+        self.parent_id = parent_id
+        self.name = name
+        self.kind = kind
+        self.start_ns = start_ns if start_ns is not None else time.time_ns()
+        self.end_ns: Optional[int] = None
+        self.attributes = dict(attributes or {})
+        self.error: Optional[str] = None
+
+    def end(self, error: Optional[BaseException] = None) -> None:
+        if self.end_ns is None:
+            self.end_ns = time.time_ns()
+            metrics.observe_span(self.name, self.kind, self.duration_ms / 1e3, self.attributes, error)
+        if error is not None:
+            self.error = f"{type(error).__name__}: {error}"
+
+    @property
+    def duration_ms(self) -> float:
+        end = self.end_ns if self.end_ns is not None else time.time_ns()
+        return (end - self.start_ns) / 1e6
+
+    def to_dict(self, origin_ns: int = 0) -> Dict[str, Any]:
+        return {
+            "span_id": self.span_id, "parent_id": self.parent_id, "name": self.name,
+            "kind": self.kind, "start_ms": round((self.start_ns - origin_ns) / 1e6, 1),
+            "duration_ms": round(self.duration_ms, 1), "open": self.end_ns is None,
+            "attributes": self.attributes, "error": self.error,
+        }
+
+
+class _JobTrace:
+    def __init__(self, job_id: str):
+        self.job_id = job_id
+        self.trace_id = secrets.token_hex(16)
+        self.spans: List[Span] = []
+        self.root: Optional[Span] = None
+        self.stage: Optional[Span] = None
+        self.dropped = 0
+
+    def add(self, span: Span) -> None:
+        if len(self.spans) >= MAX_SPANS_PER_JOB:
+            self.dropped += 1
+            return
+        self.spans.append(span)
+
+
+_TRACES: "OrderedDict[str, _JobTrace]" = OrderedDict()
+_LOCK = threading.Lock()
+
+
+def _trace_for(job_id: Optional[str], create: bool = False) -> Optional[_JobTrace]:
+    if not job_id:
+        return None
+    with _LOCK:
+        trace = _TRACES.get(job_id)
+        if trace is None and create:
+            trace = _TRACES[job_id] = _JobTrace(job_id)
+            while len(_TRACES) > MAX_TRACES:
+                _TRACES.popitem(last=False)
+        return trace
+
+
+def _active() -> Optional[_JobTrace]:
+    return _trace_for(cost_meter.current_job_id.get())
+
+
+def _open(trace: _JobTrace, name: str, kind: str, attrs: Dict[str, Any],
+          parent: Optional[Span] = None) -> Span:
+    if parent is None:
+        current = _current_span.get()
+        if current is not None and current.trace_id == trace.trace_id:
+            parent = current
+        else:
+            parent = trace.stage or trace.root
+    span = Span(trace.trace_id, parent.span_id if parent else None, name, kind, attrs)
+    trace.add(span)
+    return span
+
+
+# -- recording API -------------------------------------------------------------
+
+def start_job(job_id: str, name: str = "profile_job", **attrs: Any) -> None:
+    """Open the job's root span (also binds it as the current span)."""
+    trace = _trace_for(job_id, create=True)
+    trace.root = Span(trace.trace_id, None, name, "job", dict(attrs, job_id=job_id))
+    trace.add(trace.root)
+    _current_span.set(trace.root)
+
+
+def mark_stage(name: str, **attrs: Any) -> None:
+    """End the running stage span (if any) and start `name` under the root."""
+    trace = _active()
+    if trace is None or trace.root is None:
+        return
+    if trace.stage is not None:
+        trace.stage.end()
+    trace.stage = _open(trace, name, "stage", attrs, parent=trace.root)
+    _current_span.set(trace.stage)
+
+
+def finish_job(job_id: str, error: Optional[BaseException] = None) -> None:
+    """Close the open stage and the root span."""
+    trace = _trace_for(job_id)
+    if trace is None:
+        return
+    if trace.stage is not None:
+        trace.stage.end()
+        trace.stage = None
+    if trace.root is not None:
+        trace.root.end(error)
+        metrics.JOB_DURATION.observe(("failed" if error else "completed",), trace.root.duration_ms / 1e3)
+
+
+@contextmanager
+def span(name: str, kind: str = "internal", **attrs: Any) -> Iterator[Span]:
+    """Time a block as a child of the current span (detached outside a job)."""
+    trace = _active()
+    s = Span("", None, name, kind, attrs) if trace is None else _open(trace, name, kind, attrs)
+    metrics.span_started(name, kind)
+    token = _current_span.set(s)
+    try:
+        yield s
+    except BaseException as exc:
+        s.end(exc)
+        raise
+    finally:
+        s.end()
+        _current_span.reset(token)
+
+
+def traced(name: Optional[str] = None, kind: str = "internal"):
+    """Decorator form of `span` for sync and async functions."""
+    def decorate(fn):
+        label = name or fn.__name__
+        if inspect.iscoroutinefunction(fn):
+            @functools.wraps(fn)
+            async def async_wrapper(*args, **kwargs):
+                with span(label, kind):
+                    return await fn(*args, **kwargs)
+            return async_wrapper
+
+        @functools.wraps(fn)
+        def wrapper(*args, **kwargs):
+            with span(label, kind):
+                return fn(*args, **kwargs)
+        return wrapper
+    return decorate
+
+
+def record_span(name: str, kind: str, duration_s: float, **attrs: Any) -> None:
+    """Record an interval that just ended (e.g. a rate-limiter sleep)."""
+    trace = _active()
+    if trace is None:
+        metrics.observe_span(name, kind, duration_s, attrs, started=False)
+        return
+    end = time.time_ns()
+    s = _open(trace, name, kind, attrs)
+    s.start_ns = end - int(duration_s * 1e9)
+    s.end_ns = end
+    metrics.observe_span(name, kind, duration_s, attrs, started=False)
+
+
+def annotate(**attrs: Any) -> None:
+    """Set attributes on the current span (e.g. retry=True)."""
+    s = _current_span.get()
+    if s is not None:
+        s.attributes.update(attrs)
+
+
+def annotate_status(status_code: int) -> None:
+    """Record a vendor HTTP status on the current span. An error status already
+    recorded is kept, so a fallback call's 200 doesn't hide the first call's 429."""
+    s = _current_span.get()
+    if s is None:
+        return
+    prev = s.attributes.get("status_code")
+    if not (isinstance(prev, int) and prev >= 400):
+        s.attributes["status_code"] = status_code
+
+
+def annotate_error(exc: BaseException) -> None:
+    """Tag the current span with a caught-and-swallowed failure: its HTTP status
+    when it carries one (httpx.HTTPStatusError, OpenAI / Anthropic status
+    errors), else its exception type."""
+    status = getattr(exc, "status_code", None)
+    if not isinstance(status, int):
+        status = getattr(getattr(exc, "response", None), "status_code", None)
+    if isinstance(status, int):
+        annotate_status(status)
+    else:
+        annotate(error_type=type(exc).__name__)
+
+
+# -- reading / export ----------------------------------------------------------
+
+def critical_path(spans: List[Span], root: Span) -> List[Span]:
+    """Root, then repeatedly the child that finished last (it bounds its parent)."""
+    children: Dict[str, List[Span]] = {}
+    for s in spans:
+        if s.parent_id:
+            children.setdefault(s.parent_id, []).append(s)
+    path, node = [root], root
+    while children.get(node.span_id):
+        node = max(children[node.span_id], key=lambda c: c.end_ns or time.time_ns())
+        path.append(node)
+    return path
+
+
+def summarize(job_id: str) -> Optional[Dict[str, Any]]:
+    """The job's spans, critical path and time per kind (None if not traced)."""
+    trace = _trace_for(job_id)
+    if trace is None or trace.root is None:
+        return None
+    spans = list(trace.spans)
+    origin = trace.root.start_ns
+    by_kind: Dict[str, Dict[str, float]] = {}
+    for s in spans:
+        agg = by_kind.setdefault(s.kind, {"count": 0, "total_ms": 0.0})
+        agg["count"] += 1
+        agg["total_ms"] = round(agg["total_ms"] + s.duration_ms, 1)
+    return {
+        "job_id": job_id,
+        "trace_id": trace.trace_id,
+        "total_ms": round(trace.root.duration_ms, 1),
+        "complete": trace.root.end_ns is not None,
+        "critical_path": [s.to_dict(origin) for s in critical_path(spans, trace.root)],
+        "by_kind": by_kind,
+        "spans": [s.to_dict(origin) for s in sorted(spans, key=lambda s: s.start_ns)],
+        "dropped_spans": trace.dropped,
+    }
+
+
+def _otlp_value(value: Any) -> Dict[str, Any]:
+    if isinstance(value, bool):
+        return {"boolValue": value}
+    if isinstance(value, int):
+        return {"intValue": str(value)}
+    if isinstance(value, float):
+        return {"doubleValue": value}
+    return {"stringValue": str(value)}
+
+
+def to_otlp(job_id: str) -> Optional[Dict[str, Any]]:
+    """The job's spans as an OTLP/JSON ExportTraceServiceRequest."""
+    trace = _trace_for(job_id)
+    if trace is None:
+        return None
+    spans = []
+    for s in trace.spans:
+        attrs = dict(s.attributes, **{"rad.kind": s.kind})
+        spans.append({
+            "traceId": s.trace_id,
+            "spanId": s.span_id,
+            **({"parentSpanId": s.parent_id} if s.parent_id else {}),
+            "name": s.name,
+            "kind": 3 if s.kind in ("vendor", "llm") else 1,  # CLIENT / INTERNAL
+            "startTimeUnixNano": str(s.start_ns),
+            "endTimeUnixNano": str(s.end_ns or time.time_ns()),
+            "attributes": [{"key": k, "value": _otlp_value(v)} for k, v in attrs.items()],
+            "status": {"code": 2, "message": s.error} if s.error else {"code": 1},
+        })
+    return {"resourceSpans": [{
+        "resource": {"attributes": [{"key": "service.name", "value": {"stringValue": SERVICE_NAME}}]},
+        "scopeSpans": [{"scope": {"name": "rad.tracing"}, "spans": spans}],
+    }]}
+
+
+async def export_job(job_id: str) -> None:
+    """Ship a finished job's spans to the configured file/collector (best-effort)."""
+    if not EXPORT_PATH and not OTLP_ENDPOINT:
+        return
+    try:
+        payload = to_otlp(job_id)
+        if payload is None:
+            return
+        if EXPORT_PATH:
+            with open(EXPORT_PATH, "a", encoding="utf-8") as fh:
+                fh.write(json.dumps(payload, default=str) + "\n")
+        if OTLP_ENDPOINT:
+            import httpx
+            async with httpx.AsyncClient(timeout=5.0) as client:
+                await client.post(f"{OTLP_ENDPOINT}/v1/traces", json=payload)
+    except Exception as e:  # noqa: BLE001
+        logger.warning("Trace export failed for %s: %s", job_id, e)
+
+
+def reset(job_id: str) -> None:
+    with _LOCK:
+        _TRACES.pop(job_id, None)
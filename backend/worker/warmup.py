@@ -0,0 +1,100 @@
+"""Background warmup after startup (pure, stdlib-only at import).
+
+production_main used to import its heavy dependencies either at import time
+(delaying the port bind on every Render restart) or inside handlers on first
+call (the anthropic SDK alone is ~1s), so the first request per route was
+slow and health checks timed out while the process warmed up. Now:
+
+  * the app imports only what routing needs; everything else is lazy,
+  * a startup hook schedules `run` as a background task. It waits
+    WARMUP_DELAY_SECONDS (default 1s) so uvicorn binds the port first, imports
+    `PRELOAD_MODULES` one at a time in a worker thread (`asyncio.to_thread`,
+    so the event loop keeps answering /health), then runs the app's own warm
+    steps: Supabase pool client, content-audit CSV + embedding index, data
+    validator,
+  * `status()` reports per-step ms / errors; /health includes it.
+
+WARMUP=0 turns it off (tests, one-off scripts). A missing optional package is
+recorded as skipped, never raised.
+"""
+from __future__ import annotations
+
+import asyncio
+import importlib
+import inspect
+import logging
+import os
+import time
+from typing import Any, Callable, Dict, Iterable, Optional, Tuple
+
+logger = logging.getLogger(__name__)
+
+ENABLED = os.getenv("WARMUP", "1").lower() not in ("0", "false", "no")
+DELAY_SECONDS = float(os.getenv("WARMUP_DELAY_SECONDS", "1"))
+
+# Heaviest first-call imports, roughly in the order a job needs them.
+PRELOAD_MODULES: Tuple[str, ...] = (
+    "httpx",
+    "orchestrator",
+    "worker.data_validator",
+    "llm_council",
+    "openai",
+    "anthropic",
+    "supabase",
+    "worker.zoominfo_client",
+    "worker.news_gatherer",
+    "worker.gamma_slideshow",
+    "worker.pipeline_v31_hook",
+    "pptx",
+    "content_audit",
+    "routers.debug_payload",
+)
+
+_STATE: Dict[str, Any] = {"state": "idle", "started_at": None, "total_ms": None, "steps": {}}
+
+
+def status() -> Dict[str, Any]:
+    """Snapshot of the warmup: idle / running / done / disabled, plus per-step results."""
+    return {**_STATE, "steps": dict(_STATE["steps"])}
+
+
+def _record(name: str, t0: float, error: Optional[BaseException] = None) -> None:
+    entry: Dict[str, Any] = {"ms": round((time.perf_counter() - t0) * 1e3, 1)}
+    if isinstance(error, ImportError):
+        entry["skipped"] = f"{type(error).__name__}: {error}"
+    elif error is not None:
+        entry["error"] = f"{type(error).__name__}: {error}"
+        logger.warning(f"Warmup step {name} failed: {error}")
+    _STATE["steps"][name] = entry
+
+
+async def run(steps: Iterable[Tuple[str, Callable[[], Any]]] = (),
+              modules: Iterable[str] = PRELOAD_MODULES,
+              delay: Optional[float] = None) -> Dict[str, Any]:
+    """Preload `modules`, then run `steps` (sync callables go to a thread)."""
+    if not ENABLED:
+        _STATE["state"] = "disabled"
+        return status()
+    await asyncio.sleep(DELAY_SECONDS if delay is None else delay)
+    _STATE.update(state="running", started_at=time.time())
+    start = time.perf_counter()
+    for name in modules:
+        t0 = time.perf_counter()
+        try:
+            await asyncio.to_thread(importlib.import_module, name)
+            _record(f"import:{name}", t0)
+        except Exception as e:  # noqa: BLE001 — warmup must never take the app down
+            _record(f"import:{name}", t0, e)
+    for name, fn in steps:
+        t0 = time.perf_counter()
+        try:
+            if inspect.iscoroutinefunction(fn):
+                await fn()
+            else:
+                await asyncio.to_thread(fn)
+            _record(name, t0)
+        except Exception as e:  # noqa: BLE001
+            _record(name, t0, e)
+    _STATE.update(state="done", total_ms=round((time.perf_counter() - start) * 1e3, 1))
+    logger.info(f"Warmup done in {_STATE['total_ms']} ms")
+    return status()
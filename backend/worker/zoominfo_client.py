@@ -19,6 +19,11 @@ from typing import Dict, Any, List, Optional
 
 import httpx
 
+try:
+    from worker import tracing
+except ImportError:
+    import tracing  # bare path (v3.1 inserts worker/ on sys.path)
+
 logger = logging.getLogger(__name__)
 
 ZOOMINFO_BASE_URL = "https://api.zoominfo.com"
@@ -184,6 +189,15 @@ DEFAULT_INTENT_TOPICS = [
 ]
 
 
+async def _supabase_client():
+    """The process-wide pooled async Supabase client (None when unconfigured)."""
+    try:
+        from worker.supabase_pool import get_pool
+    except ImportError:
+        from supabase_pool import get_pool  # bare path (v3.1 inserts worker/ on sys.path)
+    return await get_pool().client()
+
+
 class ZoomInfoRateLimiter:
     """Token-bucket rate limiter for ZoomInfo's 25 req/sec limit."""
 
@@ -209,6 +223,7 @@ class ZoomInfoRateLimiter:
 
             wait_time = (1 - self.tokens) / self.max_per_second
             await asyncio.sleep(wait_time)
+            tracing.record_span("zoominfo.rate_limit_wait", "wait", wait_time)
             self.tokens = 0
             self.last_refill = time.monotonic()
             return True
@@ -444,15 +459,12 @@ class ZoomInfoClient:
         If Supabase is not configured or the table doesn't exist, fails silently.
         """
         try:
-            supabase_url = os.getenv("SUPABASE_URL")
-            supabase_key = os.getenv("SUPABASE_KEY") or os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-            if not supabase_url or not supabase_key:
+            sb = await _supabase_client()
+            if sb is None:
                 logger.debug("Supabase not configured — refresh_token stored in memory only")
                 return
 
-            from supabase import create_client
-            sb = create_client(supabase_url, supabase_key)
-            sb.table("zi_auth_tokens").upsert({
+            await sb.table("zi_auth_tokens").upsert({
                 "id": "zoominfo_refresh_token",
                 "token_value": token,
                 "updated_at": time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime()),
@@ -482,14 +494,11 @@ class ZoomInfoClient:
         Returns None if Supabase is not configured or table doesn't exist.
         """
         try:
-            supabase_url = os.getenv("SUPABASE_URL")
-            supabase_key = os.getenv("SUPABASE_KEY") or os.getenv("SUPABASE_SERVICE_ROLE_KEY")
-            if not supabase_url or not supabase_key:
+            sb = await _supabase_client()
+            if sb is None:
                 return None
 
-            from supabase import create_client
-            sb = create_client(supabase_url, supabase_key)
-            result = sb.table("zi_auth_tokens").select("token_value").eq(
+            result = await sb.table("zi_auth_tokens").select("token_value").eq(
                 "id", "zoominfo_refresh_token"
             ).execute()
             if result.data and result.data[0].get("token_value"):
@@ -622,6 +631,7 @@ class ZoomInfoClient:
                     self._refresh_token = persisted
             await self._authenticate()
 
+    @tracing.traced("zoominfo.request", kind="vendor")
     async def _make_request(
         self, endpoint: str, payload: Dict[str, Any], _is_retry: bool = False,
         params: Optional[Dict[str, Any]] = None,
@@ -630,6 +640,7 @@ class ZoomInfoClient:
         Make an authenticated POST request to ZoomInfo API.
         On HTTP 401 (expired token), re-authenticates once and retries.
         """
+        tracing.annotate(endpoint=endpoint, retry=_is_retry)
         await self._ensure_valid_token()
         await self.rate_limiter.acquire()
         url = f"{self.base_url}{endpoint}"
@@ -650,6 +661,7 @@ class ZoomInfoClient:
             response = await client.post(
                 url, json=payload, headers=self.headers, params=params,
             )
+            tracing.annotate(status_code=response.status_code)
             # On first 401, force token refresh and retry once
             if response.status_code == 401 and not _is_retry and self._auto_auth:
                 logger.warning(
@@ -1171,6 +1183,96 @@ class ZoomInfoClient:
             "error": last_error or "No contacts found for this domain in ZoomInfo"
         }
 
+    async def pull_contact_pool(
+        self,
+        domain: str,
+        job_titles: Optional[List[str]] = None,
+        canada_only: bool = False,
+        page_size: int = 100,
+        max_pages: int = 2,
+    ) -> Dict[str, Any]:
+        """
+        Broad, paged contact pull for one domain — the shared Stage 3 pool.
+
+        Instead of one `search_contacts` cascade per persona, v3.1 pulls the
+        domain's C-Level/VP-Level/Director-Level people once (paged), plus one
+        jobTitle pass over the union of every persona's titles (catches titles
+        ZoomInfo files under another management level), and grades personas
+        locally (see worker/contact_pool.py). Same geo rules as search_contacts:
+        North America first with a global fallback, or Canada only with none.
+
+        Returns:
+            Dict with success, people (priority-sorted normalized list), error,
+            calls (ZoomInfo requests made)
+        """
+        all_people: List[Dict[str, Any]] = []
+        seen_ids: set = set()
+        last_error: Optional[str] = None
+        calls = 0
+        website_candidates = self._website_candidates(domain)
+
+        async def _pull(base_attrs: Dict[str, Any], label: str, pages: int) -> int:
+            nonlocal last_error, calls
+            added = 0
+            for page in range(1, pages + 1):
+                attrs = {**base_attrs, "companyPastOrPresent": "present"}
+                payload = {"data": {"type": "ContactSearch", "attributes": attrs}}
+                params = {"page[size]": page_size, "page[number]": page}
+                calls += 1
+                try:
+                    response = await self._make_request(
+                        ENDPOINTS["contact_search"], payload, params=params)
+                except httpx.HTTPStatusError as e:
+                    last_error = f"HTTP {e.response.status_code}"
+                    logger.error("ZoomInfo pool %s HTTP error: %s", label, e)
+                    break
+                except Exception as e:
+                    last_error = str(e)
+                    logger.error("ZoomInfo pool %s failed: %s", label, e)
+                    break
+                data_list = self._extract_data_list(response)
+                for c in data_list:
+                    person = self._normalize_contact(c)
+                    if self._is_partner(person.get("title", "")):
+                        continue
+                    pid = person.get("person_id") or person.get("email") or person.get("name")
+                    if pid and pid not in seen_ids:
+                        seen_ids.add(pid)
+                        all_people.append(person)
+                        added += 1
+                if len(data_list) < page_size:
+                    break
+            logger.info("ZoomInfo pool %s: %d new contacts for domain=%s", label, added, domain)
+            return added
+
+        async def _pull_geo(base_attrs: Dict[str, Any], label: str, pages: int) -> int:
+            countries = ["Canada"] if canada_only else NORTH_AMERICA_COUNTRIES
+            count = await _pull({**base_attrs, "country": countries}, label, pages)
+            if count > 0 or canada_only:
+                return count
+            return await _pull(base_attrs, f"{label} [global]", pages)
+
+        await _pull_geo(
+            {"companyWebsite": website_candidates,
+             "managementLevel": ["C-Level", "VP-Level", "Director-Level"]},
+            "levels", max_pages,
+        )
+        if job_titles:
+            await _pull_geo(
+                {"companyWebsite": website_candidates, "jobTitle": job_titles},
+                "persona-titles", 1,
+            )
+
+        all_people.sort(key=self._contact_priority)
+        logger.info("ZoomInfo contact pool: %d people in %d calls for domain=%s",
+                    len(all_people), calls, domain)
+        return {
+            "success": bool(all_people) or last_error is None,
+            "people": all_people,
+            "error": None if all_people else last_error,
+            "calls": calls,
+        }
+
     async def enrich_contacts(
         self,
         person_ids: List[str]
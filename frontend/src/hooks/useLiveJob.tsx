@@ -17,9 +17,12 @@ export interface LiveStatus {
 }
 
 /**
- * Polls /job-status every ~1.5s while a job is processing, recording each
- * current_step transition into an audit log. Falls back to Supabase
- * result_data for already-finished jobs (cross-device / after a restart).
+ * Streams /jobs/{id}/events (SSE) while a job is processing: small stage /
+ * progress / cost deltas, then the full payload once at completion. Falls back
+ * to polling /job-status every ~1.5s when EventSource is unavailable or the
+ * stream drops, and to Supabase result_data for already-finished jobs
+ * (cross-device / after a restart). Each current_step transition is recorded
+ * into an audit log.
  */
 export function useLiveJob(jobId: string) {
   const [status, setStatus] = useState<LiveStatus | null>(null);
@@ -84,8 +87,52 @@ export function useLiveJob(jobId: string) {
       }
     };
 
-    poll();
-    return () => { alive = false; clearTimeout(timer); };
+    let es: EventSource | null = null;
+
+    const stream = () => {
+      if (typeof EventSource === 'undefined') {
+        poll();
+        return;
+      }
+      let current: LiveStatus | null = null;
+      let done = false;
+      const apply = (patch: Partial<LiveStatus>) => {
+        if (!alive) return;
+        current = { ...(current || { status: 'processing', progress: 0 }), ...patch } as LiveStatus;
+        if (patch.cost_usd !== undefined) {
+          current.api_cost = { ...(current.api_cost || {}), total_usd: patch.cost_usd };
+        }
+        setStatus(current);
+        record(current);
+      };
+      const parse = (e: Event) => JSON.parse((e as MessageEvent).data);
+      const finish = (e: Event) => {
+        done = true;
+        es?.close();
+        apply(parse(e));
+      };
+
+      es = new EventSource(apiClient.jobEventsUrl(jobId));
+      es.addEventListener('stage', (e) => apply(parse(e)));
+      es.addEventListener('snapshot', (e) => apply(parse(e)));
+      es.addEventListener('progress', (e) => apply(parse(e)));
+      es.addEventListener('cost', (e) => apply(parse(e)));
+      es.addEventListener('complete', finish);
+      es.addEventListener('failed', finish);
+      const fallback = () => {
+        es?.close();
+        if (alive && !done) poll();
+      };
+      es.addEventListener('gone', fallback);
+      // EventSource auto-reconnects with Last-Event-ID on transient drops; a 404
+      // (job not in memory) or a closed stream lands here instead.
+      es.onerror = () => {
+        if (es?.readyState === EventSource.CLOSED) fallback();
+      };
+    };
+
+    stream();
+    return () => { alive = false; clearTimeout(timer); es?.close(); };
   }, [jobId]);
 
   return { status, log };
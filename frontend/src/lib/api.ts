@@ -118,6 +118,16 @@ class APIClient {
     }
   }
 
+  /**
+   * URL of the Server-Sent Events progress stream for a job.
+   *
+   * @param jobId - Job ID to stream
+   * @returns Absolute URL for an EventSource
+   */
+  jobEventsUrl(jobId: string): string {
+    return `${this.baseURL}/jobs/${encodeURIComponent(jobId)}/events`;
+  }
+
   /**
    * Enrich contacts for a company domain via ZoomInfo Contact Enrich API.
    * Returns contacts with direct phone, mobile phone, company phone, and accuracy scores.
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Compare keyword-only and hybrid (keyword + embedding) content-audit retrieval.
+
+Runs a small hand-labelled query set against the V2 CSV and reports recall@1 /
+recall@3 and per-query latency for each mode. The queries are phrased the way
+sellers and personas phrase priorities — deliberately NOT reusing the asset
+titles — which is where keyword scoring misses. The hybrid column needs the
+index from scripts/build_content_embeddings.py (plus numpy and
+sentence-transformers); without it only the keyword column is reported.
+
+Usage
+-----
+    python3 scripts/bench_content_retrieval.py [--repeat 20]
+"""
+from __future__ import annotations
+
+import argparse
+import logging
+import os
+import statistics
+import sys
+import time
+
+_BACKEND = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend")
+sys.path.insert(0, _BACKEND)
+
+# query -> asset ids (V2 CSV row ids) a seller would accept as a good match
+EVAL_SET = {
+    "zero trust endpoint protection": {13, 34, 36},
+    "printer fleet consolidation for hospitals": {39, 44},
+    "bank printing and paper waste": {40, 43},
+    "remote access to powerful desktops for engineers": {1, 34, 35},
+    "digital employee experience monitoring": {14, 18, 25, 31},
+    "PC refresh driven by device telemetry": {32},
+    "Windows 11 migration readiness": {21},
+    "video conferencing rooms and meeting equity": {45, 46},
+    "employee wellbeing and belonging": {5, 7},
+    "machine learning workloads on local hardware": {3, 26, 53},
+    "device as a service for a global workforce": {47, 48, 49},
+    "Gen Z expectations at work": {29},
+    "lowering the cost of IT operations": {33, 46},
+}
+
+
+def _run(query: str, semantic: bool):
+    import content_audit
+    import content_embeddings
+
+    content_audit._index._invalidate()   # time the matcher (and query embedding), not the memos
+    content_embeddings._embed_query.cache_clear()
+    t0 = time.perf_counter()
+    hits = content_audit.top_matches(query.split(), k=3, semantic_query=query if semantic else None)
+    return [h["id"] for h in hits], time.perf_counter() - t0
+
+
+def main() -> int:
+    logging.basicConfig(level=logging.WARNING)
+    import content_audit
+    import content_embeddings
+
+    ap = argparse.ArgumentParser()
+    ap.add_argument("--repeat", type=int, default=20)
+    args = ap.parse_args()
+
+    content_audit.load_content_audit(force=True)
+    modes = [("keyword", False)] + ([("hybrid", True)] if content_embeddings.available() else [])
+    if len(modes) == 1:
+        print("No embedding index loaded (run scripts/build_content_embeddings.py) — keyword only.\n")
+
+    print(f"{'mode':8} {'recall@1':>9} {'recall@3':>9} {'p50 ms':>8} {'p95 ms':>8}")
+    for name, semantic in modes:
+        r1 = r3 = 0
+        latencies = []
+        for query, relevant in EVAL_SET.items():
+            for _ in range(args.repeat):
+                ids, dt = _run(query, semantic)
+                latencies.append(dt * 1000)
+            r1 += bool(set(ids[:1]) & relevant)
+            r3 += bool(set(ids[:3]) & relevant)
+        n = len(EVAL_SET)
+        latencies.sort()
+        print(f"{name:8} {r1 / n:9.2f} {r3 / n:9.2f} {statistics.median(latencies):8.3f} "
+              f"{latencies[int(0.95 * (len(latencies) - 1))]:8.3f}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
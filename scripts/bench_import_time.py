@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Import-time breakdown for the backend (cold-start budget).
+
+Runs `python -X importtime -c "import production_main"` in fresh interpreters
+(WARMUP=0, so nothing is scheduled) and reports, per run, the total import
+time, the app's own share (production_main, routers.*, worker.* and the
+backend-root modules) and the slowest modules by cumulative time. It also
+lists any module on the deferred list (llm_council, anthropic, supabase, ...)
+that was imported eagerly — those belong behind a lazy import or in warmup.
+tests/test_cold_start.py asserts the same budget in CI.
+
+Usage
+-----
+    python3 scripts/bench_import_time.py [--runs 5] [--top 15]
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+_BACKEND = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend")
+
+APP_PREFIXES = ("production_main", "routers", "worker", "llm_council", "orchestrator",
+                "content_audit", "content_embeddings", "council_resolver")
+DEFERRED = ("llm_council", "orchestrator", "worker.data_validator", "content_audit",
+            "routers.debug_payload", "anthropic", "openai", "supabase", "pptx", "numpy",
+            "sentence_transformers", "worker.zoominfo_client", "worker.gamma_slideshow")
+
+
+def importtime(module: str = "production_main"):
+    """[(module, self_us, cumulative_us)] for one cold import of `module`."""
+    env = {**os.environ, "WARMUP": "0"}
+    proc = subprocess.run([sys.executable, "-X", "importtime", "-c", f"import {module}"],
+                          cwd=_BACKEND, env=env, capture_output=True, text=True, timeout=300)
+    if proc.returncode != 0:
+        raise SystemExit(proc.stderr[-2000:])
+    rows = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:") or "self [us]" in line:
+            continue
+        self_us, cum_us, name = line[len("import time:"):].split("|")
+        rows.append((name.strip(), int(self_us), int(cum_us)))
+    return rows
+
+
+def is_app(name: str) -> bool:
+    return name.split(".")[0] in APP_PREFIXES
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5)
+    parser.add_argument("--top", type=int, default=15)
+    args = parser.parse_args()
+
+    totals, app = [], []
+    rows = []
+    for _ in range(args.runs):
+        rows = importtime()
+        totals.append(next(c for n, _, c in rows if n == "production_main") / 1e3)
+        app.append(sum(s for n, s, _ in rows if is_app(n)) / 1e3)
+
+    print(f"import production_main over {args.runs} runs (ms): "
+          f"total p50 {statistics.median(totals):.0f}, app-owned self p50 {statistics.median(app):.0f}")
+    print(f"\nslowest {args.top} by cumulative time (last run):")
+    for name, self_us, cum_us in sorted(rows, key=lambda r: -r[2])[:args.top]:
+        print(f"  {cum_us / 1e3:8.1f} ms  (self {self_us / 1e3:6.1f})  {name}")
+    print("\napp-owned modules by self time (last run):")
+    for name, self_us, _ in sorted((r for r in rows if is_app(r[0])), key=lambda r: -r[1]):
+        print(f"  {self_us / 1e3:8.1f} ms  {name}")
+    eager = sorted({n for n, _, _ in rows} & set(DEFERRED))
+    print("\neagerly imported deferred modules:", ", ".join(eager) or "none")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+#!/usr/bin/env python3
+"""
+Build the local embedding index that `backend/content_embeddings.py` loads.
+
+Why this exists
+---------------
+Semantic content-audit retrieval needs one embedding per asset. Embedding 54 (or
+a few thousand) assets at request time would put a model load and a batch
+encode on the deck path, so it is a committed offline step instead — run after
+scripts/extract_content_audit.py regenerates the CSV. The index records the
+CSV's SHA-256; a CSV edited after the build is detected and ignored (keyword-
+only matching) until this is re-run.
+
+Needs numpy + sentence-transformers (not runtime requirements). The first run
+downloads the model into the local Hugging Face cache; the backend only ever
+loads it from that cache.
+
+Usage
+-----
+    python3 scripts/build_content_embeddings.py              # V2 CSV defaults
+    python3 scripts/build_content_embeddings.py --csv <csv> --model <hf model id>
+"""
+from __future__ import annotations
+
+import argparse
+import os
+import sys
+
+_BACKEND = os.path.join(os.path.dirname(os.path.abspath(__file__)), "..", "backend")
+sys.path.insert(0, _BACKEND)
+
+
+def main() -> int:
+    import content_audit
+    import content_embeddings
+
+    ap = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    ap.add_argument("--csv", default=os.path.normpath(content_audit.CSV_PATH))
+    ap.add_argument("--model", default=content_embeddings.MODEL_NAME)
+    args = ap.parse_args()
+
+    from sentence_transformers import SentenceTransformer
+
+    content_embeddings.MODEL_NAME = args.model
+    # The build may download the model once; the backend loads it local-only.
+    model = SentenceTransformer(args.model, device="cpu")
+    content_audit.CSV_PATH = args.csv
+    content_audit.load_content_audit(force=True)
+    items = [i for i in content_audit.get_all_items() if i.get("source") == "csv"]
+    path = content_embeddings.build_index(items, args.csv, model=model)
+    print(f"Wrote {len(items)} embeddings ({args.model}) to {path}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())